@@ -0,0 +1,114 @@
+"""create_aggregate_rollup_tables
+
+Revision ID: 20261018_aggregate_rollups
+Revises: 20260403_workflows
+Create Date: 2026-10-18 00:00:00.000000
+
+Creates the ``aggregate_rollups`` and ``aggregate_rollup_values`` tables for
+opt-in materialized count/sum rollups used by the /aggregate endpoint.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_aggregate_rollups"
+down_revision: str | Sequence[str] | None = "20260403_workflows"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create aggregate_rollups and aggregate_rollup_values tables."""
+    op.create_table(
+        "aggregate_rollups",
+        sa.Column("id", sa.String(36), nullable=False, comment="Rollup ID (UUID)"),
+        sa.Column(
+            "collection_id",
+            sa.String(36),
+            nullable=False,
+            comment="Foreign key to collections table",
+        ),
+        sa.Column(
+            "group_by",
+            JSON().with_variant(JSONB(), "postgresql"),
+            nullable=False,
+            comment="JSON list of group-by field names",
+        ),
+        sa.Column(
+            "sum_fields",
+            JSON().with_variant(JSONB(), "postgresql"),
+            nullable=False,
+            comment="JSON list of number fields whose sums are maintained",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            comment="Creation timestamp",
+        ),
+        sa.Column(
+            "created_by",
+            sa.String(36),
+            nullable=True,
+            comment="User ID of who defined the rollup",
+        ),
+        sa.ForeignKeyConstraint(["collection_id"], ["collections.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("aggregate_rollups", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_aggregate_rollups_collection_id", ["collection_id"], unique=False
+        )
+
+    op.create_table(
+        "aggregate_rollup_values",
+        sa.Column(
+            "rollup_id",
+            sa.String(36),
+            nullable=False,
+            comment="Foreign key to aggregate_rollups table",
+        ),
+        sa.Column(
+            "account_id",
+            sa.String(36),
+            nullable=False,
+            comment="Account the grouped records belong to",
+        ),
+        sa.Column("group_key", sa.Text(), nullable=False, comment="JSON list of group-by values"),
+        sa.Column(
+            "field",
+            sa.String(100),
+            nullable=False,
+            comment='Sum field name, or "" for the record count',
+        ),
+        sa.Column(
+            "total",
+            sa.Numeric().with_variant(sa.Float(), "sqlite"),
+            nullable=False,
+            comment="Running sum of the field",
+        ),
+        sa.Column(
+            "value_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Record count or non-null value count",
+        ),
+        sa.ForeignKeyConstraint(["rollup_id"], ["aggregate_rollups.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("rollup_id", "account_id", "group_key", "field"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop aggregate rollup tables."""
+    op.drop_table("aggregate_rollup_values")
+
+    with op.batch_alter_table("aggregate_rollups", schema=None) as batch_op:
+        batch_op.drop_index("ix_aggregate_rollups_collection_id")
+
+    op.drop_table("aggregate_rollups")
@@ -0,0 +1,59 @@
+"""create_collection_change_counters_table
+
+Revision ID: 20261018_change_counters
+Revises: 20261018_dashboard_stats
+Create Date: 2026-10-18 18:00:00.000000
+
+Creates the ``collection_change_counters`` table. Record writes bump the
+counter of their collection and account; record list endpoints derive weak
+ETags from it.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_change_counters"
+down_revision: str | Sequence[str] | None = "20261018_dashboard_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create collection_change_counters table."""
+    op.create_table(
+        "collection_change_counters",
+        sa.Column(
+            "collection_name",
+            sa.String(255),
+            nullable=False,
+            comment="Collection whose records changed",
+        ),
+        sa.Column(
+            "account_id",
+            sa.String(36),
+            nullable=False,
+            comment="Account owning the changed records",
+        ),
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Number of record writes so far",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            comment="When a record of the collection and account last changed",
+        ),
+        sa.PrimaryKeyConstraint("collection_name", "account_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop collection_change_counters table."""
+    op.drop_table("collection_change_counters")
@@ -0,0 +1,63 @@
+"""create_collection_schema_journal_table
+
+Revision ID: 20261018_schema_journal
+Revises: 20261018_schema_state
+Create Date: 2026-10-18 23:55:00.000000
+
+Creates the ``collection_schema_journal`` table recording collection DDL that
+was applied directly (``collection_ddl_mode = "direct"``) rather than through
+generated Alembic revisions.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_schema_journal"
+down_revision: str | Sequence[str] | None = "20261018_schema_state"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create collection_schema_journal table."""
+    op.create_table(
+        "collection_schema_journal",
+        sa.Column("revision", sa.String(32), nullable=False, comment="Journal revision ID"),
+        sa.Column(
+            "collection_name",
+            sa.String(64),
+            nullable=False,
+            comment="Collection whose table changed",
+        ),
+        sa.Column("operation", sa.String(16), nullable=False, comment="create, update or delete"),
+        sa.Column(
+            "statements",
+            sa.Text(),
+            nullable=False,
+            comment="JSON list of the DDL statements executed",
+        ),
+        sa.Column(
+            "applied_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+            comment="When the change was applied",
+        ),
+        sa.PrimaryKeyConstraint("revision"),
+    )
+    op.create_index(
+        "ix_collection_schema_journal_collection",
+        "collection_schema_journal",
+        ["collection_name", "applied_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop collection_schema_journal table."""
+    op.drop_index(
+        "ix_collection_schema_journal_collection", table_name="collection_schema_journal"
+    )
+    op.drop_table("collection_schema_journal")
@@ -0,0 +1,48 @@
+"""create_dashboard_stats_table
+
+Revision ID: 20261018_dashboard_stats
+Revises: 20261018_aggregate_rollups
+Create Date: 2026-10-18 12:00:00.000000
+
+Creates the ``dashboard_stats`` table holding maintained counters (record
+counts per collection, local storage bytes) served by the dashboard.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_dashboard_stats"
+down_revision: str | Sequence[str] | None = "20261018_aggregate_rollups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create dashboard_stats table."""
+    op.create_table(
+        "dashboard_stats",
+        sa.Column("key", sa.String(255), nullable=False, comment="Counter name"),
+        sa.Column("value", sa.BigInteger(), nullable=False, comment="Current counter value"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            comment="When the counter last changed",
+        ),
+        sa.Column(
+            "reconciled_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When the counter was last recomputed from the source of truth",
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop dashboard_stats table."""
+    op.drop_table("dashboard_stats")
@@ -0,0 +1,95 @@
+"""create_event_outbox_table
+
+Revision ID: 20261018_event_outbox
+Revises: 20261018_schema_journal
+Create Date: 2026-10-18 23:58:00.000000
+
+Creates the ``event_outbox`` table that record writes append webhook, hook
+and workflow events to in their own transaction when
+``event_outbox_enabled`` is set.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_event_outbox"
+down_revision: str | Sequence[str] | None = "20261018_schema_journal"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create event_outbox table."""
+    op.create_table(
+        "event_outbox",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            autoincrement=True,
+            nullable=False,
+            comment="Event ID, also the delivery order",
+        ),
+        sa.Column("operation", sa.String(16), nullable=False, comment="create, update or delete"),
+        sa.Column(
+            "collection",
+            sa.String(64),
+            nullable=False,
+            comment="Collection of the changed record",
+        ),
+        sa.Column(
+            "account_id",
+            sa.String(36),
+            nullable=False,
+            comment="Account owning the changed record",
+        ),
+        sa.Column(
+            "payload",
+            sa.Text(),
+            nullable=False,
+            comment="JSON object with the record and its old values",
+        ),
+        sa.Column(
+            "context",
+            sa.Text(),
+            nullable=True,
+            comment="JSON snapshot of the hook context of the write",
+        ),
+        sa.Column(
+            "targets",
+            sa.String(100),
+            nullable=False,
+            comment="Comma-separated targets still to deliver to",
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Delivery attempts claimed so far",
+        ),
+        sa.Column(
+            "available_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Earliest claim time; NULL once parked",
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True, comment="Most recent delivery error"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+            comment="When the event was written",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_event_outbox_available", "event_outbox", ["available_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop event_outbox table."""
+    op.drop_index("ix_event_outbox_available", table_name="event_outbox")
+    op.drop_table("event_outbox")
@@ -0,0 +1,50 @@
+"""create_rate_limit_buckets_table
+
+Revision ID: 20261018_rate_limit_buckets
+Revises: 20261018_sequences
+Create Date: 2026-10-18 23:30:00.000000
+
+Creates the ``rate_limit_buckets`` table used by the ``database`` rate limit
+backend, so that all workers share one token bucket per client.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_rate_limit_buckets"
+down_revision: str | Sequence[str] | None = "20261018_sequences"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create rate_limit_buckets table."""
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(255), nullable=False, comment="Rate limit key"),
+        sa.Column(
+            "tokens",
+            sa.Float(),
+            nullable=False,
+            comment="Tokens left after the last consumed request",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.Float(),
+            nullable=False,
+            comment="Unix time of the last consumed request",
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        "ix_rate_limit_buckets_updated_at", "rate_limit_buckets", ["updated_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop rate_limit_buckets table."""
+    op.drop_index("ix_rate_limit_buckets_updated_at", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,87 @@
+"""create_record_changes_table
+
+Revision ID: 20261018_record_changes
+Revises: 20261018_event_outbox
+Create Date: 2026-10-19 09:00:00.000000
+
+Creates the ``record_changes`` table behind the record delta-sync endpoint.
+Every record write replaces the record's row with a new, higher sequence
+number; deletes leave a tombstone row. Clients read it through the feed
+index on (collection_name, account_id, seq).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_record_changes"
+down_revision: str | Sequence[str] | None = "20261018_event_outbox"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create record_changes table."""
+    op.create_table(
+        "record_changes",
+        sa.Column(
+            "seq",
+            sa.Integer(),
+            autoincrement=True,
+            nullable=False,
+            comment="Change sequence number, never reused",
+        ),
+        sa.Column(
+            "collection_name",
+            sa.String(255),
+            nullable=False,
+            comment="Collection of the changed record",
+        ),
+        sa.Column(
+            "account_id",
+            sa.String(36),
+            nullable=False,
+            comment="Account owning the changed record",
+        ),
+        sa.Column(
+            "record_id",
+            sa.String(255),
+            nullable=False,
+            comment="ID of the changed record",
+        ),
+        sa.Column(
+            "deleted",
+            sa.Boolean(),
+            nullable=False,
+            comment="Whether the record was deleted",
+        ),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+            comment="When the change was committed",
+        ),
+        sa.PrimaryKeyConstraint("seq"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "uq_record_changes_record",
+        "record_changes",
+        ["collection_name", "record_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_record_changes_feed",
+        "record_changes",
+        ["collection_name", "account_id", "seq"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop record_changes table."""
+    op.drop_index("ix_record_changes_feed", table_name="record_changes")
+    op.drop_index("uq_record_changes_record", table_name="record_changes")
+    op.drop_table("record_changes")
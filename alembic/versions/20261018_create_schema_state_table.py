@@ -0,0 +1,53 @@
+"""create_schema_state_table
+
+Revision ID: 20261018_schema_state
+Revises: 20261018_rate_limit_buckets
+Create Date: 2026-10-18 23:45:00.000000
+
+Creates the ``schema_state`` table in which startup records the schema
+fingerprint and Alembic heads of its last full migration and seeding pass.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_schema_state"
+down_revision: str | Sequence[str] | None = "20261018_rate_limit_buckets"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create schema_state table."""
+    op.create_table(
+        "schema_state",
+        sa.Column("name", sa.String(64), nullable=False, comment="State name"),
+        sa.Column(
+            "fingerprint",
+            sa.String(64),
+            nullable=False,
+            comment="SHA-256 of the migration scripts and seed code",
+        ),
+        sa.Column(
+            "alembic_heads",
+            sa.Text(),
+            nullable=False,
+            comment="Comma-separated Alembic revisions the database was at",
+        ),
+        sa.Column(
+            "recorded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+            comment="When the state was recorded",
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop schema_state table."""
+    op.drop_table("schema_state")
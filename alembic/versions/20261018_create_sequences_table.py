@@ -0,0 +1,36 @@
+"""create_sequences_table
+
+Revision ID: 20261018_sequences
+Revises: 20261018_change_counters
+Create Date: 2026-10-18 23:00:00.000000
+
+Creates the ``sequences`` table of named counters. Account codes are
+allocated from its ``account_code`` row, which is seeded from the highest
+existing code on first use.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_sequences"
+down_revision: str | Sequence[str] | None = "20261018_change_counters"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create sequences table."""
+    op.create_table(
+        "sequences",
+        sa.Column("name", sa.String(64), nullable=False, comment="Sequence name"),
+        sa.Column("value", sa.BigInteger(), nullable=False, comment="Last value handed out"),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop sequences table."""
+    op.drop_table("sequences")
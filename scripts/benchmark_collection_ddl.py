@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark collection creation time against the number of existing collections.
+
+Creates collections one after another through CollectionService on a scratch
+instance (SQLite database plus ``sb_data/migrations``) in each
+``collection_ddl_mode``:
+
+- ``migrations``: a revision file is generated and ``alembic upgrade heads``
+  applied per collection.
+- ``direct``: the DDL is executed in a transaction and journaled.
+
+For every checkpoint the mean time of the creates just before it is
+reported, which shows how the cost grows with the number of collections.
+Results can be written as JSON and compared across commits with
+``--compare``.
+
+Usage:
+    python scripts/benchmark_collection_ddl.py [--checkpoints 10 50 100 200] [--output ddl.json]
+    python scripts/benchmark_collection_ddl.py --modes direct --checkpoints 100 500 1000
+    python scripts/benchmark_collection_ddl.py --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Add src to path to import snackbase
+sys.path.append(str(REPO_ROOT / "src"))
+
+SCHEMA = [
+    {"name": "title", "type": "text", "required": True},
+    {"name": "body", "type": "text"},
+    {"name": "views", "type": "number"},
+    {"name": "published", "type": "boolean"},
+]
+
+
+async def run_mode(mode: str, checkpoints: list[int], window: int) -> dict[str, float]:
+    """Create collections in one mode; returns mean seconds per create by checkpoint."""
+    from snackbase.core.config import get_settings
+    from snackbase.domain.services import CollectionService
+    from snackbase.infrastructure.persistence import database
+
+    settings = get_settings()
+    settings.collection_ddl_mode = mode
+    database._db_manager = None
+    await database.init_database()
+    db = database.get_db_manager()
+
+    durations = []
+    results = {}
+    for i in range(max(checkpoints)):
+        async with db.session() as session:
+            service = CollectionService(session, db.engine)
+            start = time.perf_counter()
+            await service.create_collection(f"{mode}_{i:05d}", SCHEMA, "benchmark")
+            await session.commit()
+            durations.append(time.perf_counter() - start)
+        if i + 1 in checkpoints:
+            recent = durations[-window:]
+            results[f"{mode}.create@{i + 1}"] = sum(recent) / len(recent)
+
+    await database.close_database()
+    database._db_manager = None
+    return results
+
+
+async def run_cases(args: argparse.Namespace, workdir: Path) -> dict[str, float]:
+    """Run every mode in its own scratch database."""
+    results = {}
+    for mode in args.modes:
+        os.environ["SNACKBASE_DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/sb_data/{mode}.db"
+        shutil.rmtree(workdir / "sb_data" / "migrations", ignore_errors=True)
+        from snackbase.core.config import get_settings
+
+        get_settings.cache_clear()
+        results.update(await run_mode(mode, sorted(args.checkpoints), args.window))
+    return results
+
+
+def git_revision() -> str | None:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-case change between two result files."""
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"  {name:<28} {result['ms']:10.1f} ms   (new)")
+            continue
+        change = (result["ms"] - old["ms"]) / old["ms"] * 100
+        print(f"  {name:<28} {old['ms']:10.1f} -> {result['ms']:10.1f} ms   {change:+6.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", default=["migrations", "direct"])
+    parser.add_argument("--checkpoints", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--window", type=int, default=5, help="creates averaged per checkpoint")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    output = Path(args.output).resolve() if args.output else None
+    with tempfile.TemporaryDirectory() as workdir:
+        # Collection migrations are written relative to the working directory
+        shutil.copy(REPO_ROOT / "alembic.ini", workdir)
+        os.symlink(REPO_ROOT / "alembic", Path(workdir) / "alembic")
+        os.chdir(workdir)
+        os.environ.setdefault("SNACKBASE_LOG_LEVEL", "WARNING")
+        timings = asyncio.run(run_cases(args, Path(workdir)))
+
+    results = {}
+    print(f"mean of the last {args.window} creates at each checkpoint")
+    for name, seconds in timings.items():
+        results[name] = {"ms": round(seconds * 1000, 1)}
+        print(f"  {name:<28} {seconds * 1000:10.1f} ms")
+
+    if output:
+        document = {
+            "benchmark": "collection_ddl",
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "parameters": {
+                "modes": args.modes,
+                "checkpoints": sorted(args.checkpoints),
+                "window": args.window,
+            },
+            "results": results,
+        }
+        output.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
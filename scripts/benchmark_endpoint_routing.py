@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Micro-benchmark custom endpoint routing against the number of endpoints.
+
+Compares the precompiled route table the dispatcher uses with the previous
+approach (compile a regex per endpoint template on every request and scan
+them in turn) for accounts with a growing number of endpoints. The request
+path matches the last endpoint, which is the worst case for the scan.
+Results can be written as JSON and compared across commits with
+``--compare``.
+
+Usage:
+    python scripts/benchmark_endpoint_routing.py [--sizes 10 100 1000] [--output routes.json]
+    python scripts/benchmark_endpoint_routing.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path to import snackbase
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from snackbase.infrastructure.endpoints.route_table import CompiledEndpoint, RouteTable
+
+METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+
+def make_endpoints(count: int) -> list[CompiledEndpoint]:
+    """Build a mix of literal and parameterised endpoint templates."""
+    templates = [
+        "/resource{i}",
+        "/resource{i}/:id",
+        "/resource{i}/:id/children/:child_id",
+        "/reports/{i}/:year.json",
+    ]
+    return [
+        CompiledEndpoint(
+            id=f"ep-{i}",
+            method=METHODS[i % len(METHODS)],
+            path=templates[i % len(templates)].format(i=i),
+            auth_required=False,
+            condition=None,
+            actions=[],
+            response_template=None,
+        )
+        for i in range(count)
+    ]
+
+
+def request_for(endpoint: CompiledEndpoint) -> tuple[str, str]:
+    """Build a request path that the endpoint's template matches."""
+    path = re.sub(r":([a-zA-Z_][a-zA-Z0-9_]*)", "value", endpoint.path)
+    return endpoint.method, path
+
+
+def linear_match(endpoints: list[CompiledEndpoint], method: str, path: str) -> str | None:
+    """Previous dispatcher behaviour: per-request regex compile and scan."""
+    for endpoint in endpoints:
+        if endpoint.method != method:
+            continue
+        escaped = re.sub(r"[.]", r"\\.", endpoint.path)
+        pattern = re.sub(r":([a-zA-Z_][a-zA-Z0-9_]*)", r"(?P<\1>[^/]+)", escaped)
+        if re.compile(f"^{pattern}$").match(path):
+            return endpoint.id
+    return None
+
+
+def build_cases(sizes: list[int]) -> dict:
+    """Collect the named benchmark callables."""
+    cases = {}
+    for size in sizes:
+        endpoints = make_endpoints(size)
+        method, path = request_for(endpoints[-1])
+        table = RouteTable(endpoints)
+        assert table.match(method, path)[0].id == endpoints[-1].id
+        assert linear_match(endpoints, method, path) == endpoints[-1].id
+
+        cases[f"linear_scan.{size}"] = lambda e=endpoints, m=method, p=path: linear_match(e, m, p)
+        cases[f"route_table.{size}"] = lambda t=table, m=method, p=path: t.match(m, p)
+        cases[f"route_table_build.{size}"] = lambda e=endpoints: RouteTable(e)
+    return cases
+
+
+def git_revision() -> str | None:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-case change between two result files."""
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"  {name:<28} {result['us_per_op']:10.2f} us   (new)")
+            continue
+        change = (result["us_per_op"] - old["us_per_op"]) / old["us_per_op"] * 100
+        print(
+            f"  {name:<28} {old['us_per_op']:10.2f} -> {result['us_per_op']:10.2f} us"
+            f"   {change:+6.1f}%"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000])
+    parser.add_argument("--number", type=int, default=200, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs, best is kept")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = {}
+    print(f"{args.number} calls x {args.repeat} runs")
+    for name, func in build_cases(args.sizes).items():
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        us_per_op = best / args.number * 1_000_000
+        results[name] = {"us_per_op": round(us_per_op, 3), "ops_per_sec": round(1e6 / us_per_op)}
+        print(f"  {name:<28} {us_per_op:10.2f} us/op")
+
+    if args.output:
+        document = {
+            "benchmark": "endpoint_routing",
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "parameters": {"number": args.number, "repeat": args.repeat, "sizes": args.sizes},
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
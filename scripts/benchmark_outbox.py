@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark the transactional event outbox: write cost, relay throughput and latency.
+
+Runs against a scratch SQLite database with one collection and measures:
+
+- ``write.direct`` / ``write.outbox``: mean time of a record insert plus
+  commit through RecordRepository with the outbox disabled and enabled,
+  i.e. the cost of writing the event row in the record's transaction.
+- ``relay.drain``: time per event to deliver a backlog of ``--events``
+  events with ``OutboxRelay.drain_once`` (the reported events/s is the
+  relay throughput).
+- ``relay.latency.p50`` / ``p95``: with the relay running, time from a
+  write's commit returning to the relay finishing delivery of its event.
+
+Writes run under a hook context, so the webhook, API-defined hook and
+workflow targets look up their (empty) subscriptions as they would in a
+request. Results can be written as JSON and compared across commits with
+``--compare``.
+
+Usage:
+    python scripts/benchmark_outbox.py [--events 2000] [--output outbox.json]
+    python scripts/benchmark_outbox.py --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Add src to path to import snackbase
+sys.path.append(str(REPO_ROOT / "src"))
+
+COLLECTION = "bench_events"
+ACCOUNT_ID = "00000000-0000-0000-0000-0000000000be"
+SCHEMA = [
+    {"name": "title", "type": "text", "required": True},
+    {"name": "views", "type": "number"},
+    {"name": "published", "type": "boolean"},
+]
+
+
+async def write_records(db, count: int) -> list[tuple[str, float]]:
+    """Insert records one per transaction; returns (record ID, seconds) pairs."""
+    from snackbase.infrastructure.persistence.repositories.record_repository import (
+        RecordRepository,
+    )
+
+    timings = []
+    for i in range(count):
+        record_id = str(uuid.uuid4())
+        async with db.session() as session:
+            start = time.perf_counter()
+            await RecordRepository(session).insert_record(
+                collection_name=COLLECTION,
+                record_id=record_id,
+                account_id=ACCOUNT_ID,
+                created_by="benchmark",
+                data={"title": f"Event {i}", "views": i, "published": i % 2 == 0},
+                schema=SCHEMA,
+            )
+            await session.commit()
+            timings.append((record_id, time.perf_counter() - start))
+    return timings
+
+
+async def setup(db) -> None:
+    """Create the benchmark account and collection."""
+    from snackbase.domain.services import CollectionService
+    from snackbase.infrastructure.persistence.models import AccountModel
+
+    async with db.session() as session:
+        session.add(AccountModel(id=ACCOUNT_ID, account_code="BE0001", slug="bench", name="Bench"))
+        await session.commit()
+    async with db.session() as session:
+        await CollectionService(session, db.engine).create_collection(
+            COLLECTION, SCHEMA, "benchmark"
+        )
+        await session.commit()
+
+
+async def run_cases(args: argparse.Namespace) -> dict[str, float]:
+    """Run every case; returns seconds by case name."""
+    from snackbase.core.config import get_settings
+    from snackbase.core.context import set_current_context
+    from snackbase.domain.entities.hook_context import HookContext
+    from snackbase.infrastructure.persistence import database
+    from snackbase.infrastructure.services.outbox_relay import OutboxRelay
+
+    settings = get_settings()
+    settings.collection_ddl_mode = "direct"
+    settings.event_outbox_batch_size = args.batch_size
+    await database.init_database()
+    db = database.get_db_manager()
+    await setup(db)
+    # No hook registry: only the outbox targets' own lookups run
+    app = SimpleNamespace(state=SimpleNamespace())
+    set_current_context(HookContext(app=app, account_id=ACCOUNT_ID))
+
+    # Alternate the modes so both see the same table size and cache state
+    writes: dict[str, list[float]] = {"direct": [], "outbox": []}
+    for _ in range(args.writes):
+        for name in writes:
+            settings.event_outbox_enabled = name == "outbox"
+            [(_, seconds)] = await write_records(db, 1)
+            writes[name].append(seconds)
+    results = {f"write.{name}": statistics.mean(times) for name, times in writes.items()}
+
+    # Throughput: drain a backlog written while no relay was running
+    await write_records(db, args.events)
+    relay = OutboxRelay(db.session, settings)
+    start = time.perf_counter()
+    drained = 0
+    while claimed := await relay.drain_once():
+        drained += claimed
+    results["relay.drain"] = (time.perf_counter() - start) / drained
+
+    # Latency: the running relay is woken by each commit
+    delivered: dict[str, float] = {}
+    delivered_event = asyncio.Event()
+    deliver = relay._deliver
+
+    async def timed_deliver(event, context, subscribed):
+        result = await deliver(event, context, subscribed)
+        delivered[json.loads(event.payload)["record"]["id"]] = time.perf_counter()
+        delivered_event.set()
+        return result
+
+    relay._deliver = timed_deliver
+    await relay.start()
+    latencies = []
+    for _ in range(args.writes):
+        delivered_event.clear()
+        [(record_id, _)] = await write_records(db, 1)
+        committed = time.perf_counter()
+        while record_id not in delivered:
+            await asyncio.wait_for(delivered_event.wait(), timeout=10)
+            delivered_event.clear()
+        latencies.append(delivered[record_id] - committed)
+    await relay.stop()
+    latencies.sort()
+    results["relay.latency.p50"] = latencies[len(latencies) // 2]
+    results["relay.latency.p95"] = latencies[int(len(latencies) * 0.95)]
+
+    await database.close_database()
+    return results
+
+
+def git_revision() -> str | None:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-case change between two result files."""
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"  {name:<20} {result['ms']:10.3f} ms   (new)")
+            continue
+        change = (result["ms"] - old["ms"]) / old["ms"] * 100
+        print(f"  {name:<20} {old['ms']:10.3f} -> {result['ms']:10.3f} ms   {change:+6.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000, help="backlog drained by the relay")
+    parser.add_argument("--writes", type=int, default=200, help="timed writes per case")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    output = Path(args.output).resolve() if args.output else None
+    with tempfile.TemporaryDirectory() as workdir:
+        # init_database resolves alembic.ini and sb_data/ from the working directory
+        shutil.copy(REPO_ROOT / "alembic.ini", workdir)
+        os.symlink(REPO_ROOT / "alembic", Path(workdir) / "alembic")
+        os.chdir(workdir)
+        os.environ["SNACKBASE_DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/sb_data/bench.db"
+        os.environ.setdefault("SNACKBASE_LOG_LEVEL", "WARNING")
+        timings = asyncio.run(run_cases(args))
+
+    results = {}
+    for name, seconds in timings.items():
+        results[name] = {"ms": round(seconds * 1000, 3)}
+        print(f"  {name:<20} {seconds * 1000:10.3f} ms")
+    print(f"  relay throughput     {1 / timings['relay.drain']:10.0f} events/s")
+
+    if output:
+        document = {
+            "benchmark": "outbox",
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "parameters": {
+                "events": args.events,
+                "writes": args.writes,
+                "batch_size": args.batch_size,
+            },
+            "results": results,
+        }
+        output.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the per-request cost of the rate limit backends.
+
+Times ``consume`` on the in-memory backend and on the shared backends: the
+SQLite ``file`` backend, and the ``database`` backend against a database URL
+(a scratch SQLite file by default; pass ``--database-url`` to measure
+PostgreSQL). Each case cycles through a set of keys with a limit high enough
+that every request is allowed, plus a ``denied`` case on an exhausted bucket,
+which costs an extra read. Results can be written as JSON and compared
+across commits with ``--compare``.
+
+Usage:
+    python scripts/benchmark_rate_limit.py [--keys 100] [--output rate_limit.json]
+    python scripts/benchmark_rate_limit.py --database-url postgresql+asyncpg://...
+    python scripts/benchmark_rate_limit.py --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path to import snackbase
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from snackbase.infrastructure.api.middleware.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    SQLRateLimitBackend,
+    create_file_engine,
+)
+from snackbase.infrastructure.api.middleware.rate_limit_storage import RateLimitStorage
+
+ALLOWED_RATE = 10_000_000
+DENIED_RATE = 0.001
+
+
+async def time_consume(
+    backend: RateLimitBackend, keys: list[str], rate: float, number: int, repeat: int
+) -> float:
+    """Return the best per-call time in seconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(number):
+            await backend.consume(keys[i % len(keys)], rate, burst=1)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+async def run_cases(args: argparse.Namespace, workdir: Path) -> dict[str, float]:
+    """Time every backend; returns seconds per call by case name."""
+    database_url = args.database_url or f"sqlite+aiosqlite:///{workdir / 'app.db'}"
+    backends = {
+        "memory": MemoryRateLimitBackend(RateLimitStorage()),
+        "file": SQLRateLimitBackend(
+            create_file_engine(str(workdir / "rate_limits.db")),
+            create_table=True,
+            dispose_engine=True,
+        ),
+        "database": SQLRateLimitBackend(
+            create_async_engine(database_url),
+            create_table=True,
+            dispose_engine=True,
+        ),
+    }
+    keys = [f"ip:10.0.{i // 256}.{i % 256}" for i in range(args.keys)]
+    results = {}
+    try:
+        for name, backend in backends.items():
+            # Warm up connections and create the buckets
+            await time_consume(backend, keys, ALLOWED_RATE, len(keys), 1)
+            results[f"{name}.allowed"] = await time_consume(
+                backend, keys, ALLOWED_RATE, args.number, args.repeat
+            )
+            await backend.consume("ip:denied", DENIED_RATE, burst=1)
+            results[f"{name}.denied"] = await time_consume(
+                backend, ["ip:denied"], DENIED_RATE, args.number, args.repeat
+            )
+    finally:
+        for backend in backends.values():
+            await backend.close()
+    return results
+
+
+def git_revision() -> str | None:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-case change between two result files."""
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"  {name:<20} {result['us_per_op']:10.2f} us   (new)")
+            continue
+        change = (result["us_per_op"] - old["us_per_op"]) / old["us_per_op"] * 100
+        print(
+            f"  {name:<20} {old['us_per_op']:10.2f} -> {result['us_per_op']:10.2f} us"
+            f"   {change:+6.1f}%"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100, help="distinct rate limit keys")
+    parser.add_argument("--number", type=int, default=1000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs, best is kept")
+    parser.add_argument("--database-url", help="database for the database backend")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        timings = asyncio.run(run_cases(args, Path(workdir)))
+
+    results = {}
+    print(f"{args.number} calls x {args.repeat} runs, {args.keys} keys")
+    for name, seconds in timings.items():
+        us_per_op = seconds * 1_000_000
+        results[name] = {"us_per_op": round(us_per_op, 3), "ops_per_sec": round(1e6 / us_per_op)}
+        print(f"  {name:<20} {us_per_op:10.2f} us/op")
+
+    if args.output:
+        document = {
+            "benchmark": "rate_limit",
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "parameters": {
+                "number": args.number,
+                "repeat": args.repeat,
+                "keys": args.keys,
+                "database": "custom" if args.database_url else "sqlite",
+            },
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark record list serialization.
+
+Compares the Pydantic path (one RecordResponse per row, then FastAPI-style
+validation and JSON encoding of the envelope) against the orjson fast path
+used by the records router, for a 100-row page with 30 fields per row.
+
+Usage:
+    python scripts/benchmark_record_serialization.py [--rows 100] [--fields 30]
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add src to path to import snackbase
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+import orjson
+
+from snackbase.infrastructure.api.record_serialization import (
+    RecordJSONResponse,
+    prepare_records,
+)
+from snackbase.infrastructure.api.schemas import RecordListResponse, RecordResponse
+
+
+def make_records(rows: int, fields: int) -> list[dict]:
+    """Build a page of records with a mix of field types."""
+    now = datetime.now(UTC).isoformat()
+    records = []
+    for i in range(rows):
+        record = {
+            "id": f"rec-{i:06d}",
+            "account_id": "AB0001",
+            "created_at": now,
+            "created_by": "user-1",
+            "updated_at": now,
+            "updated_by": "user-1",
+        }
+        for f in range(fields - len(record)):
+            kind = f % 5
+            if kind == 0:
+                record[f"text_{f}"] = f"value {i}-{f} " * 3
+            elif kind == 1:
+                record[f"number_{f}"] = i * f
+            elif kind == 2:
+                record[f"price_{f}"] = Decimal(f"{i}.{f:02d}")
+            elif kind == 3:
+                record[f"flag_{f}"] = bool((i + f) % 2)
+            else:
+                record[f"meta_{f}"] = {"tags": ["a", "b"], "rank": f}
+        records.append(record)
+    return records
+
+
+def pydantic_path(records: list[dict]) -> bytes:
+    """Serialize the way the router did before the fast path."""
+    response = RecordListResponse(
+        items=[RecordResponse.from_record(r) for r in records],
+        total=len(records),
+        skip=0,
+        limit=len(records),
+    )
+    # FastAPI re-validates the returned model against response_model before encoding
+    validated = RecordListResponse.model_validate(response.model_dump())
+    return validated.model_dump_json().encode()
+
+
+def fast_path(records: list[dict]) -> bytes:
+    """Serialize the way the router does now."""
+    content = {
+        "items": prepare_records(records),
+        "total": len(records),
+        "skip": 0,
+        "limit": len(records),
+    }
+    return RecordJSONResponse(content).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--fields", type=int, default=30)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    records = make_records(args.rows, args.fields)
+
+    # Both paths must produce the same document
+    assert orjson.loads(pydantic_path(records)) == orjson.loads(fast_path(records))
+
+    print(f"{args.rows} rows x {args.fields} fields, {args.number} iterations")
+    results = {}
+    for name, func in (("pydantic", pydantic_path), ("orjson", fast_path)):
+        best = min(timeit.repeat(lambda: func(records), number=args.number, repeat=5))
+        results[name] = best / args.number * 1000
+        print(f"  {name:<9} {results[name]:8.3f} ms/page")
+    print(f"  speedup   {results['pydantic'] / results['orjson']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
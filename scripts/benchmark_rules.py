@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the rule engine and the record row decoder.
+
+Times the rule lexer, parser and SQL compilers over a set of representative
+filter, permission and computed-field expressions, and the row decoder that
+turns record query rows into API dicts. Results can be written as JSON and
+compared across commits with ``--compare``.
+
+Usage:
+    python scripts/benchmark_rules.py [--number 2000] [--output rules.json]
+    python scripts/benchmark_rules.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path to import snackbase
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from snackbase.core.rules import (
+    compile_expression_to_sql,
+    compile_filter_to_sql,
+    compile_to_sql,
+    parse_rule,
+)
+from snackbase.core.rules.lexer import Lexer, TokenType
+from snackbase.infrastructure.persistence.repositories.record_repository import (
+    _decode_record_row,
+)
+
+FILTERS = {
+    "simple": 'status = "active"',
+    "compound": 'status = "active" && price > 100 && (featured = true || stock < 5)',
+    "in_list": 'category IN ("books", "music", "games", "films", "toys") && deleted_at IS NULL',
+    "string_ops": 'title ~ "%guide%" && !(sku ~ "TMP-%") && price >= 9.99 && price <= 99.99',
+}
+
+RULES = {
+    "owner": "created_by = @request.auth.id",
+    "owner_or_public": '@request.auth.id != "" && (created_by = @request.auth.id || public = true)',
+}
+
+EXPRESSIONS = {
+    "arithmetic": "price * quantity - price * 0.2",
+    "concat": "concat(title, ' - ', email)",
+}
+
+AUTH_CONTEXT = {"id": "user-1", "email": "user@example.com", "role": "user"}
+
+# A record collection schema with the field types the decoder handles
+SCHEMA = [
+    {"name": "title", "type": "text"},
+    {"name": "price", "type": "number"},
+    {"name": "quantity", "type": "number"},
+    {"name": "featured", "type": "boolean"},
+    {"name": "archived", "type": "boolean"},
+    {"name": "metadata", "type": "json"},
+    {"name": "tags", "type": "json"},
+    {"name": "author", "type": "reference", "collection": "authors"},
+    {"name": "email", "type": "email", "pii": True, "mask_type": "email"},
+    {"name": "total", "type": "computed", "expression": "price * quantity"},
+]
+
+
+def make_rows(count: int) -> list[dict]:
+    """Build raw result rows as the database driver returns them."""
+    now = datetime.now(UTC)
+    return [
+        {
+            "id": f"rec-{i:06d}",
+            "account_id": "AB0001",
+            "created_at": now,
+            "created_by": "user-1",
+            "updated_at": now,
+            "updated_by": "user-1",
+            "title": f"Record {i}",
+            "price": i * 1.5,
+            "quantity": i % 7,
+            "featured": i % 2,
+            "archived": 0,
+            "metadata": json.dumps({"source": "import", "rank": i, "labels": ["a", "b"]}),
+            "tags": json.dumps(["red", "green", "blue"]),
+            "author": f"author-{i % 10}",
+            "email": f"user{i}@example.com",
+            "total": i * 1.5 * (i % 7),
+        }
+        for i in range(count)
+    ]
+
+
+def tokenize(expression: str) -> int:
+    """Drain the lexer over an expression."""
+    lexer = Lexer(expression)
+    count = 0
+    while lexer.get_next_token().type != TokenType.EOF:
+        count += 1
+    return count
+
+
+def build_cases(rows: list[dict]) -> dict:
+    """Collect the named benchmark callables."""
+    cases = {}
+    for name, expression in {**FILTERS, **RULES}.items():
+        cases[f"lex.{name}"] = lambda e=expression: tokenize(e)
+        cases[f"parse.{name}"] = lambda e=expression: parse_rule(e)
+    for name, expression in FILTERS.items():
+        cases[f"compile_filter.{name}"] = lambda e=expression: compile_filter_to_sql(e)
+    for name, expression in RULES.items():
+        cases[f"compile_rule.{name}"] = lambda e=expression: compile_to_sql(e, AUTH_CONTEXT)
+    fields = {f["name"] for f in SCHEMA if f["type"] != "computed"}
+    for name, expression in EXPRESSIONS.items():
+        cases[f"compile_expression.{name}"] = lambda e=expression: compile_expression_to_sql(
+            e, "sqlite", fields
+        )
+
+    schema_lookup = {f["name"]: f for f in SCHEMA}
+    cases[f"decode_rows.{len(rows)}"] = lambda: [
+        _decode_record_row(row, schema_lookup) for row in rows
+    ]
+    return cases
+
+
+def git_revision() -> str | None:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-case change between two result files."""
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"  {name:<36} {result['us_per_op']:10.2f} us   (new)")
+            continue
+        change = (result["us_per_op"] - old["us_per_op"]) / old["us_per_op"] * 100
+        print(
+            f"  {name:<36} {old['us_per_op']:10.2f} -> {result['us_per_op']:10.2f} us"
+            f"   {change:+6.1f}%"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs, best is kept")
+    parser.add_argument("--rows", type=int, default=100, help="rows per decode call")
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    cases = build_cases(make_rows(args.rows))
+    results = {}
+    print(f"{args.number} calls x {args.repeat} runs")
+    for name, func in cases.items():
+        if args.filter not in name:
+            continue
+        number = max(args.number // args.rows, 1) if name.startswith("decode_rows") else args.number
+        best = min(timeit.repeat(func, number=number, repeat=args.repeat))
+        us_per_op = best / number * 1_000_000
+        results[name] = {"us_per_op": round(us_per_op, 3), "ops_per_sec": round(1e6 / us_per_op)}
+        print(f"  {name:<36} {us_per_op:10.2f} us/op")
+
+    if args.output:
+        document = {
+            "benchmark": "rules",
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "parameters": {"number": args.number, "repeat": args.repeat, "rows": args.rows},
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Benchmark database startup time against the number of collections.
+
+Builds a scratch instance (SQLite database plus ``sb_data/migrations``) with
+the requested number of collections, each created by its own dynamic
+migration, then times ``init_database`` as a restarting worker runs it:
+
+- ``full``: the schema fingerprint fast path disabled, i.e. Alembic upgrade,
+  pagination index backfill and seeding on every start.
+- ``fast_path``: the fingerprint recorded by a previous start matches, so
+  those steps are skipped.
+
+Each timed start uses a fresh database manager (new engine and pool), like a
+new process would. Results can be written as JSON and compared across
+commits with ``--compare``.
+
+Usage:
+    python scripts/benchmark_startup.py [--collections 300] [--output startup.json]
+    python scripts/benchmark_startup.py --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Add src to path to import snackbase
+sys.path.append(str(REPO_ROOT / "src"))
+
+SCHEMA = [
+    {"name": "title", "type": "text", "required": True},
+    {"name": "body", "type": "text"},
+    {"name": "views", "type": "number"},
+    {"name": "published", "type": "boolean"},
+]
+
+MIGRATION_TEMPLATE = '''"""create_collection_{name}
+
+Revision ID: {revision}
+Revises: {down_revision}
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = {revision!r}
+down_revision: Union[str, Sequence[str], None] = {down_revision!r}
+branch_labels: Union[str, Sequence[str], None] = {branch_labels!r}
+depends_on: Union[str, Sequence[str], None] = {depends_on!r}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+{upgrade}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+{downgrade}
+'''
+
+
+def write_collection_migrations(count: int, core_head: str) -> list[tuple[str, str]]:
+    """Write one dynamic migration per collection, as collection creation does.
+
+    Returns:
+        (collection name, revision) pairs.
+    """
+    from snackbase.infrastructure.persistence.migration_service import MigrationService
+
+    service = MigrationService("alembic.ini")
+    directory = Path("sb_data/migrations")
+    directory.mkdir(parents=True, exist_ok=True)
+    collections = []
+    down_revision = None
+    for i in range(count):
+        name = f"bench_{i:04d}"
+        revision = uuid.uuid4().hex[:12]
+        first = down_revision is None
+        source = MIGRATION_TEMPLATE.format(
+            name=name,
+            revision=revision,
+            down_revision=down_revision,
+            branch_labels=("dynamic",) if first else None,
+            depends_on=core_head if first else None,
+            upgrade="\n".join(service._generate_create_table_op_lines(name, SCHEMA)),
+            downgrade="\n".join(service._generate_drop_table_op_lines(name)),
+        )
+        (directory / f"{revision}_create_collection_{name}.py").write_text(source)
+        collections.append((name, revision))
+        down_revision = revision
+    return collections
+
+
+async def start_once() -> float:
+    """Run one startup with a fresh database manager; returns seconds."""
+    from snackbase.infrastructure.persistence import database
+
+    database._db_manager = None
+    start = time.perf_counter()
+    await database.init_database()
+    elapsed = time.perf_counter() - start
+    await database.close_database()
+    database._db_manager = None
+    return elapsed
+
+
+async def prepare(collections: int) -> None:
+    """Migrate a fresh database and create the collections."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    from snackbase.infrastructure.persistence import database
+    from snackbase.infrastructure.persistence.models import CollectionModel
+
+    await start_once()
+    core_head = ScriptDirectory.from_config(Config("alembic.ini")).get_current_head()
+    created = write_collection_migrations(collections, core_head)
+
+    # The next start applies the collection migrations; register the rows
+    await start_once()
+    async with database.get_db_manager().session() as session:
+        for name, revision in created:
+            session.add(
+                CollectionModel(
+                    id=str(uuid.uuid4()),
+                    name=name,
+                    schema=json.dumps(SCHEMA),
+                    migration_revision=revision,
+                )
+            )
+        await session.commit()
+    await database.close_database()
+
+
+async def run_cases(args: argparse.Namespace) -> dict[str, float]:
+    """Time full and fast-path starts; returns best seconds by case name."""
+    from snackbase.core.config import get_settings
+
+    settings = get_settings()
+    await prepare(args.collections)
+
+    results = {}
+    for name, fast_path in (("full", False), ("fast_path", True)):
+        settings.db_startup_fast_path = fast_path
+        # Record the fingerprint before timing the fast path
+        await start_once()
+        results[f"{name}.{args.collections}"] = min(
+            [await start_once() for _ in range(args.repeat)]
+        )
+    return results
+
+
+def git_revision() -> str | None:
+    """Return the current commit hash, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the per-case change between two result files."""
+    before = json.loads(Path(before_path).read_text())
+    after = json.loads(Path(after_path).read_text())
+    print(f"{before.get('git_revision')} -> {after.get('git_revision')}")
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            print(f"  {name:<20} {result['ms']:10.1f} ms   (new)")
+            continue
+        change = (result["ms"] - old["ms"]) / old["ms"] * 100
+        print(f"  {name:<20} {old['ms']:10.1f} -> {result['ms']:10.1f} ms   {change:+6.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collections", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3, help="timed starts, best is kept")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    output = Path(args.output).resolve() if args.output else None
+    with tempfile.TemporaryDirectory() as workdir:
+        # init_database resolves alembic.ini and sb_data/ from the working directory
+        shutil.copy(REPO_ROOT / "alembic.ini", workdir)
+        os.symlink(REPO_ROOT / "alembic", Path(workdir) / "alembic")
+        os.chdir(workdir)
+        os.environ["SNACKBASE_DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/sb_data/bench.db"
+        os.environ.setdefault("SNACKBASE_LOG_LEVEL", "WARNING")
+        timings = asyncio.run(run_cases(args))
+
+    results = {}
+    print(f"{args.collections} collections, best of {args.repeat} starts")
+    for name, seconds in timings.items():
+        results[name] = {"ms": round(seconds * 1000, 1)}
+        print(f"  {name:<20} {seconds * 1000:10.1f} ms")
+
+    if output:
+        document = {
+            "benchmark": "startup",
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "parameters": {"collections": args.collections, "repeat": args.repeat},
+            "results": results,
+        }
+        output.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
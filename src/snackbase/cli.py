@@ -656,6 +656,10 @@ def worker(queue: str | None, poll_interval: float | None) -> None:
             init_database,
         )
         from snackbase.infrastructure.services.job_service import JobWorker
+        from snackbase.infrastructure.workflows.workflow_queue import (
+            WORKFLOW_QUEUE,
+            WorkflowWorker,
+        )
 
         # Initialize database
         await init_database()
@@ -676,12 +680,22 @@ def worker(queue: str | None, poll_interval: float | None) -> None:
 
             effective_settings = _SettingsOverride()  # type: ignore[assignment]
 
-        job_worker = JobWorker(
-            session_factory=db_manager.session,
-            settings=effective_settings,
-            queue_filter=queue,
-        )
-        await job_worker.start()
+        # The "workflows" queue is always served by the WorkflowWorker so
+        # that its concurrency caps and fair scheduling apply.
+        workers: list[JobWorker] = []
+        if queue is None or queue == WORKFLOW_QUEUE:
+            workers.append(WorkflowWorker(db_manager.session, effective_settings))
+        if queue != WORKFLOW_QUEUE:
+            workers.append(
+                JobWorker(
+                    session_factory=db_manager.session,
+                    settings=effective_settings,
+                    queue_filter=queue,
+                    exclude_queues=[WORKFLOW_QUEUE] if queue is None else None,
+                )
+            )
+        for job_worker in workers:
+            await job_worker.start()
         logger.info(
             "Standalone job worker started",
             queue_filter=queue,
@@ -695,7 +709,8 @@ def worker(queue: str | None, poll_interval: float | None) -> None:
         except asyncio.CancelledError:
             pass
         finally:
-            await job_worker.stop()
+            for job_worker in workers:
+                await job_worker.stop()
             await db_manager.disconnect()
 
     click.echo("Starting SnackBase job worker... (Ctrl+C to stop)")
@@ -47,6 +47,21 @@ class Settings(BaseSettings):
     db_pool_timeout: int = 30
     db_pool_recycle: int = 3600
     db_echo: bool = False
+    db_startup_fast_path: bool = Field(
+        default=True,
+        description=(
+            "Skip migrations and seeding at startup when the schema fingerprint recorded by the "
+            "last full pass still matches (SNACKBASE_DB_STARTUP_FAST_PATH)"
+        ),
+    )
+    collection_ddl_mode: Literal["migrations", "direct"] = Field(
+        default="migrations",
+        description=(
+            "How collection tables are created and altered: by generating and applying Alembic "
+            "revision files, or by executing DDL directly in a transaction recorded in the "
+            "collection_schema_journal table (SNACKBASE_COLLECTION_DDL_MODE)"
+        ),
+    )
 
     # SQLite Performance Pragmas
     db_sqlite_journal_mode: str = "WAL"
@@ -73,6 +88,32 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 7
 
+    # Password Hashing Settings (Argon2id)
+    password_hash_time_cost: int = Field(
+        default=3,
+        description="Argon2 iterations per hash (SNACKBASE_PASSWORD_HASH_TIME_COST)",
+    )
+    password_hash_memory_cost: int = Field(
+        default=65536,
+        description="Argon2 memory per hash in KiB (SNACKBASE_PASSWORD_HASH_MEMORY_COST)",
+    )
+    password_hash_parallelism: int = Field(
+        default=4,
+        description="Argon2 lanes per hash (SNACKBASE_PASSWORD_HASH_PARALLELISM)",
+    )
+    password_hash_max_workers: int = Field(
+        default=4,
+        description="Threads dedicated to password hashing (SNACKBASE_PASSWORD_HASH_MAX_WORKERS)",
+    )
+    password_hash_max_pending: int = Field(
+        default=64,
+        description="Pending hash operations before requests are rejected with 429 (SNACKBASE_PASSWORD_HASH_MAX_PENDING)",
+    )
+    saml_verify_max_workers: int = Field(
+        default=2,
+        description="Threads dedicated to SAML signature verification (SNACKBASE_SAML_VERIFY_MAX_WORKERS)",
+    )
+
     # CORS Settings
     cors_origins: list[str] = Field(default=["http://localhost:3000", "http://localhost:8000", "http://localhost:5173"])
     cors_allow_credentials: bool = True
@@ -83,10 +124,35 @@ class Settings(BaseSettings):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     log_format: Literal["json", "console"] = "json"
     log_file: str | None = None
+    query_profiling_enabled: bool = Field(
+        default=True,
+        description=(
+            "Count SQL statements per request and report them in the request log, the "
+            "Server-Timing header and /admin/profiling (SNACKBASE_QUERY_PROFILING_ENABLED)"
+        ),
+    )
+
+    # Metrics Settings
+    metrics_enabled: bool = Field(
+        default=False,
+        description=(
+            "Serve Prometheus-format metrics at /metrics; off by default since they "
+            "describe the deployment's traffic and internals (SNACKBASE_METRICS_ENABLED)"
+        ),
+    )
+    metrics_token: str | None = Field(
+        default=None,
+        description=(
+            "Bearer token required to scrape /metrics; unset leaves the endpoint open, so "
+            "restrict it at the network level instead (SNACKBASE_METRICS_TOKEN)"
+        ),
+    )
 
     # File Storage Settings
     storage_path: str = "./sb_data/files"
     max_file_size: int = 10 * 1024 * 1024  # 10MB in bytes
+    storage_chunk_size: int = 1024 * 1024  # 1MB read/write chunk for streamed file I/O
+    s3_multipart_part_size: int = 8 * 1024 * 1024  # 8MB; S3 requires at least 5MB per part
     allowed_mime_types: list[str] = Field(
         default=[
             "image/jpeg",
@@ -98,6 +164,13 @@ class Settings(BaseSettings):
             "application/json",
         ]
     )
+    storage_provider_cache_ttl_seconds: int = Field(
+        default=300,
+        description=(
+            "Seconds a resolved storage provider is reused per worker; storage configuration "
+            "changes invalidate it earlier, 0 disables the cache (SNACKBASE_STORAGE_PROVIDER_CACHE_TTL_SECONDS)"
+        ),
+    )
 
     # Rate Limiting Settings
     rate_limit_enabled: bool = False
@@ -106,6 +179,26 @@ class Settings(BaseSettings):
     rate_limit_burst: int = 10
     rate_limit_authenticated_per_minute: int = 120
     rate_limit_endpoints: dict[str, int] = Field(default_factory=dict)
+    rate_limit_backend: Literal["memory", "database", "file"] = Field(
+        default="memory",
+        description=(
+            "Where token buckets live: per-worker memory, the application database "
+            "(shared by all workers and hosts) or a SQLite file shared by the workers "
+            "of one host (SNACKBASE_RATE_LIMIT_BACKEND)"
+        ),
+    )
+    rate_limit_file_path: str = Field(
+        default="./sb_data/rate_limits.db",
+        description="SQLite file used by the file rate limit backend (SNACKBASE_RATE_LIMIT_FILE_PATH)",
+    )
+    rate_limit_bucket_idle_seconds: int = Field(
+        default=3600,
+        description="Seconds after which an unused shared rate limit bucket is deleted (SNACKBASE_RATE_LIMIT_BUCKET_IDLE_SECONDS)",
+    )
+    rate_limit_cleanup_interval_seconds: int = Field(
+        default=300,
+        description="How often each worker deletes idle shared rate limit buckets (SNACKBASE_RATE_LIMIT_CLEANUP_INTERVAL_SECONDS)",
+    )
 
     # Superadmin Settings
     superadmin_email: str | None = Field(
@@ -177,12 +270,79 @@ class Settings(BaseSettings):
         description="Maximum nesting depth for ?expand= reference expansion",
     )
 
+    # Record HTTP Caching Settings
+    records_public_cache_max_age: int = Field(
+        default=0,
+        description=(
+            "max-age in seconds of the Cache-Control header sent with anonymous record "
+            "responses of collections with a public rule; shared caches revalidate with the "
+            "ETag once it expires (SNACKBASE_RECORDS_PUBLIC_CACHE_MAX_AGE)"
+        ),
+    )
+
+    # Record Delta Sync Settings
+    record_sync_tombstone_retention_days: int = Field(
+        default=30,
+        description=(
+            "Days the delta-sync feed keeps tombstones of deleted records; clients whose "
+            "watermark is older must resync from scratch "
+            "(SNACKBASE_RECORD_SYNC_TOMBSTONE_RETENTION_DAYS)"
+        ),
+    )
+    record_sync_max_page_size: int = Field(
+        default=1000,
+        description="Maximum records per delta-sync page (SNACKBASE_RECORD_SYNC_MAX_PAGE_SIZE)",
+    )
+
+    # Aggregation Settings
+    aggregate_cache_ttl_seconds: int = Field(
+        default=30,
+        description=(
+            "Seconds an /aggregate result is cached per worker; writes to the collection "
+            "invalidate it earlier, 0 disables the cache (SNACKBASE_AGGREGATE_CACHE_TTL_SECONDS)"
+        ),
+    )
+    aggregate_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum cached /aggregate results per worker (SNACKBASE_AGGREGATE_CACHE_MAX_ENTRIES)",
+    )
+    aggregate_rollups_enabled: bool = Field(
+        default=False,
+        description=(
+            "Maintain materialized count/sum rollups on record writes and answer matching "
+            "/aggregate queries from them; rebuild rollups after turning this on "
+            "(SNACKBASE_AGGREGATE_ROLLUPS_ENABLED)"
+        ),
+    )
+
     # Batch Operations Settings
     batch_max_size: int = Field(
         default=100,
         description="Maximum records per batch create/update/delete (SNACKBASE_BATCH_MAX_SIZE)",
     )
 
+    # OAuth Provider HTTP Settings
+    oauth_http_timeout_seconds: float = Field(
+        default=10.0,
+        description="Timeout for OAuth provider requests in seconds (SNACKBASE_OAUTH_HTTP_TIMEOUT_SECONDS)",
+    )
+    oauth_http_connect_timeout_seconds: float = Field(
+        default=5.0,
+        description="Connect timeout for OAuth provider requests in seconds (SNACKBASE_OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS)",
+    )
+    oauth_http_max_connections: int = Field(
+        default=100,
+        description="Maximum pooled connections to OAuth providers (SNACKBASE_OAUTH_HTTP_MAX_CONNECTIONS)",
+    )
+    oauth_http_max_keepalive_connections: int = Field(
+        default=20,
+        description="Idle connections kept open to OAuth providers (SNACKBASE_OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS)",
+    )
+    oauth_metadata_cache_ttl_seconds: int = Field(
+        default=3600,
+        description="Cache lifetime of provider discovery documents and JWKS keys in seconds (SNACKBASE_OAUTH_METADATA_CACHE_TTL_SECONDS)",
+    )
+
     # Webhook Settings
     max_webhooks_per_account: int = Field(
         default=20,
@@ -220,11 +380,64 @@ class Settings(BaseSettings):
         default=30.0,
         description="Scheduler poll interval in seconds (SNACKBASE_SCHEDULER_POLL_INTERVAL)",
     )
+    dashboard_stats_reconcile_interval: float = Field(
+        default=900.0,
+        description=(
+            "Seconds between scheduler recounts of the dashboard record and storage "
+            "counters, 0 disables (SNACKBASE_DASHBOARD_STATS_RECONCILE_INTERVAL)"
+        ),
+    )
     max_scheduled_hooks_per_account: int = Field(
         default=10,
         description="Maximum schedule-type hooks per account (SNACKBASE_MAX_SCHEDULED_HOOKS_PER_ACCOUNT)",
     )
 
+    # Event Outbox Settings
+    event_outbox_enabled: bool = Field(
+        default=False,
+        description=(
+            "Record webhook, hook and workflow events in the event_outbox table in the "
+            "record's transaction and deliver them from a background relay; realtime events "
+            "are still published by the writing process (SNACKBASE_EVENT_OUTBOX_ENABLED)"
+        ),
+    )
+    event_outbox_batch_size: int = Field(
+        default=100,
+        description="Outbox events claimed and delivered per relay batch (SNACKBASE_EVENT_OUTBOX_BATCH_SIZE)",
+    )
+    event_outbox_delivery_concurrency: int = Field(
+        default=10,
+        description="Outbox events the relay delivers concurrently (SNACKBASE_EVENT_OUTBOX_DELIVERY_CONCURRENCY)",
+    )
+    event_outbox_poll_interval: float = Field(
+        default=1.0,
+        description=(
+            "Seconds the relay waits for new outbox events when idle; commits in the same "
+            "process wake it immediately (SNACKBASE_EVENT_OUTBOX_POLL_INTERVAL)"
+        ),
+    )
+    event_outbox_lease_seconds: int = Field(
+        default=60,
+        description=(
+            "Seconds a claimed outbox event is hidden from other relays before it is "
+            "redelivered (SNACKBASE_EVENT_OUTBOX_LEASE_SECONDS)"
+        ),
+    )
+    event_outbox_max_attempts: int = Field(
+        default=10,
+        description=(
+            "Delivery attempts before an outbox event is parked for inspection "
+            "(SNACKBASE_EVENT_OUTBOX_MAX_ATTEMPTS)"
+        ),
+    )
+    event_outbox_retry_delay_seconds: float = Field(
+        default=5.0,
+        description=(
+            "Base delay before a failed outbox event is retried, doubled per attempt "
+            "(SNACKBASE_EVENT_OUTBOX_RETRY_DELAY_SECONDS)"
+        ),
+    )
+
     # Custom Endpoints Settings (F8.2)
     max_endpoints_per_account: int = Field(
         default=20,
@@ -234,6 +447,40 @@ class Settings(BaseSettings):
         default=30,
         description="Custom endpoint execution timeout in seconds (SNACKBASE_ENDPOINT_EXECUTION_TIMEOUT_SECONDS)",
     )
+    endpoint_route_cache_max_accounts: int = Field(
+        default=1024,
+        description="Accounts whose compiled custom endpoint routes are kept per worker (SNACKBASE_ENDPOINT_ROUTE_CACHE_MAX_ACCOUNTS)",
+    )
+
+    # Workflow Engine Settings (F8.3)
+    workflow_worker_concurrency: int = Field(
+        default=10,
+        description="Maximum workflow instances executing at once per worker process (SNACKBASE_WORKFLOW_WORKER_CONCURRENCY)",
+    )
+    workflow_max_concurrent_per_account: int = Field(
+        default=5,
+        description="Maximum running workflow instances per account (SNACKBASE_WORKFLOW_MAX_CONCURRENT_PER_ACCOUNT)",
+    )
+    workflow_max_concurrent_per_workflow: int = Field(
+        default=3,
+        description="Maximum running instances of a single workflow (SNACKBASE_WORKFLOW_MAX_CONCURRENT_PER_WORKFLOW)",
+    )
+    workflow_max_queued_per_account: int = Field(
+        default=1000,
+        description="Maximum queued workflow runs per account before new triggers are rejected (SNACKBASE_WORKFLOW_MAX_QUEUED_PER_ACCOUNT)",
+    )
+    workflow_defer_seconds: int = Field(
+        default=5,
+        description="Delay before retrying a workflow run deferred by a concurrency cap (SNACKBASE_WORKFLOW_DEFER_SECONDS)",
+    )
+    workflow_max_parallel_branches: int = Field(
+        default=5,
+        description="Maximum branches of a parallel step executing at once (SNACKBASE_WORKFLOW_MAX_PARALLEL_BRANCHES)",
+    )
+    workflow_max_loop_items: int = Field(
+        default=1000,
+        description="Maximum items a loop step may iterate over (SNACKBASE_WORKFLOW_MAX_LOOP_ITEMS)",
+    )
 
     @field_validator("cors_origins", mode="before")
     @classmethod
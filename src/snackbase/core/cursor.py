@@ -1,49 +1,308 @@
-"""Cursor utilities for cursor-based pagination."""
+"""Cursor utilities for cursor-based pagination.
+
+A cursor has the form ``<payload>.<signature>``. The base64url JSON payload
+holds the boundary record's sort value tagged with its type, its ID, the sort
+field and direction the cursor was issued for, and a fingerprint of the
+collection schema. The signature is an HMAC-SHA256 of the payload keyed by
+the application secret, so clients cannot forge or alter cursors, and the
+type tag lets the sort value be bound with its native type (e.g. datetimes
+on PostgreSQL) rather than as a string.
+
+Delta-sync watermarks use the same format under their own signing prefix,
+so a cursor cannot be passed off as a watermark or the other way round.
+"""
 
 import base64
+import hashlib
+import hmac
 import json
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
+from snackbase.core.config import get_settings
+
+# Bumped whenever the payload layout changes
+CURSOR_VERSION = 1
+
+WATERMARK_VERSION = 1
+
+# Domain separation so cursor signatures cannot be replayed as other HMACs
+_SIGNING_PREFIX = b"snackbase.cursor."
+_WATERMARK_SIGNING_PREFIX = b"snackbase.watermark."
+
 
 class CursorError(Exception):
     """Raised when cursor is invalid or malformed."""
 
 
-def encode_cursor(sort_value: Any, record_id: str) -> str:
-    """Encode a cursor from sort value and record ID.
+@dataclass(frozen=True)
+class CursorScope:
+    """The listing a cursor belongs to.
+
+    Attributes:
+        sort_field: Field the listing is sorted by.
+        descending: Whether the sort is descending.
+        schema_version: Fingerprint of the collection schema.
+    """
+
+    sort_field: str
+    descending: bool
+    schema_version: str
+
+
+def schema_version(schema: list[dict[str, Any]]) -> str:
+    """Fingerprint a collection schema.
 
     Args:
-        sort_value: The value of the sort field for this record
+        schema: Collection schema (list of field definitions).
+
+    Returns:
+        A short hex digest that changes whenever the schema does.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: str, secret: str, prefix: bytes = _SIGNING_PREFIX) -> str:
+    digest = hmac.new(secret.encode(), prefix + payload.encode(), hashlib.sha256)
+    return _b64encode(digest.digest())
+
+
+def _dump_value(value: Any) -> tuple[str, Any]:
+    """Tag a sort value with its type for a JSON round trip."""
+    # bool is checked before int, which it subclasses
+    if value is None:
+        return "null", None
+    if isinstance(value, bool):
+        return "bool", value
+    if isinstance(value, int):
+        return "int", value
+    if isinstance(value, float):
+        return "float", value
+    if isinstance(value, Decimal):
+        return "decimal", str(value)
+    if isinstance(value, datetime):
+        return "datetime", value.isoformat()
+    if isinstance(value, date):
+        return "date", value.isoformat()
+    return "str", str(value)
+
+
+def _load_value(type_tag: str, raw: Any) -> Any:
+    """Rebuild a sort value from its type tag."""
+    if type_tag == "null" and raw is None:
+        return None
+    if type_tag == "bool" and isinstance(raw, bool):
+        return raw
+    if type_tag == "int" and isinstance(raw, int) and not isinstance(raw, bool):
+        return raw
+    if type_tag == "float" and isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        return float(raw)
+    if type_tag == "str" and isinstance(raw, str):
+        return raw
+    try:
+        if type_tag == "decimal" and isinstance(raw, str):
+            return Decimal(raw)
+        if type_tag == "datetime" and isinstance(raw, str):
+            return datetime.fromisoformat(raw)
+        if type_tag == "date" and isinstance(raw, str):
+            return date.fromisoformat(raw)
+    except (ValueError, InvalidOperation) as e:
+        raise CursorError(f"Invalid cursor value: {e}") from e
+    raise CursorError(f"Invalid cursor value of type '{type_tag}'")
+
+
+def encode_cursor(
+    sort_value: Any,
+    record_id: str,
+    scope: CursorScope,
+    secret: str | None = None,
+) -> str:
+    """Encode a signed cursor from sort value and record ID.
+
+    Args:
+        sort_value: The value of the sort field for this record, as returned
+            by the database driver.
         record_id: The record ID (used as tie-breaker)
+        scope: Sort and schema the cursor is issued for.
+        secret: Signing key; defaults to the application secret key.
 
     Returns:
-        Base64-encoded cursor string
+        Signed cursor string
     """
+    type_tag, value = _dump_value(sort_value)
     cursor_data = {
-        "sort_value": sort_value,
+        "v": CURSOR_VERSION,
+        "f": scope.sort_field,
+        "d": "desc" if scope.descending else "asc",
+        "s": scope.schema_version,
+        "t": type_tag,
+        "sv": value,
         "id": record_id,
     }
-    json_str = json.dumps(cursor_data, separators=(",", ":"), default=str)
-    return base64.urlsafe_b64encode(json_str.encode()).decode()
+    payload = _b64encode(json.dumps(cursor_data, separators=(",", ":")).encode())
+    return f"{payload}.{_sign(payload, secret or get_settings().secret_key)}"
 
 
-def decode_cursor(cursor: str) -> tuple[Any, str]:
-    """Decode a cursor to get sort value and record ID.
+def decode_cursor(
+    cursor: str,
+    scope: CursorScope,
+    secret: str | None = None,
+) -> tuple[Any, str]:
+    """Verify a cursor and decode its sort value and record ID.
 
     Args:
-        cursor: Base64-encoded cursor string
+        cursor: Signed cursor string
+        scope: Sort and schema of the current request; the cursor must have
+            been issued for the same.
+        secret: Signing key; defaults to the application secret key.
 
     Returns:
-        Tuple of (sort_value, record_id)
+        Tuple of (sort_value, record_id), with the sort value in its
+        original type.
 
     Raises:
-        CursorError: If cursor is invalid
+        CursorError: If the cursor is malformed, its signature does not
+            match, or it was issued for a different sort or schema.
     """
+    payload, sep, signature = cursor.partition(".")
+    if not sep or not payload or not signature:
+        raise CursorError("Invalid cursor format")
+
+    expected = _sign(payload, secret or get_settings().secret_key)
+    if not hmac.compare_digest(signature.encode(), expected.encode()):
+        raise CursorError("Invalid cursor signature")
+
     try:
-        json_str = base64.urlsafe_b64decode(cursor.encode()).decode()
-        cursor_data = json.loads(json_str)
-        sort_value = cursor_data["sort_value"]
+        cursor_data = json.loads(_b64decode(payload))
+        version = cursor_data["v"]
+        sort_field = cursor_data["f"]
+        direction = cursor_data["d"]
+        cursor_schema = cursor_data["s"]
+        type_tag = cursor_data["t"]
+        raw_value = cursor_data["sv"]
         record_id = cursor_data["id"]
-        return sort_value, record_id
     except (ValueError, KeyError, TypeError) as e:
-        raise CursorError(f"Invalid cursor format: {e}") from e
\ No newline at end of file
+        raise CursorError(f"Invalid cursor format: {e}") from e
+
+    if version != CURSOR_VERSION:
+        raise CursorError("Unsupported cursor version")
+    if sort_field != scope.sort_field or direction != ("desc" if scope.descending else "asc"):
+        raise CursorError("Cursor was issued for a different sort order")
+    if cursor_schema != scope.schema_version:
+        raise CursorError("Cursor was issued for a different collection schema")
+    if not isinstance(record_id, str):
+        raise CursorError("Invalid cursor record ID")
+
+    return _load_value(type_tag, raw_value), record_id
+
+
+@dataclass(frozen=True)
+class SyncWatermark:
+    """Position of a client in the delta sync of a collection.
+
+    Attributes:
+        collection_id: ID of the collection (changes when it is recreated).
+        account_id: Account the sync is scoped to.
+        seq: Changes up to this sequence number have been returned.
+        issued_at: When ``seq`` was read; tombstones older than the retention
+            period may be gone, so older watermarks expire.
+        snapshot_after: While the initial snapshot is paged, the
+            ``(created_at, id)`` of the last record returned; None once
+            the snapshot is complete.
+    """
+
+    collection_id: str
+    account_id: str | None
+    seq: int
+    issued_at: datetime
+    snapshot_after: tuple[Any, str] | None = None
+
+
+def encode_watermark(watermark: SyncWatermark, secret: str | None = None) -> str:
+    """Encode a signed delta-sync watermark.
+
+    Args:
+        watermark: The sync position.
+        secret: Signing key; defaults to the application secret key.
+
+    Returns:
+        Signed watermark string
+    """
+    data: dict[str, Any] = {
+        "v": WATERMARK_VERSION,
+        "c": watermark.collection_id,
+        "a": watermark.account_id,
+        "q": watermark.seq,
+        "i": watermark.issued_at.astimezone(UTC).isoformat(),
+    }
+    if watermark.snapshot_after is not None:
+        sort_value, record_id = watermark.snapshot_after
+        type_tag, value = _dump_value(sort_value)
+        data["t"], data["sv"], data["id"] = type_tag, value, record_id
+    payload = _b64encode(json.dumps(data, separators=(",", ":")).encode())
+    signature = _sign(payload, secret or get_settings().secret_key, _WATERMARK_SIGNING_PREFIX)
+    return f"{payload}.{signature}"
+
+
+def decode_watermark(token: str, secret: str | None = None) -> SyncWatermark:
+    """Verify a delta-sync watermark and decode it.
+
+    Args:
+        token: Signed watermark string
+        secret: Signing key; defaults to the application secret key.
+
+    Returns:
+        The sync position. The caller checks that it belongs to the
+        collection and account being synced.
+
+    Raises:
+        CursorError: If the watermark is malformed or its signature does not
+            match.
+    """
+    payload, sep, signature = token.partition(".")
+    if not sep or not payload or not signature:
+        raise CursorError("Invalid watermark format")
+
+    expected = _sign(payload, secret or get_settings().secret_key, _WATERMARK_SIGNING_PREFIX)
+    if not hmac.compare_digest(signature.encode(), expected.encode()):
+        raise CursorError("Invalid watermark signature")
+
+    try:
+        data = json.loads(_b64decode(payload))
+        version = data["v"]
+        collection_id = data["c"]
+        account_id = data["a"]
+        seq = data["q"]
+        issued_at = datetime.fromisoformat(data["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise CursorError(f"Invalid watermark format: {e}") from e
+
+    if version != WATERMARK_VERSION:
+        raise CursorError("Unsupported watermark version")
+    if not isinstance(seq, int) or isinstance(seq, bool) or seq < 0:
+        raise CursorError("Invalid watermark sequence number")
+
+    snapshot_after = None
+    if "id" in data:
+        if not isinstance(data["id"], str):
+            raise CursorError("Invalid watermark record ID")
+        snapshot_after = (_load_value(data.get("t"), data.get("sv")), data["id"])
+
+    return SyncWatermark(
+        collection_id=collection_id,
+        account_id=account_id,
+        seq=seq,
+        issued_at=issued_at,
+        snapshot_after=snapshot_after,
+    )
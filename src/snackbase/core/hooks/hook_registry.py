@@ -11,11 +11,13 @@ IMPORTANT: This is a STABLE API. Changes to the registration interface
 """
 
 import asyncio
+import time
 import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
 from snackbase.core.logging import get_logger
+from snackbase.core.metrics import HOOK_DURATION
 from snackbase.domain.entities.hook_context import (
     AbortHookException,
     HookContext,
@@ -258,48 +260,52 @@ class HookRegistry:
         )
 
         # Execute hooks in order
+        started = time.perf_counter()
         current_data = data
-        for hook in sorted_hooks:
-            try:
-                # Call the hook
-                hook_result = await self._execute_hook(hook, event, current_data, context)
-
-                # Update data if hook returned modified data
-                if hook_result is not None and isinstance(hook_result, dict):
-                    current_data = hook_result
-                    result.data = current_data
-
-            except AbortHookException as e:
-                # Hook wants to abort the operation
-                logger.info(
-                    "Hook aborted operation",
-                    hook_id=hook.id,
-                    hook_event=event,
-                    message=e.message,
-                    status_code=e.status_code,
-                )
-                result.success = False
-                result.aborted = True
-                result.abort_message = e.message
-                result.abort_status_code = e.status_code
-                return result
-
-            except Exception as e:
-                # Log error but continue (unless stop_on_error)
-                error_msg = f"Hook {hook.id} failed: {str(e)}"
-                logger.error(
-                    "Hook execution failed",
-                    hook_id=hook.id,
-                    hook_event=event,
-                    error=str(e),
-                    stop_on_error=hook.stop_on_error,
-                )
-                result.errors.append(error_msg)
-
-                if hook.stop_on_error:
+        try:
+            for hook in sorted_hooks:
+                try:
+                    # Call the hook
+                    hook_result = await self._execute_hook(hook, event, current_data, context)
+
+                    # Update data if hook returned modified data
+                    if hook_result is not None and isinstance(hook_result, dict):
+                        current_data = hook_result
+                        result.data = current_data
+
+                except AbortHookException as e:
+                    # Hook wants to abort the operation
+                    logger.info(
+                        "Hook aborted operation",
+                        hook_id=hook.id,
+                        hook_event=event,
+                        message=e.message,
+                        status_code=e.status_code,
+                    )
                     result.success = False
+                    result.aborted = True
+                    result.abort_message = e.message
+                    result.abort_status_code = e.status_code
                     return result
 
+                except Exception as e:
+                    # Log error but continue (unless stop_on_error)
+                    error_msg = f"Hook {hook.id} failed: {str(e)}"
+                    logger.error(
+                        "Hook execution failed",
+                        hook_id=hook.id,
+                        hook_event=event,
+                        error=str(e),
+                        stop_on_error=hook.stop_on_error,
+                    )
+                    result.errors.append(error_msg)
+
+                    if hook.stop_on_error:
+                        result.success = False
+                        return result
+        finally:
+            HOOK_DURATION.observe(time.perf_counter() - started, event=event)
+
         return result
 
     async def _execute_hook(
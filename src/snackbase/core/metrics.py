@@ -0,0 +1,396 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+A small, dependency-free registry of counters, gauges and histograms. Metric
+updates are a dict lookup and a few additions under a lock, so they are cheap
+enough to leave on in production. Values that are only meaningful at scrape
+time (pool utilization, connection counts, queue depth) are read by
+collectors registered on the registry and rendered together with the
+instrumented metrics at ``/metrics``.
+
+Example:
+    from snackbase.core.metrics import JOB_DURATION
+
+    JOB_DURATION.observe(0.25, handler="send_email", outcome="completed")
+"""
+
+import math
+import threading
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import Any
+
+from snackbase.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond to half a minute
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# A sample produced at scrape time: (metric name, labels, value)
+Sample = tuple[str, dict[str, str], float]
+
+Collector = Callable[[], Awaitable[Iterable[Sample]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class of labelled metrics."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def render(self) -> list[str]:
+        """Render the metric in the text exposition format."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Discard all recorded values."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A monotonically increasing value per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: Non-negative amount to add.
+            **labels: Label values, one per label name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            labels = dict(zip(self.labelnames, key, strict=True))
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets per label set."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: The observed value (seconds for latency histograms).
+            **labels: Label values, one per label name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = entry
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations for a label set."""
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        for key, counts, total in items:
+            labels = dict(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """A value read at scrape time from a registry collector.
+
+    Gauges are declared up front so that HELP/TYPE lines are stable; their
+    samples come from the ``Collector`` callables registered on the registry.
+    """
+
+    type_name = "gauge"
+
+    def render_samples(self, samples: list[tuple[dict[str, str], float]]) -> list[str]:
+        """Render collected samples of this gauge."""
+        lines = self._header()
+        for labels, value in samples:
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+    def render(self) -> list[str]:
+        return self.render_samples([])
+
+    def clear(self) -> None:
+        pass
+
+
+class MetricsRegistry:
+    """Registry of the process's metrics and scrape-time collectors."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Collector] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Declare a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Declare a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Declare a gauge whose samples are produced by a collector."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """Register (or replace) a scrape-time collector.
+
+        Args:
+            name: Unique collector name, e.g. ``db_pool``.
+            collector: Async callable returning ``(metric, labels, value)``
+                samples for declared gauges.
+        """
+        self._collectors[name] = collector
+
+    def unregister_collector(self, name: str) -> None:
+        """Remove a scrape-time collector if registered."""
+        self._collectors.pop(name, None)
+
+    async def render(self) -> str:
+        """Run the collectors and render every metric.
+
+        A failing collector only drops its own samples.
+
+        Returns:
+            The metrics in the Prometheus text exposition format.
+        """
+        gauge_samples: dict[str, list[tuple[dict[str, str], float]]] = {}
+        for name, collector in list(self._collectors.items()):
+            try:
+                samples = list(await collector())
+            except Exception as e:
+                logger.warning("Metrics collector failed", collector=name, error=str(e))
+                continue
+            for metric_name, labels, value in samples:
+                gauge_samples.setdefault(metric_name, []).append((labels, value))
+
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            if isinstance(metric, Gauge):
+                lines.extend(metric.render_samples(gauge_samples.get(metric.name, [])))
+            else:
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Discard all recorded counter and histogram values."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+HTTP_REQUEST_DURATION = _registry.histogram(
+    "snackbase_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+DB_POOL_CHECKOUT_WAIT = _registry.histogram(
+    "snackbase_db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the database pool.",
+)
+DB_POOL_CONNECTIONS = _registry.gauge(
+    "snackbase_db_pool_connections",
+    "Database pool connections by state (checked_out, idle, overflow) and the pool capacity.",
+    ("state",),
+)
+DB_POOL_UTILIZATION = _registry.gauge(
+    "snackbase_db_pool_utilization",
+    "Checked-out connections as a fraction of pool size plus max overflow.",
+)
+JOB_QUEUE_DEPTH = _registry.gauge(
+    "snackbase_job_queue_depth",
+    "Jobs waiting to run (pending or retrying) per queue.",
+    ("queue",),
+)
+JOB_QUEUE_OLDEST_AGE = _registry.gauge(
+    "snackbase_job_queue_oldest_age_seconds",
+    "Age of the oldest waiting job per queue.",
+    ("queue",),
+)
+JOB_DURATION = _registry.histogram(
+    "snackbase_job_duration_seconds",
+    "Job handler execution time by handler and outcome.",
+    ("handler", "outcome"),
+)
+WEBHOOK_DELIVERY_DURATION = _registry.histogram(
+    "snackbase_webhook_delivery_duration_seconds",
+    "Webhook HTTP delivery latency by outcome (delivered, failed).",
+    ("outcome",),
+)
+REALTIME_CONNECTIONS = _registry.gauge(
+    "snackbase_realtime_connections",
+    "Open realtime connections by transport.",
+    ("transport",),
+)
+REALTIME_SUBSCRIPTIONS = _registry.gauge(
+    "snackbase_realtime_subscriptions",
+    "Active realtime subscriptions.",
+)
+REALTIME_OUTBOUND_QUEUE_DEPTH = _registry.gauge(
+    "snackbase_realtime_outbound_queue_depth",
+    "Events waiting to be sent to realtime clients.",
+)
+HOOK_DURATION = _registry.histogram(
+    "snackbase_hook_duration_seconds",
+    "Hook chain execution time per event.",
+    ("event",),
+)
+OUTBOX_DEPTH = _registry.gauge(
+    "snackbase_outbox_depth",
+    "Outbox events waiting for delivery, and those parked after exhausting their attempts.",
+    ("state",),
+)
+OUTBOX_OLDEST_AGE = _registry.gauge(
+    "snackbase_outbox_oldest_age_seconds",
+    "Age of the oldest outbox event waiting for delivery.",
+)
+OUTBOX_EVENTS = _registry.counter(
+    "snackbase_outbox_events_total",
+    "Outbox events processed by the relay by outcome (delivered, retried, parked).",
+    ("outcome",),
+)
+OUTBOX_DELIVERY_LATENCY = _registry.histogram(
+    "snackbase_outbox_delivery_latency_seconds",
+    "Time from writing an outbox event to its delivery by the relay.",
+)
+PASSWORD_HASH_TASKS = _registry.gauge(
+    "snackbase_password_hash_tasks",
+    "Password hashing operations running on the pool or queued for a worker.",
+    ("state",),
+)
+PASSWORD_HASH_LIMIT = _registry.gauge(
+    "snackbase_password_hash_limit",
+    "Configured hashing pool workers and maximum pending operations.",
+    ("limit",),
+)
+PASSWORD_HASH_REJECTED = _registry.counter(
+    "snackbase_password_hash_rejected_total",
+    "Password hashing operations refused because too many were pending.",
+)
@@ -21,6 +21,12 @@ ORDERABLE_TYPES = {"number", "date", "datetime", "text", "email", "url"}
 # System fields that can be used in GROUP BY without being in the schema
 SYSTEM_GROUPABLE_FIELDS = {"id", "account_id", "created_at", "updated_at", "created_by", "updated_by"}
 
+# Types allowed as GROUP BY keys of a materialized rollup (exact-match values)
+ROLLUP_GROUPABLE_TYPES = {"text", "email", "url", "reference", "boolean"}
+
+# System fields allowed as GROUP BY keys of a materialized rollup
+ROLLUP_SYSTEM_GROUPABLE_FIELDS = {"created_by", "updated_by"}
+
 # Regex to parse a single aggregation token like count(), sum(price), avg(field_name)
 _AGG_TOKEN_RE = re.compile(r"^\s*(\w+)\(\s*(\w*)\s*\)\s*$", re.IGNORECASE)
 
@@ -201,6 +207,54 @@ def validate_group_by(
     return result
 
 
+def validate_rollup_definition(
+    group_by: list[str],
+    sum_fields: list[str],
+    schema_lookup: dict[str, dict],
+) -> None:
+    """Validate the fields of a materialized rollup definition.
+
+    Rollups group by low-cardinality, exact-match fields and maintain
+    count() plus sum() of number fields.
+
+    Args:
+        group_by: Field names the rollup groups by.
+        sum_fields: Number fields whose sums the rollup maintains.
+        schema_lookup: mapping of field name → field definition dict from collection schema.
+
+    Raises:
+        AggregationParseError: if a field is unknown, duplicated, or has an unsupported type.
+    """
+    if len(set(group_by)) != len(group_by) or len(set(sum_fields)) != len(sum_fields):
+        raise AggregationParseError("Rollup fields must not contain duplicates")
+
+    for field in group_by:
+        _validate_identifier(field)
+        if field in ROLLUP_SYSTEM_GROUPABLE_FIELDS:
+            continue
+        field_def = schema_lookup.get(field)
+        if field_def is None:
+            raise AggregationParseError(f"Field '{field}' not found in collection schema")
+        field_type = field_def.get("type", "text").lower()
+        if field_type not in ROLLUP_GROUPABLE_TYPES:
+            raise AggregationParseError(
+                f"Rollups cannot group by field '{field}' of type '{field_type}'. "
+                f"Supported types: {', '.join(sorted(ROLLUP_GROUPABLE_TYPES))}"
+            )
+
+    for field in sum_fields:
+        _validate_identifier(field)
+        field_def = schema_lookup.get(field)
+        if field_def is None:
+            raise AggregationParseError(f"Field '{field}' not found in collection schema")
+        field_type = field_def.get("type", "text").lower()
+        if field_type not in NUMERIC_TYPES:
+            raise AggregationParseError(
+                f"Rollup sum field '{field}' must be a number field, "
+                f"but has type '{field_type}'"
+            )
+
+
 def parse_having(
     having_str: str,
     alias_to_sql: dict[str, str],
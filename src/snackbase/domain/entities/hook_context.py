@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from starlette.requests import Request
 
     from snackbase.domain.entities.user import User
+    from snackbase.infrastructure.persistence.query_stats import QueryStats
 
 
 class AbortHookException(Exception):
@@ -52,6 +53,7 @@ class HookContext:
         account_id: The current account context ID.
         request_id: Correlation ID for logging and tracing.
         request: The FastAPI/Starlette Request object.
+        query_stats: SQL statement count and timing of the current request.
 
     Example:
         async def my_hook(event: str, data: dict, context: HookContext) -> dict:
@@ -68,6 +70,7 @@ class HookContext:
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
     user_name: Optional[str] = None
+    query_stats: Optional["QueryStats"] = None
 
     def __post_init__(self) -> None:
         """Validate context after initialization."""
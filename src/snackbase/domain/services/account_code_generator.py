@@ -33,6 +33,15 @@ class AccountCodeGenerator:
     # Letter range for code generation
     LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+    # Codes per letter pair (0000-9999)
+    CODES_PER_PAIR = 10_000
+
+    # Position of SY0000, the first code of the reserved SY block
+    _RESERVED_START = (18 * 26 + 24) * CODES_PER_PAIR
+
+    # Highest sequence number: every code after AA0000 except the SY block
+    MAX_SEQUENCE = 26 * 26 * CODES_PER_PAIR - 1 - CODES_PER_PAIR
+
     @classmethod
     def validate(cls, account_code: str) -> bool:
         """Validate that an account code matches the XX#### format.
@@ -106,7 +115,9 @@ class AccountCodeGenerator:
         """Generate a new unique account code.
 
         Generates the next available code by finding the highest existing code
-        and incrementing. If no existing codes, starts from AA0001.
+        and incrementing. If no existing codes, starts from AA0001. Account
+        creation uses ``AccountRepository.allocate_account_code`` instead,
+        which does not need every existing code.
 
         Thread-Safety:
             This method is a pure function and is inherently thread-safe.
@@ -155,6 +166,65 @@ class AccountCodeGenerator:
 
         return next_code
 
+    @classmethod
+    def from_sequence(cls, value: int) -> str:
+        """Map a sequence number to its account code in constant time.
+
+        Sequence numbers enumerate codes in the order ``generate`` hands them
+        out: 1 is AA0001, and the reserved SY block is skipped. Allocating
+        codes from a database-backed counter with this mapping avoids loading
+        every existing code.
+
+        Args:
+            value: Sequence number, starting at 1.
+
+        Returns:
+            The account code in XX#### format.
+
+        Raises:
+            ValueError: If the value is below 1.
+            AccountCodeExhaustedError: If the value is beyond the last code.
+
+        Examples:
+            >>> AccountCodeGenerator.from_sequence(1)
+            'AA0001'
+            >>> AccountCodeGenerator.from_sequence(10_000)
+            'AB0000'
+        """
+        if value < 1:
+            raise ValueError("Account code sequence numbers start at 1")
+        if value > cls.MAX_SEQUENCE:
+            raise AccountCodeExhaustedError()
+
+        position = value if value < cls._RESERVED_START else value + cls.CODES_PER_PAIR
+        pair, number = divmod(position, cls.CODES_PER_PAIR)
+        first_idx, second_idx = divmod(pair, 26)
+        return f"{cls.LETTERS[first_idx]}{cls.LETTERS[second_idx]}{number:04d}"
+
+    @classmethod
+    def to_sequence(cls, account_code: str) -> int:
+        """Map an account code to its sequence number.
+
+        The inverse of ``from_sequence``; AA0000 maps to 0.
+
+        Args:
+            account_code: Valid, non-reserved account code in XX#### format.
+
+        Returns:
+            The code's sequence number.
+
+        Raises:
+            ValueError: If the code is invalid or in the reserved SY block.
+        """
+        if not cls.validate(account_code) or account_code.startswith("SY"):
+            raise ValueError(f"Not an allocatable account code: {account_code!r}")
+
+        first_idx, second_idx, number = cls._code_sort_key(account_code)
+        position = (first_idx * 26 + second_idx) * cls.CODES_PER_PAIR + number
+        if position < cls._RESERVED_START:
+            return position
+        return position - cls.CODES_PER_PAIR
+
     @classmethod
     def _find_highest_code(cls, existing_codes: set[str]) -> str:
         """Find the highest code in the existing set.
@@ -10,7 +10,6 @@ from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from snackbase.domain.services.account_code_generator import AccountCodeGenerator
 from snackbase.infrastructure.persistence.models import AccountModel
 from snackbase.infrastructure.persistence.repositories import AccountRepository
 
@@ -47,8 +46,7 @@ class AccountService:
         account_id = str(uuid.uuid4())
 
         # Generate account code
-        existing_codes = await self.account_repo.get_all_account_codes()
-        account_code = AccountCodeGenerator.generate(existing_codes)
+        account_code = await self.account_repo.allocate_account_code()
 
         # Generate or validate slug
         if slug:
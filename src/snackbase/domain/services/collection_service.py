@@ -10,11 +10,25 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
 from snackbase.domain.services import CollectionValidationError, CollectionValidator
+from snackbase.infrastructure.persistence.aggregate_cache import (
+    get_aggregate_cache,
+    mark_collection_written,
+)
+from snackbase.infrastructure.persistence.direct_schema_service import DirectSchemaService
 from snackbase.infrastructure.persistence.migration_service import MigrationService
 from snackbase.infrastructure.persistence.models import CollectionModel
-from snackbase.infrastructure.persistence.repositories import CollectionRepository
+from snackbase.infrastructure.persistence.repositories import (
+    CollectionChangeCounterRepository,
+    CollectionRepository,
+    DashboardStatRepository,
+    RecordChangeRepository,
+)
+from snackbase.infrastructure.persistence.repositories.dashboard_stat_repository import (
+    record_count_key,
+)
 from snackbase.infrastructure.persistence.table_builder import TableBuilder
 
 logger = get_logger(__name__)
@@ -27,19 +41,25 @@ class CollectionService:
         self,
         session: AsyncSession,
         engine: AsyncEngine,
-        migration_service: MigrationService | None = None,
+        migration_service: MigrationService | DirectSchemaService | None = None,
     ) -> None:
         """Initialize the service.
 
         Args:
             session: SQLAlchemy async session.
             engine: SQLAlchemy async engine.
-            migration_service: Optional migration service.
+            migration_service: Optional migration service. Defaults to the
+                one selected by ``collection_ddl_mode``.
         """
         self.session = session
         self.engine = engine
         self.repository = CollectionRepository(session)
-        self.migration_service = migration_service or MigrationService(engine=engine)
+        if migration_service is None:
+            if get_settings().collection_ddl_mode == "direct":
+                migration_service = DirectSchemaService(engine)
+            else:
+                migration_service = MigrationService(engine=engine)
+        self.migration_service = migration_service
 
     async def create_collection(
         self,
@@ -295,6 +315,13 @@ class CollectionService:
 
         # Delete collection record
         await self.repository.delete(collection)
+        mark_collection_written(self.session, collection.name)
+        get_aggregate_cache().invalidate(collection.name)
+        await DashboardStatRepository(self.session).delete_keys(
+            [record_count_key(collection.name)]
+        )
+        await CollectionChangeCounterRepository(self.session).delete_collection(collection.name)
+        await RecordChangeRepository(self.session).delete_collection(collection.name)
 
         logger.info(
             "Collection record deleted",
@@ -4,6 +4,7 @@ Provides methods for collecting and aggregating dashboard metrics
 from various repositories.
 """
 
+import asyncio
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -12,6 +13,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.core.config import get_settings
+from snackbase.core.logging import get_logger
 from snackbase.infrastructure.api.schemas import (
     AuditLogResponse,
     DashboardStats,
@@ -19,13 +21,48 @@ from snackbase.infrastructure.api.schemas import (
     SystemHealthStats,
 )
 from snackbase.domain.services.audit_log_service import AuditLogService
+from snackbase.infrastructure.persistence.models import DashboardStatModel
 from snackbase.infrastructure.persistence.repositories import (
     AccountRepository,
     CollectionRepository,
+    DashboardStatRepository,
     RefreshTokenRepository,
     UserRepository,
 )
 from snackbase.infrastructure.persistence.repositories.collection_rule_repository import CollectionRuleRepository
+from snackbase.infrastructure.persistence.repositories.dashboard_stat_repository import (
+    RECORD_COUNT_PREFIX,
+    STORAGE_BYTES_KEY,
+    record_count_key,
+)
+from snackbase.infrastructure.persistence.table_builder import TableBuilder
+
+logger = get_logger(__name__)
+
+
+def measure_storage_bytes(storage_path: str | Path) -> int:
+    """Walk the local storage directory and sum file sizes.
+
+    This is blocking I/O proportional to the number of stored files; call it
+    from a worker thread.
+
+    Args:
+        storage_path: Root of the local storage directory.
+
+    Returns:
+        Total size of all files in bytes.
+    """
+    storage_path = Path(storage_path)
+    if not storage_path.exists():
+        return 0
+
+    total_size = 0
+    for dirpath, dirnames, filenames in os.walk(storage_path):
+        for filename in filenames:
+            filepath = os.path.join(dirpath, filename)
+            if os.path.exists(filepath):
+                total_size += os.path.getsize(filepath)
+    return total_size
 
 
 class DashboardService:
@@ -43,6 +80,7 @@ class DashboardService:
         self.collection_repo = CollectionRepository(session)
         self.collection_rule_repo = CollectionRuleRepository(session)
         self.refresh_token_repo = RefreshTokenRepository(session)
+        self.stat_repo = DashboardStatRepository(session)
         self.audit_log_service = AuditLogService(session)
 
     async def get_dashboard_stats(
@@ -64,7 +102,8 @@ class DashboardService:
         total_accounts = await self.account_repo.count_all()
         total_users = await self.user_repo.count_all()
         total_collections = await self.collection_repo.count_all()
-        total_records = await self._count_total_records()
+        stats = await self.stat_repo.get_all()
+        total_records = await self._count_total_records(stats)
 
         # Get growth metrics (last 7 days)
         new_accounts_7d = await self.account_repo.count_created_since(seven_days_ago)
@@ -85,7 +124,7 @@ class DashboardService:
         ]
 
         # Get system health
-        system_health = await self._get_system_health()
+        system_health = await self._get_system_health(stats)
 
         # Get public collections count
         public_collections_count = await self.collection_rule_repo.count_public_collections()
@@ -113,39 +152,67 @@ class DashboardService:
             active_sessions=active_sessions,
             public_collections_count=public_collections_count,
             recent_audit_logs=recent_audit_logs,
+            stats_updated_at=max((stat.updated_at for stat in stats.values()), default=None),
+            stats_reconciled_at=min(
+                (stat.reconciled_at for stat in stats.values() if stat.reconciled_at),
+                default=None,
+            ),
         )
 
-    async def _count_total_records(self) -> int:
+    async def _collection_names(self) -> list[str]:
+        """Return the names of all collections."""
+        collections = await self.session.execute(text("SELECT name FROM collections"))
+        return [row[0] for row in collections.fetchall()]
+
+    async def _count_table_rows(self, collection_name: str) -> int | None:
+        """Count a collection table's rows, or None if the table is unavailable."""
+        table_name = TableBuilder.generate_table_name(collection_name)
+        try:
+            result = await self.session.execute(text(f'SELECT COUNT(*) FROM "{table_name}"'))
+            return result.scalar_one()
+        except Exception:
+            # Table might not exist or other error, skip
+            return None
+
+    async def _count_total_records(self, stats: dict[str, DashboardStatModel]) -> int:
         """Count total records across all dynamic collection tables.
 
+        Uses the maintained per-collection counters. A collection without a
+        counter yet is counted once and its counter seeded.
+
+        Args:
+            stats: Current dashboard counters keyed by name.
+
         Returns:
             Total count of records.
         """
-        # Get all collections
-        collections = await self.session.execute(
-            text("SELECT name FROM collections")
-        )
-        collection_names = [row[0] for row in collections.fetchall()]
-
         total = 0
-        for collection_name in collection_names:
-            # Generate table name (same logic as TableBuilder)
-            table_name = f"col_{collection_name.lower().replace(' ', '_')}"
-            try:
-                result = await self.session.execute(
-                    text(f"SELECT COUNT(*) FROM {table_name}")
-                )
-                count = result.scalar_one()
-                total += count
-            except Exception:
-                # Table might not exist or other error, skip
+        seeded = False
+        for collection_name in await self._collection_names():
+            stat = stats.get(record_count_key(collection_name))
+            if stat is not None:
+                total += stat.value
                 continue
 
+            count = await self._count_table_rows(collection_name)
+            if count is None:
+                continue
+            await self.stat_repo.set_value(record_count_key(collection_name), count)
+            seeded = True
+            total += count
+
+        if seeded:
+            await self.session.commit()
         return total
 
-    async def _get_system_health(self) -> SystemHealthStats:
+    async def _get_system_health(
+        self, stats: dict[str, DashboardStatModel] | None = None
+    ) -> SystemHealthStats:
         """Get system health statistics.
 
+        Args:
+            stats: Current dashboard counters keyed by name.
+
         Returns:
             SystemHealthStats with database and storage info.
         """
@@ -157,31 +224,64 @@ class DashboardService:
             database_status = "disconnected"
 
         # Get storage usage
-        storage_usage_mb = self._get_storage_usage()
+        storage_usage_mb = await self._get_storage_usage(stats or {})
 
         return SystemHealthStats(
             database_status=database_status,
             storage_usage_mb=storage_usage_mb,
         )
 
-    def _get_storage_usage(self) -> float:
+    async def _get_storage_usage(self, stats: dict[str, DashboardStatModel]) -> float:
         """Get storage usage in MB.
 
+        Uses the maintained storage counter, measuring the storage directory
+        in a worker thread (and seeding the counter) only if it is missing.
+
+        Args:
+            stats: Current dashboard counters keyed by name.
+
         Returns:
             Storage usage in megabytes.
         """
-        settings = get_settings()
-        storage_path = Path(settings.storage_path)
-
-        if not storage_path.exists():
-            return 0.0
-
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(storage_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total_size += os.path.getsize(filepath)
+        stat = stats.get(STORAGE_BYTES_KEY)
+        if stat is not None:
+            total_size = stat.value
+        else:
+            total_size = await asyncio.to_thread(
+                measure_storage_bytes, get_settings().storage_path
+            )
+            await self.stat_repo.set_value(STORAGE_BYTES_KEY, total_size)
+            await self.session.commit()
 
         # Convert bytes to MB
         return round(total_size / (1024 * 1024), 2)
+
+    async def reconcile_stats(self) -> None:
+        """Recompute all dashboard counters from the source of truth.
+
+        Counts every collection table, measures the storage directory in a
+        worker thread, and drops counters of collections that no longer
+        exist. Run periodically by the background scheduler to correct drift
+        from writes that bypass the record hooks.
+        """
+        collection_names = await self._collection_names()
+        for collection_name in collection_names:
+            count = await self._count_table_rows(collection_name)
+            if count is not None:
+                await self.stat_repo.set_value(record_count_key(collection_name), count)
+
+        live_keys = {record_count_key(name) for name in collection_names}
+        stats = await self.stat_repo.get_all()
+        await self.stat_repo.delete_keys(
+            [key for key in stats if key.startswith(RECORD_COUNT_PREFIX) and key not in live_keys]
+        )
+
+        storage_bytes = await asyncio.to_thread(measure_storage_bytes, get_settings().storage_path)
+        await self.stat_repo.set_value(STORAGE_BYTES_KEY, storage_bytes)
+
+        await self.session.commit()
+        logger.info(
+            "Dashboard stats reconciled",
+            collections=len(collection_names),
+            storage_bytes=storage_bytes,
+        )
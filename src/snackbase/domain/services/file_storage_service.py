@@ -4,8 +4,10 @@ Handles file storage operations including saving, retrieving, and deleting files
 Files are stored in account-specific directories with UUID-based filenames.
 """
 
+import asyncio
 import json
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import BinaryIO
@@ -55,6 +57,23 @@ class FileMetadata:
         return cls.from_dict(json.loads(json_str))
 
 
+async def iter_file_chunks(
+    file_content: BinaryIO, chunk_size: int | None = None
+) -> AsyncIterator[bytes]:
+    """Yield a binary stream in fixed-size chunks.
+
+    Args:
+        file_content: The binary stream to read.
+        chunk_size: Bytes per chunk. Defaults to settings.storage_chunk_size.
+
+    Yields:
+        Successive chunks of the stream.
+    """
+    chunk_size = chunk_size or settings.storage_chunk_size
+    while chunk := file_content.read(chunk_size):
+        yield chunk
+
+
 class FileStorageService:
     """Service for managing file storage operations."""
 
@@ -155,8 +174,42 @@ class FileStorageService:
         Raises:
             ValueError: If file validation fails.
         """
-        # Validate file
+        # Reject oversized files before reading any content
         self.validate_file_size(size)
+
+        return await self.save_stream(
+            account_id=account_id,
+            chunks=iter_file_chunks(file_content),
+            filename=filename,
+            mime_type=mime_type,
+        )
+
+    async def save_stream(
+        self,
+        account_id: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        mime_type: str,
+    ) -> FileMetadata:
+        """Save a file to storage from a stream of chunks.
+
+        Chunks are written to disk as they arrive, off the event loop, so
+        memory use does not depend on the file size. The size limit is
+        enforced while streaming; a partially written file is removed if
+        validation or the stream fails.
+
+        Args:
+            account_id: The account ID.
+            chunks: Async iterator of file content chunks.
+            filename: Original filename.
+            mime_type: MIME type of the file.
+
+        Returns:
+            FileMetadata object with storage information.
+
+        Raises:
+            ValueError: If file validation fails.
+        """
         self.validate_mime_type(mime_type)
 
         # Get account directory and ensure it exists
@@ -167,9 +220,19 @@ class FileStorageService:
         unique_filename = self._generate_unique_filename(filename)
         file_path = account_dir / unique_filename
 
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content.read())
+        # Save file chunk by chunk
+        size = 0
+        f = await asyncio.to_thread(open, file_path, "wb")
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                self.validate_file_size(size)
+                await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            file_path.unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
 
         # Create relative path for storage (account_id/filename)
         relative_path = f"{account_id}/{unique_filename}"
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from snackbase.core.logging import get_logger
 from snackbase.domain.entities.password_reset import PasswordResetToken
-from snackbase.infrastructure.auth.password_hasher import hash_password
+from snackbase.infrastructure.auth.password_hasher import hash_password_async
 from snackbase.infrastructure.persistence.models.user import UserModel
 from snackbase.infrastructure.persistence.repositories.password_reset_repository import (
     PasswordResetRepository,
@@ -128,7 +128,7 @@ class PasswordResetService:
             return None
 
         # Update password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         await self.user_repo.update(user)
 
         # Mark token as used
@@ -212,7 +212,7 @@ class PasswordResetService:
             raise ValueError(f"User with ID {user_id} not found")
 
         # Update password
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         await self.user_repo.update(user)
 
         # Invalidate all existing reset tokens for this user
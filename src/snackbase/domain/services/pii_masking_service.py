@@ -4,6 +4,7 @@ Provides masking functions for different types of PII data based on user permiss
 """
 
 import re
+from collections.abc import Callable
 from typing import Any
 
 from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_ID
@@ -180,6 +181,28 @@ class PIIMaskingService:
         # This can be extended to support custom patterns in the future
         return cls.mask_full(value)
 
+    @classmethod
+    def masker_for(cls, mask_type: str) -> Callable[[str], str] | None:
+        """Resolve the masking function for a mask type once.
+
+        Lets callers masking a whole column skip the per-value dispatch done
+        by mask_value.
+
+        Args:
+            mask_type: Type of masking (email, ssn, phone, name, full, custom).
+
+        Returns:
+            Function taking the string value, or None for an unknown mask type.
+        """
+        return {
+            "email": cls.mask_email,
+            "ssn": cls.mask_ssn,
+            "phone": cls.mask_phone,
+            "name": cls.mask_name,
+            "full": cls.mask_full,
+            "custom": cls.mask_custom,
+        }.get(mask_type.lower())
+
     @classmethod
     def mask_value(cls, value: Any, mask_type: str) -> Any:
         """Mask a value based on its mask type.
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.domain.services import default_password_validator
 from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_ID
-from snackbase.infrastructure.auth import hash_password
+from snackbase.infrastructure.auth import hash_password_async
 
 
 class SuperadminCreationError(Exception):
@@ -125,7 +125,7 @@ class SuperadminService:
             raise SuperadminCreationError("Admin role not found in database")
 
         # Hash password
-        password_hash = hash_password(password)
+        password_hash = await hash_password_async(password)
 
         from datetime import datetime, timezone
 
@@ -17,6 +17,16 @@ from snackbase.core.config import get_settings
 from snackbase.core.hooks import HookDecorator, HookEvent, HookRegistry
 from snackbase.core.logging import configure_logging, get_logger
 from snackbase.domain.entities.hook_context import HookContext
+from snackbase.infrastructure.auth.password_hasher import (
+    PasswordHashingBusyError,
+    shutdown_password_hashing_pool,
+)
+from snackbase.infrastructure.configuration.providers.oauth.http_client import (
+    close_oauth_http_client,
+)
+from snackbase.infrastructure.configuration.providers.saml.signature import (
+    shutdown_saml_verification_pool,
+)
 from snackbase.infrastructure.hooks import register_builtin_hooks
 from snackbase.infrastructure.persistence.database import (
     close_database,
@@ -136,14 +146,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.event_broadcaster = event_broadcaster
         logger.info("Realtime components initialized")
 
-        # Start background job worker
+        # Start background job worker, plus the dedicated workflow worker
+        # that owns the "workflows" queue (F8.3)
         if settings.job_worker_enabled:
             from snackbase.infrastructure.services.job_service import JobWorker
+            from snackbase.infrastructure.workflows.workflow_queue import (
+                WORKFLOW_QUEUE,
+                WorkflowWorker,
+            )
 
-            job_worker = JobWorker(db_manager.session, settings)
+            job_worker = JobWorker(
+                db_manager.session, settings, exclude_queues=[WORKFLOW_QUEUE]
+            )
             await job_worker.start()
             app.state.job_worker = job_worker
 
+            workflow_worker = WorkflowWorker(db_manager.session, settings)
+            await workflow_worker.start()
+            app.state.workflow_worker = workflow_worker
+
+        # Start the relay delivering record events from the event outbox
+        if settings.event_outbox_enabled:
+            from snackbase.infrastructure.services.outbox_relay import OutboxRelay
+
+            outbox_relay = OutboxRelay(db_manager.session, settings)
+            await outbox_relay.start()
+            app.state.outbox_relay = outbox_relay
+
         # Start cron scheduler
         if settings.scheduler_enabled:
             from snackbase.infrastructure.services.scheduler_service import SchedulerWorker
@@ -162,14 +191,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Shutdown
         logger.info("Shutting down SnackBase")
 
-        # Stop background job worker
+        # Stop background job workers
         if hasattr(app.state, "job_worker"):
             await app.state.job_worker.stop()
+        if hasattr(app.state, "workflow_worker"):
+            await app.state.workflow_worker.stop()
 
         # Stop cron scheduler
         if hasattr(app.state, "scheduler_worker"):
             await app.state.scheduler_worker.stop()
 
+        # Stop the outbox relay; undelivered events stay in the outbox
+        if hasattr(app.state, "outbox_relay"):
+            await app.state.outbox_relay.stop()
+
         # Trigger ON_TERMINATE hook
         if hasattr(app.state, "hook_registry"):
             terminate_context = HookContext(app=app)
@@ -179,6 +214,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             )
             logger.info("ON_TERMINATE hooks triggered")
 
+        # Release password hashing and SAML verification threads, pooled
+        # OAuth provider connections and the shared rate limit store
+        from snackbase.infrastructure.api.middleware.rate_limit_backends import (
+            close_rate_limit_backend,
+        )
+
+        shutdown_password_hashing_pool()
+        shutdown_saml_verification_pool()
+        await close_oauth_http_client()
+        await close_rate_limit_backend()
+
         await close_database()
         logger.info("Database connection closed")
         logger.info("SnackBase shutdown complete")
@@ -228,6 +274,9 @@ def create_app() -> FastAPI:
     # Register health check endpoint
     register_health_check(app)
 
+    # Register Prometheus metrics endpoint
+    register_metrics(app)
+
     # Register API routes
     register_routes(app)
 
@@ -243,6 +292,21 @@ def create_app() -> FastAPI:
     return app
 
 
+def register_metrics(app: FastAPI) -> None:
+    """Register the /metrics endpoint and its scrape-time collectors.
+
+    Args:
+        app: FastAPI application instance.
+    """
+    from snackbase.infrastructure.api.routes.metrics_router import (
+        register_metrics_collectors,
+    )
+    from snackbase.infrastructure.api.routes.metrics_router import router as metrics_router
+
+    app.include_router(metrics_router, tags=["health"])
+    register_metrics_collectors(app)
+
+
 def register_health_check(app: FastAPI) -> None:
     """Register health check endpoints.
 
@@ -317,6 +381,7 @@ def register_routes(app: FastAPI) -> None:
     from snackbase.infrastructure.api.routes import (
         accounts_router,
         admin_router,
+        aggregate_rollups_router,
         api_keys_router,
         audit_log_router,
         auth_router,
@@ -364,6 +429,10 @@ def register_routes(app: FastAPI) -> None:
         collection_rules_router,
         tags=["collections", "rules"],
     )
+    collections_router.include_router(
+        aggregate_rollups_router,
+        tags=["collections", "rollups"],
+    )
     app.include_router(
         collections_router, prefix=f"{settings.api_prefix}/collections", tags=["collections"]
     )
@@ -554,6 +623,23 @@ def register_exception_handlers(app: FastAPI) -> None:
         app: FastAPI application instance.
     """
 
+    @app.exception_handler(PasswordHashingBusyError)
+    async def password_hashing_busy_handler(request, exc):
+        """Shed load when the password hashing queue is full."""
+        logger.warning(
+            "Password hashing queue full, rejecting request",
+            path=str(request.url.path),
+            limit=exc.limit,
+        )
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": "Too Many Requests",
+                "detail": "Server is busy processing authentication requests. Please retry shortly.",
+            },
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         """Handle uncaught exceptions."""
@@ -609,9 +695,17 @@ def register_middleware(app: FastAPI) -> None:
     @app.middleware("http")
     async def logging_middleware(request, call_next):
         """Middleware to log all requests and add correlation ID."""
+        import time
         import uuid
 
         from snackbase.core.logging import bind_correlation_id, clear_context, get_logger
+        from snackbase.core.metrics import HTTP_REQUEST_DURATION
+        from snackbase.infrastructure.persistence.query_stats import (
+            get_route_profiler,
+            route_template,
+            start_query_stats,
+            stop_query_stats,
+        )
 
         logger = get_logger(__name__)
 
@@ -627,8 +721,35 @@ def register_middleware(app: FastAPI) -> None:
             correlation_id=correlation_id,
         )
 
+        # Count SQL statements issued while serving this request
+        query_stats, stats_token = (
+            start_query_stats() if get_settings().query_profiling_enabled else (None, None)
+        )
+        started = time.perf_counter()
+
         try:
             response = await call_next(request)
+            duration_ms = (time.perf_counter() - started) * 1000
+            route = route_template(request.scope)
+            HTTP_REQUEST_DURATION.observe(
+                duration_ms / 1000,
+                method=request.method,
+                route=route,
+                status=str(response.status_code),
+            )
+            db_fields = {}
+            if query_stats is not None:
+                db_fields = {
+                    "db_queries": query_stats.count,
+                    "db_time_ms": round(query_stats.total_ms, 3),
+                    "db_slowest_ms": round(query_stats.slowest_ms, 3),
+                    "db_slowest_statement": query_stats.slowest_statement,
+                }
+                response.headers["Server-Timing"] = (
+                    f'db;dur={query_stats.total_ms:.3f};desc="{query_stats.count} queries", '
+                    f"total;dur={duration_ms:.3f}"
+                )
+                get_route_profiler().record(route, query_stats, duration_ms)
             # Log response
             logger.info(
                 "Request completed",
@@ -636,11 +757,15 @@ def register_middleware(app: FastAPI) -> None:
                 path=str(request.url.path),
                 status_code=response.status_code,
                 correlation_id=correlation_id,
+                duration_ms=round(duration_ms, 3),
+                **db_fields,
             )
             # Add correlation ID to response headers
             response.headers["X-Correlation-ID"] = correlation_id
             return response
         finally:
+            if stats_token is not None:
+                stop_query_stats(stats_token)
             # Clear context to prevent leakage
             clear_context()
 
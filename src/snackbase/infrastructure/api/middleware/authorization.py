@@ -4,6 +4,7 @@ Provides functions to check permissions on collection CRUD operations,
 apply field-level filtering, and enforce row-level security.
 """
 
+import json
 import re
 from typing import Any
 
@@ -334,7 +335,6 @@ async def check_collection_permission(
     # Parse allowed_fields if it's a JSON string representative of an array
     if isinstance(allowed_fields, str) and allowed_fields != "*":
         try:
-            import json
             allowed_fields = json.loads(allowed_fields)
         except json.JSONDecodeError:
             allowed_fields = "*"
@@ -403,6 +403,9 @@ async def check_collection_permission(
                     sql_type = "INTEGER"
                 elif isinstance(v, float):
                     sql_type = "NUMERIC"
+                elif isinstance(v, (dict, list)):
+                    # JSON fields are stored as serialized text
+                    v = json.dumps(v)
 
                 # CAST parameters to ensure correct type handling in DB driver
                 cols.append(f"CAST(:{param_name} AS {sql_type}) AS \"{k}\"")
@@ -11,6 +11,7 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from snackbase.core.context import clear_current_context, set_current_context
 from snackbase.core.logging import get_logger
 from snackbase.domain.entities.hook_context import HookContext
+from snackbase.infrastructure.persistence.query_stats import get_current_query_stats
 
 logger = get_logger(__name__)
 
@@ -36,6 +37,7 @@ class ContextMiddleware(BaseHTTPMiddleware):
             request=request,
             ip_address=request.client.host if request.client else None,
             user_agent=request.headers.get("user-agent"),
+            query_stats=get_current_query_stats(),
         )
         
         # Try to enrich with user info from AuthenticationMiddleware
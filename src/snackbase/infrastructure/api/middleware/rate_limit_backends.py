@@ -0,0 +1,269 @@
+"""Rate limit backends used by the rate limit middleware.
+
+The default ``memory`` backend keeps token buckets in the worker process, so
+a deployment with N workers (or N hosts) effectively allows N times the
+configured limit. The shared backends keep one bucket per key in a
+``rate_limit_buckets`` table instead:
+
+- ``database`` uses the application database and suits PostgreSQL
+  deployments with several workers or hosts.
+- ``file`` uses a separate SQLite file, so the workers of a single host share
+  buckets without adding write traffic to the application database.
+
+A request costs one round trip: a single ``INSERT ... ON CONFLICT DO UPDATE
+... WHERE ... RETURNING`` refills the bucket, takes a token and returns what
+is left, atomically. When the bucket is empty the conditional update leaves
+the row untouched and returns nothing; only then is the bucket read to
+compute the retry delay. Buckets idle for ``rate_limit_bucket_idle_seconds``
+have refilled completely and are deleted periodically by each worker.
+
+If the shared backend fails, requests are allowed and a warning is logged
+rather than turning a storage outage into an API outage.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from sqlalchemy import Float, bindparam, event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from snackbase.core.config import get_settings
+from snackbase.core.logging import get_logger
+from snackbase.infrastructure.api.middleware.rate_limit_storage import (
+    RateLimitStorage,
+    rate_limit_storage,
+)
+from snackbase.infrastructure.persistence.database import get_db_manager
+from snackbase.infrastructure.persistence.models.rate_limit_bucket import RateLimitBucketModel
+
+logger = get_logger(__name__)
+
+# Tokens in the bucket after refilling it for the time since its last use,
+# capped at its capacity. A clock running behind the stored time refills nothing.
+_REFILLED = (
+    "CASE WHEN rate_limit_buckets.updated_at >= :now THEN rate_limit_buckets.tokens "
+    "WHEN rate_limit_buckets.tokens + (:now - rate_limit_buckets.updated_at) * :rate "
+    ">= :capacity THEN :capacity "
+    "ELSE rate_limit_buckets.tokens + (:now - rate_limit_buckets.updated_at) * :rate END"
+)
+
+_FLOAT_PARAMS = [bindparam(name, type_=Float) for name in ("now", "rate", "capacity", "initial")]
+
+_CONSUME_SQL = text(
+    'INSERT INTO rate_limit_buckets ("key", tokens, updated_at) '
+    "VALUES (:key, :initial, :now) "
+    'ON CONFLICT ("key") DO UPDATE SET '
+    f"tokens = {_REFILLED} - 1, "
+    "updated_at = CASE WHEN rate_limit_buckets.updated_at >= :now "
+    "THEN rate_limit_buckets.updated_at ELSE :now END "
+    f"WHERE {_REFILLED} >= 1 "
+    "RETURNING tokens"
+).bindparams(*_FLOAT_PARAMS)
+
+_READ_SQL = text('SELECT tokens, updated_at FROM rate_limit_buckets WHERE "key" = :key')
+
+_DELETE_IDLE_SQL = text("DELETE FROM rate_limit_buckets WHERE updated_at < :cutoff").bindparams(
+    bindparam("cutoff", type_=Float)
+)
+
+
+class RateLimitBackend(ABC):
+    """Token bucket store shared by all requests of a worker."""
+
+    @abstractmethod
+    async def consume(
+        self, key: str, rate_per_minute: float, burst: float = 1.0
+    ) -> tuple[bool, int, float]:
+        """Attempt to consume a token for the given key.
+
+        Args:
+            key: The unique key (IP address or User ID).
+            rate_per_minute: Allowed requests per minute.
+            burst: Maximum burst capacity.
+
+        Returns:
+            A tuple of (is_allowed, remaining_tokens, reset_seconds). When the
+            request is not allowed, reset_seconds is the time until the next
+            token becomes available.
+        """
+
+    async def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-worker in-memory token buckets.
+
+    Args:
+        storage: Bucket storage; defaults to the process-wide instance.
+    """
+
+    def __init__(self, storage: RateLimitStorage | None = None) -> None:
+        self.storage = storage if storage is not None else rate_limit_storage
+
+    async def consume(
+        self, key: str, rate_per_minute: float, burst: float = 1.0
+    ) -> tuple[bool, int, float]:
+        """Consume a token from the in-memory bucket."""
+        return self.storage.consume(key, rate_per_minute, burst=burst)
+
+
+class SQLRateLimitBackend(RateLimitBackend):
+    """Token buckets in a ``rate_limit_buckets`` table shared by all workers.
+
+    Args:
+        engine: Engine of the database holding the table.
+        idle_seconds: Buckets unused for this long are deleted.
+        cleanup_interval: Seconds between idle bucket deletions by this worker.
+        create_table: Create the table on first use (for the file backend,
+            whose database is not managed by migrations).
+        dispose_engine: Dispose of the engine when the backend is closed.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        idle_seconds: float = 3600,
+        cleanup_interval: float = 300,
+        create_table: bool = False,
+        dispose_engine: bool = False,
+    ) -> None:
+        self.engine = engine
+        self.idle_seconds = idle_seconds
+        self.cleanup_interval = cleanup_interval
+        self._create_table = create_table
+        self._dispose_engine = dispose_engine
+        self._last_cleanup = time.time()
+
+    async def consume(
+        self, key: str, rate_per_minute: float, burst: float = 1.0
+    ) -> tuple[bool, int, float]:
+        """Consume a token from the shared bucket with one atomic upsert."""
+        now = time.time()
+        rate_per_second = rate_per_minute / 60.0
+        capacity = max(1.0, burst)
+
+        try:
+            if self._create_table:
+                await self._ensure_table()
+            async with self.engine.begin() as conn:
+                tokens = (
+                    await conn.execute(
+                        _CONSUME_SQL,
+                        {
+                            "key": key,
+                            "now": now,
+                            "rate": rate_per_second,
+                            "capacity": capacity,
+                            "initial": capacity - 1.0,
+                        },
+                    )
+                ).scalar()
+                if tokens is None:
+                    row = (await conn.execute(_READ_SQL, {"key": key})).first()
+            if now - self._last_cleanup >= self.cleanup_interval:
+                await self._delete_idle(now)
+        except SQLAlchemyError as e:
+            logger.warning("Rate limit backend unavailable, allowing request", key=key, error=str(e))
+            return True, int(capacity - 1.0), 0.0
+
+        if tokens is not None:
+            return True, int(tokens), (capacity - tokens) / rate_per_second
+
+        available = 0.0
+        if row is not None:
+            elapsed = max(0.0, now - row.updated_at)
+            available = min(capacity, row.tokens + elapsed * rate_per_second)
+        return False, 0, max(0.0, 1.0 - available) / rate_per_second
+
+    async def _ensure_table(self) -> None:
+        table = RateLimitBucketModel.__table__
+        async with self.engine.begin() as conn:
+            await conn.execute(CreateTable(table, if_not_exists=True))
+            for index in table.indexes:
+                await conn.execute(CreateIndex(index, if_not_exists=True))
+        self._create_table = False
+
+    async def _delete_idle(self, now: float) -> None:
+        self._last_cleanup = now
+        async with self.engine.begin() as conn:
+            result = await conn.execute(_DELETE_IDLE_SQL, {"cutoff": now - self.idle_seconds})
+        if result.rowcount:
+            logger.debug("Deleted idle rate limit buckets", count=result.rowcount)
+
+    async def close(self) -> None:
+        """Dispose of the engine if the backend created it."""
+        if self._dispose_engine:
+            await self.engine.dispose()
+
+
+def create_file_engine(path: str) -> AsyncEngine:
+    """Create an engine for a SQLite file of rate limit buckets.
+
+    The buckets are disposable, so the file trades durability for speed:
+    WAL lets workers read while one writes, and nothing is synced to disk.
+
+    Args:
+        path: SQLite file path; its directory is created if missing.
+
+    Returns:
+        The async engine.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        connect_args={"check_same_thread": False},
+    )
+    busy_timeout = get_settings().db_sqlite_busy_timeout
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute(f"PRAGMA busy_timeout={busy_timeout}")
+        cursor.close()
+
+    return engine
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Create the backend selected by ``rate_limit_backend``."""
+    settings = get_settings()
+    options = {
+        "idle_seconds": settings.rate_limit_bucket_idle_seconds,
+        "cleanup_interval": settings.rate_limit_cleanup_interval_seconds,
+    }
+    if settings.rate_limit_backend == "database":
+        return SQLRateLimitBackend(get_db_manager().engine, **options)
+    if settings.rate_limit_backend == "file":
+        return SQLRateLimitBackend(
+            create_file_engine(settings.rate_limit_file_path),
+            create_table=True,
+            dispose_engine=True,
+            **options,
+        )
+    return MemoryRateLimitBackend()
+
+
+_backend: RateLimitBackend | None = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Get the process-wide rate limit backend."""
+    global _backend
+    if _backend is None:
+        _backend = create_rate_limit_backend()
+        logger.info("Rate limit backend initialized", backend=type(_backend).__name__)
+    return _backend
+
+
+async def close_rate_limit_backend() -> None:
+    """Close the process-wide rate limit backend, if one was created."""
+    global _backend
+    if _backend is not None:
+        backend, _backend = _backend, None
+        await backend.close()
@@ -12,7 +12,7 @@ from starlette.responses import JSONResponse
 from snackbase.core.config import get_settings
 from snackbase.core.context import get_current_context
 from snackbase.core.logging import get_logger
-from snackbase.infrastructure.api.middleware.rate_limit_storage import rate_limit_storage
+from snackbase.infrastructure.api.middleware.rate_limit_backends import get_rate_limit_backend
 from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_ID
 
 logger = get_logger(__name__)
@@ -64,7 +64,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             rate = settings.rate_limit_endpoints[path]
 
         # Check rate limit
-        is_allowed, remaining, reset_seconds = rate_limit_storage.consume(
+        is_allowed, remaining, reset_seconds = await get_rate_limit_backend().consume(
             key, rate, burst=settings.rate_limit_burst
         )
 
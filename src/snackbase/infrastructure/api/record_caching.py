@@ -0,0 +1,166 @@
+"""Conditional GET support for record endpoints.
+
+Clients poll record endpoints with unchanged results most of the time. The
+get and list endpoints therefore send validators and answer matching
+conditional requests with ``304 Not Modified``:
+
+- A single record gets a strong ETag derived from its ``id`` and
+  ``updated_at`` plus a ``Last-Modified`` header, and ``If-Modified-Since``
+  is honoured for it.
+- A list gets a weak ETag derived from the collection's change counter
+  (bumped by every record write of the account, see
+  ``collection_change_counter_repository``), so an unchanged list costs a
+  single counter read instead of the list query.
+
+Both ETags also cover a *variant*: everything besides the data that shapes
+the response (collection schema, rule filter, field projection, account
+scope, query parameters), so a rule or schema change never produces a false
+``304``. Responses that expand references depend on other collections and
+are sent without validators.
+
+Anonymous responses are only possible when the collection's rule is public;
+they are marked cacheable by shared caches, everything else is private.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+from snackbase.core.config import get_settings
+
+# Headers the record responses vary on besides the URL
+VARY_HEADERS = "Authorization, X-Account-ID"
+
+
+def _digest(parts: Iterable[Any]) -> str:
+    encoded = json.dumps(list(parts), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+
+def as_utc(value: Any) -> datetime | None:
+    """Interpret a stored timestamp as an aware UTC datetime.
+
+    Args:
+        value: A datetime or ISO 8601 string, naive values being UTC.
+
+    Returns:
+        The timestamp in UTC, or None if it cannot be parsed.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def record_etag(record_id: str, updated_at: Any, variant: Iterable[Any]) -> str:
+    """Build the strong ETag of a single record response.
+
+    Args:
+        record_id: The record ID.
+        updated_at: The record's last update time.
+        variant: Everything besides the record that shapes the response.
+
+    Returns:
+        Quoted strong entity tag.
+    """
+    return f'"{_digest([record_id, str(updated_at), *variant])}"'
+
+
+def list_etag(change_version: int, variant: Iterable[Any]) -> str:
+    """Build the weak ETag of a record list response.
+
+    Args:
+        change_version: The collection's change counter for the listed scope.
+        variant: Everything besides the data that shapes the response.
+
+    Returns:
+        Weak entity tag.
+    """
+    return f'W/"{_digest([change_version, *variant])}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check an ETag against the request's ``If-None-Match`` header.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``.
+
+    Args:
+        request: The incoming request.
+        etag: The current entity tag of the resource.
+
+    Returns:
+        True if the client's cached representation is current.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified_since(request: Request, last_modified: datetime | None) -> bool:
+    """Check ``If-Modified-Since`` when no ``If-None-Match`` is sent.
+
+    Args:
+        request: The incoming request.
+        last_modified: When the resource last changed.
+
+    Returns:
+        True if the resource has not changed since the given date.
+    """
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # HTTP dates have second precision
+    return last_modified.replace(microsecond=0) <= since
+
+
+def cache_headers(
+    etag: str | None, last_modified: datetime | None, public: bool
+) -> dict[str, str]:
+    """Build the caching headers of a record response.
+
+    Args:
+        etag: Entity tag, or None to send no validators.
+        last_modified: When the resource last changed, if known.
+        public: Whether shared caches may store the response.
+
+    Returns:
+        Header mapping for the response.
+    """
+    if public:
+        max_age = get_settings().records_public_cache_max_age
+        cache_control = f"public, max-age={max_age}, must-revalidate"
+    else:
+        cache_control = "private, no-cache"
+    headers = {"Cache-Control": cache_control, "Vary": VARY_HEADERS}
+    if etag is not None:
+        headers["ETag"] = etag
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """Build a ``304 Not Modified`` response carrying the caching headers."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
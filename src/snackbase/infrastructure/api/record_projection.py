@@ -0,0 +1,157 @@
+"""Per-request projection plans for record responses.
+
+A record response is shaped by three inputs: the rule's ``allowed_fields``,
+the ``?fields=`` query parameter, and whether PII must be masked for the
+caller. A ``RecordProjection`` folds all three into one plan (the set of keys
+to keep and a resolved masking function per kept PII field), so each row is
+copied once and masked in the same pass instead of being rebuilt by field
+filtering, masking and ``?fields=`` limiting in turn.
+
+Plans depend only on the collection schema and those inputs, so they are
+cached per (schema, allowed_fields, fields, mask) key.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from snackbase.domain.services.pii_masking_service import PIIMaskingService
+from snackbase.infrastructure.api.middleware.authorization import SYSTEM_FIELDS
+
+PROJECTION_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class RecordProjection:
+    """Field projection and PII masking plan for record responses.
+
+    Attributes:
+        keep: Keys to keep in each record, or None to keep every key.
+        maskers: (field name, masking function) pairs for kept PII fields.
+    """
+
+    keep: frozenset[str] | None
+    maskers: tuple[tuple[str, Callable[[str], str]], ...]
+
+    @property
+    def is_identity(self) -> bool:
+        """Whether the plan leaves records unchanged."""
+        return self.keep is None and not self.maskers
+
+    def includes(self, field_name: str) -> bool:
+        """Check whether a field survives the projection."""
+        return self.keep is None or field_name in self.keep
+
+    def apply(self, records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Project and mask records in a single pass.
+
+        Input records are never modified; each output row is a new dict
+        unless the plan is the identity.
+
+        Args:
+            records: Records as returned by the repository.
+
+        Returns:
+            Projected, masked records.
+        """
+        if self.is_identity:
+            return list(records)
+
+        keep = self.keep
+        if keep is None:
+            projected = [record.copy() for record in records]
+        else:
+            projected = [{k: v for k, v in record.items() if k in keep} for record in records]
+
+        for name, mask in self.maskers:
+            for record in projected:
+                value = record.get(name)
+                if value is not None:
+                    record[name] = mask(str(value))
+        return projected
+
+    def apply_one(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Project and mask a single record."""
+        return self.apply((record,))[0]
+
+
+_projections: OrderedDict[tuple, RecordProjection] = OrderedDict()
+
+
+def _build_projection(
+    schema: list[dict[str, Any]],
+    allowed_fields: list[str] | str,
+    requested_fields: frozenset[str] | None,
+    mask_pii: bool,
+) -> RecordProjection:
+    """Build a projection plan from its inputs."""
+    keep: frozenset[str] | None = None
+    if allowed_fields != "*" and not isinstance(allowed_fields, str):
+        keep = frozenset(allowed_fields) | SYSTEM_FIELDS
+    if requested_fields is not None:
+        requested = requested_fields | SYSTEM_FIELDS
+        keep = requested if keep is None else keep & requested
+
+    maskers: list[tuple[str, Callable[[str], str]]] = []
+    if mask_pii:
+        for field in schema:
+            name = field.get("name")
+            if not field.get("pii", False) or (keep is not None and name not in keep):
+                continue
+            # Default to 'full' masking if no mask_type specified
+            mask = PIIMaskingService.masker_for(field.get("mask_type") or "full")
+            if mask is not None:
+                maskers.append((name, mask))
+
+    return RecordProjection(keep=keep, maskers=tuple(maskers))
+
+
+def parse_fields_param(fields: str | None) -> frozenset[str] | None:
+    """Parse the ``?fields=`` query parameter.
+
+    Returns:
+        Requested field names, or None when all fields are requested.
+    """
+    if not isinstance(fields, str) or not fields.strip() or fields.strip() == "*":
+        return None
+    return frozenset(f.strip() for f in fields.split(","))
+
+
+def get_record_projection(
+    schema_key: str,
+    schema: list[dict[str, Any]],
+    allowed_fields: list[str] | str,
+    fields: str | None,
+    user_groups: list[str],
+    account_id: str | None,
+) -> RecordProjection:
+    """Return the (cached) projection plan for a record response.
+
+    Args:
+        schema_key: Identifies the schema version; the raw collection schema
+            JSON is used so any schema change yields a new plan.
+        schema: Parsed collection schema.
+        allowed_fields: Fields allowed by the permission rule, or "*".
+        fields: Raw ``?fields=`` query parameter.
+        user_groups: Group names of the caller.
+        account_id: Caller's account ID (superadmins bypass PII masking).
+
+    Returns:
+        The projection plan.
+    """
+    requested_fields = parse_fields_param(fields)
+    mask_pii = PIIMaskingService.should_mask_for_user(user_groups, account_id)
+    allowed_key = allowed_fields if isinstance(allowed_fields, str) else tuple(allowed_fields)
+    key = (schema_key, allowed_key, requested_fields, mask_pii)
+
+    projection = _projections.get(key)
+    if projection is not None:
+        _projections.move_to_end(key)
+        return projection
+
+    projection = _build_projection(schema, allowed_fields, requested_fields, mask_pii)
+    _projections[key] = projection
+    if len(_projections) > PROJECTION_CACHE_SIZE:
+        _projections.popitem(last=False)
+    return projection
@@ -0,0 +1,114 @@
+"""Fast JSON encoding for record responses.
+
+Record list and get endpoints declare ``RecordResponse``-based response models
+for OpenAPI, but building a Pydantic model per row (and letting FastAPI
+validate and serialize it again) dominates the cost of large pages. This
+module produces the same JSON shape directly with orjson:
+
+- system fields are checked once per row *shape* (rows from one query share
+  their keys), not by constructing a model per row;
+- each row is emitted in ``RecordResponse`` field order (system fields,
+  ``account_name``, then collection fields);
+- the envelope and all rows are encoded to bytes in a single orjson call.
+
+Endpoints return the resulting ``Response`` directly, which FastAPI passes
+through untouched while still documenting the declared ``response_model``.
+"""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+# Required string fields of RecordResponse, in declaration order
+RECORD_SYSTEM_FIELDS = (
+    "id",
+    "account_id",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+)
+_DECLARED_FIELDS = (*RECORD_SYSTEM_FIELDS, "account_name")
+_DECLARED_FIELD_SET = frozenset(_DECLARED_FIELDS)
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson does not support natively, as Pydantic would."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _field_order(record: dict[str, Any]) -> tuple[str, ...]:
+    """Validate a row shape and return its RecordResponse field order.
+
+    Raises:
+        ValueError: If a required system field is missing.
+    """
+    missing = [name for name in RECORD_SYSTEM_FIELDS if name not in record]
+    if missing:
+        raise ValueError(f"Record is missing required system fields: {', '.join(missing)}")
+    return _DECLARED_FIELDS + tuple(k for k in record if k not in _DECLARED_FIELD_SET)
+
+
+def _check_system_values(record: dict[str, Any]) -> None:
+    """Ensure system field values are strings (RecordResponse types them as str)."""
+    for name in RECORD_SYSTEM_FIELDS:
+        if type(record[name]) is not str:
+            raise ValueError(
+                f"Record system field '{name}' must be a string, got {type(record[name]).__name__}"
+            )
+
+
+def prepare_records(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Reorder records into RecordResponse shape, validating each row shape once.
+
+    Args:
+        records: Record dictionaries as returned by the repository (after
+            field filtering, PII masking and expansion).
+
+    Returns:
+        New dictionaries ready for JSON encoding.
+
+    Raises:
+        ValueError: If a record lacks a system field or has a non-string one.
+    """
+    prepared: list[dict[str, Any]] = []
+    shape: Any = None
+    order: tuple[str, ...] = ()
+    for record in records:
+        keys = record.keys()
+        if keys != shape:
+            order = _field_order(record)
+            shape = keys
+        _check_system_values(record)
+        get = record.get
+        prepared.append({name: get(name) for name in order})
+    return prepared
+
+
+def prepare_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Reorder a single record into RecordResponse shape.
+
+    Raises:
+        ValueError: If the record lacks a system field or has a non-string one.
+    """
+    return prepare_records((record,))[0]
+
+
+class RecordJSONResponse(Response):
+    """JSON response encoded with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
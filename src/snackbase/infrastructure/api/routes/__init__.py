@@ -2,6 +2,7 @@
 
 from snackbase.infrastructure.api.routes.auth_router import router as auth_router
 from .accounts_router import router as accounts_router
+from .aggregate_rollups_router import router as aggregate_rollups_router
 from .admin_router import router as admin_router
 from .collections_router import router as collections_router
 from .collection_rules_router import router as collection_rules_router
@@ -11,6 +12,7 @@ from .files_router import router as files_router
 from .groups_router import router as groups_router
 from .invitations_router import router as invitations_router
 from .macros_router import router as macros_router
+from .metrics_router import router as metrics_router
 from .migrations_router import router as migrations_router
 from .records_router import router as records_router
 from .roles_router import router as roles_router
@@ -28,6 +30,7 @@ from .custom_endpoint_dispatcher import router as custom_endpoint_dispatcher_rou
 
 __all__ = [
     "accounts_router",
+    "aggregate_rollups_router",
     "admin_router",
     "api_keys_router",
     "audit_log_router",
@@ -40,6 +43,7 @@ __all__ = [
     "groups_router",
     "invitations_router",
     "macros_router",
+    "metrics_router",
     "migrations_router",
     "records_router",
     "roles_router",
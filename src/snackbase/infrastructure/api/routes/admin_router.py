@@ -1,15 +1,18 @@
-from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from typing import Any, Dict, List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
 from sqlalchemy import and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
 from snackbase.infrastructure.api.dependencies import SuperadminUser
 from snackbase.infrastructure.persistence.database import get_db_session
 from snackbase.infrastructure.persistence.models.configuration import ConfigurationModel
+from snackbase.infrastructure.persistence.query_stats import get_route_profiler
 from snackbase.infrastructure.persistence.repositories.configuration_repository import (
     ConfigurationRepository,
 )
+from snackbase.infrastructure.services.email_service import invalidate_provider_instances
 
 router = APIRouter(tags=["admin"])
 logger = get_logger(__name__)
@@ -410,6 +413,7 @@ async def delete_configuration(
         # Invalidate cache
         registry = request.app.state.config_registry
         registry._invalidate_cache(config.category, config.account_id, config.provider_name)
+        invalidate_provider_instances(config_id)
 
         return {"status": "success"}
 
@@ -558,6 +562,7 @@ async def update_configuration_values(
 
         # Invalidate cache
         registry._invalidate_cache(config_model.category, config_model.account_id, config_model.provider_name)
+        invalidate_provider_instances(config_id)
 
         return {"status": "success"}
     except HTTPException:
@@ -822,3 +827,29 @@ async def test_provider_connection(
     except Exception as e:
         logger.error("Connection test endpoint failed", error=str(e))
         return {"success": False, "message": f"Internal server error: {str(e)}"}
+
+
+@router.get("/profiling")
+async def get_route_profiling(
+    _admin: SuperadminUser,
+    limit: int = Query(default=20, ge=1, le=500),
+    sort_by: Literal["db_time_ms", "avg_db_time_ms", "queries", "avg_queries", "max_queries"] = (
+        "db_time_ms"
+    ),
+):
+    """Get the routes of this worker that spend the most time in the database.
+
+    Args:
+        limit: Number of routes to return (default: 20)
+        sort_by: Statistic to rank routes by (default: db_time_ms)
+    """
+    return {
+        "enabled": get_settings().query_profiling_enabled,
+        "routes": get_route_profiler().top(limit=limit, sort_by=sort_by),
+    }
+
+
+@router.delete("/profiling", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_route_profiling(_admin: SuperadminUser):
+    """Discard the route profiles collected by this worker."""
+    get_route_profiler().reset()
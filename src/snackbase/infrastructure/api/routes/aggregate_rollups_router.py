@@ -0,0 +1,246 @@
+"""Aggregate rollup API routes.
+
+Provides endpoints for managing materialized count/sum rollups of a
+collection, which answer matching /aggregate queries without scanning the
+collection table.
+"""
+
+import json
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from snackbase.core.logging import get_logger
+from snackbase.core.rules import AggregationParseError, validate_rollup_definition
+from snackbase.infrastructure.api.dependencies import SuperadminUser
+from snackbase.infrastructure.api.schemas.collection_schemas import (
+    AggregateRollupResponse,
+    CreateAggregateRollupRequest,
+)
+from snackbase.infrastructure.persistence.aggregate_cache import get_aggregate_cache
+from snackbase.infrastructure.persistence.database import get_db_session
+from snackbase.infrastructure.persistence.models import (
+    AggregateRollupModel,
+    CollectionModel,
+)
+from snackbase.infrastructure.persistence.repositories import (
+    AggregateRollupRepository,
+    CollectionRepository,
+)
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+
+async def _get_collection_or_404(session: AsyncSession, collection_name: str) -> CollectionModel:
+    """Load a collection by name or raise 404."""
+    collection = await CollectionRepository(session).get_by_name(collection_name)
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Collection '{collection_name}' not found",
+        )
+    return collection
+
+
+async def _get_rollup_or_404(
+    rollup_repo: AggregateRollupRepository,
+    collection: CollectionModel,
+    rollup_id: str,
+) -> AggregateRollupModel:
+    """Load a rollup of the given collection or raise 404."""
+    rollup = await rollup_repo.get_by_id(rollup_id)
+    if not rollup or rollup.collection_id != collection.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Rollup '{rollup_id}' not found",
+        )
+    return rollup
+
+
+@router.get(
+    "/{collection_name}/rollups",
+    response_model=list[AggregateRollupResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List aggregate rollups",
+    description="List materialized aggregate rollups of a collection. Only superadmins can access this endpoint.",
+)
+async def list_aggregate_rollups(
+    collection_name: str,
+    current_user: SuperadminUser,
+    session: AsyncSession = Depends(get_db_session),
+) -> list[AggregateRollupResponse]:
+    """List the rollups defined on a collection.
+
+    Args:
+        collection_name: Name of the collection.
+        current_user: Authenticated superadmin user.
+        session: Database session.
+
+    Returns:
+        Rollup definitions.
+
+    Raises:
+        HTTPException: 404 if collection not found.
+    """
+    await _get_collection_or_404(session, collection_name)
+    rollups = await AggregateRollupRepository(session).list_by_collection_name(collection_name)
+    return [AggregateRollupResponse.model_validate(rollup) for rollup in rollups]
+
+
+@router.post(
+    "/{collection_name}/rollups",
+    response_model=AggregateRollupResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create aggregate rollup",
+    description=(
+        "Define a materialized count/sum rollup and build it from the collection's records. "
+        "Only superadmins can access this endpoint."
+    ),
+)
+async def create_aggregate_rollup(
+    collection_name: str,
+    request: CreateAggregateRollupRequest,
+    current_user: SuperadminUser,
+    session: AsyncSession = Depends(get_db_session),
+) -> AggregateRollupResponse:
+    """Define a rollup on a collection and build its values.
+
+    Args:
+        collection_name: Name of the collection.
+        request: Group-by and sum fields of the rollup.
+        current_user: Authenticated superadmin user.
+        session: Database session.
+
+    Returns:
+        The created rollup.
+
+    Raises:
+        HTTPException: 404 if collection not found, 400 if validation fails.
+    """
+    collection = await _get_collection_or_404(session, collection_name)
+    schema = json.loads(collection.schema) if isinstance(collection.schema, str) else collection.schema
+    schema_lookup = {f["name"]: f for f in schema}
+
+    try:
+        validate_rollup_definition(request.group_by, request.sum_fields, schema_lookup)
+    except AggregationParseError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    rollup_repo = AggregateRollupRepository(session)
+    rollup = await rollup_repo.create(
+        AggregateRollupModel(
+            id=str(uuid.uuid4()),
+            collection_id=collection.id,
+            group_by=request.group_by,
+            sum_fields=request.sum_fields,
+            created_by=current_user.user_id,
+        )
+    )
+    groups = await rollup_repo.rebuild(rollup, collection_name)
+    await session.commit()
+    await session.refresh(rollup)
+
+    logger.info(
+        "Aggregate rollup created",
+        collection_name=collection_name,
+        rollup_id=rollup.id,
+        groups=groups,
+    )
+
+    response = AggregateRollupResponse.model_validate(rollup)
+    response.groups = groups
+    return response
+
+
+@router.post(
+    "/{collection_name}/rollups/{rollup_id}/rebuild",
+    response_model=AggregateRollupResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild aggregate rollup",
+    description=(
+        "Recompute a rollup from the collection's records, e.g. after enabling rollup "
+        "maintenance. Only superadmins can access this endpoint."
+    ),
+)
+async def rebuild_aggregate_rollup(
+    collection_name: str,
+    rollup_id: str,
+    current_user: SuperadminUser,
+    session: AsyncSession = Depends(get_db_session),
+) -> AggregateRollupResponse:
+    """Recompute a rollup's values from the collection table.
+
+    Args:
+        collection_name: Name of the collection.
+        rollup_id: The rollup ID.
+        current_user: Authenticated superadmin user.
+        session: Database session.
+
+    Returns:
+        The rebuilt rollup.
+
+    Raises:
+        HTTPException: 404 if collection or rollup not found.
+    """
+    collection = await _get_collection_or_404(session, collection_name)
+    rollup_repo = AggregateRollupRepository(session)
+    rollup = await _get_rollup_or_404(rollup_repo, collection, rollup_id)
+
+    groups = await rollup_repo.rebuild(rollup, collection_name)
+    await session.commit()
+    await session.refresh(rollup)
+    get_aggregate_cache().invalidate(collection_name)
+
+    logger.info(
+        "Aggregate rollup rebuilt",
+        collection_name=collection_name,
+        rollup_id=rollup_id,
+        groups=groups,
+    )
+
+    response = AggregateRollupResponse.model_validate(rollup)
+    response.groups = groups
+    return response
+
+
+@router.delete(
+    "/{collection_name}/rollups/{rollup_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete aggregate rollup",
+    description="Delete a rollup and its stored values. Only superadmins can access this endpoint.",
+)
+async def delete_aggregate_rollup(
+    collection_name: str,
+    rollup_id: str,
+    current_user: SuperadminUser,
+    session: AsyncSession = Depends(get_db_session),
+) -> None:
+    """Delete a rollup definition.
+
+    Args:
+        collection_name: Name of the collection.
+        rollup_id: The rollup ID.
+        current_user: Authenticated superadmin user.
+        session: Database session.
+
+    Raises:
+        HTTPException: 404 if collection or rollup not found.
+    """
+    collection = await _get_collection_or_404(session, collection_name)
+    rollup_repo = AggregateRollupRepository(session)
+    rollup = await _get_rollup_or_404(rollup_repo, collection, rollup_id)
+
+    await rollup_repo.delete(rollup)
+    await session.commit()
+
+    logger.info(
+        "Aggregate rollup deleted",
+        collection_name=collection_name,
+        rollup_id=rollup_id,
+    )
@@ -13,7 +13,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
 from snackbase.domain.services import (
-    AccountCodeGenerator,
     SlugGenerator,
     default_password_validator,
 )
@@ -46,9 +45,9 @@ from snackbase.infrastructure.auth import (
     DUMMY_PASSWORD_HASH,
     InvalidTokenError,
     TokenExpiredError,
-    hash_password,
+    hash_password_async,
     jwt_service,
-    verify_password,
+    verify_password_async,
 )
 from snackbase.infrastructure.persistence.database import get_db_session
 from snackbase.infrastructure.persistence.models import (
@@ -123,7 +122,7 @@ async def register(
     role_repo = RoleRepository(session)
 
     # Hash password
-    password_hash = hash_password(register_request.password)
+    password_hash = await hash_password_async(register_request.password)
 
     # Single-tenant mode: join existing account with 'user' role
     if settings.single_tenant_mode:
@@ -278,9 +277,8 @@ async def register(
         )
 
     # 4. Generate account ID and code
-    existing_codes = await account_repo.get_all_account_codes()
     account_id = str(uuid.uuid4())  # Generate UUID
-    account_code = AccountCodeGenerator.generate(existing_codes)  # Generate code
+    account_code = await account_repo.allocate_account_code()  # Generate code
 
     # 6. Create account record
     account = AccountModel(
@@ -454,7 +452,7 @@ async def login(
             account_identifier=account_identifier,
             email=request.email,
         )
-        verify_password(request.password, DUMMY_PASSWORD_HASH)
+        await verify_password_async(request.password, DUMMY_PASSWORD_HASH)
         return auth_error
 
     # 2. Look up user by email in account
@@ -467,14 +465,14 @@ async def login(
             account_id=account.id,
             email=request.email,
         )
-        verify_password(request.password, DUMMY_PASSWORD_HASH)
+        await verify_password_async(request.password, DUMMY_PASSWORD_HASH)
         return auth_error
 
     # 3. Check authentication provider
     # Users with OAuth or SAML must use their respective authentication flows
     if user.auth_provider != "password":
         # Still verify password to maintain constant-time behavior (prevent timing attacks)
-        verify_password(request.password, DUMMY_PASSWORD_HASH)
+        await verify_password_async(request.password, DUMMY_PASSWORD_HASH)
 
         logger.info(
             "Login failed: wrong authentication method",
@@ -510,7 +508,7 @@ async def login(
         )
 
     # 4. Verify password using timing-safe comparison
-    if not verify_password(request.password, user.password_hash):
+    if not await verify_password_async(request.password, user.password_hash):
         logger.info(
             "Login failed: invalid password",
             account_id=account.id,
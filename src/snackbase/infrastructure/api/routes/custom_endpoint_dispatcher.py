@@ -6,9 +6,9 @@ definition stored in the database.
 
 Request flow:
 1. Resolve account_slug → account_id (404 if not found)
-2. Collect all enabled endpoints for the account
-3. Convert stored path templates (e.g. /users/:id/orders) to regexes and
-   find the first that matches the incoming path + method (404 if none)
+2. Look up the incoming method + path in the account's precompiled route
+   table, rebuilt only when its endpoints changed (404 if no match)
+3. Extract path parameters from :param segments (e.g. /users/:id/orders)
 4. If auth_required=True, require a valid auth token (401 if missing)
 5. Evaluate optional condition expression (403 if fails)
 6. Build EndpointRequestContext from request body, query params, path params
@@ -20,7 +20,6 @@ Request flow:
 
 from __future__ import annotations
 
-import re
 import time
 from typing import Any
 
@@ -32,7 +31,7 @@ from snackbase.infrastructure.endpoints.endpoint_executor import (
     EndpointRequestContext,
     execute_endpoint_actions,
 )
-from snackbase.infrastructure.persistence.models.endpoint import EndpointModel
+from snackbase.infrastructure.endpoints.route_table import get_route_table
 
 logger = get_logger(__name__)
 
@@ -42,49 +41,6 @@ router = APIRouter(tags=["Custom Endpoints"])
 _SUPPORTED_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
 
 
-# ---------------------------------------------------------------------------
-# Path template → regex conversion
-# ---------------------------------------------------------------------------
-
-
-def _path_template_to_regex(template: str) -> re.Pattern:  # type: ignore[type-arg]
-    """Convert a path template with :param segments to a named-group regex.
-
-    Example:
-        /users/:user_id/orders  →  ^/users/(?P<user_id>[^/]+)/orders$
-    """
-    # Escape dots, then replace :param with named groups
-    escaped = re.sub(r"[.]", r"\\.", template)
-    pattern = re.sub(r":([a-zA-Z_][a-zA-Z0-9_]*)", r"(?P<\1>[^/]+)", escaped)
-    return re.compile(f"^{pattern}$")
-
-
-def _match_endpoint(
-    endpoint: EndpointModel,
-    method: str,
-    incoming_path: str,
-) -> dict[str, str] | None:
-    """Try to match an endpoint against the incoming method and path.
-
-    Args:
-        endpoint: The EndpointModel to test.
-        method: Incoming HTTP method (uppercased).
-        incoming_path: Incoming path starting with /.
-
-    Returns:
-        Dict of extracted path parameters if matched, or None if no match.
-    """
-    if endpoint.method != method:
-        return None
-
-    pattern = _path_template_to_regex(endpoint.path)
-    m = pattern.match(incoming_path)
-    if m is None:
-        return None
-
-    return m.groupdict()
-
-
 # ---------------------------------------------------------------------------
 # Response template rendering
 # ---------------------------------------------------------------------------
@@ -238,25 +194,17 @@ async def _handle_custom_endpoint(request: Request, account_slug: str, path: str
         account_id = account.id
 
         # 2. Find matching enabled endpoint
-        endpoint_repo = EndpointRepository(session)
-        enabled_endpoints = await endpoint_repo.get_all_enabled_for_account(account_id)
+        route_table = await get_route_table(EndpointRepository(session), account_id)
+        match = route_table.match(method, incoming_path)
 
-        matched_endpoint: EndpointModel | None = None
-        path_params: dict[str, str] = {}
-
-        for ep in enabled_endpoints:
-            params = _match_endpoint(ep, method, incoming_path)
-            if params is not None:
-                matched_endpoint = ep
-                path_params = params
-                break
-
-        if matched_endpoint is None:
+        if match is None:
             return JSONResponse(
                 status_code=404,
                 content={"detail": "No matching custom endpoint found"},
             )
 
+        matched_endpoint, path_params = match
+
     # 3. Auth check (outside the first session scope; uses request state)
     if matched_endpoint.auth_required:
         if not hasattr(request.state, "authenticated_user"):
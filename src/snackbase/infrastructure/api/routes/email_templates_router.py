@@ -30,6 +30,7 @@ from snackbase.infrastructure.persistence.repositories.email_log_repository impo
 from snackbase.infrastructure.persistence.repositories.email_template_repository import (
     EmailTemplateRepository,
 )
+from snackbase.infrastructure.services.email.template_renderer import get_template_renderer
 from snackbase.infrastructure.services.email_service import EmailService
 
 router = APIRouter(tags=["admin", "email"])
@@ -158,6 +159,10 @@ async def update_email_template(
         updated_template = await repo.update(session=db, template=template)
         await db.commit()
 
+        # Drop compiled versions of the old content (the cache key also
+        # includes updated_at, so other processes never render stale copies).
+        get_template_renderer().invalidate(template_id)
+
         logger.info(
             "Email template updated",
             template_id=template_id,
@@ -216,10 +221,6 @@ async def render_email_template(
             )
 
         # Render template
-        from snackbase.infrastructure.services.email.template_renderer import (
-            get_template_renderer,
-        )
-
         renderer = get_template_renderer()
 
         try:
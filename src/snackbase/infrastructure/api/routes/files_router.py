@@ -1,9 +1,18 @@
-"""File storage API endpoints for uploading and downloading files."""
+"""File storage API endpoints for uploading and downloading files.
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse, Response
+Uploads are streamed to the storage provider in chunks and downloads are
+streamed back (with single-range support), so request memory does not grow
+with file size.
+"""
+
+import re
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
 from snackbase.infrastructure.api.dependencies import CurrentUser, get_current_user
 from snackbase.infrastructure.api.schemas.file_schemas import (
@@ -11,12 +20,35 @@ from snackbase.infrastructure.api.schemas.file_schemas import (
     FileUploadResponse,
 )
 from snackbase.infrastructure.persistence.database import get_db_session
+from snackbase.infrastructure.storage.base import InvalidRangeError
 from snackbase.infrastructure.storage.storage_service import StorageService
 
 logger = get_logger(__name__)
 
 router = APIRouter(tags=["files"])
 
+# A single byte range: "bytes=start-end", "bytes=start-" or "bytes=-suffix"
+_SINGLE_RANGE_RE = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
+
+
+async def _iter_upload_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in storage-sized chunks."""
+    chunk_size = get_settings().storage_chunk_size
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+def _single_range(range_header: str | None) -> str | None:
+    """Return the Range header if it requests exactly one byte range.
+
+    Multi-range and malformed headers are ignored, which serves the whole
+    file as permitted by RFC 9110.
+    """
+    if range_header is None:
+        return None
+    value = range_header.strip().replace(" ", "")
+    return value if _SINGLE_RANGE_RE.match(value) else None
+
 
 @router.post(
     "/upload",
@@ -35,7 +67,8 @@ async def upload_file(
     The uploaded file is stored in the account's directory with a UUID-based filename.
     Returns metadata that should be stored in a record's file field.
 
-    Requires authentication. File size and MIME type are validated against configured limits.
+    Requires authentication. File size and MIME type are validated against configured
+    limits while the file is streamed to storage.
     """
     account_id = current_user.account_id
 
@@ -43,30 +76,25 @@ async def upload_file(
     filename = file.filename or "unnamed"
     mime_type = file.content_type or "application/octet-stream"
 
-    # Read file content
-    content = await file.read()
-    size = len(content)
-
     # Create storage service (resolves active configured provider)
     storage_service = StorageService(db)
 
     try:
-        # Save file (this validates size and MIME type)
-        from io import BytesIO
-
-        file_metadata = await storage_service.save_file(
+        # Stream file to storage (this validates size and MIME type)
+        file_metadata = await storage_service.save_stream(
             account_id=account_id,
-            file_content=BytesIO(content),
+            chunks=_iter_upload_chunks(file),
             filename=filename,
             mime_type=mime_type,
-            size=size,
         )
+        # Persist the storage usage counter updated by the save
+        await db.commit()
 
         logger.info(
             "File uploaded successfully",
             account_id=account_id,
             filename=filename,
-            size=size,
+            size=file_metadata.size,
             user_id=current_user.user_id,
         )
 
@@ -114,12 +142,14 @@ async def download_file(
     file_path: str,
     current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
+    range_header: str | None = Header(default=None, alias="Range"),
 ) -> Response:
     """Download a file from storage.
 
     The file path should be in the format: {account_id}/{uuid_filename}
 
     Requires authentication. Users can only download files from their own account.
+    A single byte range (Range header) is answered with 206 Partial Content.
     """
     account_id = current_user.account_id
 
@@ -127,7 +157,9 @@ async def download_file(
     storage_service = StorageService(db)
 
     try:
-        stored_file = await storage_service.get_file(account_id, file_path)
+        stored_file = await storage_service.get_file(
+            account_id, file_path, byte_range=_single_range(range_header)
+        )
 
         logger.info(
             "File downloaded",
@@ -143,17 +175,38 @@ async def download_file(
                 media_type=stored_file.mime_type,
             )
 
+        download_name = stored_file.filename or "download"
+        headers = {"Content-Disposition": f'attachment; filename="{download_name}"'}
+
+        if stored_file.stream is not None:
+            headers["Accept-Ranges"] = "bytes"
+            if stored_file.size is not None:
+                headers["Content-Length"] = str(stored_file.size)
+            status_code = status.HTTP_200_OK
+            if stored_file.content_range is not None:
+                headers["Content-Range"] = stored_file.content_range
+                status_code = status.HTTP_206_PARTIAL_CONTENT
+            return StreamingResponse(
+                stored_file.stream,
+                status_code=status_code,
+                media_type=stored_file.mime_type or "application/octet-stream",
+                headers=headers,
+            )
+
         if stored_file.content is None:
             raise RuntimeError("Storage provider returned an empty file response")
 
-        download_name = stored_file.filename or "download"
-        headers = {"Content-Disposition": f'attachment; filename="{download_name}"'}
         return Response(
             content=stored_file.content,
             media_type=stored_file.mime_type or "application/octet-stream",
             headers=headers,
         )
 
+    except InvalidRangeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail=str(e),
+        )
     except ValueError as e:
         logger.warning(
             "File download validation failed",
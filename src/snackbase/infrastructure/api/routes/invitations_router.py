@@ -30,7 +30,7 @@ from snackbase.infrastructure.api.schemas import (
     InvitationStatus,
     UserResponse,
 )
-from snackbase.infrastructure.auth import hash_password, jwt_service
+from snackbase.infrastructure.auth import hash_password_async, jwt_service
 from snackbase.infrastructure.persistence.database import get_db_session
 from snackbase.infrastructure.persistence.models import (
     AccountModel,
@@ -544,7 +544,7 @@ async def accept_invitation(
             content={"error": "Internal error", "message": "Role configuration error"},
         )
 
-    password_hash = hash_password(request.password)
+    password_hash = await hash_password_async(request.password)
 
     user = UserModel(
         id=str(uuid.uuid4()),
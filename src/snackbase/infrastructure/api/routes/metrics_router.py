@@ -0,0 +1,158 @@
+"""Prometheus metrics endpoint.
+
+Serves the process's metrics in the Prometheus text exposition format at
+``/metrics``, together with scrape-time gauges for the database pool, the
+job queues, the event outbox, the password hashing pool and realtime
+connections.
+"""
+
+import hmac
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from snackbase.core.config import get_settings
+from snackbase.core.metrics import (
+    DB_POOL_CONNECTIONS,
+    DB_POOL_UTILIZATION,
+    JOB_QUEUE_DEPTH,
+    JOB_QUEUE_OLDEST_AGE,
+    OUTBOX_DEPTH,
+    OUTBOX_OLDEST_AGE,
+    PASSWORD_HASH_LIMIT,
+    PASSWORD_HASH_TASKS,
+    REALTIME_CONNECTIONS,
+    REALTIME_OUTBOUND_QUEUE_DEPTH,
+    REALTIME_SUBSCRIPTIONS,
+    Sample,
+    get_metrics_registry,
+)
+from snackbase.infrastructure.auth.password_hasher import get_password_hashing_stats
+from snackbase.infrastructure.persistence.database import get_db_manager
+from snackbase.infrastructure.persistence.repositories.event_outbox_repository import (
+    EventOutboxRepository,
+)
+from snackbase.infrastructure.persistence.repositories.job_repository import JobRepository
+
+router = APIRouter()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def _collect_db_pool() -> list[Sample]:
+    """Read database pool occupancy."""
+    stats = get_db_manager().pool_stats()
+    if stats is None:
+        return []
+    samples: list[Sample] = [
+        (DB_POOL_CONNECTIONS.name, {"state": state}, stats[state])
+        for state in ("checked_out", "idle", "overflow", "capacity")
+    ]
+    if stats["capacity"]:
+        samples.append(
+            (DB_POOL_UTILIZATION.name, {}, stats["checked_out"] / stats["capacity"])
+        )
+    return samples
+
+
+async def _collect_job_queues() -> list[Sample]:
+    """Read the depth and oldest waiting job of each job queue."""
+    async with get_db_manager().session() as session:
+        queues = await JobRepository(session).get_queue_stats()
+
+    now = datetime.now(UTC)
+    samples: list[Sample] = []
+    for queue, (depth, oldest) in queues.items():
+        samples.append((JOB_QUEUE_DEPTH.name, {"queue": queue}, depth))
+        if oldest is not None:
+            # SQLite returns naive datetimes; they are stored in UTC
+            if oldest.tzinfo is None:
+                oldest = oldest.replace(tzinfo=UTC)
+            age = max((now - oldest).total_seconds(), 0.0)
+            samples.append((JOB_QUEUE_OLDEST_AGE.name, {"queue": queue}, age))
+    return samples
+
+
+async def _collect_outbox() -> list[Sample]:
+    """Read the event outbox backlog, when the outbox is enabled."""
+    if not get_settings().event_outbox_enabled:
+        return []
+    async with get_db_manager().session() as session:
+        waiting, parked, oldest = await EventOutboxRepository(session).get_stats()
+
+    samples: list[Sample] = [
+        (OUTBOX_DEPTH.name, {"state": "waiting"}, waiting),
+        (OUTBOX_DEPTH.name, {"state": "parked"}, parked),
+    ]
+    if oldest is not None:
+        age = max((datetime.now(UTC) - oldest).total_seconds(), 0.0)
+        samples.append((OUTBOX_OLDEST_AGE.name, {}, age))
+    return samples
+
+
+async def _collect_password_hashing() -> list[Sample]:
+    """Read the password hashing pool's occupancy and limits."""
+    stats = get_password_hashing_stats()
+    return [
+        (PASSWORD_HASH_TASKS.name, {"state": "running"}, stats["running"]),
+        (PASSWORD_HASH_TASKS.name, {"state": "queued"}, stats["queued"]),
+        (PASSWORD_HASH_LIMIT.name, {"limit": "workers"}, stats["max_workers"]),
+        (PASSWORD_HASH_LIMIT.name, {"limit": "pending"}, stats["max_pending"]),
+    ]
+
+
+def register_metrics_collectors(app: FastAPI) -> None:
+    """Register the scrape-time collectors of an application.
+
+    Args:
+        app: FastAPI application whose realtime connection manager is read.
+    """
+
+    async def collect_realtime() -> list[Sample]:
+        manager = getattr(app.state, "connection_manager", None)
+        if manager is None:
+            return []
+        stats = manager.stats()
+        samples: list[Sample] = [
+            (REALTIME_CONNECTIONS.name, {"transport": transport}, count)
+            for transport, count in stats["connections"].items()
+        ]
+        samples.append((REALTIME_SUBSCRIPTIONS.name, {}, stats["subscriptions"]))
+        samples.append((REALTIME_OUTBOUND_QUEUE_DEPTH.name, {}, stats["queued"]))
+        return samples
+
+    registry = get_metrics_registry()
+    registry.register_collector("db_pool", _collect_db_pool)
+    registry.register_collector("job_queues", _collect_job_queues)
+    registry.register_collector("event_outbox", _collect_outbox)
+    registry.register_collector("password_hashing", _collect_password_hashing)
+    registry.register_collector("realtime", collect_realtime)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request) -> PlainTextResponse:
+    """Serve metrics in the Prometheus text exposition format.
+
+    Requires ``Authorization: Bearer <SNACKBASE_METRICS_TOKEN>`` when a
+    metrics token is configured.
+
+    Raises:
+        HTTPException: 404 if metrics are disabled, 401 if the token is wrong.
+    """
+    settings = get_settings()
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if settings.metrics_token:
+        expected = f"Bearer {settings.metrics_token}"
+        provided = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(provided.encode(), expected.encode()):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    body = await get_metrics_registry().render()
+    return PlainTextResponse(body, media_type=CONTENT_TYPE)
@@ -12,7 +12,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
-from snackbase.domain.services import AccountCodeGenerator
 from snackbase.infrastructure.api.schemas.auth_schemas import (
     AccountResponse,
     OAuthAuthorizeRequest,
@@ -23,7 +22,7 @@ from snackbase.infrastructure.api.schemas.auth_schemas import (
 )
 from snackbase.infrastructure.auth import (
     generate_random_password,
-    hash_password,
+    hash_password_async,
     jwt_service,
 )
 from snackbase.infrastructure.configuration.providers.oauth import (
@@ -430,7 +429,7 @@ async def callback(
                     id=str(uuid.uuid4()),
                     account_id=account_id,
                     email=email,
-                    password_hash=hash_password(generate_random_password()),
+                    password_hash=await hash_password_async(generate_random_password()),
                     role_id=user_role.id,
                     is_active=True,
                     auth_provider="oauth",
@@ -451,9 +450,8 @@ async def callback(
                 # Multi-tenant mode: create new account
                 is_new_account = True
                 # Create account logic (similar to register route)
-                existing_codes = await account_repo.get_all_account_codes()
                 new_account_id = str(uuid.uuid4())
-                account_code = AccountCodeGenerator.generate(existing_codes)
+                account_code = await account_repo.allocate_account_code()
 
                 from snackbase.domain.services import SlugGenerator
 
@@ -495,7 +493,7 @@ async def callback(
                     id=str(uuid.uuid4()),
                     account_id=account_id,
                     email=email,
-                    password_hash=hash_password(generate_random_password()),
+                    password_hash=await hash_password_async(generate_random_password()),
                     role_id=admin_role.id,
                     is_active=True,
                     auth_provider="oauth",
@@ -543,7 +541,7 @@ async def callback(
                 id=str(uuid.uuid4()),
                 account_id=account_id,
                 email=email,
-                password_hash=hash_password(generate_random_password()),
+                password_hash=await hash_password_async(generate_random_password()),
                 role_id=admin_role.id,
                 is_active=True,
                 auth_provider="oauth",
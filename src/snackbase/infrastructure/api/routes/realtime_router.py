@@ -150,7 +150,9 @@ async def sse_endpoint(
         connection_id=connection_id,
         user_id=current_user.user_id,
         account_id=current_user.account_id,
-        send_callback=send_callback
+        send_callback=send_callback,
+        transport="sse",
+        outbound_queue=event_queue,
     )
     
     await manager.add_connection(connection)
@@ -5,6 +5,7 @@ Provides dynamic endpoints for CRUD operations on collection records.
 
 import json
 import uuid
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
@@ -12,7 +13,15 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.core.config import get_settings
-from snackbase.core.cursor import CursorError, decode_cursor
+from snackbase.core.cursor import (
+    CursorError,
+    CursorScope,
+    SyncWatermark,
+    decode_cursor,
+    decode_watermark,
+    encode_watermark,
+    schema_version,
+)
 from snackbase.core.logging import get_logger
 from snackbase.core.rules import (
     AggregationParseError,
@@ -26,8 +35,9 @@ from snackbase.core.rules import (
 )
 from snackbase.infrastructure.persistence.repositories.record_repository import (
     _build_computed_select_parts,
+    resolve_sort_field,
 )
-from snackbase.domain.services import FieldType, PIIMaskingService, RecordValidator
+from snackbase.domain.services import FieldType, RecordValidator
 from snackbase.infrastructure.api.dependencies import (
     ANONYMOUS_USER_ID,
     AuthenticatedUser,
@@ -35,6 +45,24 @@ from snackbase.infrastructure.api.dependencies import (
     OptionalAuthContext,
     OptionalUser,
 )
+from snackbase.infrastructure.api.record_caching import (
+    as_utc,
+    cache_headers,
+    etag_matches,
+    list_etag,
+    not_modified,
+    not_modified_since,
+    record_etag,
+)
+from snackbase.infrastructure.api.record_projection import (
+    RecordProjection,
+    get_record_projection,
+)
+from snackbase.infrastructure.api.record_serialization import (
+    RecordJSONResponse,
+    prepare_record,
+    prepare_records,
+)
 from snackbase.infrastructure.api.middleware import (
     RuleFilter,
     apply_field_filter,
@@ -55,10 +83,13 @@ from snackbase.infrastructure.api.schemas import (
     RecordResponse,
     RecordValidationErrorDetail,
     RecordValidationErrorResponse,
+    SyncChangesResponse,
 )
 from snackbase.infrastructure.persistence.database import get_db_session
 from snackbase.infrastructure.persistence.repositories import (
+    CollectionChangeCounterRepository,
     CollectionRepository,
+    RecordChangeRepository,
     RecordRepository,
 )
 
@@ -67,49 +98,101 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-def _mask_record_pii(
-    record: dict[str, Any],
+def _response_projection(
+    collection_model: Any,
     schema: list[dict],
-    user_groups: list[str],
-    account_id: str | None = None,
-) -> dict[str, Any]:
-    """Mask PII fields in a record based on user groups.
+    allowed_fields: list[str] | str,
+    current_user: Any,
+    fields: str | None = None,
+) -> RecordProjection:
+    """Get the field projection and PII masking plan for a record response.
 
     Args:
-        record: The record data to mask.
-        schema: The collection schema with PII field definitions.
-        user_groups: List of group names the user belongs to.
-        account_id: Optional account ID for superadmin PII bypass.
+        collection_model: The collection (its raw schema keys the plan cache).
+        schema: The parsed collection schema with PII field definitions.
+        allowed_fields: Fields allowed by the permission rule, or "*".
+        current_user: The authenticated user, if any.
+        fields: Optional ``?fields=`` query parameter.
 
     Returns:
-        Record with PII fields masked if user doesn't have pii_access group.
+        Plan that filters fields and masks PII for users without pii_access.
     """
-    # Check if user has pii_access group or is superadmin
-    if not PIIMaskingService.should_mask_for_user(user_groups, account_id):
-        # User has pii_access or is superadmin, return unmasked data
-        return record
+    return get_record_projection(
+        collection_model.schema,
+        schema,
+        allowed_fields,
+        fields,
+        current_user.groups if current_user else [],
+        current_user.account_id if current_user else None,
+    )
 
-    # User doesn't have pii_access, mask PII fields
-    masked_record = record.copy()
 
-    for field in schema:
-        field_name = field.get("name")
-        is_pii = field.get("pii", False)
-        mask_type = field.get("mask_type")
-
-        if is_pii and field_name in masked_record and masked_record[field_name] is not None:
-            # Determine mask type (use default if not specified)
-            if not mask_type:
-                # Default to 'full' masking if no mask_type specified
-                mask_type = "full"
-
-            # Apply masking
-            masked_record[field_name] = PIIMaskingService.mask_value(
-                masked_record[field_name],
-                mask_type,
-            )
+def _cache_variant(
+    collection_model: Any,
+    schema: list[dict],
+    rule_result: RuleFilter,
+    projection: RecordProjection,
+    current_user: Any,
+    account_id: str | None,
+) -> list[Any]:
+    """Get everything besides the data that shapes a record response.
+
+    Folded into ETags so that rule, schema or permission changes never
+    validate a stale cached response.
+
+    Args:
+        collection_model: The collection (its ID changes when it is recreated).
+        schema: The parsed collection schema.
+        rule_result: The rule filter applied to the query.
+        projection: The field projection and PII masking plan.
+        current_user: The authenticated user, if any.
+        account_id: The account scope of the query (None for all accounts).
+
+    Returns:
+        JSON-serializable variant components.
+    """
+    return [
+        collection_model.id,
+        schema_version(schema),
+        rule_result.sql,
+        rule_result.params,
+        sorted(projection.keep) if projection.keep is not None else None,
+        [name for name, _ in projection.maskers],
+        account_id,
+        current_user.user_id if current_user else None,
+    ]
+
+
+async def _publish_record_events(
+    request: Request,
+    account_id: str,
+    collection: str,
+    operation: str,
+    records: list[dict[str, Any]],
+) -> None:
+    """Broadcast committed record changes to realtime subscribers.
 
-    return masked_record
+    Called once the write has committed. Realtime subscribers are connected
+    to this process, so the changes are published here even with the event
+    outbox enabled; the outbox only carries webhook, hook and workflow
+    deliveries. Subscribers connected to other processes of a multi-process
+    deployment do not see these events.
+
+    Args:
+        request: The current request (its app holds the event broadcaster).
+        account_id: The account owning the records.
+        collection: The collection name.
+        operation: The operation (create, update, delete).
+        records: The event data, one dict per record.
+    """
+    broadcaster = request.app.state.event_broadcaster
+    for data in records:
+        await broadcaster.publish_event(
+            account_id=account_id,
+            collection=collection,
+            operation=operation,
+            data=data,
+        )
 
 
 def _parse_expand_param(
@@ -483,27 +566,17 @@ async def create_record(
 
     # 7.5 Broadcast create event
     try:
-        broadcaster = request.app.state.event_broadcaster
         # Use full record for creation broadcast
-        await broadcaster.publish_event(
-            account_id=target_account_id,
-            collection=collection,
-            operation="create",
-            data=created_record
+        await _publish_record_events(
+            request, target_account_id, collection, "create", [created_record]
         )
     except Exception as e:
         logger.error("Failed to broadcast create event", error=str(e))
 
-    # 8. Apply field filter to response
-    if allowed_fields != "*":
-        created_record = apply_field_filter(created_record, allowed_fields)
-
-    # 9. Apply PII masking to response
-    created_record = _mask_record_pii(
-        created_record, schema,
-        current_user.groups if current_user else [],
-        current_user.account_id if current_user else None,
-    )
+    # 8. Apply field filter and PII masking to response
+    created_record = _response_projection(
+        collection_model, schema, allowed_fields, current_user
+    ).apply_one(created_record)
 
     return RecordResponse.from_record(created_record)
 
@@ -522,7 +595,7 @@ async def list_records(
     request: Request,
     current_user: OptionalUser,
     auth_context: OptionalAuthContext,
-    skip: int = Query(0, ge=0),
+    skip: int | None = Query(None, ge=0),
     limit: int = Query(30, ge=1, le=100),
     sort: str = Query("-created_at"),
     fields: str | None = Query(None),
@@ -532,10 +605,16 @@ async def list_records(
     cursor_before: str | None = Query(None),
     include_count: bool = Query(False),
     session: AsyncSession = Depends(get_db_session),
-) -> RecordListResponse | CursorListResponse | JSONResponse:
+) -> RecordJSONResponse | JSONResponse:
     """List records in a collection.
 
-    Supports pagination, sorting, and filtering.
+    Supports pagination, sorting, and filtering. Lists are paginated with
+    signed keyset cursors (``next_cursor``/``prev_cursor``) unless ``skip``
+    is given, which selects offset pagination with a total count.
+
+    Responses carry a weak ETag derived from the collection's change counter;
+    a matching ``If-None-Match`` is answered with ``304 Not Modified``
+    without running the list query.
     """
     # 0. Check read/list permission
     rule_result = await check_collection_permission(
@@ -600,9 +679,9 @@ async def list_records(
             },
         )
 
-    # 4b. Determine pagination mode
-    is_cursor_mode = cursor is not None or cursor_before is not None
-    if is_cursor_mode and (skip != 0):
+    # 4b. Determine pagination mode: keyset cursors unless an offset is given
+    is_cursor_mode = cursor is not None or cursor_before is not None or skip is None
+    if is_cursor_mode:
         # In cursor mode, skip is ignored
         skip = 0
 
@@ -619,10 +698,13 @@ async def list_records(
     cursor_sort_value = None
     cursor_record_id = None
     is_backward = False
+    cursor_scope = CursorScope(
+        resolve_sort_field(sort_by, schema), descending, schema_version(schema)
+    )
 
     if cursor:
         try:
-            cursor_sort_value, cursor_record_id = decode_cursor(cursor)
+            cursor_sort_value, cursor_record_id = decode_cursor(cursor, cursor_scope)
         except CursorError as e:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -633,7 +715,7 @@ async def list_records(
             )
     elif cursor_before:
         try:
-            cursor_sort_value, cursor_record_id = decode_cursor(cursor_before)
+            cursor_sort_value, cursor_record_id = decode_cursor(cursor_before, cursor_scope)
             is_backward = True
         except CursorError as e:
             return JSONResponse(
@@ -679,6 +761,29 @@ async def list_records(
     target_account_id = await _resolve_account_id(current_user, request, session)
     repo_account_id = None if (current_user is not None and current_user.account_id == SYSTEM_ACCOUNT_ID) else target_account_id
 
+    # Only the fields that survive the projection are selected
+    projection = _response_projection(
+        collection_model, schema, allowed_fields, current_user, fields
+    )
+
+    # Answer unchanged lists from the change counter, before the list query.
+    # Expanded lists depend on other collections and get no validator.
+    etag = None
+    last_modified = None
+    if not expand:
+        change_version, changed_at = await CollectionChangeCounterRepository(
+            session
+        ).get_state(collection, repo_account_id)
+        last_modified = as_utc(changed_at)
+        variant = _cache_variant(
+            collection_model, schema, rule_result, projection, current_user, repo_account_id
+        )
+        variant.append(sorted(request.query_params.items()))
+        etag = list_etag(change_version, variant)
+    headers = cache_headers(etag, last_modified, public=current_user is None)
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(headers)
+
     if is_cursor_mode:
         records, next_cursor, prev_cursor, has_more, total = await record_repo.find_all_cursor(
             collection_name=collection,
@@ -693,6 +798,7 @@ async def list_records(
             cursor_record_id=cursor_record_id,
             is_backward=is_backward,
             include_count=include_count,
+            columns=projection.keep,
         )
     else:
         records, total = await record_repo.find_all(
@@ -705,31 +811,16 @@ async def list_records(
             descending=descending,
             user_filter=user_filter,
             rule_filter=rule_result,
+            columns=projection.keep,
         )
         next_cursor = None
         prev_cursor = None
         has_more = False
 
-    # 6. Apply field filtering based on permissions
-    if allowed_fields != "*":
-        filtered_records = []
-        for record in records:
-            filtered_record = apply_field_filter(record, allowed_fields)
-            filtered_records.append(filtered_record)
-        records = filtered_records
-
-    # 7. Apply PII masking to all records
-    masked_records = []
-    for record in records:
-        masked_record = _mask_record_pii(
-            record, schema,
-            current_user.groups if current_user else [],
-            current_user.account_id if current_user else None,
-        )
-        masked_records.append(masked_record)
-    records = masked_records
-
-    # 7b. Expand reference fields if requested
+    # 6. Apply permission field filter, ?fields= limiting and PII masking in one pass
+    records = projection.apply(records)
+
+    # 7. Expand reference fields if requested
     if expand:
         expand_paths, invalid_field = _parse_expand_param(expand, schema)
         if invalid_field is not None:
@@ -754,49 +845,30 @@ async def list_records(
                 max_depth=max_depth,
             )
 
-    # 8. Apply additional field limiting if requested via query param
-    # Note: '*' means all fields, skip filtering in that case
-    if fields and fields.strip() != "*":
-        field_list = [f.strip() for f in fields.split(",")]
-        # Always include system fields - RecordResponse requires them
-        system_fields = {"id", "account_id", "created_at", "updated_at", "created_by", "updated_by"}
-        field_list = list(set(field_list) | system_fields)
-
-        filtered_records = []
-        for record in records:
-            filtered_record = {k: v for k, v in record.items() if k in field_list}
-            filtered_records.append(filtered_record)
-        records = filtered_records
-
-    # 9. Return response
-    # Debug: Log records before response creation
-    logger.debug(f"Creating response with {len(records)} records")
-    for i, r in enumerate(records):
-        logger.debug(f"Record {i}: keys={list(r.keys())}, id={r.get('id')}")
-
-    response_items = []
-    for r in records:
-        try:
-            response_items.append(RecordResponse.from_record(r))
-        except Exception as e:
-            logger.error(f"Failed to create RecordResponse for record: {r}", error=str(e))
-            raise
+    # 8. Return response (encoded directly; response_model documents the shape)
+    logger.debug("Creating list response", record_count=len(records))
+    items = prepare_records(records)
 
     if is_cursor_mode:
-        return CursorListResponse(
-            items=response_items,
-            next_cursor=next_cursor,
-            prev_cursor=prev_cursor,
-            has_more=has_more,
-            total=total if include_count else None,
-        )
-    else:
-        return RecordListResponse(
-            items=response_items,
-            total=total,
-            skip=skip,
-            limit=limit,
+        return RecordJSONResponse(
+            {
+                "items": items,
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+                "has_more": has_more,
+                "total": total if include_count else None,
+            },
+            headers=headers,
         )
+    return RecordJSONResponse(
+        {
+            "items": items,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+        },
+        headers=headers,
+    )
 
 
 # ── Aggregate endpoint — MUST be registered before /{collection}/{record_id} ──
@@ -928,6 +1000,213 @@ async def aggregate_collection(
     return AggregationResponse(results=results, total_groups=total_groups)
 
 
+# ── Delta sync endpoint — MUST be registered before /{collection}/{record_id} ──
+
+
+@router.get(
+    "/{collection}/changes",
+    response_model=SyncChangesResponse,
+    responses={
+        400: {"description": "Invalid watermark"},
+        401: {"description": "Authentication required"},
+        403: {"description": "Permission denied"},
+        404: {"description": "Collection not found"},
+        410: {"description": "Watermark expired; restart the sync without 'since'"},
+    },
+)
+async def sync_changes(
+    collection: str,
+    request: Request,
+    current_user: OptionalUser,
+    auth_context: OptionalAuthContext,
+    since: str | None = Query(None, description="Watermark returned by the previous call"),
+    limit: int = Query(100, ge=1),
+    fields: str | None = Query(None),
+    session: AsyncSession = Depends(get_db_session),
+) -> RecordJSONResponse | JSONResponse:
+    """Get the records created, updated or deleted since a watermark.
+
+    Lets clients keep an offline copy of a collection in sync. Without
+    ``since`` the first pages are a snapshot of every visible record, paged
+    by the keyset pagination index. Each response carries a ``watermark`` to
+    pass as ``since`` next; once the snapshot is complete, calls return only
+    what changed: records in ``items`` and tombstones in ``deleted`` (IDs of
+    records deleted or no longer visible under the list rule). Keep calling
+    while ``has_more`` is true.
+
+    Changes are read by keyset from the record change feed, which holds one
+    row per record. Records deleted or cleared by a reference field's
+    ``on_delete`` cascade are reported like direct writes. The feed is
+    ordered per account, so superadmins pass the account to sync in the
+    ``X-Account-ID`` header. Watermarks older than the tombstone retention
+    period are answered with ``410 Gone``; the client then resyncs without
+    ``since``.
+    """
+    # 1. Permission check — same as list_records
+    rule_result = await check_collection_permission(
+        auth_context=auth_context,
+        collection=collection,
+        operation="list",
+        session=session,
+    )
+
+    # 2. Collection lookup
+    collection_repo = CollectionRepository(session)
+    collection_model = await collection_repo.get_by_name(collection)
+    if collection_model is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": "Not found", "message": f"Collection '{collection}' not found"},
+        )
+    schema = json.loads(collection_model.schema)
+
+    # 3. Resolve account. Feed sequence numbers follow commit order only
+    # within an account, so a superadmin names the account to sync
+    from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_ID
+
+    if current_user is not None and current_user.account_id == SYSTEM_ACCOUNT_ID:
+        if not request.headers.get("X-Account-ID"):
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={
+                    "error": "Account required",
+                    "message": "Pass the account to sync in the X-Account-ID header",
+                },
+            )
+        repo_account_id = await _resolve_account_id(None, request, session)
+    else:
+        repo_account_id = await _resolve_account_id(current_user, request, session)
+
+    # 4. Check the watermark
+    settings = get_settings()
+    now = datetime.now(UTC)
+    if since:
+        try:
+            watermark = decode_watermark(since)
+        except CursorError as e:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"error": "Invalid watermark", "message": str(e)},
+            )
+        if watermark.account_id != repo_account_id:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={
+                    "error": "Invalid watermark",
+                    "message": "Watermark was issued for a different account",
+                },
+            )
+        retention = timedelta(days=settings.record_sync_tombstone_retention_days)
+        if watermark.collection_id != collection_model.id or watermark.issued_at < now - retention:
+            return JSONResponse(
+                status_code=status.HTTP_410_GONE,
+                content={
+                    "error": "Watermark expired",
+                    "message": "Restart the sync without 'since'",
+                },
+            )
+    else:
+        watermark = SyncWatermark(
+            collection_id=collection_model.id,
+            account_id=repo_account_id,
+            seq=await RecordChangeRepository(session).get_latest_seq(
+                collection, repo_account_id
+            ),
+            issued_at=now,
+            snapshot_after=None,
+        )
+
+    limit = min(limit, settings.record_sync_max_page_size)
+    projection = _response_projection(
+        collection_model, schema, rule_result.allowed_fields, current_user, fields
+    )
+    record_repo = RecordRepository(session)
+    change_repo = RecordChangeRepository(session)
+
+    if since is None or watermark.snapshot_after is not None:
+        # 5a. Snapshot: every visible record by (created_at, id); changes made
+        # meanwhile follow from the sequence number read when it started
+        after_value, after_id = watermark.snapshot_after or (None, None)
+        records, next_cursor, _, snapshot_more, _ = await record_repo.find_all_cursor(
+            collection_name=collection,
+            account_id=repo_account_id,
+            schema=schema,
+            limit=limit,
+            sort_by="created_at",
+            descending=False,
+            rule_filter=rule_result,
+            cursor_sort_value=after_value,
+            cursor_record_id=after_id,
+            columns=projection.keep,
+        )
+        deleted: list[str] = []
+        snapshot_after = None
+        if snapshot_more:
+            snapshot_after = decode_cursor(
+                next_cursor, CursorScope("created_at", False, schema_version(schema))
+            )
+            has_more = True
+        else:
+            latest = await change_repo.get_latest_seq(collection, repo_account_id)
+            has_more = latest > watermark.seq
+        next_watermark = SyncWatermark(
+            collection_id=watermark.collection_id,
+            account_id=watermark.account_id,
+            seq=watermark.seq,
+            issued_at=watermark.issued_at,
+            snapshot_after=snapshot_after,
+        )
+    else:
+        # 5b. Changes after the watermark, oldest first
+        changes = await change_repo.list_changes(
+            collection, repo_account_id, watermark.seq, limit + 1
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        changed_ids = [change.record_id for change in changes if not change.deleted]
+        found: dict[str, dict[str, Any]] = {}
+        if changed_ids:
+            id_params = {f"sync_id_{i}": record_id for i, record_id in enumerate(changed_ids)}
+            id_filter = RuleFilter(
+                sql='r."id" IN (' + ", ".join(f":{name}" for name in id_params) + ")",
+                params=id_params,
+            )
+            # Sorted by id so the rows are looked up by primary key
+            rows, _, _, _, _ = await record_repo.find_all_cursor(
+                collection_name=collection,
+                account_id=repo_account_id,
+                schema=schema,
+                limit=len(changed_ids),
+                sort_by="id",
+                descending=False,
+                user_filter=id_filter,
+                rule_filter=rule_result,
+                columns=projection.keep,
+            )
+            found = {record["id"]: record for record in rows}
+
+        records = [found[c.record_id] for c in changes if c.record_id in found]
+        deleted = [c.record_id for c in changes if c.record_id not in found]
+        # All later changes commit after this read, unless this page stopped
+        # short of them; those are no newer than the current watermark's
+        next_watermark = SyncWatermark(
+            collection_id=watermark.collection_id,
+            account_id=watermark.account_id,
+            seq=changes[-1].seq if changes else watermark.seq,
+            issued_at=watermark.issued_at if has_more else now,
+        )
+
+    return RecordJSONResponse(
+        {
+            "items": prepare_records(projection.apply(records)),
+            "deleted": deleted,
+            "watermark": encode_watermark(next_watermark),
+            "has_more": has_more,
+        }
+    )
+
+
 # ── Batch endpoints — MUST be registered before /{collection}/{record_id} ────
 # Starlette matches routes in registration order. Placing POST/PATCH/DELETE
 # /{collection}/batch here (before the parameterized /{record_id} routes below)
@@ -1064,28 +1343,13 @@ async def batch_create_records(
 
     # Broadcast a create event for each record
     try:
-        broadcaster = request.app.state.event_broadcaster
-        for r in created:
-            await broadcaster.publish_event(
-                account_id=target_account_id,
-                collection=collection,
-                operation="create",
-                data=r,
-            )
+        await _publish_record_events(request, target_account_id, collection, "create", created)
     except Exception as e:
         logger.error("Failed to broadcast batch create events", error=str(e))
 
     # Build response — apply field filter + PII masking
-    response_records = []
-    for r in created:
-        if allowed_fields != "*":
-            r = apply_field_filter(r, allowed_fields)
-        r = _mask_record_pii(
-            r, schema,
-            current_user.groups if current_user else [],
-            current_user.account_id if current_user else None,
-        )
-        response_records.append(RecordResponse.from_record(r))
+    projection = _response_projection(collection_model, schema, allowed_fields, current_user)
+    response_records = [RecordResponse.from_record(r) for r in projection.apply(created)]
 
     return BatchCreateResponse(created=response_records, count=len(response_records))
 
@@ -1234,28 +1498,13 @@ async def batch_update_records(
 
     # Broadcast update events
     try:
-        broadcaster = request.app.state.event_broadcaster
-        for r in updated:
-            await broadcaster.publish_event(
-                account_id=target_account_id,
-                collection=collection,
-                operation="update",
-                data=r,
-            )
+        await _publish_record_events(request, target_account_id, collection, "update", updated)
     except Exception as e:
         logger.error("Failed to broadcast batch update events", error=str(e))
 
     # Build response
-    response_records = []
-    for r in updated:
-        if allowed_fields != "*":
-            r = apply_field_filter(r, allowed_fields)
-        r = _mask_record_pii(
-            r, schema,
-            current_user.groups if current_user else [],
-            current_user.account_id if current_user else None,
-        )
-        response_records.append(RecordResponse.from_record(r))
+    projection = _response_projection(collection_model, schema, allowed_fields, current_user)
+    response_records = [RecordResponse.from_record(r) for r in projection.apply(updated)]
 
     return BatchUpdateResponse(updated=response_records, count=len(response_records))
 
@@ -1366,14 +1615,13 @@ async def batch_delete_records(
 
     # Broadcast delete events
     try:
-        broadcaster = request.app.state.event_broadcaster
-        for rid in deleted_ids:
-            await broadcaster.publish_event(
-                account_id=target_account_id,
-                collection=collection,
-                operation="delete",
-                data={"id": rid},
-            )
+        await _publish_record_events(
+            request,
+            target_account_id,
+            collection,
+            "delete",
+            [{"id": rid} for rid in deleted_ids],
+        )
     except Exception as e:
         logger.error("Failed to broadcast batch delete events", error=str(e))
 
@@ -1397,8 +1645,13 @@ async def get_record(
     auth_context: OptionalAuthContext,
     expand: str | None = Query(None),
     session: AsyncSession = Depends(get_db_session),
-) -> RecordResponse | JSONResponse:
-    """Get a single record by ID."""
+) -> RecordJSONResponse | JSONResponse:
+    """Get a single record by ID.
+
+    Responses carry a strong ETag and ``Last-Modified`` derived from the
+    record's ``updated_at``; matching conditional requests are answered with
+    ``304 Not Modified``.
+    """
     # 1. Look up collection (to get schema for type conversion)
     collection_repo = CollectionRepository(session)
     collection_model = await collection_repo.get_by_name(collection)
@@ -1436,12 +1689,41 @@ async def get_record(
     target_account_id = await _resolve_account_id(current_user, request, session)
     repo_account_id = None if (current_user is not None and current_user.account_id == SYSTEM_ACCOUNT_ID) else target_account_id
 
+    projection = _response_projection(collection_model, schema, allowed_fields, current_user)
+    variant = _cache_variant(
+        collection_model, schema, rule_result, projection, current_user, repo_account_id
+    )
+    public = current_user is None
+    if not isinstance(expand, str):
+        expand = None
+
+    # Revalidate a cached copy from the system columns alone, skipping the
+    # full fetch and serialization. Expanded records depend on other
+    # collections and get no validator.
+    if not expand and (
+        "if-none-match" in request.headers or "if-modified-since" in request.headers
+    ):
+        current = await record_repo.get_by_id(
+            collection_name=collection,
+            record_id=record_id,
+            account_id=repo_account_id,
+            schema=schema,
+            rule_filter=rule_result,
+            columns=(),
+        )
+        if current is not None:
+            etag = record_etag(current["id"], current["updated_at"], variant)
+            last_modified = as_utc(current["updated_at"])
+            if etag_matches(request, etag) or not_modified_since(request, last_modified):
+                return not_modified(cache_headers(etag, last_modified, public))
+
     record = await record_repo.get_by_id(
         collection_name=collection,
         record_id=record_id,
         account_id=repo_account_id,
         schema=schema,
         rule_filter=rule_result,
+        columns=projection.keep,
     )
 
     if record is None:
@@ -1453,20 +1735,19 @@ async def get_record(
             },
         )
 
-    # 3. Apply field filter to response
-    if allowed_fields != "*":
-        record = apply_field_filter(record, allowed_fields)
+    if expand:
+        headers = cache_headers(None, None, public)
+    else:
+        headers = cache_headers(
+            record_etag(record["id"], record["updated_at"], variant),
+            as_utc(record["updated_at"]),
+            public,
+        )
 
-    # 5. Apply PII masking to response
-    record = _mask_record_pii(
-        record, schema,
-        current_user.groups if current_user else [],
-        current_user.account_id if current_user else None,
-    )
+    # 3. Apply field filter and PII masking to response
+    record = projection.apply_one(record)
 
     # 6. Expand reference fields if requested
-    if not isinstance(expand, str):
-        expand = None
     if expand:
         expand_paths, invalid_field = _parse_expand_param(expand, schema)
         if invalid_field is not None:
@@ -1492,7 +1773,7 @@ async def get_record(
             )
             record = expanded[0]
 
-    return RecordResponse.from_record(record)
+    return RecordJSONResponse(prepare_record(record), headers=headers)
 
 
 @router.put(
@@ -1734,26 +2015,16 @@ async def _update_record(
 
     # 7.5 Broadcast update event
     try:
-        broadcaster = request.app.state.event_broadcaster
-        await broadcaster.publish_event(
-            account_id=target_account_id,
-            collection=collection,
-            operation="update",
-            data=updated_record
+        await _publish_record_events(
+            request, target_account_id, collection, "update", [updated_record]
         )
     except Exception as e:
         logger.error("Failed to broadcast update event", error=str(e))
 
-    # 8. Apply field filter to response
-    if allowed_fields != "*":
-        updated_record = apply_field_filter(updated_record, allowed_fields)
-
-    # 9. Apply PII masking to response
-    updated_record = _mask_record_pii(
-        updated_record, schema,
-        current_user.groups if current_user else [],
-        current_user.account_id if current_user else None,
-    )
+    # 8. Apply field filter and PII masking to response
+    updated_record = _response_projection(
+        collection_model, schema, allowed_fields, current_user
+    ).apply_one(updated_record)
 
     return RecordResponse.from_record(updated_record)
 
@@ -1864,12 +2135,8 @@ async def delete_record(
 
         # Broadcast delete event
         try:
-            broadcaster = request.app.state.event_broadcaster
-            await broadcaster.publish_event(
-                account_id=target_account_id,
-                collection=collection,
-                operation="delete",
-                data={"id": record_id}
+            await _publish_record_events(
+                request, target_account_id, collection, "delete", [{"id": record_id}]
             )
         except Exception as e:
             logger.error("Failed to broadcast delete event", error=str(e))
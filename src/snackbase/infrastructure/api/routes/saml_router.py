@@ -16,7 +16,7 @@ from datetime import datetime, timezone, timedelta
 
 from snackbase.infrastructure.auth import (
     generate_random_password,
-    hash_password,
+    hash_password_async,
     jwt_service,
 )
 from snackbase.infrastructure.api.schemas.auth_schemas import (
@@ -415,7 +415,7 @@ async def acs(
             id=str(uuid.uuid4()),
             account_id=account_id,
             email=email,
-            password_hash=hash_password(generate_random_password()),
+            password_hash=await hash_password_async(generate_random_password()),
             role_id=admin_role.id,
             is_active=True,
             auth_provider="saml",
@@ -30,7 +30,7 @@ from snackbase.infrastructure.api.schemas.users_schemas import (
     UserResponse,
     UserUpdateRequest,
 )
-from snackbase.infrastructure.auth import generate_random_password, hash_password
+from snackbase.infrastructure.auth import generate_random_password, hash_password_async
 from snackbase.infrastructure.persistence.models import AccountModel, RoleModel, UserModel
 from snackbase.infrastructure.persistence.repositories.user_repository import UserRepository
 
@@ -129,7 +129,7 @@ async def create_user(
         id=str(uuid.uuid4()),
         account_id=user_data.account_id,
         email=user_data.email,
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
         role_id=user_data.role_id,
         is_active=user_data.is_active,
         auth_provider=user_data.auth_provider,
@@ -23,10 +23,9 @@ Note: /{id}/toggle, /{id}/trigger, /{id}/instances must be registered before
 
 from __future__ import annotations
 
-import asyncio
 import secrets
 from datetime import UTC, datetime
-from typing import Annotated, Any, Set
+from typing import Annotated, Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -57,14 +56,16 @@ from snackbase.infrastructure.persistence.repositories.workflow_repository impor
 from snackbase.infrastructure.persistence.repositories.workflow_step_log_repository import (
     WorkflowStepLogRepository,
 )
+from snackbase.infrastructure.workflows.workflow_queue import (
+    WorkflowQueueFullError,
+    enqueue_workflow_resume,
+    start_workflow_instance,
+)
 
 logger = get_logger(__name__)
 
 _DEFAULT_MAX_WORKFLOWS = 50
 
-# Keep references to prevent background tasks from being GC'd
-_background_tasks: Set[asyncio.Task] = set()
-
 # ---------------------------------------------------------------------------
 # Routers — two separate routers so they can be mounted at different prefixes
 # ---------------------------------------------------------------------------
@@ -135,6 +136,31 @@ def _build_instance_response(inst: WorkflowInstanceModel) -> WorkflowInstanceRes
     )
 
 
+async def _queue_instance(
+    session: AsyncSession,
+    *,
+    workflow_id: str,
+    account_id: str,
+    trigger: dict[str, Any],
+) -> WorkflowInstanceModel:
+    """Create an instance and queue its run; 429 when the account's queue is full."""
+    try:
+        instance = await start_workflow_instance(
+            session,
+            workflow_id=workflow_id,
+            account_id=account_id,
+            trigger=trigger,
+        )
+    except WorkflowQueueFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+            headers={"Retry-After": "60"},
+        ) from exc
+    await session.commit()
+    return instance
+
+
 def _validate_trigger(trigger_dict: dict[str, Any]) -> None:
     """Validate trigger config; raises HTTPException on invalid input."""
     t_type = trigger_dict.get("type")
@@ -270,7 +296,6 @@ async def trigger_workflow(
     workflow_id: str,
     current_user: AuthenticatedUser,
     repo: WorkflowRepo,
-    instance_repo: InstanceRepo,
     session: Annotated[AsyncSession, Depends(get_db_session)],
     body: dict[str, Any] | None = None,
 ) -> TriggerWorkflowResponse:
@@ -278,33 +303,22 @@ async def trigger_workflow(
 
     Works for any trigger type. Accepts an optional JSON body that becomes
     the trigger context data available via ``{{trigger.*}}`` in step configs.
+    The run is queued on the ``workflows`` job queue; returns 429 when the
+    account's queue is full.
     """
     wf = await repo.get(workflow_id)
     if wf is None or wf.account_id != current_user.account_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workflow not found")
 
     trigger_data: dict[str, Any] = body or {}
-    instance = WorkflowInstanceModel(
+    instance = await _queue_instance(
+        session,
         workflow_id=wf.id,
         account_id=current_user.account_id,
-        status="pending",
-        context={"trigger": {**trigger_data, "_source": "manual"}, "steps": {}},
-        started_at=datetime.now(UTC),
+        trigger={**trigger_data, "_source": "manual"},
     )
-    await instance_repo.create(instance)
-    await session.commit()
     instance_id = instance.id
 
-    # Run in background so the API returns immediately
-    from snackbase.infrastructure.persistence.database import get_db_manager
-    from snackbase.infrastructure.workflows.workflow_executor import run_instance
-
-    db_manager = get_db_manager()
-
-    task = asyncio.create_task(run_instance(instance_id, db_manager.session))
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
-
     logger.info(
         "Workflow manually triggered",
         workflow_id=workflow_id,
@@ -438,8 +452,16 @@ async def get_instance(
     log_repo = WorkflowStepLogRepository(session)
     logs, _ = await log_repo.list_for_instance(instance_id)
 
+    # Step outputs are stored only in the step log; expose them under
+    # context["steps"] as before (latest execution of each step wins).
+    response = _build_instance_response(inst)
+    steps_section: dict[str, Any] = dict(response.context.get("steps") or {})
+    for log in logs:
+        steps_section[log.step_name] = {"output": log.output or {}, "status": log.status}
+    response.context = {**response.context, "steps": steps_section}
+
     return WorkflowInstanceDetailResponse(
-        **_build_instance_response(inst).model_dump(),
+        **response.model_dump(),
         step_logs=[WorkflowStepLogResponse.model_validate(log) for log in logs],
     )
 
@@ -499,15 +521,8 @@ async def resume_instance_endpoint(
             detail=f"Only failed or waiting instances can be resumed (current: {inst.status!r})",
         )
 
-    from snackbase.infrastructure.persistence.database import get_db_manager
-    from snackbase.infrastructure.workflows.workflow_executor import resume_instance
-
-    db_manager = get_db_manager()
-    task = asyncio.create_task(
-        resume_instance(instance_id, inst.current_step, db_manager.session)
-    )
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
+    await enqueue_workflow_resume(session, inst, inst.current_step)
+    await session.commit()
 
     logger.info("Workflow instance resume requested", instance_id=instance_id)
     return TriggerWorkflowResponse(
@@ -548,26 +563,14 @@ async def workflow_webhook_trigger(
     except Exception:
         body = {}
 
-    instance_repo = WorkflowInstanceRepository(session)
-    inst = WorkflowInstanceModel(
+    inst = await _queue_instance(
+        session,
         workflow_id=wf.id,
         account_id=wf.account_id,
-        status="pending",
-        context={"trigger": {**body, "_source": "webhook"}, "steps": {}},
-        started_at=datetime.now(UTC),
+        trigger={**body, "_source": "webhook"},
     )
-    await instance_repo.create(inst)
-    await session.commit()
     instance_id = inst.id
 
-    from snackbase.infrastructure.persistence.database import get_db_manager
-    from snackbase.infrastructure.workflows.workflow_executor import run_instance
-
-    db_manager = get_db_manager()
-    task = asyncio.create_task(run_instance(instance_id, db_manager.session))
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
-
     logger.info(
         "Workflow webhook triggered",
         workflow_id=wf.id,
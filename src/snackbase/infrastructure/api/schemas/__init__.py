@@ -86,6 +86,7 @@ from snackbase.infrastructure.api.schemas.record_schemas import (
     RecordResponse,
     RecordValidationErrorDetail,
     RecordValidationErrorResponse,
+    SyncChangesResponse,
 )
 from snackbase.infrastructure.api.schemas.role_schemas import (
     CreateRoleRequest,
@@ -160,6 +161,7 @@ __all__ = [
     "RoleResponse",
     "SchemaFieldResponse",
     "SendVerificationRequest",
+    "SyncChangesResponse",
     "SystemHealthStats",
     "TokenRefreshResponse",
     "UpdateAccountRequest",
@@ -306,6 +306,42 @@ class UpdateCollectionRulesRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+# ============================================================================
+# Aggregate Rollup Schemas
+# ============================================================================
+
+
+class CreateAggregateRollupRequest(BaseModel):
+    """Request schema for defining a materialized aggregate rollup."""
+
+    group_by: list[str] = Field(
+        default_factory=list,
+        description="Fields to group by (text, email, url, reference, boolean, created_by, updated_by)",
+    )
+    sum_fields: list[str] = Field(
+        default_factory=list,
+        description="Number fields whose sum/avg are maintained alongside the record count",
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AggregateRollupResponse(BaseModel):
+    """Response schema for an aggregate rollup definition."""
+
+    id: str = Field(..., description="Rollup ID (UUID)")
+    collection_id: str = Field(..., description="Collection ID")
+    group_by: list[str] = Field(..., description="Fields the rollup groups by")
+    sum_fields: list[str] = Field(..., description="Number fields whose sums are maintained")
+    created_at: datetime = Field(..., description="When the rollup was defined")
+    created_by: str | None = Field(None, description="User who defined the rollup")
+    groups: int | None = Field(
+        None, description="Number of groups stored by the last rebuild (create/rebuild only)"
+    )
+
+    model_config = {"from_attributes": True}
+
+
 # ============================================================================
 # Collection Export/Import Schemas
 # ============================================================================
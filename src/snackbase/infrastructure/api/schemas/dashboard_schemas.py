@@ -61,4 +61,13 @@ class DashboardStats(BaseModel):
     # Audit logs
     recent_audit_logs: list[AuditLogResponse]
 
+    # Freshness of the maintained counters behind total_records and storage usage
+    stats_updated_at: datetime | None = Field(
+        default=None, description="When a maintained dashboard counter last changed"
+    )
+    stats_reconciled_at: datetime | None = Field(
+        default=None,
+        description="Oldest full recount of the maintained counters (null if never reconciled)",
+    )
+
     model_config = ConfigDict(from_attributes=True)
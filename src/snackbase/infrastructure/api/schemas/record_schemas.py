@@ -72,6 +72,19 @@ class CursorListResponse(BaseModel):
     total: int | None = Field(None, description="Total count (only included if include_count=true)")
 
 
+class SyncChangesResponse(BaseModel):
+    """Response for a delta-sync page of a collection."""
+
+    items: list[RecordResponse] = Field(
+        ..., description="Records created or updated since the watermark, in change order"
+    )
+    deleted: list[str] = Field(
+        ..., description="IDs of records deleted (or no longer visible) since the watermark"
+    )
+    watermark: str = Field(..., description="Pass as 'since' to continue the sync")
+    has_more: bool = Field(..., description="Whether more changes follow right away")
+
+
 # ── Batch request bodies ──────────────────────────────────────────────────────
 
 
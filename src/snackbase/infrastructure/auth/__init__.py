@@ -17,10 +17,14 @@ from snackbase.infrastructure.auth.api_key_service import (
 )
 from snackbase.infrastructure.auth.password_hasher import (
     DUMMY_PASSWORD_HASH,
+    PasswordHashingBusyError,
     generate_random_password,
+    get_password_hashing_stats,
     hash_password,
+    hash_password_async,
     needs_rehash,
     verify_password,
+    verify_password_async,
 )
 from snackbase.infrastructure.auth.token_types import (
     AuthenticatedUser,
@@ -36,17 +40,21 @@ from snackbase.infrastructure.auth.authenticator import Authenticator
 
 __all__ = [
     "DUMMY_PASSWORD_HASH",
+    "PasswordHashingBusyError",
     "InvalidTokenError",
     "JWTError",
     "JWTService",
     "TokenExpiredError",
     "generate_random_password",
+    "get_password_hashing_stats",
     "hash_password",
+    "hash_password_async",
     "jwt_service",
     "api_key_service",
     "APIKeyService",
     "needs_rehash",
     "verify_password",
+    "verify_password_async",
     "TokenPayload",
     "TokenType",
     "AuthenticationError",
@@ -34,8 +34,8 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         Returns:
             The response from the application.
         """
-        # Skip health endpoints
-        if request.url.path in ["/health", "/ready", "/live"]:
+        # Skip health and metrics endpoints
+        if request.url.path in ["/health", "/ready", "/live", "/metrics"]:
             return await call_next(request)
 
         # Get database session factory
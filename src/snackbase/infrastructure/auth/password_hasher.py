@@ -2,16 +2,48 @@
 
 Provides secure password hashing and verification using the Argon2id algorithm,
 which is the winner of the Password Hashing Competition and recommended by OWASP.
+
+Argon2 is deliberately CPU- and memory-hard, so async code must use
+``hash_password_async`` / ``verify_password_async``. They run the work on a
+dedicated, bounded thread pool (argon2-cffi releases the GIL while hashing)
+and refuse new work with PasswordHashingBusyError once too many operations
+are pending, so a login flood turns into 429 responses instead of stalling
+the event loop.
 """
 
+import asyncio
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
-# Create a password hasher with secure defaults
+from snackbase.core.config import get_settings
+from snackbase.core.metrics import PASSWORD_HASH_REJECTED
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when too many password hashing operations are already pending."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        super().__init__(f"Password hashing queue is full ({limit} pending operations)")
+
+
+def _create_hasher() -> PasswordHasher:
+    """Create the Argon2id hasher from application settings."""
+    settings = get_settings()
+    return PasswordHasher(
+        time_cost=settings.password_hash_time_cost,
+        memory_cost=settings.password_hash_memory_cost,
+        parallelism=settings.password_hash_parallelism,
+    )
+
+
 # Argon2id is recommended for password hashing
-_hasher = PasswordHasher()
+_hasher = _create_hasher()
 
 # Dummy hash for timing-safe comparison when user doesn't exist.
 # This is a valid Argon2id hash that will never match any password,
@@ -98,3 +130,129 @@ def needs_rehash(hashed: str) -> bool:
         True if the hash should be updated, False otherwise.
     """
     return _hasher.check_needs_rehash(hashed)
+
+
+class _HashingPool:
+    """Bounded thread pool with admission control for Argon2 operations."""
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="snackbase-argon2"
+            )
+        return self._executor
+
+    def _call(self, fn: Any, *args: Any) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    async def run(self, fn: Any, *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                PASSWORD_HASH_REJECTED.inc()
+                raise PasswordHashingBusyError(self.max_pending)
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._call, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_pool: _HashingPool | None = None
+
+
+def _get_pool() -> _HashingPool:
+    """Get the process-wide hashing pool, creating it from settings on first use."""
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = _HashingPool(
+            max_workers=settings.password_hash_max_workers,
+            max_pending=settings.password_hash_max_pending,
+        )
+    return _pool
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bounded hashing pool.
+
+    Args:
+        password: The plaintext password to hash.
+
+    Returns:
+        The hashed password string.
+
+    Raises:
+        PasswordHashingBusyError: If the hashing queue is full.
+    """
+    return await _get_pool().run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify a password against a hash on the bounded hashing pool.
+
+    Args:
+        password: The plaintext password to verify.
+        hashed: The hashed password to verify against.
+
+    Returns:
+        True if the password matches, False otherwise.
+
+    Raises:
+        PasswordHashingBusyError: If the hashing queue is full.
+    """
+    return await _get_pool().run(verify_password, password, hashed)
+
+
+def get_password_hashing_stats() -> dict[str, int]:
+    """Get queue-depth and throughput counters for the hashing pool.
+
+    Returns:
+        Dictionary with max_workers, max_pending, pending, running, queued,
+        completed and rejected counts.
+    """
+    return _get_pool().stats()
+
+
+def shutdown_password_hashing_pool() -> None:
+    """Shut down the hashing pool (a new one is created on next use)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
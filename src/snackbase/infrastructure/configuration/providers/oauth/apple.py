@@ -7,10 +7,17 @@ from urllib.parse import urlencode
 import httpx
 import jwt
 
+from snackbase.infrastructure.configuration.providers.oauth.http_client import (
+    get_discovery_document,
+    get_oauth_http_client,
+    get_signing_key,
+)
 from snackbase.infrastructure.configuration.providers.oauth.oauth_handler import (
     OAuthProviderHandler,
 )
 
+APPLE_ISSUER = "https://appleid.apple.com"
+
 
 class AppleOAuthHandler(OAuthProviderHandler):
     """Apple OAuth 2.0 authentication provider.
@@ -139,18 +146,18 @@ class AppleOAuthHandler(OAuthProviderHandler):
             "redirect_uri": redirect_uri,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=data)
+        client = get_oauth_http_client()
+        response = await client.post(token_url, data=data)
 
-            if response.status_code != 200:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
-                except Exception:
-                    error_msg = response.text
-                raise ValueError(f"Failed to exchange Apple OAuth code: {error_msg}")
+        if response.status_code != 200:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
+            except Exception:
+                error_msg = response.text
+            raise ValueError(f"Failed to exchange Apple OAuth code: {error_msg}")
 
-            return response.json()
+        return response.json()
 
     async def get_user_info(
         self,
@@ -182,10 +189,19 @@ class AppleOAuthHandler(OAuthProviderHandler):
         id_token = access_token
         
         try:
-            # We don't verify the signature here because we just got it 
-            # from Apple over TLS, but in production we should verify 
-            # against Apple's public keys.
-            decoded = jwt.decode(id_token, options={"verify_signature": False})
+            # Verify against Apple's published keys; the discovery document
+            # and JWKS are cached, so this normally costs no request.
+            discovery = await get_discovery_document(APPLE_ISSUER)
+            signing_key = await get_signing_key(
+                discovery["jwks_uri"], jwt.get_unverified_header(id_token).get("kid")
+            )
+            decoded = jwt.decode(
+                id_token,
+                signing_key,
+                algorithms=["RS256"],
+                audience=config["client_id"],
+                issuer=APPLE_ISSUER,
+            )
             
             return {
                 "id": str(decoded.get("sub")),
@@ -201,21 +217,21 @@ class AppleOAuthHandler(OAuthProviderHandler):
         """Validate Apple OAuth configuration."""
         discovery_url = "https://appleid.apple.com/.well-known/openid-configuration"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # 1. Test discovery endpoint reachability
-                response = await client.get(discovery_url)
-                if response.status_code != 200:
-                    return False, f"Failed to fetch Apple discovery document: {response.status_code}"
-
-                # 2. Basic configuration validation (check required fields)
-                required = ["client_id", "client_secret", "team_id", "key_id", "redirect_uri"]
-                for field in required:
-                    if not config.get(field):
-                        return False, f"Missing required configuration field: {field}"
-
-                return True, "Apple connection successful. Discovery endpoint reached."
-            except httpx.HTTPError as e:
-                return False, f"Connectivity error to Apple: {str(e)}"
-            except Exception as e:
-                return False, f"Configuration validation failed: {str(e)}"
+        client = get_oauth_http_client()
+        try:
+            # 1. Test discovery endpoint reachability
+            response = await client.get(discovery_url)
+            if response.status_code != 200:
+                return False, f"Failed to fetch Apple discovery document: {response.status_code}"
+
+            # 2. Basic configuration validation (check required fields)
+            required = ["client_id", "client_secret", "team_id", "key_id", "redirect_uri"]
+            for field in required:
+                if not config.get(field):
+                    return False, f"Missing required configuration field: {field}"
+
+            return True, "Apple connection successful. Discovery endpoint reached."
+        except httpx.HTTPError as e:
+            return False, f"Connectivity error to Apple: {str(e)}"
+        except Exception as e:
+            return False, f"Configuration validation failed: {str(e)}"
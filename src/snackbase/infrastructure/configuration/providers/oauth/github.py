@@ -2,6 +2,9 @@
 
 from typing import Any, Dict, List, Optional
 import httpx
+from snackbase.infrastructure.configuration.providers.oauth.http_client import (
+    get_oauth_http_client,
+)
 from snackbase.infrastructure.configuration.providers.oauth.oauth_handler import (
     OAuthProviderHandler,
 )
@@ -98,24 +101,24 @@ class GitHubOAuthHandler(OAuthProviderHandler):
         
         headers = {"Accept": "application/json"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=data, headers=headers)
-            
-            if response.status_code != 200:
-                error_msg = f"HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error_description", error_data.get("error", error_msg))
-                except Exception:
-                    pass
-                raise ValueError(f"Failed to exchange GitHub OAuth code: {error_msg}")
+        client = get_oauth_http_client()
+        response = await client.post(token_url, data=data, headers=headers)
+        
+        if response.status_code != 200:
+            error_msg = f"HTTP {response.status_code}"
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("error_description", error_data.get("error", error_msg))
+            except Exception:
+                pass
+            raise ValueError(f"Failed to exchange GitHub OAuth code: {error_msg}")
+        
+        data = response.json()
+        if "error" in data:
+            error_msg = data.get("error_description", data.get("error"))
+            raise ValueError(f"Failed to exchange GitHub OAuth code: {error_msg}")
             
-            data = response.json()
-            if "error" in data:
-                error_msg = data.get("error_description", data.get("error"))
-                raise ValueError(f"Failed to exchange GitHub OAuth code: {error_msg}")
-                
-            return data
+        return data
 
     async def get_user_info(
         self,
@@ -131,63 +134,63 @@ class GitHubOAuthHandler(OAuthProviderHandler):
             "Accept": "application/vnd.github.v3+json",
         }
         
-        async with httpx.AsyncClient() as client:
-            # 1. Fetch basic user info
-            user_response = await client.get(user_url, headers=headers)
-            if user_response.status_code != 200:
-                raise ValueError(f"Failed to fetch GitHub user info: {user_response.status_code}")
-            user_data = user_response.json()
-            
-            # 2. Fetch email addresses
-            emails_response = await client.get(emails_url, headers=headers)
-            if emails_response.status_code != 200:
-                raise ValueError(f"Failed to fetch GitHub user emails: {emails_response.status_code}")
-            emails_data = emails_response.json()
-            
-            # 3. Find primary verified email
-            primary_email = None
+        client = get_oauth_http_client()
+        # 1. Fetch basic user info
+        user_response = await client.get(user_url, headers=headers)
+        if user_response.status_code != 200:
+            raise ValueError(f"Failed to fetch GitHub user info: {user_response.status_code}")
+        user_data = user_response.json()
+        
+        # 2. Fetch email addresses
+        emails_response = await client.get(emails_url, headers=headers)
+        if emails_response.status_code != 200:
+            raise ValueError(f"Failed to fetch GitHub user emails: {emails_response.status_code}")
+        emails_data = emails_response.json()
+        
+        # 3. Find primary verified email
+        primary_email = None
+        for email_info in emails_data:
+            if email_info.get("primary") and email_info.get("verified"):
+                primary_email = email_info.get("email")
+                break
+        
+        # Fallback to any verified email if primary not found
+        if not primary_email:
             for email_info in emails_data:
-                if email_info.get("primary") and email_info.get("verified"):
+                if email_info.get("verified"):
                     primary_email = email_info.get("email")
                     break
-            
-            # Fallback to any verified email if primary not found
-            if not primary_email:
-                for email_info in emails_data:
-                    if email_info.get("verified"):
-                        primary_email = email_info.get("email")
-                        break
-            
-            # Fallback to the first email if still not found
-            if not primary_email and emails_data:
-                primary_email = emails_data[0].get("email")
+        
+        # Fallback to the first email if still not found
+        if not primary_email and emails_data:
+            primary_email = emails_data[0].get("email")
 
-            return {
-                "id": str(user_data.get("id")),
-                "email": primary_email,
-                "name": user_data.get("name") or user_data.get("login"),
-                "picture": user_data.get("avatar_url"),
-            }
+        return {
+            "id": str(user_data.get("id")),
+            "email": primary_email,
+            "name": user_data.get("name") or user_data.get("login"),
+            "picture": user_data.get("avatar_url"),
+        }
 
     async def test_connection(self, config: Dict[str, Any]) -> tuple[bool, str]:
         """Validate GitHub OAuth configuration by checking required fields and API reachability."""
         api_url = "https://api.github.com"
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # 1. Test API reachability
-                response = await client.get(api_url)
-                if response.status_code != 200:
-                    return False, f"Failed to reach GitHub API: {response.status_code}"
-                
-                # 2. Basic configuration validation (check required fields)
-                required = ["client_id", "client_secret", "redirect_uri"]
-                for field in required:
-                    if not config.get(field):
-                        return False, f"Missing required configuration field: {field}"
-                
-                return True, "GitHub connection successful. API reached."
-            except httpx.HTTPError as e:
-                return False, f"Connectivity error to GitHub: {str(e)}"
-            except Exception as e:
-                return False, f"Configuration validation failed: {str(e)}"
+        client = get_oauth_http_client()
+        try:
+            # 1. Test API reachability
+            response = await client.get(api_url)
+            if response.status_code != 200:
+                return False, f"Failed to reach GitHub API: {response.status_code}"
+            
+            # 2. Basic configuration validation (check required fields)
+            required = ["client_id", "client_secret", "redirect_uri"]
+            for field in required:
+                if not config.get(field):
+                    return False, f"Missing required configuration field: {field}"
+            
+            return True, "GitHub connection successful. API reached."
+        except httpx.HTTPError as e:
+            return False, f"Connectivity error to GitHub: {str(e)}"
+        except Exception as e:
+            return False, f"Configuration validation failed: {str(e)}"
@@ -2,6 +2,9 @@
 
 from typing import Any, Dict, Optional
 import httpx
+from snackbase.infrastructure.configuration.providers.oauth.http_client import (
+    get_oauth_http_client,
+)
 from snackbase.infrastructure.configuration.providers.oauth.oauth_handler import (
     OAuthProviderHandler,
 )
@@ -110,15 +113,15 @@ class GoogleOAuthHandler(OAuthProviderHandler):
         if code_verifier:
             data["code_verifier"] = code_verifier
             
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=data)
-            
-            if response.status_code != 200:
-                error_data = response.json()
-                error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
-                raise ValueError(f"Failed to exchange Google OAuth code: {error_msg}")
-            
-            return response.json()
+        client = get_oauth_http_client()
+        response = await client.post(token_url, data=data)
+        
+        if response.status_code != 200:
+            error_data = response.json()
+            error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
+            raise ValueError(f"Failed to exchange Google OAuth code: {error_msg}")
+        
+        return response.json()
 
     async def get_user_info(
         self,
@@ -130,43 +133,43 @@ class GoogleOAuthHandler(OAuthProviderHandler):
         
         headers = {"Authorization": f"Bearer {access_token}"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(userinfo_url, headers=headers)
-            
-            if response.status_code != 200:
-                error_data = response.json()
-                error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
-                raise ValueError(f"Failed to fetch Google user info: {error_msg}")
-            
-            data = response.json()
-            
-            return {
-                "id": str(data.get("id")),
-                "email": data.get("email"),
-                "name": data.get("name"),
-                "picture": data.get("picture"),
-                "verified_email": data.get("verified_email", False),
-            }
+        client = get_oauth_http_client()
+        response = await client.get(userinfo_url, headers=headers)
+        
+        if response.status_code != 200:
+            error_data = response.json()
+            error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
+            raise ValueError(f"Failed to fetch Google user info: {error_msg}")
+        
+        data = response.json()
+        
+        return {
+            "id": str(data.get("id")),
+            "email": data.get("email"),
+            "name": data.get("name"),
+            "picture": data.get("picture"),
+            "verified_email": data.get("verified_email", False),
+        }
 
     async def test_connection(self, config: Dict[str, Any]) -> tuple[bool, str]:
         """Validate Google OAuth configuration."""
         discovery_url = "https://accounts.google.com/.well-known/openid-configuration"
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # 1. Test discovery endpoint reachability
-                response = await client.get(discovery_url)
-                if response.status_code != 200:
-                    return False, f"Failed to fetch Google discovery document: {response.status_code}"
-                
-                # 2. Basic configuration validation (check required fields)
-                required = ["client_id", "client_secret", "redirect_uri"]
-                for field in required:
-                    if not config.get(field):
-                        return False, f"Missing required configuration field: {field}"
-                
-                return True, "Google connection successful. Discovery endpoint reached."
-            except httpx.HTTPError as e:
-                return False, f"Connectivity error to Google: {str(e)}"
-            except Exception as e:
-                return False, f"Configuration validation failed: {str(e)}"
+        client = get_oauth_http_client()
+        try:
+            # 1. Test discovery endpoint reachability
+            response = await client.get(discovery_url)
+            if response.status_code != 200:
+                return False, f"Failed to fetch Google discovery document: {response.status_code}"
+            
+            # 2. Basic configuration validation (check required fields)
+            required = ["client_id", "client_secret", "redirect_uri"]
+            for field in required:
+                if not config.get(field):
+                    return False, f"Missing required configuration field: {field}"
+            
+            return True, "Google connection successful. Discovery endpoint reached."
+        except httpx.HTTPError as e:
+            return False, f"Connectivity error to Google: {str(e)}"
+        except Exception as e:
+            return False, f"Configuration validation failed: {str(e)}"
@@ -0,0 +1,127 @@
+"""Shared HTTP client and metadata cache for OAuth providers.
+
+Opening an ``httpx.AsyncClient`` per request costs a TLS handshake and a new
+connection pool on every login. The providers instead share one long-lived,
+connection-pooled client with bounded timeouts, which the application closes
+on shutdown.
+
+Provider metadata that changes rarely (OpenID discovery documents and JWKS
+signing keys) is cached in-process with a TTL. An unknown key ID triggers
+one early JWKS refresh so key rotation is picked up without waiting for the
+TTL, but at most once per ``_JWKS_MIN_REFRESH_SECONDS``, so forged tokens
+cannot turn every request into a JWKS fetch.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import jwt
+
+from snackbase.core.config import get_settings
+
+_JWKS_MIN_REFRESH_SECONDS = 60.0
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+# url -> (fetched_at, document), using the monotonic clock
+_json_cache: dict[str, tuple[float, Any]] = {}
+
+
+def get_oauth_http_client() -> httpx.AsyncClient:
+    """Get the shared OAuth HTTP client, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a
+    client created on another (e.g. closed) loop is replaced.
+
+    Returns:
+        The shared client.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        settings = get_settings()
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                settings.oauth_http_timeout_seconds,
+                connect=settings.oauth_http_connect_timeout_seconds,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.oauth_http_max_connections,
+                max_keepalive_connections=settings.oauth_http_max_keepalive_connections,
+            ),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_oauth_http_client() -> None:
+    """Close the shared OAuth HTTP client and drop cached metadata."""
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    _json_cache.clear()
+
+
+async def fetch_cached_json(url: str, max_age: float | None = None) -> Any:
+    """Fetch a JSON document, reusing a cached copy younger than ``max_age``.
+
+    Args:
+        url: Document URL.
+        max_age: Maximum age of a cached copy in seconds. Defaults to
+            ``oauth_metadata_cache_ttl_seconds``.
+
+    Returns:
+        The decoded JSON document.
+
+    Raises:
+        httpx.HTTPError: If the document cannot be fetched.
+    """
+    if max_age is None:
+        max_age = get_settings().oauth_metadata_cache_ttl_seconds
+    cached = _json_cache.get(url)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return cached[1]
+
+    response = await get_oauth_http_client().get(url)
+    response.raise_for_status()
+    document = response.json()
+    _json_cache[url] = (time.monotonic(), document)
+    return document
+
+
+async def get_discovery_document(issuer: str) -> dict[str, Any]:
+    """Get the cached OpenID Connect discovery document of an issuer.
+
+    Args:
+        issuer: Issuer URL, e.g. "https://appleid.apple.com".
+
+    Returns:
+        The discovery document.
+    """
+    return await fetch_cached_json(f"{issuer.rstrip('/')}/.well-known/openid-configuration")
+
+
+async def get_signing_key(jwks_uri: str, kid: str | None) -> jwt.PyJWK:
+    """Look up a JWT signing key in a cached JWKS.
+
+    Args:
+        jwks_uri: URL of the key set.
+        kid: Key ID from the token header.
+
+    Returns:
+        The matching key.
+
+    Raises:
+        ValueError: If the key set has no key with that ID.
+    """
+    for max_age in (None, _JWKS_MIN_REFRESH_SECONDS):
+        jwks = jwt.PyJWKSet.from_dict(await fetch_cached_json(jwks_uri, max_age))
+        for key in jwks.keys:
+            if key.key_id == kid:
+                return key
+    raise ValueError(f"Signing key {kid!r} not found in {jwks_uri}")
@@ -3,6 +3,9 @@
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 import httpx
+from snackbase.infrastructure.configuration.providers.oauth.http_client import (
+    get_oauth_http_client,
+)
 from snackbase.infrastructure.configuration.providers.oauth.oauth_handler import (
     OAuthProviderHandler,
 )
@@ -111,18 +114,18 @@ class MicrosoftOAuthHandler(OAuthProviderHandler):
             "scope": scopes,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=data)
+        client = get_oauth_http_client()
+        response = await client.post(token_url, data=data)
 
-            if response.status_code != 200:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
-                except Exception:
-                    error_msg = response.text
-                raise ValueError(f"Failed to exchange Microsoft OAuth code: {error_msg}")
+        if response.status_code != 200:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("error_description", error_data.get("error", "Unknown error"))
+            except Exception:
+                error_msg = response.text
+            raise ValueError(f"Failed to exchange Microsoft OAuth code: {error_msg}")
 
-            return response.json()
+        return response.json()
 
     async def get_user_info(
         self,
@@ -134,49 +137,49 @@ class MicrosoftOAuthHandler(OAuthProviderHandler):
 
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(userinfo_url, headers=headers)
+        client = get_oauth_http_client()
+        response = await client.get(userinfo_url, headers=headers)
 
-            if response.status_code != 200:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                except Exception:
-                    error_msg = response.text
-                raise ValueError(f"Failed to fetch Microsoft user info: {error_msg}")
+        if response.status_code != 200:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("error", {}).get("message", "Unknown error")
+            except Exception:
+                error_msg = response.text
+            raise ValueError(f"Failed to fetch Microsoft user info: {error_msg}")
 
-            data = response.json()
+        data = response.json()
 
-            # Microsoft Graph returns mail or userPrincipalName for email
-            email = data.get("mail") or data.get("userPrincipalName")
+        # Microsoft Graph returns mail or userPrincipalName for email
+        email = data.get("mail") or data.get("userPrincipalName")
 
-            return {
-                "id": str(data.get("id")),
-                "email": email,
-                "name": data.get("displayName"),
-                "picture": None,  # Microsoft Graph requires separate call for photo
-            }
+        return {
+            "id": str(data.get("id")),
+            "email": email,
+            "name": data.get("displayName"),
+            "picture": None,  # Microsoft Graph requires separate call for photo
+        }
 
     async def test_connection(self, config: Dict[str, Any]) -> tuple[bool, str]:
         """Validate Microsoft OAuth configuration."""
         tenant = config.get("tenant_id", "common")
         discovery_url = f"https://login.microsoftonline.com/{tenant}/v2.0/.well-known/openid-configuration"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # 1. Test discovery endpoint reachability
-                response = await client.get(discovery_url)
-                if response.status_code != 200:
-                    return False, f"Failed to fetch Microsoft discovery document: {response.status_code}"
-
-                # 2. Basic configuration validation (check required fields)
-                required = ["client_id", "client_secret", "redirect_uri"]
-                for field in required:
-                    if not config.get(field):
-                        return False, f"Missing required configuration field: {field}"
-
-                return True, "Microsoft connection successful. Discovery endpoint reached."
-            except httpx.HTTPError as e:
-                return False, f"Connectivity error to Microsoft: {str(e)}"
-            except Exception as e:
-                return False, f"Configuration validation failed: {str(e)}"
+        client = get_oauth_http_client()
+        try:
+            # 1. Test discovery endpoint reachability
+            response = await client.get(discovery_url)
+            if response.status_code != 200:
+                return False, f"Failed to fetch Microsoft discovery document: {response.status_code}"
+
+            # 2. Basic configuration validation (check required fields)
+            required = ["client_id", "client_secret", "redirect_uri"]
+            for field in required:
+                if not config.get(field):
+                    return False, f"Missing required configuration field: {field}"
+
+            return True, "Microsoft connection successful. Discovery endpoint reached."
+        except httpx.HTTPError as e:
+            return False, f"Connectivity error to Microsoft: {str(e)}"
+        except Exception as e:
+            return False, f"Configuration validation failed: {str(e)}"
@@ -7,11 +7,12 @@ import urllib.parse
 import zlib
 from typing import Any
 
-from signxml import XMLVerifier
-
 from snackbase.infrastructure.configuration.providers.saml.saml_handler import (
     SAMLProviderHandler,
 )
+from snackbase.infrastructure.configuration.providers.saml.signature import (
+    verify_saml_signature,
+)
 
 
 class AzureADSAMLProvider(SAMLProviderHandler):
@@ -131,16 +132,8 @@ class AzureADSAMLProvider(SAMLProviderHandler):
         try:
             xml_str = base64.b64decode(saml_response)
             
-            cert = config["idp_x509_cert"]
-            if not cert.startswith("-----BEGIN CERTIFICATE"):
-                cert = f"-----BEGIN CERTIFICATE-----\n{cert}\n-----END CERTIFICATE-----"
-
             # Azure AD requires checking audience restriction usually, but verify handles sign
-            verified_data = XMLVerifier().verify(
-                xml_str, 
-                x509_cert=cert,
-                ignore_ambiguous_key_info=True
-            ).signed_xml
+            verified_data = await verify_saml_signature(xml_str, config["idp_x509_cert"])
             
             ns = {
                 'saml': 'urn:oasis:names:tc:SAML:2.0:assertion',
@@ -7,11 +7,12 @@ import urllib.parse
 import zlib
 from typing import Any
 
-from signxml import XMLVerifier
-
 from snackbase.infrastructure.configuration.providers.saml.saml_handler import (
     SAMLProviderHandler,
 )
+from snackbase.infrastructure.configuration.providers.saml.signature import (
+    verify_saml_signature,
+)
 
 
 class GenericSAMLProvider(SAMLProviderHandler):
@@ -152,17 +153,8 @@ class GenericSAMLProvider(SAMLProviderHandler):
             # Decode Base64
             xml_str = base64.b64decode(saml_response)
             
-            # Format certificate
-            cert = config["idp_x509_cert"]
-            if not cert.startswith("-----BEGIN CERTIFICATE"):
-                cert = f"-----BEGIN CERTIFICATE-----\n{cert}\n-----END CERTIFICATE-----"
-
             # Verify signature
-            verified_data = XMLVerifier().verify(
-                xml_str, 
-                x509_cert=cert,
-                ignore_ambiguous_key_info=True
-            ).signed_xml
+            verified_data = await verify_saml_signature(xml_str, config["idp_x509_cert"])
 
             # Namespaces
             ns = {
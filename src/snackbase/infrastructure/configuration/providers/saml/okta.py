@@ -9,11 +9,13 @@ from typing import Any
 from xml.etree import ElementTree
 
 from lxml import etree
-from signxml import XMLVerifier
 
 from snackbase.infrastructure.configuration.providers.saml.saml_handler import (
     SAMLProviderHandler,
 )
+from snackbase.infrastructure.configuration.providers.saml.signature import (
+    verify_saml_signature,
+)
 
 
 class OktaSAMLProvider(SAMLProviderHandler):
@@ -132,21 +134,11 @@ class OktaSAMLProvider(SAMLProviderHandler):
             # Decode Base64
             xml_str = base64.b64decode(saml_response)
             
-            # Format certificate
-            cert = config["idp_x509_cert"]
-            if not cert.startswith("-----BEGIN CERTIFICATE"):
-                # Wrap it if raw base64
-                cert = f"-----BEGIN CERTIFICATE-----\n{cert}\n-----END CERTIFICATE-----"
-
-            # Verify signature using signxml
+            # Verify signature using signxml on the SAML verification pool
             # Note: We need to handle potential namespaces and schema validation
             # signxml XMLVerifier verifies the signature and returns the signed data
             # strict=True ensures we don't accept unsigned assertions if we expect them
-            verified_data = XMLVerifier().verify(
-                xml_str, 
-                x509_cert=cert,
-                ignore_ambiguous_key_info=True # Common issue with some providers
-            ).signed_xml
+            verified_data = await verify_saml_signature(xml_str, config["idp_x509_cert"])
 
             # If verify returns, the signature is valid.
             # verified_data is an lxml Element
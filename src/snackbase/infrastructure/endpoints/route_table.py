@@ -0,0 +1,249 @@
+"""Precompiled route tables for custom endpoints (F8.2).
+
+Matching a request used to load every enabled endpoint of the account, compile
+a regex per path template and scan them in turn. Instead, each worker keeps a
+compiled route table per account: a trie per HTTP method whose nodes are path
+segments, so matching costs one dict lookup per segment regardless of how
+many endpoints the account has.
+
+Segments are matched in order of specificity: a literal segment beats a
+``:param`` segment, which beats a segment mixing literal text and parameters
+(e.g. ``:name.json``, matched with a regex). Parameters never match an empty
+segment, and a template matches only paths with the same number of segments,
+exactly like the regex each template compiles to.
+
+A table is tagged with the account's route version (see
+``endpoint_repository``), which every committed endpoint change bumps. The
+dispatcher reads that version on each request and rebuilds the table only
+when it moved, which keeps all workers consistent.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from snackbase.core.config import get_settings
+from snackbase.core.logging import get_logger
+from snackbase.infrastructure.persistence.models.endpoint import EndpointModel
+
+logger = get_logger(__name__)
+
+_PARAM_SEGMENT_RE = re.compile(r"^:([a-zA-Z_][a-zA-Z0-9_]*)$")
+_PARAM_RE = re.compile(r":([a-zA-Z_][a-zA-Z0-9_]*)")
+
+
+@dataclass(frozen=True)
+class CompiledEndpoint:
+    """Snapshot of an endpoint definition, safe to share across sessions.
+
+    Attributes:
+        id: Endpoint ID.
+        method: HTTP method.
+        path: Path template.
+        auth_required: Whether a valid auth token is required.
+        condition: Optional rule expression gating access.
+        actions: Action pipeline definitions.
+        response_template: Optional response template.
+    """
+
+    id: str
+    method: str
+    path: str
+    auth_required: bool
+    condition: str | None
+    actions: list[dict[str, Any]]
+    response_template: dict[str, Any] | None
+
+    @classmethod
+    def from_model(cls, endpoint: EndpointModel) -> CompiledEndpoint:
+        """Snapshot an endpoint model."""
+        return cls(
+            id=endpoint.id,
+            method=endpoint.method,
+            path=endpoint.path,
+            auth_required=endpoint.auth_required,
+            condition=endpoint.condition,
+            actions=list(endpoint.actions or []),
+            response_template=endpoint.response_template,
+        )
+
+
+@dataclass
+class _Node:
+    literals: dict[str, _Node] = field(default_factory=dict)
+    # (parameter name, child) for whole-segment parameters
+    params: list[tuple[str, _Node]] = field(default_factory=list)
+    # (compiled segment regex, child) for segments mixing text and parameters
+    patterns: list[tuple[re.Pattern[str], _Node]] = field(default_factory=list)
+    endpoint: CompiledEndpoint | None = None
+
+
+def _segment_regex(segment: str) -> re.Pattern[str]:
+    """Compile a segment the way a whole template used to be compiled."""
+    escaped = re.sub(r"[.]", r"\\.", segment)
+    return re.compile("^" + _PARAM_RE.sub(r"(?P<\1>[^/]+)", escaped) + "$")
+
+
+def _split(path: str) -> list[str]:
+    # Paths start with "/"; a trailing "/" yields a final empty segment
+    return path.split("/")[1:]
+
+
+class RouteTable:
+    """Method + segment trie over an account's enabled endpoints."""
+
+    def __init__(self, endpoints: list[CompiledEndpoint] | None = None) -> None:
+        self._roots: dict[str, _Node] = {}
+        for endpoint in endpoints or ():
+            self.add(endpoint)
+
+    def add(self, endpoint: CompiledEndpoint) -> None:
+        """Insert an endpoint; the first one added for a template wins.
+
+        Raises:
+            re.error: If a segment compiles to an invalid regex, e.g. one
+                naming the same parameter twice.
+        """
+        node = self._roots.setdefault(endpoint.method, _Node())
+        for segment in _split(endpoint.path):
+            node = self._child(node, segment)
+        if node.endpoint is None:
+            node.endpoint = endpoint
+
+    @staticmethod
+    def _child(node: _Node, segment: str) -> _Node:
+        param = _PARAM_SEGMENT_RE.match(segment)
+        if param:
+            name = param.group(1)
+            for existing, child in node.params:
+                if existing == name:
+                    return child
+            child = _Node()
+            node.params.append((name, child))
+            return child
+        if ":" not in segment:
+            return node.literals.setdefault(segment, _Node())
+        regex = _segment_regex(segment)
+        for existing, child in node.patterns:
+            if existing.pattern == regex.pattern:
+                return child
+        child = _Node()
+        node.patterns.append((regex, child))
+        return child
+
+    def match(self, method: str, path: str) -> tuple[CompiledEndpoint, dict[str, str]] | None:
+        """Find the endpoint serving a request.
+
+        Args:
+            method: HTTP method (uppercased).
+            path: Incoming path starting with /.
+
+        Returns:
+            The endpoint and its extracted path parameters, or None.
+        """
+        root = self._roots.get(method)
+        if root is None:
+            return None
+        return self._match(root, _split(path), 0, {})
+
+    def _match(
+        self, node: _Node, segments: list[str], index: int, params: dict[str, str]
+    ) -> tuple[CompiledEndpoint, dict[str, str]] | None:
+        if index == len(segments):
+            return (node.endpoint, dict(params)) if node.endpoint is not None else None
+        segment = segments[index]
+
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._match(child, segments, index + 1, params)
+            if found is not None:
+                return found
+        if segment:
+            for name, child in node.params:
+                found = self._match(child, segments, index + 1, {**params, name: segment})
+                if found is not None:
+                    return found
+        for regex, child in node.patterns:
+            m = regex.match(segment)
+            if m is None:
+                continue
+            found = self._match(child, segments, index + 1, {**params, **m.groupdict()})
+            if found is not None:
+                return found
+        return None
+
+
+class RouteTableCache:
+    """Per-worker LRU of route tables tagged with account route versions.
+
+    Args:
+        max_accounts: Maximum number of accounts whose tables are kept.
+    """
+
+    def __init__(self, max_accounts: int) -> None:
+        self.max_accounts = max_accounts
+        self._tables: OrderedDict[str, tuple[int, RouteTable]] = OrderedDict()
+
+    def get(self, account_id: str, version: int) -> RouteTable | None:
+        """Return the account's table if it was built at ``version``."""
+        entry = self._tables.get(account_id)
+        if entry is None or entry[0] != version:
+            return None
+        self._tables.move_to_end(account_id)
+        return entry[1]
+
+    def put(self, account_id: str, version: int, table: RouteTable) -> None:
+        """Store the table built for an account at ``version``."""
+        if self.max_accounts <= 0:
+            return
+        self._tables[account_id] = (version, table)
+        self._tables.move_to_end(account_id)
+        while len(self._tables) > self.max_accounts:
+            self._tables.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every table."""
+        self._tables.clear()
+
+
+_cache: RouteTableCache | None = None
+
+
+def get_route_table_cache() -> RouteTableCache:
+    """Get the process-wide route table cache."""
+    global _cache
+    if _cache is None:
+        _cache = RouteTableCache(max_accounts=get_settings().endpoint_route_cache_max_accounts)
+    return _cache
+
+
+async def get_route_table(endpoint_repo: Any, account_id: str) -> RouteTable:
+    """Get an account's current route table, rebuilding it if endpoints changed.
+
+    Args:
+        endpoint_repo: EndpointRepository bound to the request's session.
+        account_id: Tenant account ID.
+
+    Returns:
+        The compiled route table.
+    """
+    cache = get_route_table_cache()
+    version = await endpoint_repo.get_route_version(account_id)
+    table = cache.get(account_id, version)
+    if table is None:
+        table = RouteTable()
+        for endpoint in await endpoint_repo.get_all_enabled_for_account(account_id):
+            try:
+                table.add(CompiledEndpoint.from_model(endpoint))
+            except re.error as exc:
+                logger.warning(
+                    "Skipping custom endpoint with invalid path template",
+                    endpoint_id=endpoint.id,
+                    path=endpoint.path,
+                    error=str(exc),
+                )
+        cache.put(account_id, version, table)
+    return table
@@ -7,6 +7,7 @@ from snackbase.infrastructure.hooks.builtin_hooks import (
     BUILTIN_HOOKS,
     account_isolation_hook,
     created_by_hook,
+    record_count_hook,
     register_builtin_hooks,
     timestamp_hook,
 )
@@ -15,6 +16,7 @@ __all__ = [
     "BUILTIN_HOOKS",
     "account_isolation_hook",
     "created_by_hook",
+    "record_count_hook",
     "register_builtin_hooks",
     "timestamp_hook",
 ]
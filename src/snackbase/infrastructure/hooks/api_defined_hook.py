@@ -6,6 +6,8 @@ hooks, evaluates optional conditions, executes actions, and logs the result.
 
 This mirrors the webhook_hook.py pattern: background tasks for non-blocking
 dispatch, session_factory for DB access, no per-hook registration overhead.
+With the event outbox enabled, record events are dispatched by the
+OutboxRelay after the write commits instead.
 
 Supported events:
     records.create  → ON_RECORD_AFTER_CREATE
@@ -22,6 +24,7 @@ import time
 from datetime import UTC, datetime
 from typing import Any, Optional, Set
 
+from snackbase.core.config import get_settings
 from snackbase.core.hooks.hook_events import HookEvent
 from snackbase.core.hooks.hook_registry import HookRegistry
 from snackbase.core.logging import get_logger
@@ -74,6 +77,9 @@ def register_api_defined_hooks(registry: HookRegistry, session_factory: Any) ->
             _internal_event: str = internal_event,
             _session_factory: Any = session_factory,
         ) -> Optional[dict[str, Any]]:
+            if _internal_event in _RECORD_EVENTS and get_settings().event_outbox_enabled:
+                # Dispatched by the outbox relay once the write commits
+                return data
             # Dispatch as a background task so it never blocks the caller
             task = asyncio.create_task(
                 _dispatch_api_hooks(
@@ -107,15 +113,21 @@ async def _dispatch_api_hooks(
     data: Optional[dict[str, Any]],
     context: Optional[HookContext],
     session_factory: Any,
+    reraise: bool = False,
 ) -> None:
     """Query matching hooks and execute them.
 
+    Failures of a hook's actions are logged as its execution result; with
+    ``reraise`` a failure to look the hooks up is raised so the outbox
+    relay can retry the event.
+
     Args:
         internal_event: HookEvent constant (e.g. "on_record_after_create").
         api_event: Public event string (e.g. "records.create").
         data: Hook data containing record, collection, old_values.
         context: Hook context with account_id, user.
         session_factory: Async session factory.
+        reraise: Raise lookup errors instead of only logging them.
     """
     if context is None or not context.account_id:
         return
@@ -166,6 +178,8 @@ async def _dispatch_api_hooks(
             account_id=account_id,
             error=str(exc),
         )
+        if reraise:
+            raise
 
 
 async def _run_hook(
@@ -7,6 +7,7 @@ they run before or after user hooks as appropriate.
 Built-in hooks in Phase 1:
 - timestamp_hook: Sets created_at/updated_at timestamps
 - account_isolation_hook: Ensures account_id is set on records
+- record_count_hook: Maintains per-collection record counters for the dashboard
 """
 
 from datetime import datetime, timezone
@@ -281,6 +282,45 @@ async def audit_capture_hook(
     return data
 
 
+async def record_count_hook(
+    event: str,
+    data: dict[str, Any] | None,
+    context: HookContext | None,
+) -> dict[str, Any] | None:
+    """Built-in hook to maintain per-collection record counters.
+
+    Queues an adjustment of the collection's dashboard counter, applied when
+    the record write commits. Writes that bypass hooks are corrected by the
+    periodic reconciliation in the scheduler.
+
+    Args:
+        event: The hook event name.
+        data: The record data (contains 'collection' and 'session').
+        context: The hook context.
+
+    Returns:
+        Unmodified data.
+    """
+    if data is None:
+        return data
+
+    session = data.get("session")
+    collection_name = data.get("collection")
+    if session is None or collection_name is None:
+        return data
+
+    delta = 1 if event == HookEvent.ON_RECORD_AFTER_CREATE else -1
+
+    from snackbase.infrastructure.persistence.repositories.dashboard_stat_repository import (
+        queue_increment,
+        record_count_key,
+    )
+
+    queue_increment(session, record_count_key(collection_name), delta)
+
+    return data
+
+
 def register_builtin_hooks(registry: HookRegistry) -> list[str]:
     """Register all built-in hooks.
 
@@ -369,6 +409,20 @@ def register_builtin_hooks(registry: HookRegistry) -> list[str]:
             )
         )
 
+    # Record count hooks - keep dashboard counters current
+    for event in [
+        HookEvent.ON_RECORD_AFTER_CREATE,
+        HookEvent.ON_RECORD_AFTER_DELETE,
+    ]:
+        hook_ids.append(
+            registry.register(
+                event=event,
+                callback=record_count_hook,
+                priority=90,
+                is_builtin=True,
+            )
+        )
+
     logger.info(
         "Built-in hooks registered",
         hook_count=len(hook_ids),
@@ -384,4 +438,5 @@ BUILTIN_HOOKS = {
     "account_isolation_hook": account_isolation_hook,
     "created_by_hook": created_by_hook,
     "audit_capture_hook": audit_capture_hook,
+    "record_count_hook": record_count_hook,
 }
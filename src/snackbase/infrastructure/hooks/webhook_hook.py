@@ -2,11 +2,14 @@
 
 Registers hooks that fire outbound webhooks when record events occur.
 Webhook delivery is asynchronous and does NOT block the record operation.
+With the event outbox enabled the hooks stand down and the OutboxRelay
+calls ``_dispatch_webhooks`` for committed events instead.
 """
 
 import asyncio
 from typing import Any, Optional, Set
 
+from snackbase.core.config import get_settings
 from snackbase.core.hooks.hook_events import HookEvent
 from snackbase.core.hooks.hook_registry import HookRegistry
 from snackbase.core.logging import get_logger
@@ -63,6 +66,9 @@ def register_webhook_hooks(registry: HookRegistry, session_factory: Any) -> list
             _webhook_event: str = webhook_event,
             _session_factory: Any = session_factory,
         ) -> Optional[dict[str, Any]]:
+            if get_settings().event_outbox_enabled:
+                # Dispatched by the outbox relay once the write commits
+                return data
             return await _dispatch_webhooks(
                 event=_event,
                 webhook_event=_webhook_event,
@@ -90,6 +96,7 @@ async def _dispatch_webhooks(
     data: Optional[dict[str, Any]],
     context: Optional[HookContext],
     session_factory: Any,
+    reraise: bool = False,
 ) -> Optional[dict[str, Any]]:
     """Internal: look up matching webhooks and fire them.
 
@@ -99,6 +106,8 @@ async def _dispatch_webhooks(
         data: Hook data containing "record", "collection", "old_values", "session".
         context: Hook context with account_id.
         session_factory: Async session factory.
+        reraise: Create the deliveries before returning and raise on
+            failure, so the outbox relay can retry the event.
 
     Returns:
         Unmodified data (webhook dispatch doesn't alter the record).
@@ -121,7 +130,6 @@ async def _dispatch_webhooks(
     # For delete, record IS the previous; current record is None
     current_record = None if webhook_event == "records.delete" else record
 
-    from snackbase.core.config import get_settings
     from snackbase.infrastructure.persistence.repositories.webhook_repository import (
         WebhookRepository,
     )
@@ -155,6 +163,17 @@ async def _dispatch_webhooks(
                     )
                     continue
 
+            if reraise:
+                await dispatch_webhook(
+                    webhook=webhook,
+                    event_type=webhook_event,
+                    record=current_record or {},
+                    previous=previous,
+                    session_factory=session_factory,
+                    timeout_seconds=timeout,
+                )
+                continue
+
             # Fire delivery as background task, deferred so the calling
             # transaction can commit first (avoids SQLite "database is locked").
             async def _dispatch(wh: Any = webhook) -> None:
@@ -185,5 +204,7 @@ async def _dispatch_webhooks(
             collection=collection,
             error=str(exc),
         )
+        if reraise:
+            raise
 
     return data
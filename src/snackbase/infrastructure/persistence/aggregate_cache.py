@@ -0,0 +1,139 @@
+"""Per-worker result cache for collection aggregations.
+
+Dashboards poll ``/aggregate`` with identical parameters, so results are
+cached in-process, keyed by everything that shapes the query (collection,
+account scope, functions, group-by, filters, having). Entries are tagged with
+the collection's *write version*:
+
+- RecordRepository calls ``mark_collection_written`` on every insert, update
+  and delete, which bumps the version immediately (so the writer's own
+  session never reads a stale entry) and again when the transaction commits
+  or rolls back (so entries computed from pre-commit data are dropped).
+- A lookup only hits when the entry's version matches the current one and
+  its TTL has not expired. The TTL bounds staleness for writes made by other
+  worker processes, which this process cannot observe.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from snackbase.core.config import get_settings
+
+_PENDING_WRITES_KEY = "snackbase_written_collections"
+
+_write_versions: dict[str, int] = {}
+
+
+def collection_write_version(collection_name: str) -> int:
+    """Return the current write version of a collection in this process."""
+    return _write_versions.get(collection_name, 0)
+
+
+def _bump(collection_name: str) -> None:
+    _write_versions[collection_name] = _write_versions.get(collection_name, 0) + 1
+
+
+def mark_collection_written(session: Any, collection_name: str) -> None:
+    """Record a write to a collection's table in the current transaction.
+
+    Args:
+        session: The (async) session performing the write.
+        collection_name: The collection whose table was written.
+    """
+    _bump(collection_name)
+    info = getattr(session, "info", None)
+    if isinstance(info, dict):
+        info.setdefault(_PENDING_WRITES_KEY, set()).add(collection_name)
+
+
+def has_pending_writes(session: Any, collection_name: str) -> bool:
+    """Check whether a session has uncommitted writes to a collection."""
+    info = getattr(session, "info", None)
+    return isinstance(info, dict) and collection_name in info.get(_PENDING_WRITES_KEY, ())
+
+
+def _bump_pending(session: Session, *args: Any) -> None:
+    for collection_name in session.info.pop(_PENDING_WRITES_KEY, ()):
+        _bump(collection_name)
+
+
+event.listen(Session, "after_commit", _bump_pending)
+event.listen(Session, "after_rollback", _bump_pending)
+
+
+class AggregateResultCache:
+    """LRU cache of aggregation results tagged with collection write versions.
+
+    Args:
+        max_entries: Maximum number of cached results.
+        ttl_seconds: Lifetime of an entry; 0 disables caching.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[str, int, float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def make_key(collection_name: str, *parts: Any) -> str:
+        """Build a cache key from a collection name and query components."""
+        return json.dumps([collection_name, *parts], sort_keys=True, default=str)
+
+    def get(self, collection_name: str, key: str) -> Any | None:
+        """Return a cached value if it is current, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        _, version, expires_at, value = entry
+        if version != collection_write_version(collection_name) or expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, collection_name: str, key: str, version: int, value: Any) -> None:
+        """Cache a value computed while the collection was at ``version``."""
+        if not self.enabled or version != collection_write_version(collection_name):
+            return
+        self._entries[key] = (
+            collection_name,
+            version,
+            time.monotonic() + self.ttl_seconds,
+            value,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, collection_name: str | None = None) -> None:
+        """Drop cached results for one collection, or all of them."""
+        if collection_name is None:
+            self._entries.clear()
+            return
+        for key in [k for k, e in self._entries.items() if e[0] == collection_name]:
+            del self._entries[key]
+
+
+_cache: AggregateResultCache | None = None
+
+
+def get_aggregate_cache() -> AggregateResultCache:
+    """Get the process-wide aggregation result cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = AggregateResultCache(
+            max_entries=settings.aggregate_cache_max_entries,
+            ttl_seconds=settings.aggregate_cache_ttl_seconds,
+        )
+    return _cache
@@ -5,20 +5,24 @@ for SQLAlchemy with async support. It supports both SQLite (aiosqlite) and
 PostgreSQL (asyncpg) drivers.
 """
 
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import event, text
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
+from snackbase.core.metrics import DB_POOL_CHECKOUT_WAIT
 
 logger = get_logger(__name__)
 
@@ -33,6 +37,30 @@ class Base(DeclarativeBase):
     pass
 
 
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def _is_memory_database(database_url: str) -> bool:
+    """Check whether a URL points at an in-memory SQLite database.
+
+    SQLAlchemy serves these from a StaticPool holding the one connection that
+    owns the data; a queue pool would open a new, empty database for every
+    connection it creates.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
 class DatabaseManager:
     """Database connection and session manager.
 
@@ -55,13 +83,19 @@ class DatabaseManager:
             AsyncEngine: SQLAlchemy async engine instance.
         """
         if self._engine is None:
+            pool_options: dict[str, Any] = {}
+            if not _is_memory_database(self.settings.database_url):
+                pool_options = {
+                    "poolclass": TimedQueuePool,
+                    "pool_size": self.settings.db_pool_size,
+                    "max_overflow": self.settings.db_max_overflow,
+                    "pool_timeout": self.settings.db_pool_timeout,
+                    "pool_recycle": self.settings.db_pool_recycle,
+                }
             self._engine = create_async_engine(
                 self.settings.database_url,
                 echo=self.settings.db_echo,
-                pool_size=self.settings.db_pool_size,
-                max_overflow=self.settings.db_max_overflow,
-                pool_timeout=self.settings.db_pool_timeout,
-                pool_recycle=self.settings.db_pool_recycle,
+                **pool_options,
                 # SQLite-specific settings
                 connect_args={
                     "check_same_thread": False,
@@ -170,6 +204,23 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    def pool_stats(self) -> dict[str, int] | None:
+        """Get connection pool occupancy.
+
+        Returns:
+            Checked-out, idle and overflow connection counts plus the pool
+            capacity, or None if the engine does not use a queue pool.
+        """
+        pool = self.engine.sync_engine.pool
+        if not isinstance(pool, QueuePool):
+            return None
+        return {
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "capacity": pool.size() + self.settings.db_max_overflow,
+        }
+
     async def check_connection(self) -> bool:
         """Check if database connection is working.
 
@@ -227,6 +278,10 @@ async def init_database() -> None:
     This function should be called on application startup.
     It creates tables if they don't exist (development mode).
     In production, migrations should be used instead.
+
+    When the schema fingerprint recorded by the last full pass still matches
+    (see ``schema_fingerprint``), migrations, index backfill and default
+    data seeding are skipped.
     """
     # Import all models to ensure they are registered with Base.metadata
     # This import must happen before create_tables() is called
@@ -258,6 +313,26 @@ async def init_database() -> None:
         logger.error("Database connection failed")
         raise RuntimeError("Failed to connect to database")
 
+    # Skip migrations and seeding when the last full pass ran the same
+    # migration scripts and seed code against this database
+    fingerprint = None
+    if settings.db_startup_fast_path:
+        from snackbase.infrastructure.persistence.schema_fingerprint import (
+            compute_schema_fingerprint,
+            is_schema_current,
+        )
+
+        fingerprint = compute_schema_fingerprint("alembic.ini")
+        if await is_schema_current(db.engine, fingerprint):
+            logger.info(
+                "Schema fingerprint unchanged, skipping migrations and seeding",
+                fingerprint=fingerprint[:12],
+            )
+            # These depend on environment settings, not on the schema
+            await _create_superadmin_from_env(db)
+            await _create_single_tenant_account(db)
+            return
+
     # Run Alembic migrations to ensure database is up to date
     # This works for both development and production
     logger.info("Running Alembic migrations to initialize/update database")
@@ -282,6 +357,9 @@ async def init_database() -> None:
         logger.error("Failed to run Alembic migrations", error=str(e))
         raise RuntimeError(f"Database initialization failed: {e}")
 
+    # Backfill indexes that collections created by older versions lack
+    await _ensure_pagination_indexes(db, CollectionModel)
+
     # Create superadmin from environment variables if configured
     await _create_superadmin_from_env(db)
 
@@ -294,6 +372,17 @@ async def init_database() -> None:
     # Seed default email templates
     await _seed_default_email_templates(db)
 
+    if fingerprint is not None:
+        from snackbase.infrastructure.persistence.schema_fingerprint import (
+            record_schema_fingerprint,
+        )
+
+        try:
+            await record_schema_fingerprint(db.engine, fingerprint)
+        except Exception as e:
+            # Another worker may have recorded it concurrently
+            logger.warning("Failed to record schema fingerprint", error=str(e))
+
 
 async def _seed_default_roles(db: DatabaseManager, RoleModel: type) -> None:
     """Seed default roles if they don't exist.
@@ -325,6 +414,27 @@ async def _seed_default_roles(db: DatabaseManager, RoleModel: type) -> None:
         await session.commit()
 
 
+async def _ensure_pagination_indexes(db: DatabaseManager, collection_model: type) -> None:
+    """Ensure every collection table has its keyset pagination index.
+
+    Args:
+        db: Database manager instance.
+        collection_model: The CollectionModel class to read collections from.
+    """
+    from sqlalchemy import select
+
+    from snackbase.infrastructure.persistence.table_builder import TableBuilder
+
+    async with db.session() as session:
+        names = (await session.execute(select(collection_model.name))).scalars().all()
+
+    for name in names:
+        try:
+            async with db.engine.begin() as conn:
+                await conn.execute(text(TableBuilder.build_pagination_index_ddl(name)))
+        except Exception as e:
+            # A collection whose table is missing must not block startup
+            logger.warning("Failed to ensure pagination index", collection=name, error=str(e))
 
 
 async def _create_superadmin_from_env(db: DatabaseManager) -> None:
@@ -397,7 +507,6 @@ async def _create_single_tenant_account(db: DatabaseManager) -> None:
     import uuid
 
     from snackbase.core.config import get_settings
-    from snackbase.domain.services import AccountCodeGenerator
     from snackbase.infrastructure.persistence.models import AccountModel
     from snackbase.infrastructure.persistence.repositories import AccountRepository
 
@@ -427,9 +536,8 @@ async def _create_single_tenant_account(db: DatabaseManager) -> None:
             return
 
         # Create the account
-        existing_codes = await account_repo.get_all_account_codes()
         account_id = str(uuid.uuid4())
-        account_code = AccountCodeGenerator.generate(existing_codes)
+        account_code = await account_repo.allocate_account_code()
         display_name = settings.single_tenant_account_name or settings.single_tenant_account
 
         account = AccountModel(
@@ -0,0 +1,161 @@
+"""Direct collection DDL recorded in a database-side schema journal.
+
+In the default ``migrations`` mode every collection create, alter and drop
+writes an Alembic revision file to ``sb_data/migrations/`` and runs an
+upgrade, which loads every revision script. That takes seconds, slows down
+as the history grows and needs a writable filesystem shared by all hosts.
+
+With ``collection_ddl_mode = "direct"`` CollectionService uses
+``DirectSchemaService`` instead. It has the same generate/apply interface as
+MigrationService, but generating only queues the DDL built by TableBuilder,
+and applying executes everything queued in one transaction together with a
+``collection_schema_journal`` row per change. The cost of a change no longer
+depends on how many collections exist, and nothing is written to disk.
+
+Tables created either way coexist: startup still applies existing revision
+files, and journaled tables are ordinary tables to later changes in either
+mode.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from snackbase.core.logging import get_logger
+from snackbase.domain.services import FieldType
+from snackbase.infrastructure.persistence.models.collection_schema_journal import (
+    CollectionSchemaJournalModel,
+)
+from snackbase.infrastructure.persistence.table_builder import TableBuilder
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PendingChange:
+    revision: str
+    collection_name: str
+    operation: str
+    statements: list[str]
+
+
+class DirectSchemaService:
+    """Applies collection DDL directly and journals it in the database."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize the service.
+
+        Args:
+            engine: Database engine the DDL is executed on.
+        """
+        self.engine = engine
+        self.dialect = engine.dialect.name
+        self._pending: list[_PendingChange] = []
+
+    def _queue(self, collection_name: str, operation: str, statements: list[str]) -> str:
+        revision = uuid.uuid4().hex[:12]
+        self._pending.append(_PendingChange(revision, collection_name, operation, statements))
+        return revision
+
+    def generate_create_collection_migration(
+        self, collection_name: str, schema: list[dict[str, Any]]
+    ) -> str:
+        """Queue the DDL creating a collection table and its indexes.
+
+        Args:
+            collection_name: The name of the collection.
+            schema: The collection schema definition.
+
+        Returns:
+            The journal revision ID.
+        """
+        statements = [TableBuilder.build_create_table_ddl(collection_name, schema, self.dialect)]
+        statements.extend(TableBuilder.build_index_ddl(collection_name, schema))
+        return self._queue(collection_name, "create", statements)
+
+    def generate_update_collection_migration(
+        self, collection_name: str, new_fields: list[dict[str, Any]]
+    ) -> str:
+        """Queue the DDL adding columns (and their indexes) to a collection table.
+
+        Args:
+            collection_name: The name of the collection.
+            new_fields: The new fields to add.
+
+        Returns:
+            The journal revision ID.
+        """
+        table_name = TableBuilder.generate_table_name(collection_name)
+        statements = TableBuilder.build_add_column_ddl(collection_name, new_fields, self.dialect)
+        for field in new_fields:
+            name = field["name"]
+            field_type = field["type"].lower()
+            if field_type == FieldType.COMPUTED.value:
+                continue
+            # ADD COLUMN cannot carry UNIQUE on SQLite; a unique index enforces it
+            if field.get("unique", False):
+                statements.append(
+                    f'CREATE UNIQUE INDEX "uq_{table_name}_{name}" ON "{table_name}"("{name}");'
+                )
+            if field_type == FieldType.REFERENCE.value:
+                statements.append(
+                    f'CREATE INDEX "idx_{table_name}_{name}" ON "{table_name}"("{name}");'
+                )
+        return self._queue(collection_name, "update", statements)
+
+    def generate_delete_collection_migration(self, collection_name: str) -> str:
+        """Queue the DDL dropping a collection table.
+
+        Args:
+            collection_name: The name of the collection.
+
+        Returns:
+            The journal revision ID.
+        """
+        table_name = TableBuilder.generate_table_name(collection_name)
+        return self._queue(collection_name, "delete", [f'DROP TABLE IF EXISTS "{table_name}";'])
+
+    async def apply_migrations(self, connection: Any = None) -> None:
+        """Execute all queued DDL and journal it in a single transaction.
+
+        Args:
+            connection: Optional existing AsyncConnection to use; its
+                transaction is then owned by the caller.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if connection is not None:
+            await self._execute(connection, pending)
+        else:
+            async with self.engine.begin() as conn:
+                await self._execute(conn, pending)
+
+        for change in pending:
+            logger.info(
+                "Collection DDL applied",
+                revision=change.revision,
+                collection_name=change.collection_name,
+                operation=change.operation,
+            )
+
+    @staticmethod
+    async def _execute(conn: Any, pending: list[_PendingChange]) -> None:
+        for change in pending:
+            # Journal first: the pysqlite driver only opens a transaction
+            # before DML, so this makes the following DDL transactional on
+            # SQLite too (PostgreSQL DDL is transactional regardless)
+            await conn.execute(
+                CollectionSchemaJournalModel.__table__.insert().values(
+                    revision=change.revision,
+                    collection_name=change.collection_name,
+                    operation=change.operation,
+                    statements=json.dumps(change.statements),
+                )
+            )
+            for statement in change.statements:
+                await conn.execute(text(statement))
@@ -300,6 +300,11 @@ class MigrationService:
 
         # Indexes (skip computed fields — no physical column)
         lines.append(f"    op.create_index('ix_{table_name}_account_id', '{table_name}', ['account_id'])")
+        pagination_index = TableBuilder.pagination_index_name(collection_name)
+        lines.append(
+            f"    op.create_index('{pagination_index}', '{table_name}', "
+            "['account_id', 'created_at', 'id'])"
+        )
         for field in schema:
             if field["type"].lower() == "reference":
                 name = field["name"]
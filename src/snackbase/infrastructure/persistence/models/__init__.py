@@ -5,25 +5,41 @@ automatically created on application startup in development mode.
 """
 
 from snackbase.infrastructure.persistence.models.account import AccountModel
+from snackbase.infrastructure.persistence.models.aggregate_rollup import (
+    AggregateRollupModel,
+    AggregateRollupValueModel,
+)
 from snackbase.infrastructure.persistence.models.api_key import APIKeyModel
 from snackbase.infrastructure.persistence.models.audit_log import AuditLogModel
 from snackbase.infrastructure.persistence.models.collection import CollectionModel
+from snackbase.infrastructure.persistence.models.collection_change_counter import (
+    CollectionChangeCounterModel,
+)
 from snackbase.infrastructure.persistence.models.collection_rule import CollectionRuleModel
+from snackbase.infrastructure.persistence.models.collection_schema_journal import (
+    CollectionSchemaJournalModel,
+)
 from snackbase.infrastructure.persistence.models.configuration import (
     ConfigurationModel,
     OAuthStateModel,
 )
+from snackbase.infrastructure.persistence.models.dashboard_stat import DashboardStatModel
 from snackbase.infrastructure.persistence.models.email_log import EmailLogModel
 from snackbase.infrastructure.persistence.models.email_template import EmailTemplateModel
 from snackbase.infrastructure.persistence.models.email_verification import (
     EmailVerificationTokenModel,
 )
+from snackbase.infrastructure.persistence.models.event_outbox import EventOutboxModel
 from snackbase.infrastructure.persistence.models.group import GroupModel
 from snackbase.infrastructure.persistence.models.invitation import InvitationModel
 from snackbase.infrastructure.persistence.models.macro import MacroModel
 from snackbase.infrastructure.persistence.models.password_reset import PasswordResetTokenModel
+from snackbase.infrastructure.persistence.models.rate_limit_bucket import RateLimitBucketModel
+from snackbase.infrastructure.persistence.models.record_change import RecordChangeModel
 from snackbase.infrastructure.persistence.models.refresh_token import RefreshTokenModel
 from snackbase.infrastructure.persistence.models.role import RoleModel
+from snackbase.infrastructure.persistence.models.schema_state import SchemaStateModel
+from snackbase.infrastructure.persistence.models.sequence import SequenceModel
 from snackbase.infrastructure.persistence.models.token_blacklist import TokenBlacklistModel
 
 from snackbase.infrastructure.persistence.models.user import UserModel
@@ -43,21 +59,31 @@ from snackbase.infrastructure.persistence.models.workflow_step_log import Workfl
 
 __all__ = [
     "AccountModel",
+    "AggregateRollupModel",
+    "AggregateRollupValueModel",
     "APIKeyModel",
     "AuditLogModel",
+    "CollectionChangeCounterModel",
     "CollectionModel",
     "CollectionRuleModel",
+    "CollectionSchemaJournalModel",
     "ConfigurationModel",
+    "DashboardStatModel",
     "EmailLogModel",
     "EmailTemplateModel",
     "EmailVerificationTokenModel",
+    "EventOutboxModel",
     "GroupModel",
     "InvitationModel",
     "MacroModel",
     "OAuthStateModel",
     "PasswordResetTokenModel",
+    "RateLimitBucketModel",
+    "RecordChangeModel",
     "RefreshTokenModel",
     "RoleModel",
+    "SchemaStateModel",
+    "SequenceModel",
     "TokenBlacklistModel",
     "UserModel",
     "UsersGroupsModel",
@@ -0,0 +1,131 @@
+"""SQLAlchemy models for materialized aggregate rollups.
+
+A rollup pre-computes count()/sum() groupings of one collection so that
+matching /aggregate queries can be answered without scanning the collection
+table. Record writes maintain the values incrementally in the same
+transaction.
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, Numeric, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import JSON
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class AggregateRollupModel(Base):
+    """SQLAlchemy model for the aggregate_rollups table.
+
+    Attributes:
+        id: Primary key (UUID string).
+        collection_id: Foreign key to collections table.
+        group_by: JSON list of field names the rollup groups by.
+        sum_fields: JSON list of number fields whose sums are maintained.
+        created_at: Timestamp when the rollup was defined.
+        created_by: User ID of who defined the rollup.
+    """
+
+    __tablename__ = "aggregate_rollups"
+
+    id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+        comment="Rollup ID (UUID)",
+    )
+    collection_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("collections.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Foreign key to collections table",
+    )
+    group_by: Mapped[list[str]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="JSON list of group-by field names",
+    )
+    sum_fields: Mapped[list[str]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="JSON list of number fields whose sums are maintained",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Creation timestamp",
+    )
+    created_by: Mapped[str | None] = mapped_column(
+        String(36),
+        nullable=True,
+        comment="User ID of who defined the rollup",
+    )
+
+    def __repr__(self) -> str:
+        return f"<AggregateRollup(id={self.id}, collection_id={self.collection_id})>"
+
+
+class AggregateRollupValueModel(Base):
+    """SQLAlchemy model for the aggregate_rollup_values table.
+
+    One row per (rollup, account, group, field). The row with an empty
+    ``field`` holds the group's record count; the others hold the running
+    sum and non-null count of a sum field.
+
+    Attributes:
+        rollup_id: Foreign key to aggregate_rollups table.
+        account_id: Account the grouped records belong to.
+        group_key: JSON list of the group-by values, as stored in the table.
+        field: Sum field name, or "" for the record count row.
+        total: Running sum of the field (0 for the count row). Exact NUMERIC
+            on PostgreSQL; SQLite has no decimal type and stores a REAL.
+        value_count: Number of records (count row) or non-null values.
+    """
+
+    __tablename__ = "aggregate_rollup_values"
+
+    rollup_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("aggregate_rollups.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Foreign key to aggregate_rollups table",
+    )
+    account_id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        comment="Account the grouped records belong to",
+    )
+    group_key: Mapped[str] = mapped_column(
+        Text,
+        primary_key=True,
+        comment="JSON list of group-by values",
+    )
+    field: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment='Sum field name, or "" for the record count',
+    )
+    total: Mapped[Decimal] = mapped_column(
+        Numeric().with_variant(Float(), "sqlite"),
+        nullable=False,
+        default=0,
+        comment="Running sum of the field",
+    )
+    value_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Record count or non-null value count",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AggregateRollupValue(rollup_id={self.rollup_id}, "
+            f"group_key={self.group_key}, field={self.field})>"
+        )
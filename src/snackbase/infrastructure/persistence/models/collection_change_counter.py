@@ -0,0 +1,56 @@
+"""SQLAlchemy model for per-collection, per-account change counters.
+
+Every record insert, update and delete bumps the counter of the affected
+collection and account in the same transaction. List endpoints derive weak
+ETags from it, so an unchanged list can be answered with ``304 Not Modified``
+after a single counter read instead of running the list query.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class CollectionChangeCounterModel(Base):
+    """SQLAlchemy model for the collection_change_counters table.
+
+    Attributes:
+        collection_name: Collection whose records changed.
+        account_id: Account owning the changed records.
+        version: Number of record writes so far.
+        updated_at: When a record of the collection and account last changed.
+    """
+
+    __tablename__ = "collection_change_counters"
+
+    collection_name: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Collection whose records changed",
+    )
+    account_id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        comment="Account owning the changed records",
+    )
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Number of record writes so far",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When a record of the collection and account last changed",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CollectionChangeCounter(collection_name={self.collection_name}, "
+            f"account_id={self.account_id}, version={self.version})>"
+        )
@@ -0,0 +1,65 @@
+"""SQLAlchemy model for the journal of directly applied collection DDL.
+
+With ``collection_ddl_mode = "direct"`` collection tables are created,
+altered and dropped by executing DDL in a transaction instead of generating
+and applying Alembic revision files. Each change is recorded here in the
+same transaction, so the journal always matches the physical schema.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class CollectionSchemaJournalModel(Base):
+    """SQLAlchemy model for the collection_schema_journal table.
+
+    Attributes:
+        revision: Journal revision ID, stored as the collection's migration_revision.
+        collection_name: Collection whose table changed.
+        operation: "create", "update" or "delete".
+        statements: JSON list of the DDL statements executed.
+        applied_at: When the change was applied.
+    """
+
+    __tablename__ = "collection_schema_journal"
+
+    revision: Mapped[str] = mapped_column(
+        String(32),
+        primary_key=True,
+        comment="Journal revision ID",
+    )
+    collection_name: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Collection whose table changed",
+    )
+    operation: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        comment="create, update or delete",
+    )
+    statements: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="JSON list of the DDL statements executed",
+    )
+    applied_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When the change was applied",
+    )
+
+    __table_args__ = (
+        Index("ix_collection_schema_journal_collection", "collection_name", "applied_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CollectionSchemaJournal(revision={self.revision}, "
+            f"collection_name={self.collection_name}, operation={self.operation})>"
+        )
@@ -0,0 +1,53 @@
+"""SQLAlchemy model for maintained dashboard counters.
+
+Counters such as per-collection record counts and local storage bytes are
+updated incrementally by writes and periodically reconciled against the
+source of truth, so the dashboard never scans collection tables or the
+storage directory on the request path.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class DashboardStatModel(Base):
+    """SQLAlchemy model for the dashboard_stats table.
+
+    Attributes:
+        key: Counter name, e.g. "records:posts" or "storage_bytes".
+        value: Current counter value.
+        updated_at: When the counter last changed (incrementally or by reconciliation).
+        reconciled_at: When the counter was last recomputed from the source of truth.
+    """
+
+    __tablename__ = "dashboard_stats"
+
+    key: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Counter name",
+    )
+    value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Current counter value",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When the counter last changed",
+    )
+    reconciled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the counter was last recomputed from the source of truth",
+    )
+
+    def __repr__(self) -> str:
+        return f"<DashboardStat(key={self.key}, value={self.value})>"
@@ -0,0 +1,105 @@
+"""SQLAlchemy model for the transactional event outbox.
+
+With ``event_outbox_enabled`` every record create, update and delete writes
+an event row here in the same transaction as the record change. The
+OutboxRelay claims rows in batches and delivers them to webhooks,
+API-defined hooks and workflow triggers, deleting a row only once every
+target has accepted it.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class EventOutboxModel(Base):
+    """SQLAlchemy model for the event_outbox table.
+
+    Attributes:
+        id: Primary key (auto-increment), also the delivery order.
+        operation: "create", "update" or "delete".
+        collection: Collection of the changed record.
+        account_id: Account owning the changed record.
+        payload: JSON object with the record and, for updates, its old values.
+        context: JSON snapshot of the hook context (account, user) of the write.
+        targets: Comma-separated targets still to deliver to.
+        attempts: Number of delivery attempts claimed so far.
+        available_at: Earliest time the event may be claimed; NULL once the
+            event is parked after exhausting its attempts.
+        last_error: Most recent delivery error.
+        created_at: When the event was written.
+    """
+
+    __tablename__ = "event_outbox"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="Event ID, also the delivery order",
+    )
+    operation: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        comment="create, update or delete",
+    )
+    collection: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Collection of the changed record",
+    )
+    account_id: Mapped[str] = mapped_column(
+        String(36),
+        nullable=False,
+        comment="Account owning the changed record",
+    )
+    payload: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="JSON object with the record and its old values",
+    )
+    context: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        comment="JSON snapshot of the hook context of the write",
+    )
+    targets: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Comma-separated targets still to deliver to",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Delivery attempts claimed so far",
+    )
+    available_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Earliest claim time; NULL once parked",
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Most recent delivery error",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        comment="When the event was written",
+    )
+
+    __table_args__ = (Index("ix_event_outbox_available", "available_at", "id"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EventOutbox(id={self.id}, collection={self.collection}, "
+            f"operation={self.operation}, attempts={self.attempts})>"
+        )
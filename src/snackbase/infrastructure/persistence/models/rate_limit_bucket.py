@@ -0,0 +1,45 @@
+"""SQLAlchemy model for shared rate limit token buckets.
+
+The in-memory rate limiter keeps one bucket map per worker process, so N
+workers allow N times the configured limit. With the ``database`` or ``file``
+rate limit backend every worker consumes tokens from these rows instead, each
+with a single atomic upsert.
+"""
+
+from sqlalchemy import Float, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class RateLimitBucketModel(Base):
+    """SQLAlchemy model for the rate_limit_buckets table.
+
+    Attributes:
+        key: Rate limit key, e.g. "ip:203.0.113.7" or "user:<id>".
+        tokens: Tokens left after the last consumed request.
+        updated_at: Unix time of the last consumed request.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Rate limit key",
+    )
+    tokens: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Tokens left after the last consumed request",
+    )
+    updated_at: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Unix time of the last consumed request",
+    )
+
+    __table_args__ = (Index("ix_rate_limit_buckets_updated_at", "updated_at"),)
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket(key={self.key}, tokens={self.tokens})>"
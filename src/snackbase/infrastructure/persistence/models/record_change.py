@@ -0,0 +1,79 @@
+"""SQLAlchemy model for the record change feed.
+
+Holds one row per record ever written: every insert, update and delete
+replaces the record's row with a new one, so its ``seq`` is taken from an
+ever-growing sequence in the order writes commit. Deleted records keep their
+row as a tombstone until the retention period has passed. Clients syncing a
+collection incrementally ask for the rows with a ``seq`` above the watermark
+they were last given.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class RecordChangeModel(Base):
+    """SQLAlchemy model for the record_changes table.
+
+    Attributes:
+        seq: Primary key (auto-increment, never reused), the change order.
+        collection_name: Collection of the changed record.
+        account_id: Account owning the changed record.
+        record_id: ID of the changed record.
+        deleted: Whether the record was deleted (a tombstone).
+        changed_at: When the change was committed.
+    """
+
+    __tablename__ = "record_changes"
+
+    seq: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="Change sequence number, never reused",
+    )
+    collection_name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Collection of the changed record",
+    )
+    account_id: Mapped[str] = mapped_column(
+        String(36),
+        nullable=False,
+        comment="Account owning the changed record",
+    )
+    record_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="ID of the changed record",
+    )
+    deleted: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Whether the record was deleted",
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        comment="When the change was committed",
+    )
+
+    __table_args__ = (
+        Index("uq_record_changes_record", "collection_name", "record_id", unique=True),
+        Index("ix_record_changes_feed", "collection_name", "account_id", "seq"),
+        # Sequence numbers must never be reused, even after the newest row goes
+        {"sqlite_autoincrement": True},
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RecordChange(seq={self.seq}, collection_name={self.collection_name}, "
+            f"record_id={self.record_id}, deleted={self.deleted})>"
+        )
@@ -0,0 +1,52 @@
+"""SQLAlchemy model for the recorded startup schema state.
+
+After a full startup pass (migrations plus seeding) the application records a
+fingerprint of the migration scripts and seed code it ran, together with the
+Alembic heads the database reached. A later start whose fingerprint and heads
+still match skips the pass; see ``schema_fingerprint``.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class SchemaStateModel(Base):
+    """SQLAlchemy model for the schema_state table.
+
+    Attributes:
+        name: State name, e.g. "startup".
+        fingerprint: SHA-256 of the migration scripts and seed code.
+        alembic_heads: Comma-separated Alembic revisions the database was at.
+        recorded_at: When the state was recorded.
+    """
+
+    __tablename__ = "schema_state"
+
+    name: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="State name",
+    )
+    fingerprint: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="SHA-256 of the migration scripts and seed code",
+    )
+    alembic_heads: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Comma-separated Alembic revisions the database was at",
+    )
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When the state was recorded",
+    )
+
+    def __repr__(self) -> str:
+        return f"<SchemaState(name={self.name}, fingerprint={self.fingerprint[:12]})>"
@@ -0,0 +1,37 @@
+"""SQLAlchemy model for named counters allocated in the database.
+
+A sequence row is incremented with a single atomic UPDATE, so concurrent
+workers never receive the same value. Account codes are allocated from the
+``account_code`` sequence instead of scanning every existing code.
+"""
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from snackbase.infrastructure.persistence.database import Base
+
+
+class SequenceModel(Base):
+    """SQLAlchemy model for the sequences table.
+
+    Attributes:
+        name: Sequence name, e.g. "account_code".
+        value: Last value handed out.
+    """
+
+    __tablename__ = "sequences"
+
+    name: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="Sequence name",
+    )
+    value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Last value handed out",
+    )
+
+    def __repr__(self) -> str:
+        return f"<Sequence(name={self.name}, value={self.value})>"
@@ -1,8 +1,9 @@
 """SQLAlchemy model for workflow run instances (F8.3).
 
 Each time a workflow is triggered a new WorkflowInstanceModel is created.
-It tracks the current execution state, the accumulated context (trigger data
-+ per-step outputs), and links to the resume job when paused on a wait step.
+It tracks the current execution state (a compact cursor: status + current
+step), the trigger data, and links to the resume job when paused on a wait
+step. Per-step outputs are stored only in ``workflow_step_logs``.
 """
 
 import uuid
@@ -25,8 +26,8 @@ class WorkflowInstanceModel(Base):
         account_id: Tenant scoping.
         status: pending | running | waiting | completed | failed | cancelled.
         current_step: Name of the step currently executing (or last executed).
-        context: Accumulated execution context:
-            {"trigger": {...}, "steps": {"step_name": {"output": {...}}}}
+        context: Execution input: {"trigger": {...}}. Step outputs are not
+            accumulated here; they are read back from workflow_step_logs.
         started_at: When the instance began executing.
         completed_at: When the instance reached a terminal state.
         error_message: Error detail if status is failed.
@@ -72,7 +73,7 @@ class WorkflowInstanceModel(Base):
         nullable=False,
         default=dict,
         server_default="{}",
-        comment="Accumulated context: trigger data + per-step outputs",
+        comment="Trigger data (step outputs live in workflow_step_logs)",
     )
     started_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,226 @@
+"""Per-request SQL statement instrumentation.
+
+Cursor-level SQLAlchemy listeners count the statements issued while a request
+is being served, together with total database time and the slowest statement.
+The request logging middleware opens a ``QueryStats`` per request, reports it
+in the "Request completed" log and the ``Server-Timing`` header, and feeds it
+into a per-worker ``RouteProfiler`` exposed at ``/admin/profiling``.
+"""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Longest statement text kept for the slowest query of a request
+MAX_STATEMENT_LENGTH = 500
+
+_STARTED_KEY = "snackbase_query_started"
+
+
+@dataclass
+class QueryStats:
+    """SQL statements issued while serving one request.
+
+    Attributes:
+        count: Number of statements executed.
+        total_ms: Combined execution time of all statements.
+        slowest_ms: Execution time of the slowest statement.
+        slowest_statement: SQL text of the slowest statement (truncated).
+    """
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Account for one executed statement.
+
+        Args:
+            statement: The SQL text that was executed.
+            elapsed_ms: How long the cursor execution took.
+        """
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms >= self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = " ".join(statement.split())[:MAX_STATEMENT_LENGTH]
+
+
+_current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def start_query_stats() -> tuple[QueryStats, Token]:
+    """Begin collecting statement stats for the current request.
+
+    Returns:
+        The new stats object and the token to pass to ``stop_query_stats``.
+    """
+    stats = QueryStats()
+    return stats, _current_query_stats.set(stats)
+
+
+def stop_query_stats(token: Token) -> None:
+    """Stop collecting statement stats started with ``start_query_stats``.
+
+    Args:
+        token: Token returned by ``start_query_stats``.
+    """
+    _current_query_stats.reset(token)
+
+
+def get_current_query_stats() -> QueryStats | None:
+    """Get the statement stats of the current request.
+
+    Returns:
+        The current QueryStats or None outside of a request.
+    """
+    return _current_query_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_query_stats.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_query_stats.get()
+    started = conn.info.get(_STARTED_KEY)
+    if stats is None or not started:
+        return
+    stats.record(statement, (time.perf_counter() - started.pop()) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is None or _current_query_stats.get() is None:
+        return
+    started = connection.info.get(_STARTED_KEY)
+    if started:
+        started.pop()
+
+
+def route_template(scope: dict[str, Any]) -> str:
+    """Build the route key a request is profiled under.
+
+    Path parameter values are replaced by their names so that all requests
+    to one route share an entry, e.g. ``GET /api/v1/records/{collection}``.
+
+    Args:
+        scope: ASGI scope of a request that has been routed.
+
+    Returns:
+        Method and path template, or ``<unmatched>`` for unrouted paths.
+    """
+    if scope.get("route") is None:
+        return f"{scope.get('method', '')} <unmatched>"
+    path = scope.get("path", "")
+    for name, value in reversed(list(scope.get("path_params", {}).items())):
+        head, sep, tail = path.rpartition(f"/{value}")
+        if sep and (not tail or tail.startswith("/")):
+            path = f"{head}/{{{name}}}{tail}"
+    return f"{scope.get('method', '')} {path}"
+
+
+@dataclass
+class RouteProfile:
+    """Accumulated statement stats of one route."""
+
+    requests: int = 0
+    total_ms: float = 0.0
+    db_ms: float = 0.0
+    queries: int = 0
+    max_queries: int = 0
+    slowest_ms: float = 0.0
+    slowest_statement: str | None = None
+
+    def to_dict(self, route: str) -> dict[str, Any]:
+        """Serialize the profile with per-request averages."""
+        return {
+            "route": route,
+            "requests": self.requests,
+            "db_time_ms": round(self.db_ms, 3),
+            "avg_db_time_ms": round(self.db_ms / self.requests, 3),
+            "avg_duration_ms": round(self.total_ms / self.requests, 3),
+            "queries": self.queries,
+            "avg_queries": round(self.queries / self.requests, 2),
+            "max_queries": self.max_queries,
+            "slowest_ms": round(self.slowest_ms, 3),
+            "slowest_statement": self.slowest_statement,
+        }
+
+
+class RouteProfiler:
+    """Per-worker aggregate of statement stats by route template.
+
+    Args:
+        max_routes: Maximum number of distinct routes tracked; requests to
+            further routes are ignored once the limit is reached.
+    """
+
+    def __init__(self, max_routes: int = 500) -> None:
+        self._max_routes = max_routes
+        self._routes: dict[str, RouteProfile] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, stats: QueryStats, duration_ms: float) -> None:
+        """Add a completed request to its route's profile.
+
+        Args:
+            route: Route key, e.g. ``GET /api/v1/records/{collection}``.
+            stats: Statement stats of the request.
+            duration_ms: Total request duration.
+        """
+        with self._lock:
+            profile = self._routes.get(route)
+            if profile is None:
+                if len(self._routes) >= self._max_routes:
+                    return
+                profile = self._routes[route] = RouteProfile()
+            profile.requests += 1
+            profile.total_ms += duration_ms
+            profile.db_ms += stats.total_ms
+            profile.queries += stats.count
+            profile.max_queries = max(profile.max_queries, stats.count)
+            if stats.slowest_ms >= profile.slowest_ms and stats.slowest_statement:
+                profile.slowest_ms = stats.slowest_ms
+                profile.slowest_statement = stats.slowest_statement
+
+    def top(self, limit: int = 20, sort_by: str = "db_time_ms") -> list[dict[str, Any]]:
+        """Return the heaviest routes.
+
+        Args:
+            limit: Maximum number of routes to return.
+            sort_by: Key of ``RouteProfile.to_dict`` to sort by, descending.
+
+        Returns:
+            Route profiles, heaviest first.
+        """
+        with self._lock:
+            rows = [profile.to_dict(route) for route, profile in self._routes.items()]
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[:limit]
+
+    def reset(self) -> None:
+        """Discard all collected profiles."""
+        with self._lock:
+            self._routes.clear()
+
+
+_route_profiler = RouteProfiler()
+
+
+def get_route_profiler() -> RouteProfiler:
+    """Get the per-worker route profiler."""
+    return _route_profiler
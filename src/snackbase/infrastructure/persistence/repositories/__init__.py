@@ -3,9 +3,15 @@
 from snackbase.infrastructure.persistence.repositories.account_repository import (
     AccountRepository,
 )
+from snackbase.infrastructure.persistence.repositories.aggregate_rollup_repository import (
+    AggregateRollupRepository,
+)
 from snackbase.infrastructure.persistence.repositories.api_key_repository import (
     APIKeyRepository,
 )
+from snackbase.infrastructure.persistence.repositories.collection_change_counter_repository import (
+    CollectionChangeCounterRepository,
+)
 from snackbase.infrastructure.persistence.repositories.collection_repository import (
     CollectionRepository,
 )
@@ -15,12 +21,18 @@ from snackbase.infrastructure.persistence.repositories.collection_rule_repositor
 from snackbase.infrastructure.persistence.repositories.configuration_repository import (
     ConfigurationRepository,
 )
+from snackbase.infrastructure.persistence.repositories.dashboard_stat_repository import (
+    DashboardStatRepository,
+)
 from snackbase.infrastructure.persistence.repositories.email_log_repository import (
     EmailLogRepository,
 )
 from snackbase.infrastructure.persistence.repositories.email_template_repository import (
     EmailTemplateRepository,
 )
+from snackbase.infrastructure.persistence.repositories.event_outbox_repository import (
+    EventOutboxRepository,
+)
 from snackbase.infrastructure.persistence.repositories.email_verification_repository import (
     EmailVerificationRepository,
 )
@@ -30,6 +42,9 @@ from snackbase.infrastructure.persistence.repositories.password_reset_repository
 from snackbase.infrastructure.persistence.repositories.invitation_repository import (
     InvitationRepository,
 )
+from snackbase.infrastructure.persistence.repositories.record_change_repository import (
+    RecordChangeRepository,
+)
 from snackbase.infrastructure.persistence.repositories.record_repository import (
     RecordRepository,
 )
@@ -64,19 +79,24 @@ from snackbase.infrastructure.persistence.repositories.webhook_repository import
 
 __all__ = [
     "AccountRepository",
+    "AggregateRollupRepository",
     "APIKeyRepository",
     "AuditLogRepository",
+    "CollectionChangeCounterRepository",
     "CollectionRepository",
     "CollectionRuleRepository",
     "ConfigurationRepository",
+    "DashboardStatRepository",
     "EmailLogRepository",
     "EmailTemplateRepository",
+    "EventOutboxRepository",
     "EmailVerificationRepository",
     "GroupRepository",
     "InvitationRepository",
     "MacroRepository",
     "OAuthStateRepository",
     "PasswordResetRepository",
+    "RecordChangeRepository",
     "RecordRepository",
     "RefreshTokenRepository",
     "RoleRepository",
@@ -1,10 +1,14 @@
 """Account repository for database operations."""
 
-from sqlalchemy import select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from snackbase.domain.services.account_code_generator import AccountCodeGenerator
 from snackbase.infrastructure.persistence.models import AccountModel
 
+# Name of the sequence account codes are allocated from
+ACCOUNT_CODE_SEQUENCE = "account_code"
+
 
 class AccountRepository:
     """Repository for account database operations."""
@@ -100,7 +104,7 @@ class AccountRepository:
     async def get_all_account_codes(self) -> list[str]:
         """Get all account codes.
 
-        Used for account code generation to avoid collisions.
+        Loads every code; account creation uses ``allocate_account_code``.
 
         Returns:
             List of all account codes in XX#### format.
@@ -108,6 +112,73 @@ class AccountRepository:
         result = await self.session.execute(select(AccountModel.account_code))
         return list(result.scalars().all())
 
+    async def allocate_account_code(self) -> str:
+        """Allocate the next free account code.
+
+        Codes come from a database sequence that is incremented atomically
+        in the caller's transaction, so concurrent workers never get the same
+        code and allocation does not depend on the number of accounts. Codes
+        that are already taken (e.g. assigned explicitly) are skipped.
+
+        Returns:
+            A new account code in XX#### format.
+
+        Raises:
+            AccountCodeExhaustedError: If all account codes are allocated.
+        """
+        while True:
+            account_code = AccountCodeGenerator.from_sequence(
+                await self._next_account_code_sequence()
+            )
+            if await self.get_by_code(account_code) is None:
+                return account_code
+
+    async def _next_account_code_sequence(self) -> int:
+        """Increment the account code sequence, seeding it on first use.
+
+        Returns:
+            The new sequence value.
+        """
+        increment = text(
+            "UPDATE sequences SET value = value + 1 WHERE name = :name RETURNING value"
+        )
+        params = {"name": ACCOUNT_CODE_SEQUENCE}
+        value = (await self.session.execute(increment, params)).scalar_one_or_none()
+        if value is not None:
+            return value
+
+        # Continue after the highest existing code; racing workers seed the
+        # same value and only the first insert wins
+        await self.session.execute(
+            text(
+                "INSERT INTO sequences (name, value) VALUES (:name, :value) "
+                "ON CONFLICT (name) DO NOTHING"
+            ),
+            {**params, "value": await self._highest_account_code_sequence()},
+        )
+        return (await self.session.execute(increment, params)).scalar_one()
+
+    async def _highest_account_code_sequence(self) -> int:
+        """Get the sequence number of the highest allocated account code.
+
+        Returns:
+            The sequence number, or 0 if no codes are allocated yet.
+        """
+        result = await self.session.execute(
+            select(func.max(AccountModel.account_code)).where(
+                AccountModel.account_code.not_like("SY%")
+            )
+        )
+        highest = result.scalar_one_or_none()
+        if highest is None:
+            return 0
+        if AccountCodeGenerator.validate(highest):
+            return AccountCodeGenerator.to_sequence(highest)
+
+        # Malformed codes sort above valid ones; fall back to a full scan once
+        next_code = AccountCodeGenerator.generate(await self.get_all_account_codes())
+        return AccountCodeGenerator.to_sequence(next_code) - 1
+
     async def get_by_slug_or_code(self, identifier: str) -> AccountModel | None:
         """Get an account by slug or account code (XX#### format).
 
@@ -0,0 +1,408 @@
+"""Repository for materialized aggregate rollups.
+
+Provides CRUD for rollup definitions, full rebuilds from the collection
+table, incremental maintenance on record writes, and answering /aggregate
+queries from the stored values.
+
+Totals are accumulated as Decimal so that repeated +/- deltas on decimal
+values do not drift the way float additions would, and are returned as
+floats, like the number columns the table query aggregates.
+"""
+
+import json
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from snackbase.infrastructure.persistence.models import (
+    AggregateRollupModel,
+    AggregateRollupValueModel,
+    CollectionModel,
+)
+from snackbase.infrastructure.persistence.table_builder import TableBuilder
+
+# Value row holding a group's record count (sum fields use their own name)
+COUNT_FIELD = ""
+
+_UPSERT_VALUE_SQL = """
+    INSERT INTO aggregate_rollup_values
+        (rollup_id, account_id, group_key, field, total, value_count)
+    VALUES (:rollup_id, :account_id, :group_key, :field, :total, :value_count)
+    ON CONFLICT (rollup_id, account_id, group_key, field) DO UPDATE SET
+        total = aggregate_rollup_values.total + excluded.total,
+        value_count = aggregate_rollup_values.value_count + excluded.value_count
+"""
+
+_SET_VALUE_SQL = """
+    INSERT INTO aggregate_rollup_values
+        (rollup_id, account_id, group_key, field, total, value_count)
+    VALUES (:rollup_id, :account_id, :group_key, :field, :total, :value_count)
+    ON CONFLICT (rollup_id, account_id, group_key, field) DO UPDATE SET
+        total = excluded.total,
+        value_count = excluded.value_count
+"""
+
+
+def _exact(value: Any) -> Decimal:
+    """Convert a stored or record number to the decimal it was written as.
+
+    Floats go through their shortest repr, so 0.1 becomes Decimal("0.1")
+    rather than the binary expansion of the nearest double.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def rollup_columns(rollups: Iterable[AggregateRollupModel]) -> list[str]:
+    """Return the collection columns needed to maintain the given rollups."""
+    columns = {"account_id"}
+    for rollup in rollups:
+        columns.update(rollup.group_by)
+        columns.update(rollup.sum_fields)
+    return sorted(columns)
+
+
+def find_matching_rollup(
+    rollups: Iterable[AggregateRollupModel],
+    agg_functions: list[Any],
+    group_by_fields: list[str],
+) -> AggregateRollupModel | None:
+    """Find a rollup that can answer an aggregation exactly.
+
+    A rollup matches when the requested group-by fields are a subset of its
+    own (finer groups are merged on read) and every function is count(),
+    or count/sum/avg of one of its sum fields.
+
+    Args:
+        rollups: Candidate rollups of the collection.
+        agg_functions: Validated AggFunction instances.
+        group_by_fields: Validated group-by field names.
+
+    Returns:
+        The first matching rollup, or None.
+    """
+    for rollup in rollups:
+        if not set(group_by_fields) <= set(rollup.group_by):
+            continue
+        if all(
+            (agg.fn == "count" and agg.field is None)
+            or (agg.fn in ("count", "sum", "avg") and agg.field in rollup.sum_fields)
+            for agg in agg_functions
+        ):
+            return rollup
+    return None
+
+
+class AggregateRollupRepository:
+    """Repository for aggregate rollup database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    def _get_dialect(self) -> str:
+        """Get the database dialect name.
+
+        Returns:
+            The dialect name (e.g., 'sqlite', 'postgresql').
+        """
+        if self.session.bind and hasattr(self.session.bind, "dialect"):
+            return self.session.bind.dialect.name
+        return "sqlite"  # Default fallback
+
+    def _bind_total(self, total: Decimal) -> Decimal | float:
+        """Convert a total for binding (sqlite3 cannot bind Decimal)."""
+        return total if self._get_dialect() == "postgresql" else float(total)
+
+    async def create(self, rollup: AggregateRollupModel) -> AggregateRollupModel:
+        """Create a new rollup definition.
+
+        Args:
+            rollup: The rollup model to create.
+
+        Returns:
+            The created rollup model.
+        """
+        self.session.add(rollup)
+        await self.session.flush()
+        return rollup
+
+    async def get_by_id(self, rollup_id: str) -> AggregateRollupModel | None:
+        """Get a rollup definition by ID.
+
+        Args:
+            rollup_id: The rollup ID.
+
+        Returns:
+            The rollup model if found, None otherwise.
+        """
+        result = await self.session.execute(
+            select(AggregateRollupModel).where(AggregateRollupModel.id == rollup_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_by_collection_name(self, collection_name: str) -> list[AggregateRollupModel]:
+        """List the rollups defined on a collection.
+
+        Args:
+            collection_name: The collection name.
+
+        Returns:
+            Rollup models ordered by creation time.
+        """
+        result = await self.session.execute(
+            select(AggregateRollupModel)
+            .join(CollectionModel, AggregateRollupModel.collection_id == CollectionModel.id)
+            .where(CollectionModel.name == collection_name)
+            .order_by(AggregateRollupModel.created_at, AggregateRollupModel.id)
+        )
+        return list(result.scalars().all())
+
+    async def delete(self, rollup: AggregateRollupModel) -> None:
+        """Delete a rollup definition and its values.
+
+        Args:
+            rollup: The rollup model to delete.
+        """
+        await self.session.execute(
+            delete(AggregateRollupValueModel).where(
+                AggregateRollupValueModel.rollup_id == rollup.id
+            )
+        )
+        await self.session.delete(rollup)
+        await self.session.flush()
+
+    async def rebuild(self, rollup: AggregateRollupModel, collection_name: str) -> int:
+        """Recompute a rollup's values from the collection table.
+
+        Args:
+            rollup: The rollup to rebuild.
+            collection_name: The collection the rollup belongs to.
+
+        Returns:
+            Number of groups stored.
+        """
+        table_name = TableBuilder.generate_table_name(collection_name)
+        group_cols = ", ".join(f'"{f}"' for f in ["account_id", *rollup.group_by])
+        agg_parts = ["COUNT(*)"]
+        for field in rollup.sum_fields:
+            agg_parts.append(f'SUM("{field}")')
+            agg_parts.append(f'COUNT("{field}")')
+
+        result = await self.session.execute(
+            text(
+                f'SELECT {group_cols}, {", ".join(agg_parts)} '
+                f'FROM "{table_name}" GROUP BY {group_cols}'
+            )
+        )
+        rows = result.fetchall()
+
+        await self.session.execute(
+            delete(AggregateRollupValueModel).where(
+                AggregateRollupValueModel.rollup_id == rollup.id
+            )
+        )
+
+        width = len(rollup.group_by)
+        values: list[dict[str, Any]] = []
+        for row in rows:
+            account_id = row[0]
+            group_key = json.dumps(list(row[1 : width + 1]))
+            aggregates = row[width + 1 :]
+            values.append(
+                {
+                    "rollup_id": rollup.id,
+                    "account_id": account_id,
+                    "group_key": group_key,
+                    "field": COUNT_FIELD,
+                    "total": self._bind_total(Decimal(0)),
+                    "value_count": aggregates[0],
+                }
+            )
+            for i, field in enumerate(rollup.sum_fields):
+                total, value_count = aggregates[1 + 2 * i], aggregates[2 + 2 * i]
+                values.append(
+                    {
+                        "rollup_id": rollup.id,
+                        "account_id": account_id,
+                        "group_key": group_key,
+                        "field": field,
+                        "total": self._bind_total(_exact(total or 0)),
+                        "value_count": value_count,
+                    }
+                )
+
+        if values:
+            await self.session.execute(text(_UPSERT_VALUE_SQL), values)
+        return len(rows)
+
+    async def apply_write(
+        self,
+        rollups: list[AggregateRollupModel],
+        old_row: dict[str, Any] | None,
+        new_row: dict[str, Any] | None,
+    ) -> None:
+        """Apply one record write to the rollups' stored values.
+
+        Rows carry raw column values as stored in the collection table
+        (``account_id`` plus every group-by and sum field of the rollups).
+
+        Args:
+            rollups: Rollups defined on the written collection.
+            old_row: The record before the write (None for inserts).
+            new_row: The record after the write (None for deletes).
+        """
+        deltas: dict[tuple[str, str, str, str], list[Any]] = {}
+
+        def accumulate(row: dict[str, Any], sign: int) -> None:
+            for rollup in rollups:
+                group_key = json.dumps([row.get(f) for f in rollup.group_by])
+                base = (rollup.id, row["account_id"], group_key)
+                delta = deltas.setdefault((*base, COUNT_FIELD), [Decimal(0), 0])
+                delta[1] += sign
+                for field in rollup.sum_fields:
+                    value = row.get(field)
+                    if value is None:
+                        continue
+                    delta = deltas.setdefault((*base, field), [Decimal(0), 0])
+                    delta[0] += sign * _exact(value)
+                    delta[1] += sign
+
+        if old_row is not None:
+            accumulate(old_row, -1)
+        if new_row is not None:
+            accumulate(new_row, 1)
+
+        values = [
+            {
+                "rollup_id": rollup_id,
+                "account_id": account_id,
+                "group_key": group_key,
+                "field": field,
+                "total": total,
+                "value_count": value_count,
+            }
+            for (rollup_id, account_id, group_key, field), (total, value_count) in deltas.items()
+            if total or value_count
+        ]
+        if not values:
+            return
+        if self._get_dialect() == "postgresql":
+            # NUMERIC addition is exact, so deltas are added in place
+            await self.session.execute(text(_UPSERT_VALUE_SQL), values)
+        else:
+            await self._add_exactly(values)
+
+    async def _add_exactly(self, values: list[dict[str, Any]]) -> None:
+        """Add deltas to the stored values with decimal arithmetic.
+
+        SQLite has no decimal type, so the new totals are computed here and
+        written back. The record write earlier in the transaction already
+        holds SQLite's write lock, so no other writer can interleave.
+
+        Args:
+            values: Value rows holding Decimal total deltas and count deltas.
+        """
+        keys = [(v["rollup_id"], v["account_id"], v["group_key"], v["field"]) for v in values]
+        result = await self.session.execute(
+            select(
+                AggregateRollupValueModel.rollup_id,
+                AggregateRollupValueModel.account_id,
+                AggregateRollupValueModel.group_key,
+                AggregateRollupValueModel.field,
+                AggregateRollupValueModel.total,
+                AggregateRollupValueModel.value_count,
+            ).where(
+                tuple_(
+                    AggregateRollupValueModel.rollup_id,
+                    AggregateRollupValueModel.account_id,
+                    AggregateRollupValueModel.group_key,
+                    AggregateRollupValueModel.field,
+                ).in_(keys)
+            )
+        )
+        stored = {tuple(row[:4]): (row[4], row[5]) for row in result.all()}
+        for value, key in zip(values, keys, strict=True):
+            total, value_count = stored.get(key, (0, 0))
+            value["total"] = self._bind_total(_exact(total) + value["total"])
+            value["value_count"] += value_count
+        await self.session.execute(text(_SET_VALUE_SQL), values)
+
+    async def query(
+        self,
+        rollup: AggregateRollupModel,
+        account_id: str | None,
+        agg_functions: list[Any],
+        group_by_fields: list[str],
+    ) -> list[dict[str, Any]]:
+        """Answer an aggregation from a rollup's stored values.
+
+        The rollup must have been chosen with ``find_matching_rollup``.
+
+        Args:
+            rollup: The matching rollup.
+            account_id: The account ID for scoping (None for all accounts).
+            agg_functions: Validated AggFunction instances.
+            group_by_fields: Validated group-by field names.
+
+        Returns:
+            Result rows shaped like ``RecordRepository.aggregate_records``.
+        """
+        stmt = select(
+            AggregateRollupValueModel.group_key,
+            AggregateRollupValueModel.field,
+            AggregateRollupValueModel.total,
+            AggregateRollupValueModel.value_count,
+        ).where(AggregateRollupValueModel.rollup_id == rollup.id)
+        if account_id:
+            stmt = stmt.where(AggregateRollupValueModel.account_id == account_id)
+        result = await self.session.execute(stmt)
+
+        positions = [rollup.group_by.index(f) for f in group_by_fields]
+        groups: dict[str, dict[str, list[Any]]] = {}
+        group_values: dict[str, list[Any]] = {}
+        for group_key, field, total, value_count in result.all():
+            stored = json.loads(group_key)
+            projected = [stored[i] for i in positions]
+            key = json.dumps(projected)
+            group_values.setdefault(key, projected)
+            bucket = groups.setdefault(key, {}).setdefault(field, [Decimal(0), 0])
+            bucket[0] += _exact(total)
+            bucket[1] += value_count
+
+        if not group_by_fields and not groups:
+            # A global aggregate always yields one row, even over no records
+            groups["[]"] = {}
+            group_values["[]"] = []
+
+        rows: list[dict[str, Any]] = []
+        for key in sorted(groups):
+            fields = groups[key]
+            record_count = fields.get(COUNT_FIELD, [Decimal(0), 0])[1]
+            if group_by_fields and record_count <= 0:
+                continue
+            row: dict[str, Any] = {}
+            for agg in agg_functions:
+                if agg.field is None:
+                    row[agg.alias] = record_count
+                    continue
+                total, value_count = fields.get(agg.field, [Decimal(0), 0])
+                if agg.fn == "count":
+                    row[agg.alias] = value_count
+                elif value_count <= 0:
+                    row[agg.alias] = None
+                elif agg.fn == "sum":
+                    row[agg.alias] = float(total)
+                else:
+                    row[agg.alias] = float(total) / value_count
+            row.update(zip(group_by_fields, group_values[key], strict=True))
+            rows.append(row)
+        return rows
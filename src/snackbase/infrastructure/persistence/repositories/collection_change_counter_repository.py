@@ -0,0 +1,124 @@
+"""Repository for per-collection, per-account change counters.
+
+Record writes bump the counters; conditional list requests read them to
+decide whether a list can have changed since the client last fetched it.
+
+RecordRepository calls ``mark_records_changed`` on every insert, update and
+delete. The pairs touched by a transaction are collected on the session and
+bumped once each just before it commits, so a batch of writes costs a single
+counter update per collection and account, and a rolled back transaction
+bumps nothing. The same listener then writes the transaction's record change
+feed rows (see record_change_repository.py), while the bumped counter rows
+are still locked.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from snackbase.infrastructure.persistence.models import CollectionChangeCounterModel
+from snackbase.infrastructure.persistence.repositories.record_change_repository import (
+    discard_pending_changes,
+    write_pending_changes,
+)
+
+_PENDING_CHANGES_KEY = "snackbase_changed_records"
+
+_BUMP_SQL = text(
+    "INSERT INTO collection_change_counters "
+    "(collection_name, account_id, version, updated_at) "
+    "VALUES (:collection_name, :account_id, 1, :now) "
+    "ON CONFLICT (collection_name, account_id) DO UPDATE SET "
+    "version = collection_change_counters.version + 1, "
+    "updated_at = excluded.updated_at"
+)
+
+
+def mark_records_changed(session: Any, collection_name: str, account_id: str) -> None:
+    """Record a write to a collection's records in the current transaction.
+
+    Args:
+        session: The (async) session performing the write.
+        collection_name: The collection that was written.
+        account_id: The account owning the written record.
+    """
+    info = getattr(session, "info", None)
+    if isinstance(info, dict):
+        info.setdefault(_PENDING_CHANGES_KEY, set()).add((collection_name, account_id))
+
+
+def _bump_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if pending:
+        now = datetime.now(UTC)
+        session.execute(
+            _BUMP_SQL,
+            [
+                {"collection_name": collection_name, "account_id": account_id, "now": now}
+                for collection_name, account_id in sorted(pending)
+            ],
+        )
+    # After the bumps, so feed sequence numbers are taken under the counter locks
+    write_pending_changes(session)
+
+
+def _discard_pending(session: Session, *args: Any) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+    discard_pending_changes(session)
+
+
+event.listen(Session, "before_commit", _bump_pending)
+event.listen(Session, "after_rollback", _discard_pending)
+
+
+class CollectionChangeCounterRepository:
+    """Repository for collection change counter database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    async def get_state(
+        self, collection_name: str, account_id: str | None
+    ) -> tuple[int, datetime | None]:
+        """Get the change state of a collection.
+
+        Args:
+            collection_name: The collection name.
+            account_id: Account to scope to, or None for all accounts.
+
+        Returns:
+            Tuple of (version, last change time). The version only grows
+            while the collection exists; the time is None if no record was
+            ever written.
+        """
+        query = select(
+            func.coalesce(func.sum(CollectionChangeCounterModel.version), 0),
+            func.max(CollectionChangeCounterModel.updated_at),
+        ).where(CollectionChangeCounterModel.collection_name == collection_name)
+        if account_id is not None:
+            query = query.where(CollectionChangeCounterModel.account_id == account_id)
+
+        version, updated_at = (await self.session.execute(query)).one()
+        if updated_at is not None and updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=UTC)
+        return int(version), updated_at
+
+    async def delete_collection(self, collection_name: str) -> None:
+        """Delete all counters of a collection.
+
+        Args:
+            collection_name: The collection name.
+        """
+        await self.session.execute(
+            delete(CollectionChangeCounterModel).where(
+                CollectionChangeCounterModel.collection_name == collection_name
+            )
+        )
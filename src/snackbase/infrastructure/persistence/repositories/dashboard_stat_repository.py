@@ -0,0 +1,125 @@
+"""Repository for maintained dashboard counters.
+
+Provides incremental updates and reconciliation writes for the
+dashboard_stats table.
+
+Record and file writes call ``queue_increment`` instead of updating a counter
+row directly. The deltas are summed on the session and applied once per
+counter just before it commits, so a hot counter row is only locked for the
+commit itself rather than for the rest of the write transaction, a batch of
+writes costs a single update per counter, and a rolled back transaction
+changes nothing.
+"""
+
+from typing import Any
+
+from sqlalchemy import delete, event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from snackbase.infrastructure.persistence.models import DashboardStatModel
+
+# Counter holding the bytes used by the local storage directory
+STORAGE_BYTES_KEY = "storage_bytes"
+
+# Prefix of per-collection record count counters
+RECORD_COUNT_PREFIX = "records:"
+
+
+def record_count_key(collection_name: str) -> str:
+    """Return the counter key for a collection's record count."""
+    return f"{RECORD_COUNT_PREFIX}{collection_name}"
+
+
+_PENDING_DELTAS_KEY = "snackbase_dashboard_stat_deltas"
+
+_INCREMENT_SQL = text(
+    "UPDATE dashboard_stats "
+    "SET value = value + :delta, updated_at = CURRENT_TIMESTAMP "
+    "WHERE key = :key"
+)
+
+
+def queue_increment(session: Any, key: str, delta: int) -> None:
+    """Adjust an existing counter when the current transaction commits.
+
+    Counters that have not been seeded yet are left alone; they are computed
+    in full on first read or by the next reconciliation, which a partial
+    delta would otherwise corrupt.
+
+    Args:
+        session: The (async) session performing the write.
+        key: Counter name.
+        delta: Amount to add (negative to subtract).
+    """
+    info = getattr(session, "info", None)
+    if isinstance(info, dict) and delta:
+        pending = info.setdefault(_PENDING_DELTAS_KEY, {})
+        pending[key] = pending.get(key, 0) + delta
+
+
+def _apply_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_DELTAS_KEY, None)
+    if pending:
+        params = [{"key": key, "delta": delta} for key, delta in sorted(pending.items()) if delta]
+        if params:
+            session.execute(_INCREMENT_SQL, params)
+
+
+def _discard_pending(session: Session, *args: Any) -> None:
+    session.info.pop(_PENDING_DELTAS_KEY, None)
+
+
+event.listen(Session, "before_commit", _apply_pending)
+event.listen(Session, "after_rollback", _discard_pending)
+
+
+class DashboardStatRepository:
+    """Repository for dashboard counter database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    async def get_all(self) -> dict[str, DashboardStatModel]:
+        """Get all counters keyed by name.
+
+        Returns:
+            Mapping of counter key to counter model.
+        """
+        result = await self.session.execute(select(DashboardStatModel))
+        return {stat.key: stat for stat in result.scalars().all()}
+
+    async def set_value(self, key: str, value: int) -> None:
+        """Store a counter value recomputed from the source of truth.
+
+        Args:
+            key: Counter name.
+            value: The exact current value.
+        """
+        await self.session.execute(
+            text(
+                "INSERT INTO dashboard_stats (key, value, updated_at, reconciled_at) "
+                "VALUES (:key, :value, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, "
+                "updated_at = excluded.updated_at, "
+                "reconciled_at = excluded.reconciled_at"
+            ),
+            {"key": key, "value": value},
+        )
+
+    async def delete_keys(self, keys: list[str]) -> None:
+        """Delete counters by name.
+
+        Args:
+            keys: Counter names to delete.
+        """
+        if keys:
+            await self.session.execute(
+                delete(DashboardStatModel).where(DashboardStatModel.key.in_(keys))
+            )
@@ -1,9 +1,62 @@
-"""Repository for custom endpoint CRUD operations (F8.2)."""
+"""Repository for custom endpoint CRUD operations (F8.2).
 
-from sqlalchemy import func, select
+Every create, update and delete marks the endpoint's account on the session;
+just before the transaction commits, the account's route version (a row of
+the ``sequences`` table) is bumped once. Dispatchers in every worker compare
+that version with the one their compiled route table was built from, so an
+endpoint change is picked up everywhere on the next request.
+"""
+
+from typing import Any
+
+from sqlalchemy import event, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from snackbase.infrastructure.persistence.models.endpoint import EndpointModel
+from snackbase.infrastructure.persistence.models.sequence import SequenceModel
+
+_PENDING_ROUTE_CHANGES_KEY = "snackbase_changed_endpoint_accounts"
+
+_BUMP_ROUTE_VERSION_SQL = text(
+    "INSERT INTO sequences (name, value) VALUES (:name, 1) "
+    "ON CONFLICT (name) DO UPDATE SET value = sequences.value + 1"
+)
+
+
+def route_version_sequence(account_id: str) -> str:
+    """Name of the sequence holding an account's endpoint route version."""
+    return f"endpoint_routes:{account_id}"
+
+
+def mark_endpoints_changed(session: Any, account_id: str) -> None:
+    """Record a change to an account's endpoints in the current transaction.
+
+    Args:
+        session: The (async) session performing the write.
+        account_id: The account owning the changed endpoint.
+    """
+    info = getattr(session, "info", None)
+    if isinstance(info, dict):
+        info.setdefault(_PENDING_ROUTE_CHANGES_KEY, set()).add(account_id)
+
+
+def _bump_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_ROUTE_CHANGES_KEY, None)
+    if not pending:
+        return
+    session.execute(
+        _BUMP_ROUTE_VERSION_SQL,
+        [{"name": route_version_sequence(account_id)} for account_id in sorted(pending)],
+    )
+
+
+def _discard_pending(session: Session, *args: Any) -> None:
+    session.info.pop(_PENDING_ROUTE_CHANGES_KEY, None)
+
+
+event.listen(Session, "before_commit", _bump_pending)
+event.listen(Session, "after_rollback", _discard_pending)
 
 
 class EndpointRepository:
@@ -24,6 +77,7 @@ class EndpointRepository:
         """Persist a new endpoint record."""
         self._session.add(endpoint)
         await self._session.flush()
+        mark_endpoints_changed(self._session, endpoint.account_id)
         return endpoint
 
     async def get(self, endpoint_id: str) -> EndpointModel | None:
@@ -78,6 +132,22 @@ class EndpointRepository:
         )
         return list(result.scalars().all())
 
+    async def get_route_version(self, account_id: str) -> int:
+        """Return the account's endpoint route version.
+
+        Args:
+            account_id: Tenant account ID.
+
+        Returns:
+            Number of committed endpoint changes, 0 if there were none.
+        """
+        result = await self._session.execute(
+            select(SequenceModel.value).where(
+                SequenceModel.name == route_version_sequence(account_id)
+            )
+        )
+        return result.scalar_one_or_none() or 0
+
     async def list_for_account(
         self,
         account_id: str,
@@ -119,6 +189,7 @@ class EndpointRepository:
     async def update(self, endpoint: EndpointModel) -> EndpointModel:
         """Persist changes to an existing endpoint."""
         await self._session.flush()
+        mark_endpoints_changed(self._session, endpoint.account_id)
         return endpoint
 
     async def delete(self, endpoint_id: str) -> None:
@@ -127,6 +198,7 @@ class EndpointRepository:
         if endpoint:
             await self._session.delete(endpoint)
             await self._session.flush()
+            mark_endpoints_changed(self._session, endpoint.account_id)
 
     # ------------------------------------------------------------------
     # Limit enforcement
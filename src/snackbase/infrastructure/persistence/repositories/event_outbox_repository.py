@@ -0,0 +1,245 @@
+"""Repository for the transactional event outbox.
+
+With ``event_outbox_enabled`` RecordRepository calls ``enqueue_record_event``
+on every insert, update and delete. The events of a transaction are collected
+on the session and written to ``event_outbox`` just before it commits, in a
+single statement, so they become visible exactly when the record changes do
+and a rolled back transaction leaves none behind. Listeners registered with
+``add_commit_listener`` are called after such a commit so an in-process relay
+can deliver without waiting for its next poll.
+
+The relay side claims due events in batches by pushing their
+``available_at`` forward by a lease, which hides them from other relays
+until they are either deleted (delivered) or released for a retry.
+"""
+
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from snackbase.core.config import get_settings
+from snackbase.core.context import get_current_context
+from snackbase.infrastructure.persistence.models import EventOutboxModel
+
+# Delivery targets of an event, in delivery order. Realtime subscribers are
+# served by the writing process right after commit, not through the outbox.
+OUTBOX_TARGETS = ("webhooks", "hooks", "workflows")
+
+_PENDING_EVENTS_KEY = "snackbase_pending_outbox_events"
+_WRITTEN_EVENTS_KEY = "snackbase_written_outbox_events"
+
+_commit_listeners: list[Callable[[], None]] = []
+
+
+def _context_snapshot() -> str | None:
+    """Serialize the parts of the current hook context the targets read."""
+    context = get_current_context()
+    if context is None:
+        return None
+    user = context.user
+    snapshot: dict[str, Any] = {
+        "account_id": context.account_id,
+        "request_id": context.request_id,
+        "user": None,
+    }
+    if user is not None:
+        token_type = getattr(user, "token_type", None)
+        snapshot["user"] = {
+            "user_id": getattr(user, "id", None),
+            "account_id": getattr(user, "account_id", None),
+            "email": getattr(user, "email", None),
+            "role": getattr(user, "role", None),
+            "token_type": getattr(token_type, "value", token_type),
+            "groups": list(getattr(user, "groups", None) or []),
+        }
+    return json.dumps(snapshot, default=str)
+
+
+def enqueue_record_event(
+    session: Any,
+    operation: str,
+    collection_name: str,
+    account_id: str,
+    record: dict[str, Any],
+    old_values: dict[str, Any] | None = None,
+) -> None:
+    """Record an event for a record write in the current transaction.
+
+    Does nothing unless ``event_outbox_enabled`` is set.
+
+    Args:
+        session: The (async) session performing the write.
+        operation: "create", "update" or "delete".
+        collection_name: The collection that was written.
+        account_id: The account owning the written record.
+        record: The record after the write (before it, for deletes).
+        old_values: The record before an update.
+    """
+    if not get_settings().event_outbox_enabled:
+        return
+    info = getattr(session, "info", None)
+    if not isinstance(info, dict):
+        return
+    now = datetime.now(UTC)
+    info.setdefault(_PENDING_EVENTS_KEY, []).append(
+        {
+            "operation": operation,
+            "collection": collection_name,
+            "account_id": account_id,
+            # Serialized now, the caller may still reshape the record dict
+            "payload": json.dumps({"record": record, "old_values": old_values}, default=str),
+            "context": _context_snapshot(),
+            "targets": ",".join(OUTBOX_TARGETS),
+            "attempts": 0,
+            "available_at": now,
+            "created_at": now,
+        }
+    )
+
+
+def add_commit_listener(callback: Callable[[], None]) -> None:
+    """Call ``callback`` after every commit that wrote outbox events.
+
+    Args:
+        callback: Synchronous callable, run on the committing thread.
+    """
+    _commit_listeners.append(callback)
+
+
+def remove_commit_listener(callback: Callable[[], None]) -> None:
+    """Stop calling a callback registered with ``add_commit_listener``.
+
+    Args:
+        callback: The registered callable.
+    """
+    if callback in _commit_listeners:
+        _commit_listeners.remove(callback)
+
+
+def _write_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if not pending:
+        return
+    session.execute(insert(EventOutboxModel.__table__), pending)
+    session.info[_WRITTEN_EVENTS_KEY] = True
+
+
+def _notify_written(session: Session) -> None:
+    if session.info.pop(_WRITTEN_EVENTS_KEY, None):
+        for callback in list(_commit_listeners):
+            callback()
+
+
+def _discard_pending(session: Session, *args: Any) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
+    session.info.pop(_WRITTEN_EVENTS_KEY, None)
+
+
+event.listen(Session, "before_commit", _write_pending)
+event.listen(Session, "after_commit", _notify_written)
+event.listen(Session, "after_rollback", _discard_pending)
+
+
+class EventOutboxRepository:
+    """Repository for event outbox database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> list[Any]:
+        """Claim the oldest due events for delivery.
+
+        Claimed events are hidden from other relays for ``lease_seconds``;
+        if they are neither completed nor released by then (e.g. the relay
+        died), they are claimed again.
+
+        Args:
+            limit: Maximum number of events to claim.
+            lease_seconds: How long the claim lasts.
+
+        Returns:
+            The claimed event rows, oldest first.
+        """
+        now = datetime.now(UTC)
+        due = (
+            select(EventOutboxModel.id)
+            .where(EventOutboxModel.available_at <= now)
+            .order_by(EventOutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(EventOutboxModel)
+            .where(EventOutboxModel.id.in_(due), EventOutboxModel.available_at <= now)
+            .values(
+                available_at=now + timedelta(seconds=lease_seconds),
+                attempts=EventOutboxModel.attempts + 1,
+            )
+            .returning(*EventOutboxModel.__table__.columns)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.all(), key=lambda row: row.id)
+
+    async def complete(self, event_ids: list[int]) -> None:
+        """Delete delivered events.
+
+        Args:
+            event_ids: IDs of the events delivered to every target.
+        """
+        if event_ids:
+            await self.session.execute(
+                delete(EventOutboxModel).where(EventOutboxModel.id.in_(event_ids))
+            )
+
+    async def release(
+        self,
+        event_id: int,
+        targets: list[str],
+        error: str,
+        retry_at: datetime | None,
+    ) -> None:
+        """Return a partially delivered event to the outbox.
+
+        Args:
+            event_id: The event ID.
+            targets: Targets that still have to receive the event.
+            error: The delivery error.
+            retry_at: When to retry, or None to park the event.
+        """
+        await self.session.execute(
+            update(EventOutboxModel)
+            .where(EventOutboxModel.id == event_id)
+            .values(targets=",".join(targets), last_error=error, available_at=retry_at)
+        )
+
+    async def get_stats(self) -> tuple[int, int, datetime | None]:
+        """Get the outbox backlog.
+
+        Returns:
+            Tuple of (waiting events, parked events, creation time of the
+            oldest waiting event).
+        """
+        waiting = EventOutboxModel.available_at.is_not(None)
+        row = (
+            await self.session.execute(
+                select(
+                    func.count().filter(waiting),
+                    func.count().filter(EventOutboxModel.available_at.is_(None)),
+                    func.min(EventOutboxModel.created_at).filter(waiting),
+                )
+            )
+        ).one()
+        oldest = row[2]
+        if oldest is not None and oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=UTC)
+        return int(row[0]), int(row[1]), oldest
@@ -102,7 +102,13 @@ class JobRepository:
             stats[row.status] = row.count
         return stats
 
-    async def pick_next_job(self, queue_filter: str | None = None) -> JobModel | None:
+    async def pick_next_job(
+        self,
+        queue_filter: str | None = None,
+        *,
+        exclude_queues: list[str] | None = None,
+        account_id: str | None = None,
+    ) -> JobModel | None:
         """Atomically pick and claim the next available job.
 
         Uses SELECT FOR UPDATE SKIP LOCKED on PostgreSQL for true concurrent
@@ -112,6 +118,8 @@ class JobRepository:
 
         Args:
             queue_filter: Only pick jobs from this queue (None = any queue).
+            exclude_queues: Never pick jobs from these queues.
+            account_id: Only pick jobs belonging to this account.
 
         Returns:
             The claimed JobModel, or None if no job is available.
@@ -123,6 +131,10 @@ class JobRepository:
         ]
         if queue_filter:
             base_conditions.append(JobModel.queue == queue_filter)
+        if exclude_queues:
+            base_conditions.append(JobModel.queue.not_in(exclude_queues))
+        if account_id is not None:
+            base_conditions.append(JobModel.account_id == account_id)
 
         where_clause = and_(*base_conditions)
 
@@ -177,6 +189,101 @@ class JobRepository:
                 return None
             return job
 
+    async def list_ready_accounts(self, queue: str, limit: int = 100) -> list[str]:
+        """Return account IDs that have jobs ready to run on a queue.
+
+        Ordered by each account's oldest ready job so that callers can serve
+        accounts round-robin instead of strictly FIFO across all tenants.
+
+        Args:
+            queue: Queue name to inspect.
+            limit: Maximum number of accounts to return.
+        """
+        now = datetime.now(UTC)
+        result = await self.session.execute(
+            select(JobModel.account_id)
+            .where(
+                JobModel.queue == queue,
+                JobModel.status.in_(["pending", "retrying"]),
+                or_(JobModel.run_at.is_(None), JobModel.run_at <= now),
+                JobModel.account_id.is_not(None),
+            )
+            .group_by(JobModel.account_id)
+            .order_by(func.min(JobModel.created_at).asc())
+            .limit(limit)
+        )
+        return [row[0] for row in result.all()]
+
+    async def count_queued(self, queue: str, account_id: str | None = None) -> int:
+        """Count pending/retrying jobs on a queue, optionally for one account."""
+        conditions = [
+            JobModel.queue == queue,
+            JobModel.status.in_(["pending", "retrying"]),
+        ]
+        if account_id is not None:
+            conditions.append(JobModel.account_id == account_id)
+        result = await self.session.execute(
+            select(func.count(JobModel.id)).where(and_(*conditions))
+        )
+        return result.scalar_one() or 0
+
+    async def get_queue_stats(self) -> dict[str, tuple[int, datetime]]:
+        """Return ``{queue: (waiting job count, oldest waiting job's created_at)}``.
+
+        Waiting jobs are those pending or retrying; queues without any are
+        omitted.
+        """
+        result = await self.session.execute(
+            select(JobModel.queue, func.count(JobModel.id), func.min(JobModel.created_at))
+            .where(JobModel.status.in_(["pending", "retrying"]))
+            .group_by(JobModel.queue)
+        )
+        return {queue: (count, oldest) for queue, count, oldest in result.all()}
+
+    async def count_running_by_account(
+        self, queue: str, account_ids: list[str]
+    ) -> dict[str, int]:
+        """Return ``{account_id: running job count}`` on a queue.
+
+        Running jobs of crashed workers are reset by ``reset_stale_jobs``, so
+        these counts heal on their own.
+        """
+        if not account_ids:
+            return {}
+        result = await self.session.execute(
+            select(JobModel.account_id, func.count(JobModel.id))
+            .where(
+                JobModel.queue == queue,
+                JobModel.status == "running",
+                JobModel.account_id.in_(account_ids),
+            )
+            .group_by(JobModel.account_id)
+        )
+        return {account_id: count for account_id, count in result.all()}
+
+    async def count_running_with_payload(self, queue: str, key: str, value: str) -> int:
+        """Count running jobs on a queue whose payload has ``payload[key] == value``."""
+        result = await self.session.execute(
+            select(func.count(JobModel.id)).where(
+                JobModel.queue == queue,
+                JobModel.status == "running",
+                JobModel.payload[key].as_string() == value,
+            )
+        )
+        return result.scalar_one() or 0
+
+    async def defer_job(self, job_id: str, run_at: datetime) -> None:
+        """Return a claimed job to the queue without counting an attempt.
+
+        Used for backpressure when a concurrency limit is reached.
+        """
+        await self.session.execute(
+            update(JobModel)
+            .where(JobModel.id == job_id)
+            .values(status="pending", started_at=None, run_at=run_at)
+        )
+        await self.session.flush()
+
     async def mark_running(self, job_id: str) -> None:
         """Mark a job as running and set started_at.
 
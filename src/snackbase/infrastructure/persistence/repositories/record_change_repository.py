@@ -0,0 +1,187 @@
+"""Repository for the record change feed behind delta sync.
+
+RecordRepository calls ``track_record_change`` on every insert, update and
+delete. The records touched by a transaction are collected on the session
+and, just before it commits, each record's feed row is replaced by one with
+a new sequence number, so the feed holds a single row per record and a
+rolled back transaction leaves it untouched.
+
+The rows are written by the change counter listener right after it bumps
+the counters (see collection_change_counter_repository.py). On PostgreSQL
+the bumped counter row stays locked until commit, so within a collection and
+account sequence numbers are handed out in commit order and a reader never
+sees a lower number commit after a higher one it has already returned.
+Feeds across all accounts get no such guarantee on PostgreSQL.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import bindparam, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from snackbase.infrastructure.persistence.models import RecordChangeModel
+
+_PENDING_CHANGES_KEY = "snackbase_pending_record_changes"
+
+
+def track_record_change(
+    session: Any,
+    collection_name: str,
+    account_id: str,
+    record_id: str,
+    deleted: bool = False,
+) -> None:
+    """Record a write to a record in the current transaction.
+
+    Args:
+        session: The (async) session performing the write.
+        collection_name: The collection that was written.
+        account_id: The account owning the written record.
+        record_id: The written record.
+        deleted: Whether the record was deleted.
+    """
+    info = getattr(session, "info", None)
+    if not isinstance(info, dict):
+        return
+    pending = info.setdefault(_PENDING_CHANGES_KEY, {})
+    key = (collection_name, record_id)
+    # Re-inserted so the last write of a record decides its place in the feed
+    pending.pop(key, None)
+    pending[key] = (account_id, deleted)
+
+
+def write_pending_changes(session: Session) -> None:
+    """Replace the feed rows of the records written in this transaction.
+
+    Called from the change counter's ``before_commit`` listener.
+
+    Args:
+        session: The committing (sync) session.
+    """
+    pending = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if not pending:
+        return
+    table = RecordChangeModel.__table__
+    session.execute(
+        delete(table).where(
+            table.c.collection_name == bindparam("collection_name"),
+            table.c.record_id == bindparam("record_id"),
+        ),
+        [
+            {"collection_name": collection_name, "record_id": record_id}
+            for collection_name, record_id in pending
+        ],
+    )
+    now = datetime.now(UTC)
+    session.execute(
+        insert(table),
+        [
+            {
+                "collection_name": collection_name,
+                "account_id": account_id,
+                "record_id": record_id,
+                "deleted": deleted,
+                "changed_at": now,
+            }
+            for (collection_name, record_id), (account_id, deleted) in pending.items()
+        ],
+    )
+
+
+def discard_pending_changes(session: Session) -> None:
+    """Forget the changes of a rolled back transaction.
+
+    Args:
+        session: The (sync) session that rolled back.
+    """
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+class RecordChangeRepository:
+    """Repository for record change feed database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy async session.
+        """
+        self.session = session
+
+    async def list_changes(
+        self,
+        collection_name: str,
+        account_id: str | None,
+        after_seq: int,
+        limit: int,
+    ) -> list[Any]:
+        """Get the changes after a sequence number, oldest first.
+
+        Served by the (collection_name, account_id, seq) index when scoped
+        to an account.
+
+        Args:
+            collection_name: The collection name.
+            account_id: Account to scope to, or None for all accounts.
+            after_seq: Only changes with a higher sequence number.
+            limit: Maximum number of changes.
+
+        Returns:
+            Rows with ``seq``, ``record_id`` and ``deleted``.
+        """
+        query = select(
+            RecordChangeModel.seq, RecordChangeModel.record_id, RecordChangeModel.deleted
+        ).where(
+            RecordChangeModel.collection_name == collection_name,
+            RecordChangeModel.seq > after_seq,
+        )
+        if account_id is not None:
+            query = query.where(RecordChangeModel.account_id == account_id)
+        result = await self.session.execute(query.order_by(RecordChangeModel.seq).limit(limit))
+        return list(result.all())
+
+    async def get_latest_seq(self, collection_name: str, account_id: str | None) -> int:
+        """Get the highest sequence number of a collection.
+
+        Args:
+            collection_name: The collection name.
+            account_id: Account to scope to, or None for all accounts.
+
+        Returns:
+            The sequence number, 0 if the collection has no changes.
+        """
+        query = select(func.max(RecordChangeModel.seq)).where(
+            RecordChangeModel.collection_name == collection_name
+        )
+        if account_id is not None:
+            query = query.where(RecordChangeModel.account_id == account_id)
+        return int(await self.session.scalar(query) or 0)
+
+    async def delete_tombstones_before(self, cutoff: datetime) -> int:
+        """Delete the tombstones of records deleted before a cutoff.
+
+        Args:
+            cutoff: Tombstones older than this are deleted.
+
+        Returns:
+            The number of tombstones deleted.
+        """
+        result = await self.session.execute(
+            delete(RecordChangeModel).where(
+                RecordChangeModel.deleted.is_(True),
+                RecordChangeModel.changed_at < cutoff,
+            )
+        )
+        return result.rowcount or 0
+
+    async def delete_collection(self, collection_name: str) -> None:
+        """Delete the change feed of a collection.
+
+        Args:
+            collection_name: The collection name.
+        """
+        await self.session.execute(
+            delete(RecordChangeModel).where(RecordChangeModel.collection_name == collection_name)
+        )
@@ -5,17 +5,41 @@ since tables are created dynamically and not mapped to ORM models.
 """
 
 import json
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from snackbase.core.config import get_settings
 from snackbase.core.context import get_current_context
-from snackbase.core.cursor import encode_cursor
+from snackbase.core.cursor import CursorScope, encode_cursor, schema_version
 from snackbase.core.hooks.hook_events import HookEvent
 from snackbase.core.logging import get_logger
+from snackbase.domain.services import FieldType, OnDeleteAction
+from snackbase.infrastructure.persistence.aggregate_cache import (
+    collection_write_version,
+    get_aggregate_cache,
+    has_pending_writes,
+    mark_collection_written,
+)
+from snackbase.infrastructure.persistence.models import CollectionModel
+from snackbase.infrastructure.persistence.repositories.aggregate_rollup_repository import (
+    AggregateRollupRepository,
+    find_matching_rollup,
+    rollup_columns,
+)
+from snackbase.infrastructure.persistence.repositories.collection_change_counter_repository import (
+    mark_records_changed,
+)
+from snackbase.infrastructure.persistence.repositories.event_outbox_repository import (
+    enqueue_record_event,
+)
+from snackbase.infrastructure.persistence.repositories.record_change_repository import (
+    track_record_change,
+)
 from snackbase.infrastructure.persistence.table_builder import TableBuilder
 
 logger = get_logger(__name__)
@@ -85,6 +109,104 @@ def _build_computed_select_parts(
     return parts, all_params
 
 
+RECORD_SYSTEM_COLUMNS = ("id", "account_id", "created_at", "created_by", "updated_at", "updated_by")
+
+
+def _build_select_list(
+    schema: list[dict[str, Any]],
+    computed_parts: list[tuple[str, str]],
+    columns: Collection[str] | None,
+    alias: str | None = None,
+    required: Iterable[str] = (),
+) -> tuple[str, bool]:
+    """Build the SELECT column list for a record query.
+
+    Args:
+        schema: Collection schema (list of field definitions).
+        computed_parts: (sql_expression, field_name) tuples for computed fields.
+        columns: Field names to return, or None for every column. System
+            fields are always returned; names not in the schema are ignored,
+            so user input can be passed through safely.
+        alias: Table alias to qualify stored columns with.
+        required: Extra fields the query needs in its rows (e.g. the cursor
+            sort field).
+
+    Returns:
+        A tuple of (select list SQL, whether ``account_name`` was requested
+        and the accounts table must be joined).
+    """
+    prefix = f'{alias}.' if alias else ""
+    computed = [f'({sql}) AS "{name}"' for sql, name in computed_parts]
+
+    if columns is None:
+        return ", ".join([f"{prefix}*", *computed]), True
+
+    wanted = set(columns).union(required)
+    stored = [
+        f["name"] for f in schema
+        if f.get("type", "").lower() != "computed"
+        and f["name"] in wanted
+        and f["name"] not in RECORD_SYSTEM_COLUMNS
+    ]
+    select = [f'{prefix}"{name}"' for name in (*RECORD_SYSTEM_COLUMNS, *stored)]
+    select.extend(
+        f'({sql}) AS "{name}"' for sql, name in computed_parts if name in wanted
+    )
+    return ", ".join(select), "account_name" in wanted
+
+
+def resolve_sort_field(sort_by: str, schema: list[dict[str, Any]]) -> str:
+    """Validate a requested sort field.
+
+    Args:
+        sort_by: Requested sort field name.
+        schema: Collection schema (list of field definitions).
+
+    Returns:
+        The field name if it is a system or schema field (including
+        computed fields), otherwise ``created_at``.
+    """
+    # Only known names are interpolated into ORDER BY, preventing SQL injection
+    schema_field_names = {f["name"] for f in schema}
+    system_fields = {"id", "created_at", "created_by", "updated_at", "updated_by"}
+    if sort_by not in schema_field_names and sort_by not in system_fields:
+        return "created_at"
+    return sort_by
+
+def _decode_record_row(
+    mapping: Any,
+    schema_lookup: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Convert a result row into a record dict with API value types.
+
+    System timestamps become ISO strings, JSON fields are parsed and boolean
+    fields are coerced from their integer storage. Computed fields and
+    unknown columns are returned as-is from SQL.
+
+    Args:
+        mapping: Row mapping (``row._mapping``) of a record query.
+        schema_lookup: Field definitions keyed by field name.
+
+    Returns:
+        The decoded record.
+    """
+    record = dict(mapping)
+    for key, value in record.items():
+        # System fields: convert datetime to ISO string
+        if key in ("created_at", "updated_at") and isinstance(value, datetime):
+            record[key] = value.isoformat()
+        elif key in schema_lookup:
+            field_type = schema_lookup[key].get("type", "text").lower()
+            if field_type == "json" and value is not None:
+                try:
+                    record[key] = json.loads(value)
+                except (json.JSONDecodeError, TypeError):
+                    pass  # Keep original value
+            elif field_type == "boolean":
+                record[key] = bool(value)
+    return record
+
+
 @dataclass
 class RuleFilter:
     """Rule results including SQL filter for row-level security."""
@@ -93,6 +215,20 @@ class RuleFilter:
     allowed_fields: list[str] | str = "*"
 
 
+@dataclass
+class CascadedRows:
+    """Rows of a referencing collection changed by a delete's ON DELETE action.
+
+    With ``action`` "cascade" the rows are deleted along with the referenced
+    record; with "set_null" their ``field`` is cleared.
+    """
+
+    collection_name: str
+    field: str
+    action: str
+    rows: list[dict[str, Any]]
+
+
 class RecordRepository:
     """Repository for dynamic record database operations.
 
@@ -133,6 +269,148 @@ class RecordRepository:
             return value
         return 1 if value else 0
 
+    async def _load_rollups(self, collection_name: str) -> list[Any]:
+        """Return the rollups to maintain on writes, if rollups are enabled.
+
+        Args:
+            collection_name: The collection name.
+
+        Returns:
+            Rollup definitions of the collection (empty when disabled).
+        """
+        if not get_settings().aggregate_rollups_enabled:
+            return []
+        return await AggregateRollupRepository(self.session).list_by_collection_name(
+            collection_name
+        )
+
+    async def _select_rollup_row(
+        self,
+        table_name: str,
+        rollups: list[Any],
+        where_clause: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Fetch the raw columns a write contributes to the given rollups.
+
+        Args:
+            table_name: The collection table name.
+            rollups: Rollup definitions of the collection.
+            where_clause: WHERE clause selecting the written record.
+            params: Parameters for the WHERE clause.
+
+        Returns:
+            The row's rollup columns, or None if no row matches.
+        """
+        columns = ", ".join(f'"{c}"' for c in rollup_columns(rollups))
+        result = await self.session.execute(
+            text(f'SELECT {columns} FROM "{table_name}" WHERE {where_clause}'), params
+        )
+        row = result.fetchone()
+        return dict(row._mapping) if row is not None else None
+
+    async def _find_referencing_fields(
+        self, collection_name: str
+    ) -> list[tuple[str, str, str]]:
+        """Find reference fields whose ON DELETE action changes other rows.
+
+        Args:
+            collection_name: The referenced collection name.
+
+        Returns:
+            (collection name, field name, on_delete) for every cascade or
+            set_null reference field targeting the collection.
+        """
+        # Only schemas mentioning the name can reference the collection
+        result = await self.session.execute(
+            select(CollectionModel.name, CollectionModel.schema).where(
+                CollectionModel.schema.contains(f'"{collection_name}"')
+            )
+        )
+        actions = (OnDeleteAction.CASCADE.value, OnDeleteAction.SET_NULL.value)
+        references = []
+        for name, schema_json in result.all():
+            for field in json.loads(schema_json):
+                on_delete = field.get("on_delete", OnDeleteAction.RESTRICT.value)
+                if (
+                    field.get("type") == FieldType.REFERENCE.value
+                    and field.get("collection") == collection_name
+                    and on_delete in actions
+                ):
+                    references.append((name, field["name"], on_delete))
+        return references
+
+    async def _collect_cascaded_rows(
+        self, collection_name: str, record_ids: list[str]
+    ) -> list[CascadedRows]:
+        """Fetch the rows a delete will change through foreign key actions.
+
+        Must run before the DELETE: cascaded rows are gone afterwards.
+        Cascades are followed through every level of references.
+
+        Args:
+            collection_name: The collection records are deleted from.
+            record_ids: IDs of the records being deleted.
+
+        Returns:
+            The affected rows of each referencing collection, as raw columns.
+        """
+        if self._get_dialect() == "sqlite" and not get_settings().db_sqlite_foreign_keys:
+            return []
+
+        cascaded: list[CascadedRows] = []
+        deleted = {(collection_name, record_id) for record_id in record_ids}
+        pending = [(collection_name, list(record_ids))]
+        while pending:
+            target, ids = pending.pop()
+            for ref_collection, field, action in await self._find_referencing_fields(target):
+                table_name = TableBuilder.generate_table_name(ref_collection)
+                id_params = {f"id_{i}": v for i, v in enumerate(ids)}
+                placeholders = ", ".join(f":{k}" for k in id_params)
+                result = await self.session.execute(
+                    text(f'SELECT * FROM "{table_name}" WHERE "{field}" IN ({placeholders})'),
+                    id_params,
+                )
+                rows = [
+                    dict(row._mapping)
+                    for row in result.fetchall()
+                    if (ref_collection, row._mapping["id"]) not in deleted
+                ]
+                if not rows:
+                    continue
+                if action == OnDeleteAction.CASCADE.value:
+                    deleted.update((ref_collection, row["id"]) for row in rows)
+                    pending.append((ref_collection, [row["id"] for row in rows]))
+                cascaded.append(CascadedRows(ref_collection, field, action, rows))
+        return cascaded
+
+    async def _apply_cascaded_writes(self, cascaded: list[CascadedRows]) -> None:
+        """Apply a delete's foreign key actions to referencing collections.
+
+        Args:
+            cascaded: Rows collected by ``_collect_cascaded_rows``.
+        """
+        for entry in cascaded:
+            rollups = await self._load_rollups(entry.collection_name)
+            if rollups:
+                rollup_repo = AggregateRollupRepository(self.session)
+                for row in entry.rows:
+                    new_row = None
+                    if entry.action == OnDeleteAction.SET_NULL.value:
+                        new_row = {**row, entry.field: None}
+                    await rollup_repo.apply_write(rollups, row, new_row)
+            mark_collection_written(self.session, entry.collection_name)
+            deleted = entry.action == OnDeleteAction.CASCADE.value
+            for row in entry.rows:
+                mark_records_changed(self.session, entry.collection_name, row["account_id"])
+                track_record_change(
+                    self.session,
+                    entry.collection_name,
+                    row["account_id"],
+                    row["id"],
+                    deleted=deleted,
+                )
+
     async def insert_record(
         self,
         collection_name: str,
@@ -202,6 +480,16 @@ class RecordRepository:
 
         await self.session.execute(text(insert_sql), sql_values)
 
+        rollups = await self._load_rollups(collection_name)
+        if rollups:
+            new_row = await self._select_rollup_row(
+                table_name, rollups, '"id" = :record_id', {"record_id": record_id}
+            )
+            await AggregateRollupRepository(self.session).apply_write(rollups, None, new_row)
+        mark_collection_written(self.session, collection_name)
+        mark_records_changed(self.session, collection_name, account_id)
+        track_record_change(self.session, collection_name, account_id, record_id)
+
         logger.info(
             "Record inserted successfully",
             table_name=table_name,
@@ -221,6 +509,7 @@ class RecordRepository:
             "updated_by": created_by,
             **data,  # Include original user data (not SQL-converted)
         }
+        enqueue_record_event(self.session, "create", collection_name, account_id, created_record)
 
         # Trigger audit hook if context is available
         context = get_current_context()
@@ -302,6 +591,14 @@ class RecordRepository:
 
         where_clause = " AND ".join(where_clauses)
 
+        old_row = None
+        rollups = await self._load_rollups(collection_name)
+        if rollups:
+            where_params = {k: v for k, v in params.items() if k not in sql_values}
+            old_row = await self._select_rollup_row(
+                table_name, rollups, where_clause, where_params
+            )
+
         update_sql = f'''
             UPDATE "{table_name}"
             SET {set_clause}
@@ -316,23 +613,24 @@ class RecordRepository:
         if row is None:
             return None
 
+        if rollups and old_row is not None:
+            await AggregateRollupRepository(self.session).apply_write(
+                rollups, old_row, dict(row._mapping)
+            )
+        mark_collection_written(self.session, collection_name)
+        mark_records_changed(self.session, collection_name, row._mapping["account_id"])
+        track_record_change(self.session, collection_name, row._mapping["account_id"], record_id)
+
         # Convert back to dict
-        record = dict(row._mapping)
-
-        # Type conversion
-        for key, value in list(record.items()):
-            # System fields: convert datetime to ISO string
-            if key in ("created_at", "updated_at") and isinstance(value, datetime):
-                record[key] = value.isoformat()
-            elif key in schema_lookup:
-                field_type = schema_lookup[key].get("type", "text").lower()
-                if field_type == "json" and value is not None:
-                    try:
-                        record[key] = json.loads(value)
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                elif field_type == "boolean":
-                    record[key] = bool(value)
+        record = _decode_record_row(row._mapping, schema_lookup)
+        enqueue_record_event(
+            self.session,
+            "update",
+            collection_name,
+            row._mapping["account_id"],
+            record,
+            old_values,
+        )
 
         # Trigger audit hook for update
         context = get_current_context()
@@ -370,6 +668,7 @@ class RecordRepository:
         account_id: str,
         schema: list[dict[str, Any]],
         rule_filter: RuleFilter | None = None,
+        columns: Collection[str] | None = None,
     ) -> dict[str, Any] | None:
         """Get a record by ID, scoped to account and rules.
 
@@ -379,6 +678,8 @@ class RecordRepository:
             account_id: The account ID for scoping.
             schema: The collection schema for type conversion.
             rule_filter: Optional rule filter for row-level security.
+            columns: Optional fields to return (system fields are always
+                included). None returns every column.
 
         Returns:
             The record dict if found, None otherwise.
@@ -402,10 +703,7 @@ class RecordRepository:
         # Build SELECT with computed field expressions
         dialect = self._get_dialect()
         computed_parts, computed_params = _build_computed_select_parts(schema, dialect)
-        computed_sql = ", ".join(
-            f'({sql}) AS "{name}"' for sql, name in computed_parts
-        )
-        select_cols = f'*, {computed_sql}' if computed_sql else '*'
+        select_cols, _ = _build_select_list(schema, computed_parts, columns)
         params.update(computed_params)
 
         select_sql = f'''
@@ -422,29 +720,9 @@ class RecordRepository:
         if row is None:
             return None
 
-        # Convert row to dict
-        record = dict(row._mapping)
-
         # Convert types back from SQL storage
         schema_lookup = {f["name"]: f for f in schema}
-        computed_fields = {f["name"]: f for f in schema if f.get("type", "").lower() == "computed"}
-        for key, value in list(record.items()):
-            # System fields: convert datetime to ISO string
-            if key in ("created_at", "updated_at") and isinstance(value, datetime):
-                record[key] = value.isoformat()
-            elif key in computed_fields:
-                pass  # Computed fields: returned as-is from SQL
-            elif key in schema_lookup:
-                field_type = schema_lookup[key].get("type", "text").lower()
-                if field_type == "json" and value is not None:
-                    try:
-                        record[key] = json.loads(value)
-                    except (json.JSONDecodeError, TypeError):
-                        pass  # Keep original value
-                elif field_type == "boolean":
-                    record[key] = bool(value)
-
-        return record
+        return _decode_record_row(row._mapping, schema_lookup)
 
     async def check_reference_exists(
         self,
@@ -489,6 +767,7 @@ class RecordRepository:
         ids: list[str],
         account_id: str | None,
         schema: list[dict[str, Any]],
+        columns: Collection[str] | None = None,
     ) -> dict[str, dict[str, Any]]:
         """Batch-fetch records by a list of IDs, scoped to account.
 
@@ -497,6 +776,8 @@ class RecordRepository:
             ids: List of record IDs to fetch.
             account_id: The account ID for scoping (None for superadmin bypass).
             schema: The collection schema for type conversion.
+            columns: Optional fields to return (system fields are always
+                included). None returns every column.
 
         Returns:
             Dict mapping record ID to record dict for found records.
@@ -519,10 +800,7 @@ class RecordRepository:
         # Build SELECT with computed field expressions
         dialect = self._get_dialect()
         computed_parts, computed_params = _build_computed_select_parts(schema, dialect)
-        computed_sql = ", ".join(
-            f'({sql}) AS "{name}"' for sql, name in computed_parts
-        )
-        select_cols = f'*, {computed_sql}' if computed_sql else '*'
+        select_cols, _ = _build_select_list(schema, computed_parts, columns)
         params.update(computed_params)
         select_sql = f'SELECT {select_cols} FROM "{table_name}" WHERE {where_clause}'
 
@@ -533,25 +811,10 @@ class RecordRepository:
             return {}
 
         schema_lookup = {f["name"]: f for f in schema}
-        computed_fields = {f["name"] for f in schema if f.get("type", "").lower() == "computed"}
         records: dict[str, dict[str, Any]] = {}
 
         for row in rows:
-            record = dict(row._mapping)
-            for key, value in list(record.items()):
-                if key in ("created_at", "updated_at") and isinstance(value, datetime):
-                    record[key] = value.isoformat()
-                elif key in computed_fields:
-                    pass  # Computed fields: returned as-is from SQL
-                elif key in schema_lookup:
-                    field_type = schema_lookup[key].get("type", "text").lower()
-                    if field_type == "json" and value is not None:
-                        try:
-                            record[key] = json.loads(value)
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    elif field_type == "boolean":
-                        record[key] = bool(value)
+            record = _decode_record_row(row._mapping, schema_lookup)
             records[record["id"]] = record
 
         return records
@@ -567,6 +830,7 @@ class RecordRepository:
         descending: bool = True,
         user_filter: RuleFilter | None = None,
         rule_filter: RuleFilter | None = None,
+        columns: Collection[str] | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
         """Find records in a collection with pagination, sorting, and filtering.
 
@@ -580,6 +844,10 @@ class RecordRepository:
             descending: Whether to sort in descending order.
             user_filter: Optional compiled filter from ?filter= query param.
             rule_filter: Optional rule filter for row-level security.
+            columns: Optional fields to return (system fields are always
+                included). Other columns are not selected, and the accounts
+                join only runs when ``account_name`` is requested. None
+                returns every column plus ``account_name``.
 
         Returns:
             A tuple containing (list of records, total count).
@@ -604,13 +872,7 @@ class RecordRepository:
             params.update(user_filter.params)
 
         # Validate sort field to prevent SQL injection
-        # Allow system fields, schema fields (including computed)
-        schema_field_names = {f["name"] for f in schema}
-        system_fields = {"id", "created_at", "created_by", "updated_at", "updated_by"}
-
-        if sort_by not in schema_field_names and sort_by not in system_fields:
-            # Fallback to default if invalid sort field
-            sort_by = "created_at"
+        sort_by = resolve_sort_field(sort_by, schema)
 
         where_clause = " AND ".join(where_clauses)
         where_sql = f" WHERE {where_clause}" if where_clause else ""
@@ -619,10 +881,14 @@ class RecordRepository:
         dialect = self._get_dialect()
         computed_parts, computed_params = _build_computed_select_parts(schema, dialect)
         computed_expr_map = {name: sql for sql, name in computed_parts}
-        computed_sql = ", ".join(
-            f'({sql}) AS "{name}"' for sql, name in computed_parts
+        select_cols, join_accounts = _build_select_list(
+            schema, computed_parts, columns, alias="r", required=(sort_by,)
         )
-        extra_select = f", {computed_sql}" if computed_sql else ""
+        if join_accounts:
+            select_cols += ", a.name as account_name"
+            accounts_join = "LEFT JOIN accounts a ON r.account_id = a.id"
+        else:
+            accounts_join = ""
         params.update(computed_params)
 
         # Determine ORDER BY expression (computed fields use their SQL expression)
@@ -640,8 +906,8 @@ class RecordRepository:
         sort_order = "DESC" if descending else "ASC"
 
         select_sql = f'''
-            SELECT r.*, a.name as account_name{extra_select} FROM "{table_name}" r
-            LEFT JOIN accounts a ON r.account_id = a.id
+            SELECT {select_cols} FROM "{table_name}" r
+            {accounts_join}
             {where_sql}
             ORDER BY {sort_expr} {sort_order}
             LIMIT :limit OFFSET :skip
@@ -654,31 +920,8 @@ class RecordRepository:
         rows = result.fetchall()
 
         # 5. Convert rows to dicts and fix types
-        records = []
         schema_lookup = {f["name"]: f for f in schema}
-        computed_fields = set(computed_expr_map.keys())
-
-        for row in rows:
-            record = dict(row._mapping)
-
-            # Type conversion
-            for key, value in list(record.items()):
-                # System fields: convert datetime to ISO string
-                if key in ("created_at", "updated_at") and isinstance(value, datetime):
-                    record[key] = value.isoformat()
-                elif key in computed_fields:
-                    pass  # Computed fields: returned as-is from SQL
-                elif key in schema_lookup:
-                    field_type = schema_lookup[key].get("type", "text").lower()
-                    if field_type == "json" and value is not None:
-                        try:
-                            record[key] = json.loads(value)
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    elif field_type == "boolean":
-                        record[key] = bool(value)
-
-            records.append(record)
+        records = [_decode_record_row(row._mapping, schema_lookup) for row in rows]
 
         return records, total_count
 
@@ -696,6 +939,7 @@ class RecordRepository:
         cursor_record_id: str | None = None,
         is_backward: bool = False,
         include_count: bool = False,
+        columns: Collection[str] | None = None,
     ) -> tuple[list[dict[str, Any]], str | None, str | None, bool, int | None]:
         """Find records using cursor-based pagination.
 
@@ -708,10 +952,14 @@ class RecordRepository:
             descending: Whether to sort in descending order.
             user_filter: Optional compiled filter from ?filter= query param.
             rule_filter: Optional rule filter for row-level security.
-            cursor_sort_value: Sort value from cursor (for keyset pagination).
-            cursor_record_id: Record ID from cursor (tie-breaker).
+            cursor_sort_value: Sort value from cursor (for keyset pagination);
+                None when the boundary record's sort value is NULL.
+            cursor_record_id: Record ID from cursor (tie-breaker); None for
+                the first page.
             is_backward: Whether this is a backward navigation request.
             include_count: Whether to include total count (expensive).
+            columns: Optional fields to return, as for find_all. The sort
+                field is always selected so cursors can be built.
 
         Returns:
             A tuple containing (records, next_cursor, prev_cursor, has_more, total).
@@ -736,19 +984,20 @@ class RecordRepository:
             params.update(user_filter.params)
 
         # Validate sort field
-        schema_field_names = {f["name"] for f in schema}
-        system_fields = {"id", "created_at", "created_by", "updated_at", "updated_by"}
-        if sort_by not in schema_field_names and sort_by not in system_fields:
-            sort_by = "created_at"
+        sort_by = resolve_sort_field(sort_by, schema)
 
         # 2. Build computed field expressions
         dialect = self._get_dialect()
         computed_parts, computed_params = _build_computed_select_parts(schema, dialect)
         computed_expr_map = {name: sql for sql, name in computed_parts}
-        computed_sql = ", ".join(
-            f'({sql}) AS "{name}"' for sql, name in computed_parts
+        select_cols, join_accounts = _build_select_list(
+            schema, computed_parts, columns, alias="r", required=(sort_by,)
         )
-        extra_select = f", {computed_sql}" if computed_sql else ""
+        if join_accounts:
+            select_cols += ", a.name as account_name"
+            accounts_join = "LEFT JOIN accounts a ON r.account_id = a.id"
+        else:
+            accounts_join = ""
         params.update(computed_params)
 
         # Determine ORDER BY expression (computed fields use their SQL expression)
@@ -757,21 +1006,29 @@ class RecordRepository:
         else:
             sort_expr = f'r."{sort_by}"'
 
-        # 3. Build cursor condition for keyset pagination
+        # 3. Build cursor condition for keyset pagination. Backward pages
+        # scan in reverse order from the cursor and are flipped afterwards.
+        # NULL sort values rank lowest on every dialect: they lead ascending
+        # scans and trail descending ones, so comparisons against them need
+        # their own IS NULL branches.
+        scan_descending = descending != is_backward
         cursor_condition = ""
-        if cursor_sort_value is not None and cursor_record_id is not None:
-            if is_backward:
-                if descending:
-                    cursor_condition = f'AND (({sort_expr} > :cursor_sort_value) OR ({sort_expr} = :cursor_sort_value AND r."id" > :cursor_record_id))'
-                else:
-                    cursor_condition = f'AND (({sort_expr} < :cursor_sort_value) OR ({sort_expr} = :cursor_sort_value AND r."id" < :cursor_record_id))'
+        if cursor_record_id is not None:
+            op = "<" if scan_descending else ">"
+            id_after = f'r."id" {op} :cursor_record_id'
+            if cursor_sort_value is None:
+                branches = [f"({sort_expr} IS NULL AND {id_after})"]
+                if not scan_descending:
+                    branches.append(f"{sort_expr} IS NOT NULL")
             else:
-                if descending:
-                    cursor_condition = f'AND (({sort_expr} < :cursor_sort_value) OR ({sort_expr} = :cursor_sort_value AND r."id" < :cursor_record_id))'
-                else:
-                    cursor_condition = f'AND (({sort_expr} > :cursor_sort_value) OR ({sort_expr} = :cursor_sort_value AND r."id" > :cursor_record_id))'
-
-            params["cursor_sort_value"] = cursor_sort_value
+                branches = [
+                    f"({sort_expr} {op} :cursor_sort_value)",
+                    f"({sort_expr} = :cursor_sort_value AND {id_after})",
+                ]
+                if scan_descending:
+                    branches.append(f"{sort_expr} IS NULL")
+                params["cursor_sort_value"] = cursor_sort_value
+            cursor_condition = f"AND ({' OR '.join(branches)})"
             params["cursor_record_id"] = cursor_record_id
 
         where_clause = " AND ".join(where_clauses)
@@ -785,13 +1042,14 @@ class RecordRepository:
             total_count = count_result.scalar_one()
 
         # 5. Get records with cursor pagination
-        sort_order = "DESC" if descending else "ASC"
+        sort_order = "DESC" if scan_descending else "ASC"
+        nulls_order = "NULLS LAST" if scan_descending else "NULLS FIRST"
 
         select_sql = f'''
-            SELECT r.*, a.name as account_name{extra_select} FROM "{table_name}" r
-            LEFT JOIN accounts a ON r.account_id = a.id
+            SELECT {select_cols} FROM "{table_name}" r
+            {accounts_join}
             {where_sql} {cursor_condition}
-            ORDER BY {sort_expr} {sort_order}, r."id" {sort_order}
+            ORDER BY {sort_expr} {sort_order} {nulls_order}, r."id" {sort_order}
             LIMIT :limit
         '''
 
@@ -801,46 +1059,29 @@ class RecordRepository:
         rows = result.fetchall()
 
         # 6. Process results
-        records = []
         schema_lookup = {f["name"]: f for f in schema}
-        computed_fields = set(computed_expr_map.keys())
 
         has_more = len(rows) > limit
         actual_rows = rows[:limit]  # Trim to requested limit
+        if is_backward:
+            actual_rows.reverse()
 
-        for row in actual_rows:
-            record = dict(row._mapping)
-
-            # Type conversion
-            for key, value in list(record.items()):
-                if key in ("created_at", "updated_at") and isinstance(value, datetime):
-                    record[key] = value.isoformat()
-                elif key in computed_fields:
-                    pass  # Computed fields: returned as-is from SQL
-                elif key in schema_lookup:
-                    field_type = schema_lookup[key].get("type", "text").lower()
-                    if field_type == "json" and value is not None:
-                        try:
-                            record[key] = json.loads(value)
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    elif field_type == "boolean":
-                        record[key] = bool(value)
-
-            records.append(record)
-
-        # 7. Generate cursors
+        records = [_decode_record_row(row._mapping, schema_lookup) for row in actual_rows]
+
+        # 7. Generate cursors from the raw driver values so they are bound
+        # back with their native types
         next_cursor = None
         prev_cursor = None
 
-        if records:
+        if actual_rows:
+            scope = CursorScope(sort_by, descending, schema_version(schema))
             # Next cursor: from the last record
-            last_record = records[-1]
-            next_cursor = encode_cursor(last_record[sort_by], last_record["id"])
+            last_row = actual_rows[-1]._mapping
+            next_cursor = encode_cursor(last_row[sort_by], last_row["id"], scope)
 
             # Prev cursor: from the first record (for backward navigation)
-            first_record = records[0]
-            prev_cursor = encode_cursor(first_record[sort_by], first_record["id"])
+            first_row = actual_rows[0]._mapping
+            prev_cursor = encode_cursor(first_row[sort_by], first_row["id"], scope)
 
         return records, next_cursor, prev_cursor, has_more, total_count
 
@@ -858,6 +1099,12 @@ class RecordRepository:
     ) -> tuple[list[dict[str, Any]], int]:
         """Run a database-level aggregation query against a collection.
 
+        Results are served from the per-worker aggregate cache when the
+        collection has not been written since they were computed, and from a
+        materialized rollup when rollups are enabled and one matches an
+        unfiltered count/sum/avg query. Otherwise a single grouped query runs;
+        it has no LIMIT, so ``total_groups`` is simply the number of rows.
+
         Args:
             collection_name: The collection name.
             account_id: The account ID for scoping (None for superadmin bypass).
@@ -872,6 +1119,97 @@ class RecordRepository:
         Returns:
             A tuple of (result_rows, total_groups).
         """
+        cache = get_aggregate_cache()
+        cache_key: str | None = None
+        version = collection_write_version(collection_name)
+        if cache.enabled and not has_pending_writes(self.session, collection_name):
+            cache_key = cache.make_key(
+                collection_name,
+                account_id,
+                [agg.sql_expr for agg in agg_functions],
+                [agg.alias for agg in agg_functions],
+                group_by_fields,
+                [user_filter.sql, user_filter.params] if user_filter else None,
+                [rule_filter.sql, rule_filter.params] if rule_filter else None,
+                having_sql,
+                having_params,
+            )
+            cached = cache.get(collection_name, cache_key)
+            if cached is not None:
+                return [dict(row) for row in cached], len(cached)
+
+        results = await self._aggregate_from_rollup(
+            collection_name,
+            account_id,
+            agg_functions,
+            group_by_fields,
+            user_filter,
+            rule_filter,
+            having_sql,
+        )
+        if results is None:
+            results = await self._aggregate_from_table(
+                collection_name,
+                account_id,
+                agg_functions,
+                group_by_fields,
+                user_filter,
+                rule_filter,
+                having_sql,
+                having_params,
+                schema,
+            )
+
+        if cache_key is not None:
+            cache.put(collection_name, cache_key, version, [dict(row) for row in results])
+        return results, len(results)
+
+    async def _aggregate_from_rollup(
+        self,
+        collection_name: str,
+        account_id: str | None,
+        agg_functions: list[Any],
+        group_by_fields: list[str],
+        user_filter: "RuleFilter | None",
+        rule_filter: "RuleFilter | None",
+        having_sql: str | None,
+    ) -> list[dict[str, Any]] | None:
+        """Answer an aggregation from a materialized rollup if one applies.
+
+        Returns:
+            Result rows, or None when no rollup can answer the query exactly.
+        """
+        if user_filter or having_sql:
+            return None
+        if rule_filter and rule_filter.sql.strip() not in ("", "1=1"):
+            return None
+
+        rollups = await self._load_rollups(collection_name)
+        rollup = find_matching_rollup(rollups, agg_functions, group_by_fields)
+        if rollup is None:
+            return None
+
+        return await AggregateRollupRepository(self.session).query(
+            rollup, account_id, agg_functions, group_by_fields
+        )
+
+    async def _aggregate_from_table(
+        self,
+        collection_name: str,
+        account_id: str | None,
+        agg_functions: list[Any],
+        group_by_fields: list[str],
+        user_filter: "RuleFilter | None",
+        rule_filter: "RuleFilter | None",
+        having_sql: str | None,
+        having_params: dict[str, Any] | None,
+        schema: list[dict[str, Any]] | None,
+    ) -> list[dict[str, Any]]:
+        """Run the grouped aggregation query against the collection table.
+
+        Returns:
+            Result rows with group-by datetimes converted to ISO strings.
+        """
         table_name = TableBuilder.generate_table_name(collection_name)
 
         # 1. Build SELECT clause
@@ -914,7 +1252,7 @@ class RecordRepository:
             if having_params:
                 params.update(having_params)
 
-        # 5. Execute main query
+        # 5. Execute query
         query_sql = f"""
             SELECT {select_clause}
             FROM "{table_name}" r
@@ -925,24 +1263,7 @@ class RecordRepository:
         result = await self.session.execute(text(query_sql), params)
         rows = result.fetchall()
 
-        # 6. Determine total_groups
-        if group_by_fields:
-            count_sql = f"""
-                SELECT COUNT(*) FROM (
-                    SELECT 1
-                    FROM "{table_name}" r
-                    {where_sql}
-                    {group_by_sql}
-                    {having_sql_clause}
-                ) _agg_count
-            """
-            count_result = await self.session.execute(text(count_sql), params)
-            total_groups = count_result.scalar_one()
-        else:
-            # Global aggregate always produces at most one row
-            total_groups = len(rows)
-
-        # 7. Convert rows to dicts with optional type conversion for group-by datetime fields
+        # 6. Convert rows to dicts with optional type conversion for group-by datetime fields
         schema_lookup = {f["name"]: f for f in (schema or [])}
         results: list[dict[str, Any]] = []
         for row in rows:
@@ -958,7 +1279,7 @@ class RecordRepository:
                         row_dict[field] = val.isoformat()
             results.append(row_dict)
 
-        return results, total_groups
+        return results
 
     async def delete_record(
         self,
@@ -996,6 +1317,21 @@ class RecordRepository:
 
         where_clause = " AND ".join(where_clauses)
 
+        old_row = None
+        rollups = await self._load_rollups(collection_name)
+        if rollups:
+            old_row = await self._select_rollup_row(table_name, rollups, where_clause, params)
+
+        # The owning account is needed to bump its change counter
+        owner_account_id = account_id or (record_data or {}).get("account_id")
+        if not owner_account_id:
+            owner = await self.session.execute(
+                text(f'SELECT "account_id" FROM "{table_name}" WHERE {where_clause}'), params
+            )
+            owner_account_id = owner.scalar()
+
+        cascaded = await self._collect_cascaded_rows(collection_name, [record_id])
+
         delete_sql = f'''
             DELETE FROM "{table_name}"
             WHERE {where_clause}
@@ -1008,6 +1344,23 @@ class RecordRepository:
 
         success = result.rowcount > 0
 
+        if success:
+            if old_row is not None:
+                await AggregateRollupRepository(self.session).apply_write(rollups, old_row, None)
+            mark_collection_written(self.session, collection_name)
+            mark_records_changed(self.session, collection_name, owner_account_id)
+            track_record_change(
+                self.session, collection_name, owner_account_id, record_id, deleted=True
+            )
+            await self._apply_cascaded_writes(cascaded)
+            enqueue_record_event(
+                self.session,
+                "delete",
+                collection_name,
+                owner_account_id,
+                record_data or {"id": record_id},
+            )
+
         if success and record_data:
             # Trigger audit hook if context is available
             context = get_current_context()
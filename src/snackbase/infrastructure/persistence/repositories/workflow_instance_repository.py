@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from typing import Any
+
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.infrastructure.persistence.models.workflow_instance import WorkflowInstanceModel
@@ -56,6 +58,23 @@ class WorkflowInstanceRepository:
         await self._session.flush()
         return instance
 
+    async def advance_cursor(self, instance_id: str, **values: Any) -> bool:
+        """Update cursor columns of a running instance without loading the row.
+
+        Only the given columns are written; the ``context`` JSON is never
+        rewritten. Returns False when the instance no longer exists or has
+        left the ``running`` state (e.g. it was cancelled mid-run).
+        """
+        result = await self._session.execute(
+            update(WorkflowInstanceModel)
+            .where(
+                WorkflowInstanceModel.id == instance_id,
+                WorkflowInstanceModel.status == "running",
+            )
+            .values(**values)
+        )
+        return result.rowcount > 0
+
     async def delete(self, instance_id: str) -> None:
         inst = await self.get(instance_id)
         if inst is not None:
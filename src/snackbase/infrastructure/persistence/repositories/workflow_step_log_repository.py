@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +21,32 @@ class WorkflowStepLogRepository:
         await self._session.flush()
         return log
 
+    async def create_many(self, logs: list[WorkflowStepLogModel]) -> None:
+        """Add several step logs in one flush (batched progress writes)."""
+        self._session.add_all(logs)
+        await self._session.flush()
+
+    async def get_step_outputs(self, instance_id: str) -> dict[str, dict[str, Any]]:
+        """Return ``{step_name: {"output": ..., "status": ...}}`` for an instance.
+
+        Step outputs live only in the step log; this rebuilds the ``steps``
+        section of the template context on demand. When a step ran more than
+        once, the most recent execution wins.
+        """
+        result = await self._session.execute(
+            select(
+                WorkflowStepLogModel.step_name,
+                WorkflowStepLogModel.output,
+                WorkflowStepLogModel.status,
+            )
+            .where(WorkflowStepLogModel.instance_id == instance_id)
+            .order_by(WorkflowStepLogModel.started_at.asc())
+        )
+        return {
+            name: {"output": output or {}, "status": step_status}
+            for name, output, step_status in result.all()
+        }
+
     async def list_for_instance(
         self,
         instance_id: str,
@@ -0,0 +1,114 @@
+"""Startup schema fingerprint.
+
+Every process start used to run ``alembic upgrade heads`` (which loads every
+core and dynamic collection migration script), backfill the pagination index
+of every collection and re-check all seed data. On an instance with many
+collections that dominates cold start and worker restart time.
+
+After a full pass, startup now records a *schema fingerprint* in the
+``schema_state`` table: a SHA-256 over the application version, the seed code
+and the name and content of every migration script, together with the
+Alembic heads the database reached. The next start recomputes the
+fingerprint (reading the scripts, not importing them) and, if both it and the
+database's current heads match the recorded state, skips the pass.
+
+Adding a migration (including a collection change, which writes a dynamic
+migration), upgrading SnackBase, or changing the database's revisions behind
+the application's back all invalidate the recorded state, so the next start
+runs the full pass again and records the new state.
+"""
+
+import hashlib
+from pathlib import Path
+
+from alembic.config import Config
+from sqlalchemy import delete, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from snackbase.core.config import get_settings
+from snackbase.core.logging import get_logger
+from snackbase.infrastructure.persistence.models.schema_state import SchemaStateModel
+
+logger = get_logger(__name__)
+
+STARTUP_STATE = "startup"
+
+# Seed data is defined alongside init_database
+_SEED_SOURCES = (Path(__file__).with_name("database.py"),)
+
+
+def compute_schema_fingerprint(alembic_ini_path: str = "alembic.ini") -> str:
+    """Fingerprint the migration scripts and seed code startup would run.
+
+    Args:
+        alembic_ini_path: Path to alembic.ini, whose version locations are read.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(get_settings().app_version.encode())
+    for source in _SEED_SOURCES:
+        digest.update(source.read_bytes())
+
+    for index, location in enumerate(Config(alembic_ini_path).get_version_locations_list() or []):
+        directory = Path(location)
+        if not directory.is_dir():
+            continue
+        for script in sorted(directory.glob("*.py")):
+            digest.update(f"\0{index}/{script.name}\0".encode())
+            digest.update(script.read_bytes())
+    return digest.hexdigest()
+
+
+async def _current_heads(conn: AsyncConnection) -> str:
+    revisions = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalars()
+    return ",".join(sorted(revisions))
+
+
+async def is_schema_current(engine: AsyncEngine, fingerprint: str) -> bool:
+    """Check whether the last full startup pass recorded this fingerprint.
+
+    Args:
+        engine: Application database engine.
+        fingerprint: Fingerprint computed for this start.
+
+    Returns:
+        True if the recorded fingerprint and the database's Alembic heads
+        both match, False otherwise (including on a database that has not
+        been migrated far enough to have the tables).
+    """
+    try:
+        async with engine.connect() as conn:
+            state = (
+                await conn.execute(
+                    select(SchemaStateModel.fingerprint, SchemaStateModel.alembic_heads).where(
+                        SchemaStateModel.name == STARTUP_STATE
+                    )
+                )
+            ).first()
+            if state is None or state.fingerprint != fingerprint:
+                return False
+            return state.alembic_heads == await _current_heads(conn)
+    except SQLAlchemyError as e:
+        logger.debug("Schema state unavailable, running full startup", error=str(e))
+        return False
+
+
+async def record_schema_fingerprint(engine: AsyncEngine, fingerprint: str) -> None:
+    """Record the fingerprint and current Alembic heads after a full pass.
+
+    Args:
+        engine: Application database engine.
+        fingerprint: Fingerprint computed before the pass ran.
+    """
+    async with engine.begin() as conn:
+        heads = await _current_heads(conn)
+        await conn.execute(delete(SchemaStateModel).where(SchemaStateModel.name == STARTUP_STATE))
+        await conn.execute(
+            SchemaStateModel.__table__.insert().values(
+                name=STARTUP_STATE, fingerprint=fingerprint, alembic_heads=heads
+            )
+        )
+    logger.info("Recorded schema fingerprint", fingerprint=fingerprint[:12], heads=heads)
@@ -213,12 +213,46 @@ class TableBuilder:
         ddl = f'CREATE TABLE "{table_name}" (\n  {columns_sql}\n);'
         return ddl
 
+    @classmethod
+    def pagination_index_name(cls, collection_name: str) -> str:
+        """Get the name of the keyset pagination index of a collection table.
+
+        Args:
+            collection_name: The collection name.
+
+        Returns:
+            The index name.
+        """
+        return f"ix_{cls.generate_table_name(collection_name)}_account_created_id"
+
+    @classmethod
+    def build_pagination_index_ddl(cls, collection_name: str) -> str:
+        """Build the CREATE INDEX statement backing the default record listing.
+
+        Lists are scoped by account and keyset-paginated by ``created_at``
+        with ``id`` as tie-breaker, which this composite index serves
+        without a sort.
+
+        Args:
+            collection_name: The collection name.
+
+        Returns:
+            An idempotent DDL statement.
+        """
+        table_name = cls.generate_table_name(collection_name)
+        index_name = cls.pagination_index_name(collection_name)
+        return (
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+            f'ON "{table_name}"("account_id", "created_at", "id");'
+        )
+
     @classmethod
     def build_index_ddl(cls, collection_name: str, schema: list[dict[str, Any]]) -> list[str]:
         """Build CREATE INDEX statements for the table.
 
         Creates indexes on:
         - account_id (always, for multi-tenancy queries)
+        - account_id, created_at, id (always, for keyset pagination)
         - Any unique fields
 
         Args:
@@ -235,6 +269,7 @@ class TableBuilder:
         indexes.append(
             f'CREATE INDEX "idx_{table_name}_account_id" ON "{table_name}"("account_id");'
         )
+        indexes.append(cls.build_pagination_index_ddl(collection_name))
 
         # Index unique fields (SQLite may already create these for UNIQUE constraint)
         # Also index reference fields for join performance
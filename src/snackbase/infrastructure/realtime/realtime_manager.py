@@ -24,7 +24,9 @@ class RealtimeConnection:
         connection_id: str, 
         user_id: str, 
         account_id: str,
-        send_callback: Callable[[Any], asyncio.Task]
+        send_callback: Callable[[Any], asyncio.Task],
+        transport: str = "websocket",
+        outbound_queue: Optional[asyncio.Queue] = None,
     ):
         self.id = connection_id
         self.user_id = user_id
@@ -32,6 +34,9 @@ class RealtimeConnection:
         self.subscriptions: Dict[str, Subscription] = {}
         self.last_activity = datetime.now(timezone.utc)
         self.send_callback = send_callback
+        self.transport = transport
+        # Events buffered for the client (SSE), None when sent directly
+        self.outbound_queue = outbound_queue
 
     def add_subscription(self, subscription: Subscription) -> None:
         self.subscriptions[subscription.id] = subscription
@@ -66,6 +71,23 @@ class ConnectionManager:
     async def get_connection(self, connection_id: str) -> Optional[RealtimeConnection]:
         return self.active_connections.get(connection_id)
 
+    def stats(self) -> Dict[str, Any]:
+        """Summarize open connections for metrics.
+
+        Returns:
+            Connection counts per transport, the number of subscriptions and
+            the number of events waiting in outbound queues.
+        """
+        connections: Dict[str, int] = {}
+        subscriptions = 0
+        queued = 0
+        for conn in list(self.active_connections.values()):
+            connections[conn.transport] = connections.get(conn.transport, 0) + 1
+            subscriptions += len(conn.subscriptions)
+            if conn.outbound_queue is not None:
+                queued += conn.outbound_queue.qsize()
+        return {"connections": connections, "subscriptions": subscriptions, "queued": queued}
+
     async def broadcast_to_account(self, account_id: str, collection: str, operation: str, data: Any) -> None:
         """Broadcast an event to all authorized subscribers in an account."""
         async with self._lock:
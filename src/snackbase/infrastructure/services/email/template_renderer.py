@@ -1,36 +1,80 @@
 """Jinja2 template renderer for email templates.
 
 Provides safe template rendering with HTML escaping and error handling.
+Compiled templates can be cached under a caller-supplied key so repeated
+sends of the same stored template skip Jinja2 parsing and compilation.
 """
 
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
 from jinja2 import Environment, Template, TemplateSyntaxError, UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
 from snackbase.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from snackbase.infrastructure.persistence.models.email_template import EmailTemplateModel
+
 logger = get_logger(__name__)
 
+# Maximum number of compiled templates kept in memory (LRU eviction).
+COMPILED_TEMPLATE_CACHE_SIZE = 512
+
 
 class TemplateRenderer:
     """Jinja2 template renderer with security features.
 
     Uses sandboxed environment to prevent code execution in templates.
+    Keeps an LRU cache of compiled templates for callers that pass a cache
+    key (see ``template_cache_key``).
     """
 
-    def __init__(self) -> None:
-        """Initialize the template renderer with sandboxed environment."""
+    def __init__(self, cache_size: int = COMPILED_TEMPLATE_CACHE_SIZE) -> None:
+        """Initialize the template renderer with sandboxed environment.
+
+        Args:
+            cache_size: Maximum number of compiled templates to keep.
+        """
         self.env = SandboxedEnvironment(
             autoescape=True,
             trim_blocks=True,
             lstrip_blocks=True,
         )
-
-    def render(self, template_string: str, variables: dict[str, str]) -> str:
+        self._cache_size = cache_size
+        self._compiled: OrderedDict[Hashable, Template] = OrderedDict()
+
+    def _get_compiled(self, template_string: str, cache_key: Hashable | None) -> Template:
+        """Return a compiled template, using the cache when a key is given."""
+        if cache_key is None:
+            return self.env.from_string(template_string)
+
+        template = self._compiled.get(cache_key)
+        if template is not None:
+            self._compiled.move_to_end(cache_key)
+            return template
+
+        template = self.env.from_string(template_string)
+        self._compiled[cache_key] = template
+        if len(self._compiled) > self._cache_size:
+            self._compiled.popitem(last=False)
+        return template
+
+    def render(
+        self,
+        template_string: str,
+        variables: dict[str, str],
+        cache_key: Hashable | None = None,
+    ) -> str:
         """Render a template string with variables.
 
         Args:
             template_string: Jinja2 template string.
             variables: Dictionary of variables to substitute.
+            cache_key: Optional key identifying this exact template source.
+                When given, the compiled template is cached and reused. The
+                key must change whenever the source changes.
 
         Returns:
             Rendered template string.
@@ -40,7 +84,7 @@ class TemplateRenderer:
             UndefinedError: If required variable is missing.
         """
         try:
-            template = self.env.from_string(template_string)
+            template = self._get_compiled(template_string, cache_key)
             rendered = template.render(**variables)
             logger.debug("Template rendered successfully", variable_count=len(variables))
             return rendered
@@ -54,6 +98,32 @@ class TemplateRenderer:
             logger.error("Template rendering failed", error=str(e))
             raise
 
+    def invalidate(self, template_id: str | None = None) -> None:
+        """Drop cached compiled templates.
+
+        Args:
+            template_id: Drop only entries built by ``template_cache_key`` for
+                this template. If None, clears the entire cache.
+        """
+        if template_id is None:
+            self._compiled.clear()
+            return
+        for key in [k for k in self._compiled if isinstance(k, tuple) and k[0] == template_id]:
+            del self._compiled[key]
+
+
+def template_cache_key(template: "EmailTemplateModel", field: str) -> tuple:
+    """Build the compiled-template cache key for a stored email template field.
+
+    Args:
+        template: Stored email template.
+        field: Template field being rendered ('subject', 'html_body', 'text_body').
+
+    Returns:
+        Cache key of (template id, updated_at, locale, field).
+    """
+    return (template.id, template.updated_at, template.locale, field)
+
 
 # Global template renderer instance
 _template_renderer: TemplateRenderer | None = None
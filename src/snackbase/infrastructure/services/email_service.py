@@ -5,13 +5,16 @@ and comprehensive logging for audit purposes.
 """
 
 import uuid
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.core.logging import get_logger
+from snackbase.infrastructure.persistence.models.configuration import ConfigurationModel
 from snackbase.infrastructure.persistence.models.email_log import EmailLogModel
+from snackbase.infrastructure.persistence.models.email_template import EmailTemplateModel
 from snackbase.infrastructure.persistence.repositories.configuration_repository import (
     ConfigurationRepository,
 )
@@ -35,12 +38,37 @@ from snackbase.infrastructure.services.email.smtp_provider import (
     SMTPProvider,
     SMTPSettings,
 )
-from snackbase.infrastructure.services.email.template_renderer import get_template_renderer
+from snackbase.infrastructure.services.email.template_renderer import (
+    get_template_renderer,
+    template_cache_key,
+)
 
 logger = get_logger(__name__)
 
 SYSTEM_ACCOUNT_ID = "00000000-0000-0000-0000-000000000000"
 
+# Maximum number of provider instances kept across EmailService instances.
+PROVIDER_INSTANCE_CACHE_SIZE = 64
+
+# (config id, config updated_at) -> (provider, from_email, from_name, reply_to)
+_provider_instances: OrderedDict[
+    tuple[str, datetime], tuple[EmailProvider, str, str, Optional[str]]
+] = OrderedDict()
+
+
+def invalidate_provider_instances(config_id: Optional[str] = None) -> None:
+    """Drop shared email provider instances.
+
+    Args:
+        config_id: Drop only instances built from this configuration. If None,
+            clears all of them.
+    """
+    if config_id is None:
+        _provider_instances.clear()
+        return
+    for key in [k for k in _provider_instances if k[0] == config_id]:
+        del _provider_instances[key]
+
 
 class ProviderCache:
     """Cache for email provider instances with TTL."""
@@ -155,6 +183,48 @@ class EmailService:
         else:
             raise ValueError(f"Unknown email provider: {provider_name}")
 
+    def _provider_from_config(
+        self, config_model: ConfigurationModel
+    ) -> tuple[EmailProvider, str, str, Optional[str]]:
+        """Build (or reuse) the provider for a stored provider configuration.
+
+        Provider instances are shared process-wide per (config id, updated_at),
+        so clients such as the boto3 SES client are created once per config
+        instead of once per request. Editing a configuration bumps updated_at,
+        which makes the old instance unreachable.
+
+        Args:
+            config_model: Enabled email provider configuration.
+
+        Returns:
+            Tuple of (provider, from_email, from_name, reply_to).
+        """
+        cache_key = None
+        if config_model.id is not None and config_model.updated_at is not None:
+            cache_key = (config_model.id, config_model.updated_at)
+            cached = _provider_instances.get(cache_key)
+            if cached is not None:
+                _provider_instances.move_to_end(cache_key)
+                return cached
+
+        # Decrypt configuration
+        decrypted_config = self.encryption_service.decrypt_dict(config_model.config)
+
+        # Create provider instance
+        provider = self._create_provider(config_model.provider_name, decrypted_config)
+
+        # Extract email settings
+        from_email = decrypted_config.get("from_email", "noreply@snackbase.io")
+        from_name = decrypted_config.get("from_name", "SnackBase")
+        reply_to = decrypted_config.get("reply_to")
+
+        result = (provider, from_email, from_name, reply_to)
+        if cache_key is not None:
+            _provider_instances[cache_key] = result
+            if len(_provider_instances) > PROVIDER_INSTANCE_CACHE_SIZE:
+                _provider_instances.popitem(last=False)
+        return result
+
     async def _select_provider(
         self,
         session: AsyncSession,
@@ -216,28 +286,17 @@ class EmailService:
             logger.error(error_msg, account_id=account_id)
             raise ValueError(error_msg)
 
-        provider_name = config_model.provider_name
-
-        # Decrypt configuration
-        decrypted_config = self.encryption_service.decrypt_dict(config_model.config)
-
-        # Create provider instance
-        provider = self._create_provider(provider_name, decrypted_config)
-
-        # Extract email settings
-        from_email = decrypted_config.get("from_email", "noreply@snackbase.io")
-        from_name = decrypted_config.get("from_name", "SnackBase")
-        reply_to = decrypted_config.get("reply_to")
+        result = self._provider_from_config(config_model)
 
         logger.info(
             "Email provider selected",
-            provider=provider_name,
+            provider=config_model.provider_name,
             account_id=account_id,
             is_system=config_model.is_system,
             is_default=config_model.is_default,
         )
 
-        return provider, from_email, from_name, reply_to
+        return result
 
     async def _get_specific_provider(
         self,
@@ -278,18 +337,7 @@ class EmailService:
         if not config_model or not config_model.enabled:
             raise ValueError(f"Provider '{provider_name}' is not configured or enabled.")
 
-        # Decrypt configuration
-        decrypted_config = self.encryption_service.decrypt_dict(config_model.config)
-
-        # Create provider instance
-        provider = self._create_provider(provider_name, decrypted_config)
-
-        # Extract email settings
-        from_email = decrypted_config.get("from_email", "noreply@snackbase.io")
-        from_name = decrypted_config.get("from_name", "SnackBase")
-        reply_to = decrypted_config.get("reply_to")
-
-        return provider, from_email, from_name, reply_to
+        return self._provider_from_config(config_model)
 
     async def _get_provider(
         self,
@@ -335,6 +383,26 @@ class EmailService:
             self._provider_cache.invalidate(cache_key)
             logger.info("Email provider cache invalidated", account_id=account_id)
 
+    async def _resolve_provider(
+        self,
+        session: AsyncSession,
+        account_id: str,
+        provider_name: str | None,
+    ) -> tuple[EmailProvider, str, str, Optional[str]]:
+        """Get a specific provider by name, or select one automatically.
+
+        Args:
+            session: Database session.
+            account_id: Account ID for provider selection.
+            provider_name: Provider to use; None or 'auto' selects automatically.
+
+        Returns:
+            Tuple of (provider, from_email, from_name, reply_to).
+        """
+        if provider_name and provider_name != "auto":
+            return await self._get_specific_provider(session, account_id, provider_name)
+        return await self._get_provider(session, account_id)
+
     async def send_email(
         self,
         session: AsyncSession,
@@ -365,16 +433,10 @@ class EmailService:
         log_id = str(uuid.uuid4())
 
         try:
-            # Get provider (specific or automatic)
-            if provider_name and provider_name != "auto":
-                provider, from_email, from_name, reply_to = await self._get_specific_provider(
-                    session, account_id, provider_name
-                )
-            else:
-                provider, from_email, from_name, reply_to = await self._get_provider(
-                    session, account_id
-                )
-            provider_name = provider.__class__.__name__.replace("Provider", "").lower()
+            provider, from_email, from_name, reply_to = await self._resolve_provider(
+                session, account_id, provider_name
+            )
+            provider_name = _provider_label(provider)
 
             # Send email via provider
             success = await provider.send_email(
@@ -484,6 +546,65 @@ class EmailService:
             "support_email": config_data.get("support_email", ""),
         }
 
+    async def _load_template(
+        self,
+        session: AsyncSession,
+        account_id: str,
+        template_type: str,
+        locale: str,
+    ) -> EmailTemplateModel:
+        """Get an enabled template with account fallback.
+
+        Raises:
+            ValueError: If no matching template exists.
+        """
+        template = await self.template_repository.get_template(
+            session=session,
+            account_id=account_id,
+            template_type=template_type,
+            locale=locale,
+        )
+
+        if template is None:
+            error_msg = f"Email template not found: {template_type} (locale: {locale})"
+            logger.error(error_msg, account_id=account_id)
+            raise ValueError(error_msg)
+
+        return template
+
+    def _render_template(
+        self,
+        template: EmailTemplateModel,
+        variables: dict[str, str],
+    ) -> tuple[str, str, str]:
+        """Render a stored template's subject, HTML and text bodies.
+
+        Compiled templates are cached by (template id, updated_at, locale), so
+        repeated sends of the same template only pay for rendering.
+
+        Returns:
+            Tuple of (subject, html_body, text_body).
+
+        Raises:
+            ValueError: If rendering fails.
+        """
+        try:
+            return (
+                self.renderer.render(
+                    template.subject, variables, template_cache_key(template, "subject")
+                ),
+                self.renderer.render(
+                    template.html_body, variables, template_cache_key(template, "html_body")
+                ),
+                self.renderer.render(
+                    template.text_body, variables, template_cache_key(template, "text_body")
+                ),
+            )
+        except Exception as e:
+            error_msg = f"Template rendering failed: {str(e)}"
+            logger.error(error_msg, template_type=template.template_type, error=str(e))
+            raise ValueError(error_msg)
+
     async def send_template_email(
         self,
         session: AsyncSession,
@@ -510,32 +631,13 @@ class EmailService:
         Raises:
             ValueError: If template not found or rendering fails.
         """
-        # Get template with account fallback
-        template = await self.template_repository.get_template(
-            session=session,
-            account_id=account_id,
-            template_type=template_type,
-            locale=locale,
-        )
-
-        if template is None:
-            error_msg = f"Email template not found: {template_type} (locale: {locale})"
-            logger.error(error_msg, account_id=account_id)
-            raise ValueError(error_msg)
+        template = await self._load_template(session, account_id, template_type, locale)
 
         # Merge system variables with user-provided variables
         system_vars = await self._get_system_variables(session, account_id)
         merged_variables = {**system_vars, **variables}  # User variables override system
 
-        # Render template
-        try:
-            subject = self.renderer.render(template.subject, merged_variables)
-            html_body = self.renderer.render(template.html_body, merged_variables)
-            text_body = self.renderer.render(template.text_body, merged_variables)
-        except Exception as e:
-            error_msg = f"Template rendering failed: {str(e)}"
-            logger.error(error_msg, template_type=template_type, error=str(e))
-            raise ValueError(error_msg)
+        subject, html_body, text_body = self._render_template(template, merged_variables)
 
         # Send email
         return await self.send_email(
@@ -549,3 +651,8 @@ class EmailService:
             variables=merged_variables,
             provider_name=provider_name,
         )
+
+
+def _provider_label(provider: EmailProvider) -> str:
+    """Short provider name used in email logs (e.g. 'smtp', 'awsses')."""
+    return provider.__class__.__name__.replace("Provider", "").lower()
@@ -24,11 +24,13 @@ Usage:
 
 import asyncio
 import base64
+import time
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from snackbase.core.logging import get_logger
+from snackbase.core.metrics import JOB_DURATION
 
 if TYPE_CHECKING:
     from snackbase.infrastructure.persistence.models.job import JobModel
@@ -181,6 +183,27 @@ async def _handle_workflow_resume(payload: dict, job: "JobModel") -> None:
     await resume_instance(instance_id, next_step, db_manager.session)
 
 
+@handler_registry.register("workflow_run")
+async def _handle_workflow_run(payload: dict, job: "JobModel") -> None:
+    """Start executing a newly created workflow instance (F8.3).
+
+    Enqueued on the ``workflows`` queue by every trigger path (event, manual,
+    webhook) and picked up by the WorkflowWorker, which enforces the
+    per-account and per-workflow concurrency caps.
+
+    Payload keys:
+        instance_id: str — ID of the pending WorkflowInstanceModel
+        workflow_id: str — parent workflow ID (used for concurrency caps)
+    """
+    instance_id: str = payload["instance_id"]
+
+    from snackbase.infrastructure.persistence.database import get_db_manager
+    from snackbase.infrastructure.workflows.workflow_executor import run_instance
+
+    db_manager = get_db_manager()
+    await run_instance(instance_id, db_manager.session)
+
+
 @handler_registry.register("scheduled_hook")
 async def _handle_scheduled_hook(payload: dict, job: "JobModel") -> None:
     """Execute a scheduled hook fired by the cron scheduler (F7.3).
@@ -290,13 +313,16 @@ class JobWorker:
     - asyncio.wait_for() enforces per-job execution timeout
     - Exponential backoff retries: delay * 2^attempt_number
     - Stale job recovery (every 60 polls)
-    - Retention cleanup of completed jobs (every 86400 polls)
+    - Retention cleanup of completed jobs and of delta-sync tombstones
+      (every 86400 polls)
     - Optional queue_filter for dedicated queue workers
 
     Args:
         session_factory: Async session factory (e.g., db_manager.session).
         settings: Application settings instance.
         queue_filter: If set, only pick jobs from this queue.
+        exclude_queues: Queues this worker never picks from (served by a
+            dedicated worker, e.g. ``workflows``).
     """
 
     def __init__(
@@ -304,10 +330,12 @@ class JobWorker:
         session_factory: Any,
         settings: Any,
         queue_filter: str | None = None,
+        exclude_queues: list[str] | None = None,
     ) -> None:
         self._session_factory = session_factory
         self._settings = settings
         self._queue_filter = queue_filter
+        self._exclude_queues = exclude_queues
         self._running = False
         self._task: asyncio.Task | None = None
         self._poll_count = 0
@@ -355,6 +383,7 @@ class JobWorker:
         # Retention cleanup every 86400 polls (~24h at 1s interval)
         if self._poll_count % 86400 == 0:
             await self._cleanup_old_jobs()
+            await self._cleanup_record_tombstones()
 
         # Pick and execute one job
         await self._process_one_job()
@@ -386,28 +415,81 @@ class JobWorker:
         if count:
             logger.info("Deleted old completed jobs", count=count, cutoff=str(cutoff))
 
+    async def _cleanup_record_tombstones(self) -> None:
+        """Delete delta-sync tombstones older than the retention period."""
+        from snackbase.infrastructure.persistence.repositories.record_change_repository import (
+            RecordChangeRepository,
+        )
+
+        cutoff = datetime.now(UTC) - timedelta(
+            days=self._settings.record_sync_tombstone_retention_days
+        )
+        async with self._session_factory() as session:
+            count = await RecordChangeRepository(session).delete_tombstones_before(cutoff)
+            await session.commit()
+        if count:
+            logger.info("Deleted old record tombstones", count=count, cutoff=str(cutoff))
+
     async def _process_one_job(self) -> None:
         """Pick the next available job and execute it."""
+        job = await self._claim_job()
+        if job is not None:
+            await self._execute_job(job)
+
+    async def _claim_job(self, account_id: str | None = None) -> Any:
+        """Atomically claim the next available job.
+
+        Args:
+            account_id: Only claim jobs belonging to this account.
+
+        Returns:
+            A detached snapshot of the claimed job, or None if none is ready.
+        """
         from snackbase.infrastructure.persistence.repositories.job_repository import (
             JobRepository,
         )
 
-        # Pick and claim next job
         async with self._session_factory() as session:
             repo = JobRepository(session)
-            job = await repo.pick_next_job(queue_filter=self._queue_filter)
+            job = await repo.pick_next_job(
+                queue_filter=self._queue_filter,
+                exclude_queues=self._exclude_queues,
+                account_id=account_id,
+            )
             if job is None:
-                return
-
-            # Capture job fields before session closes
-            job_id = job.id
-            handler_name = job.handler
-            payload = dict(job.payload)
-            attempt = job.attempt_number
-            max_retries = job.max_retries
-            retry_delay = job.retry_delay_seconds
+                return None
+
+            # Build a lightweight snapshot to pass to the handler.
+            # The session is closed afterwards so we cannot pass the ORM
+            # object; SimpleNamespace gives attribute access without
+            # SQLAlchemy overhead.
+            import types
+
+            snapshot = types.SimpleNamespace(
+                id=job.id,
+                handler=job.handler,
+                payload=dict(job.payload),
+                attempt_number=job.attempt_number,
+                max_retries=job.max_retries,
+                retry_delay_seconds=job.retry_delay_seconds,
+                account_id=job.account_id,
+            )
 
             await session.commit()
+        return snapshot
+
+    async def _execute_job(self, job_snapshot: Any) -> None:
+        """Run a claimed job's handler and persist the outcome."""
+        from snackbase.infrastructure.persistence.repositories.job_repository import (
+            JobRepository,
+        )
+
+        job_id = job_snapshot.id
+        handler_name = job_snapshot.handler
+        payload = job_snapshot.payload
+        attempt = job_snapshot.attempt_number
+        max_retries = job_snapshot.max_retries
+        retry_delay = job_snapshot.retry_delay_seconds
 
         # Look up the handler
         handler = handler_registry.get(handler_name)
@@ -422,32 +504,23 @@ class JobWorker:
             )
             return
 
-        # Build a lightweight snapshot to pass to the handler.
-        # The session is already closed so we cannot pass the ORM object;
-        # SimpleNamespace gives attribute access without SQLAlchemy overhead.
-        import types
-
-        job_snapshot = types.SimpleNamespace(
-            id=job_id,
-            handler=handler_name,
-            payload=payload,
-            attempt_number=attempt,
-            max_retries=max_retries,
-            retry_delay_seconds=retry_delay,
-        )
-
         # Execute with timeout
+        started = time.perf_counter()
+        outcome = "failed"
         try:
             await asyncio.wait_for(
                 handler(payload, job_snapshot),
                 timeout=float(self._settings.job_execution_timeout),
             )
+            outcome = "completed"
         except (asyncio.TimeoutError, TimeoutError):
+            outcome = "timeout"
             error = f"Job timed out after {self._settings.job_execution_timeout}s"
             logger.warning("Job timed out", job_id=job_id, handler=handler_name)
             await self._fail_job(job_id, error, attempt, max_retries, retry_delay)
             return
         except asyncio.CancelledError:
+            outcome = "cancelled"
             # Worker is shutting down; reset job to pending so it is retried later
             async with self._session_factory() as session:
                 repo = JobRepository(session)
@@ -463,6 +536,10 @@ class JobWorker:
             )
             await self._fail_job(job_id, str(exc), attempt, max_retries, retry_delay)
             return
+        finally:
+            JOB_DURATION.observe(
+                time.perf_counter() - started, handler=handler_name, outcome=outcome
+            )
 
         # Success
         async with self._session_factory() as session:
@@ -0,0 +1,325 @@
+"""Outbox relay: delivers record events from the transactional event outbox.
+
+With ``event_outbox_enabled`` record writes append their events to the
+``event_outbox`` table in the same transaction (see
+event_outbox_repository.py), and the webhook, API-defined hook and workflow
+trigger hooks stand down for record events. The OutboxRelay runs as a
+background asyncio task within FastAPI's lifespan context and delivers the
+committed events instead. Realtime subscribers are not an outbox target: the
+process that made the write publishes to them once it has committed.
+
+Each pass:
+1. Claims up to ``event_outbox_batch_size`` due events, oldest first, by
+   leasing them for ``event_outbox_lease_seconds``.
+2. Delivers each event to its remaining targets in order: webhooks (delivery
+   rows plus jobs), API-defined hooks and workflow triggers.
+3. Deletes fully delivered events. Events with failed targets are released
+   with only those targets left and retried with exponential backoff, and
+   parked (``available_at`` NULL) after ``event_outbox_max_attempts``.
+
+Delivery is at least once: a relay that dies mid-batch leaves its events
+leased, and they are claimed again once the lease runs out. Commits in this
+process wake the relay immediately; events written by other processes are
+picked up within ``event_outbox_poll_interval``.
+
+Usage (managed by app.py lifespan):
+    relay = OutboxRelay(db_manager.session, settings)
+    await relay.start()
+    ...
+    await relay.stop()
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select
+
+from snackbase.core.hooks.hook_events import HookEvent
+from snackbase.core.logging import get_logger
+from snackbase.core.metrics import OUTBOX_DELIVERY_LATENCY, OUTBOX_EVENTS
+from snackbase.domain.entities.hook_context import HookContext
+from snackbase.infrastructure.auth.token_types import AuthenticatedUser, TokenType
+from snackbase.infrastructure.persistence.repositories.event_outbox_repository import (
+    EventOutboxRepository,
+    add_commit_listener,
+    remove_commit_listener,
+)
+
+logger = get_logger(__name__)
+
+_HOOK_EVENTS = {
+    "create": HookEvent.ON_RECORD_AFTER_CREATE,
+    "update": HookEvent.ON_RECORD_AFTER_UPDATE,
+    "delete": HookEvent.ON_RECORD_AFTER_DELETE,
+}
+
+
+def _restore_context(snapshot: str | None) -> HookContext | None:
+    """Rebuild the hook context captured when the event was written."""
+    if not snapshot:
+        return None
+    data = json.loads(snapshot)
+    user = None
+    if data.get("user"):
+        fields = data["user"]
+        try:
+            user = AuthenticatedUser(
+                user_id=fields["user_id"],
+                account_id=fields["account_id"],
+                email=fields["email"],
+                role=fields["role"],
+                token_type=TokenType(fields["token_type"]),
+                groups=fields.get("groups") or [],
+            )
+        except (KeyError, TypeError, ValueError):
+            user = None
+    return HookContext(
+        app=None,
+        user=user,
+        account_id=data.get("account_id"),
+        request_id=data.get("request_id") or "",
+        user_name=user.email if user else None,
+    )
+
+
+class OutboxRelay:
+    """Background worker that delivers event outbox rows.
+
+    Args:
+        session_factory: Async session factory (e.g., db_manager.session).
+        settings: Application settings instance.
+    """
+
+    def __init__(self, session_factory: Any, settings: Any) -> None:
+        self._session_factory = session_factory
+        self._settings = settings
+        self._running = False
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(settings.event_outbox_delivery_concurrency)
+
+    async def start(self) -> None:
+        """Start the relay background task."""
+        self._running = True
+        add_commit_listener(self._wakeup.set)
+        self._task = asyncio.create_task(self._loop(), name="snackbase-outbox-relay")
+        logger.info(
+            "Outbox relay started",
+            batch_size=self._settings.event_outbox_batch_size,
+            poll_interval=self._settings.event_outbox_poll_interval,
+        )
+
+    async def stop(self) -> None:
+        """Stop the relay and wait for the current batch to finish."""
+        self._running = False
+        remove_commit_listener(self._wakeup.set)
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Outbox relay stopped")
+
+    async def _loop(self) -> None:
+        """Main relay loop: drains while events are due, then waits for a wakeup."""
+        while self._running:
+            # Cleared before draining so a commit during the pass is not missed
+            self._wakeup.clear()
+            try:
+                claimed = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("Outbox relay tick error", error=str(exc))
+                claimed = 0
+            if claimed:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self._settings.event_outbox_poll_interval
+                )
+            except TimeoutError:
+                pass
+
+    async def drain_once(self) -> int:
+        """Claim and deliver one batch of due events.
+
+        Returns:
+            The number of events claimed.
+        """
+        async with self._session_factory() as session:
+            events = await EventOutboxRepository(session).claim_batch(
+                self._settings.event_outbox_batch_size,
+                self._settings.event_outbox_lease_seconds,
+            )
+            await session.commit()
+        if not events:
+            return 0
+
+        contexts = [_restore_context(event.context) for event in events]
+        subscribed = await self._subscribed_targets(contexts)
+        results = await asyncio.gather(
+            *(self._deliver(event, context, subscribed) for event, context in zip(events, contexts))
+        )
+
+        now = datetime.now(UTC)
+        delivered: list[int] = []
+        async with self._session_factory() as session:
+            repo = EventOutboxRepository(session)
+            for event, (remaining, error) in zip(events, results):
+                if not remaining:
+                    delivered.append(event.id)
+                    created_at = event.created_at
+                    if created_at.tzinfo is None:
+                        created_at = created_at.replace(tzinfo=UTC)
+                    OUTBOX_DELIVERY_LATENCY.observe(max((now - created_at).total_seconds(), 0.0))
+                    continue
+                retry_at = None
+                if event.attempts < self._settings.event_outbox_max_attempts:
+                    delay = self._settings.event_outbox_retry_delay_seconds * 2 ** (
+                        event.attempts - 1
+                    )
+                    retry_at = now + timedelta(seconds=delay)
+                await repo.release(event.id, remaining, error, retry_at)
+                OUTBOX_EVENTS.inc(outcome="retried" if retry_at else "parked")
+                log = logger.warning if retry_at else logger.error
+                log(
+                    "Outbox event delivery failed",
+                    event_id=event.id,
+                    collection=event.collection,
+                    operation=event.operation,
+                    attempts=event.attempts,
+                    targets=remaining,
+                    retry_at=retry_at.isoformat() if retry_at else None,
+                    error=error,
+                )
+            await repo.complete(delivered)
+            await session.commit()
+        if delivered:
+            OUTBOX_EVENTS.inc(len(delivered), outcome="delivered")
+        return len(events)
+
+    async def _subscribed_targets(self, contexts: list[HookContext | None]) -> dict[str, set[str]]:
+        """Find the accounts of a batch that have any subscriptions per target.
+
+        Most accounts have no webhooks, event hooks or event workflows; one
+        query per target for the whole batch spares their events the
+        per-event lookups.
+
+        Returns:
+            Mapping of target to the account IDs with enabled subscriptions.
+        """
+        from snackbase.infrastructure.persistence.models import (
+            HookModel,
+            WebhookModel,
+            WorkflowModel,
+        )
+
+        account_ids = {c.account_id for c in contexts if c is not None and c.account_id}
+        if not account_ids:
+            return {}
+        queries = {
+            "webhooks": select(WebhookModel.account_id).where(
+                WebhookModel.account_id.in_(account_ids),
+                WebhookModel.enabled.is_(True),
+            ),
+            "hooks": select(HookModel.account_id).where(
+                HookModel.account_id.in_(account_ids),
+                HookModel.enabled.is_(True),
+            ),
+            "workflows": select(WorkflowModel.account_id).where(
+                WorkflowModel.account_id.in_(account_ids),
+                WorkflowModel.trigger_type == "event",
+                WorkflowModel.enabled.is_(True),
+            ),
+        }
+        async with self._session_factory() as session:
+            return {
+                target: set((await session.execute(query.distinct())).scalars())
+                for target, query in queries.items()
+            }
+
+    async def _deliver(
+        self,
+        event: Any,
+        context: HookContext | None,
+        subscribed: dict[str, set[str]],
+    ) -> tuple[list[str], str | None]:
+        """Deliver one event to its remaining targets.
+
+        Targets the writing account has no subscriptions for are skipped.
+
+        Returns:
+            Tuple of (targets that failed, last error message).
+        """
+        payload = json.loads(event.payload)
+        record = payload.get("record") or {}
+        data = {
+            "record": record,
+            "collection": event.collection,
+            "old_values": payload.get("old_values"),
+        }
+        failed: list[str] = []
+        error: str | None = None
+        async with self._semaphore:
+            for target in event.targets.split(","):
+                if context is None or context.account_id not in subscribed.get(target, ()):
+                    continue
+                try:
+                    await self._deliver_to(target, event, data, context)
+                except Exception as exc:
+                    failed.append(target)
+                    error = f"{target}: {exc}"
+        return failed, error
+
+    async def _deliver_to(
+        self,
+        target: str,
+        event: Any,
+        data: dict[str, Any],
+        context: HookContext | None,
+    ) -> None:
+        """Deliver an event to a single target, raising on failure."""
+        hook_event = _HOOK_EVENTS[event.operation]
+        api_event = f"records.{event.operation}"
+
+        if target == "webhooks":
+            from snackbase.infrastructure.hooks.webhook_hook import _dispatch_webhooks
+
+            await _dispatch_webhooks(
+                event=hook_event,
+                webhook_event=api_event,
+                data=data,
+                context=context,
+                session_factory=self._session_factory,
+                reraise=True,
+            )
+        elif target == "hooks":
+            from snackbase.infrastructure.hooks.api_defined_hook import _dispatch_api_hooks
+
+            await _dispatch_api_hooks(
+                internal_event=hook_event,
+                api_event=api_event,
+                data=data,
+                context=context,
+                session_factory=self._session_factory,
+                reraise=True,
+            )
+        elif target == "workflows":
+            from snackbase.infrastructure.workflows.workflow_trigger import (
+                _dispatch_workflow_triggers,
+            )
+
+            await _dispatch_workflow_triggers(
+                internal_event=hook_event,
+                api_event=api_event,
+                data=data,
+                context=context,
+                session_factory=self._session_factory,
+                reraise=True,
+            )
+        else:
+            raise ValueError(f"Unknown outbox target '{target}'")
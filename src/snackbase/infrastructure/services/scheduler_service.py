@@ -13,6 +13,10 @@ Each poll tick:
 2. For each due hook, enqueues a job with ``handler="scheduled_hook"`` and
    updates ``last_run_at`` / ``next_run_at`` atomically in the same transaction.
 
+Every ``dashboard_stats_reconcile_interval`` seconds the worker also recounts
+the maintained dashboard counters (record counts, storage bytes) to correct
+drift from writes that bypass the record hooks.
+
 Usage (managed by app.py lifespan):
     worker = SchedulerWorker(db_manager.session, settings)
     await worker.start()
@@ -21,6 +25,7 @@ Usage (managed by app.py lifespan):
 """
 
 import asyncio
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -43,6 +48,7 @@ class SchedulerWorker:
         self._settings = settings
         self._running = False
         self._task: asyncio.Task | None = None
+        self._last_stats_reconcile = time.monotonic()
 
     async def start(self) -> None:
         """Start the scheduler background task."""
@@ -80,6 +86,12 @@ class SchedulerWorker:
                 raise
             except Exception as exc:
                 logger.error("Scheduler tick error", error=str(exc))
+            try:
+                await self._maybe_reconcile_stats()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("Dashboard stats reconciliation failed", error=str(exc))
             await asyncio.sleep(self._settings.scheduler_poll_interval)
 
     async def _recalculate_all_next_runs(self) -> None:
@@ -118,6 +130,18 @@ class SchedulerWorker:
         if recalculated:
             logger.info("Scheduler recalculated next_run_at", count=recalculated)
 
+    async def _maybe_reconcile_stats(self) -> None:
+        """Recount dashboard counters when the reconcile interval has elapsed."""
+        interval = self._settings.dashboard_stats_reconcile_interval
+        if not interval or time.monotonic() - self._last_stats_reconcile < interval:
+            return
+        self._last_stats_reconcile = time.monotonic()
+
+        from snackbase.domain.services.dashboard_service import DashboardService
+
+        async with self._session_factory() as session:
+            await DashboardService(session).reconcile_stats()
+
     async def _tick(self) -> None:
         """Single scheduler tick: enqueue jobs for all due hooks."""
         from snackbase.infrastructure.persistence.models.job import JobModel
@@ -1,6 +1,10 @@
 """Storage services and provider implementations."""
 
-from snackbase.infrastructure.storage.base import StorageProvider, StoredFile
+from snackbase.infrastructure.storage.base import (
+    InvalidRangeError,
+    StorageProvider,
+    StoredFile,
+)
 from snackbase.infrastructure.storage.local_storage_provider import LocalStorageProvider
 from snackbase.infrastructure.storage.s3_storage_provider import (
     S3StorageProvider,
@@ -9,6 +13,7 @@ from snackbase.infrastructure.storage.s3_storage_provider import (
 from snackbase.infrastructure.storage.storage_service import StorageService
 
 __all__ = [
+    "InvalidRangeError",
     "LocalStorageProvider",
     "S3StorageProvider",
     "S3StorageSettings",
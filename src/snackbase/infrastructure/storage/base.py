@@ -1,6 +1,7 @@
 """Base abstractions for storage providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import BinaryIO
@@ -8,14 +9,26 @@ from typing import BinaryIO
 from snackbase.domain.services.file_storage_service import FileMetadata
 
 
+class InvalidRangeError(ValueError):
+    """Raised when a requested byte range cannot be satisfied."""
+
+
 @dataclass(slots=True)
 class StoredFile:
-    """Transport object returned by storage providers for file retrieval."""
+    """Transport object returned by storage providers for file retrieval.
+
+    Exactly one of ``local_path``, ``stream`` or ``content`` is set. When a
+    byte range was served from a stream, ``content_range`` holds the
+    Content-Range value and ``size`` the length of that range.
+    """
 
     local_path: Path | None = None
     content: bytes | None = None
     filename: str | None = None
     mime_type: str | None = None
+    stream: AsyncIterator[bytes] | None = None
+    size: int | None = None
+    content_range: str | None = None
 
 
 class StorageProvider(ABC):
@@ -34,8 +47,33 @@ class StorageProvider(ABC):
         ...
 
     @abstractmethod
-    async def get_file(self, account_id: str, file_path: str) -> StoredFile:
-        """Get a file from the provider."""
+    async def save_stream(
+        self,
+        account_id: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        mime_type: str,
+    ) -> FileMetadata:
+        """Save a file to the provider from a stream of chunks.
+
+        Implementations must enforce the size limit while streaming and
+        must not buffer the whole file in memory.
+        """
+        ...
+
+    @abstractmethod
+    async def get_file(
+        self, account_id: str, file_path: str, byte_range: str | None = None
+    ) -> StoredFile:
+        """Get a file from the provider.
+
+        Args:
+            account_id: The account ID.
+            file_path: Stored file path.
+            byte_range: Optional single HTTP Range value (e.g. 'bytes=0-1023').
+                Providers returning a local path may ignore it; the response
+                layer handles ranges for local files.
+        """
         ...
 
     @abstractmethod
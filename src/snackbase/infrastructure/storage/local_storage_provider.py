@@ -1,5 +1,6 @@
 """Local filesystem storage provider."""
 
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import BinaryIO
 
@@ -29,7 +30,23 @@ class LocalStorageProvider(StorageProvider):
             size=size,
         )
 
-    async def get_file(self, account_id: str, file_path: str) -> StoredFile:
+    async def save_stream(
+        self,
+        account_id: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        mime_type: str,
+    ) -> FileMetadata:
+        return await self._service.save_stream(
+            account_id=account_id,
+            chunks=chunks,
+            filename=filename,
+            mime_type=mime_type,
+        )
+
+    async def get_file(
+        self, account_id: str, file_path: str, byte_range: str | None = None
+    ) -> StoredFile:
         absolute_path = self._service.get_file_path(account_id, file_path)
         return StoredFile(
             local_path=absolute_path,
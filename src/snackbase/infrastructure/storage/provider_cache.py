@@ -0,0 +1,105 @@
+"""Per-worker cache of resolved storage providers.
+
+Resolving a provider means reading the storage configuration, decrypting its
+credentials and building an S3 client, which is too much work to repeat for
+every upload and download. Resolved providers are therefore cached
+in-process and tagged with the *storage configuration version*:
+
+- Any flush that inserts, updates or deletes a ``storage_providers``
+  configuration bumps the version immediately (so the writer's own session
+  never reads a stale provider) and again when the transaction commits or
+  rolls back (so providers resolved from pre-commit data are dropped).
+- A lookup only hits when the entry's version matches the current one and
+  its TTL has not expired. The TTL bounds staleness for configuration
+  changes made by other worker processes, which this process cannot observe.
+"""
+
+import time
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from snackbase.core.config import get_settings
+from snackbase.infrastructure.persistence.models.configuration import ConfigurationModel
+
+STORAGE_PROVIDERS_CATEGORY = "storage_providers"
+
+_PENDING_CHANGE_KEY = "snackbase_storage_config_changed"
+
+_config_version = 0
+
+
+def storage_config_version() -> int:
+    """Return the current storage configuration version in this process."""
+    return _config_version
+
+
+def _bump() -> None:
+    global _config_version
+    _config_version += 1
+
+
+def _track_storage_config_changes(session: Session, *args: Any) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, ConfigurationModel) and obj.category == STORAGE_PROVIDERS_CATEGORY:
+            session.info[_PENDING_CHANGE_KEY] = True
+            _bump()
+            return
+
+
+def _bump_pending(session: Session, *args: Any) -> None:
+    if session.info.pop(_PENDING_CHANGE_KEY, False):
+        _bump()
+
+
+event.listen(Session, "before_flush", _track_storage_config_changes)
+event.listen(Session, "after_commit", _bump_pending)
+event.listen(Session, "after_rollback", _bump_pending)
+
+
+class StorageProviderCache:
+    """Cache of resolved providers tagged with the storage configuration version.
+
+    Args:
+        ttl_seconds: Lifetime of an entry; 0 disables caching.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[int, float, Any]] = {}
+
+    def get(self, key: str) -> Any | None:
+        """Return a cached provider if it is current, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        version, expires_at, provider = entry
+        if version != storage_config_version() or expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return provider
+
+    def put(self, key: str, version: int, provider: Any) -> None:
+        """Cache a provider resolved while the configuration was at ``version``."""
+        if self.ttl_seconds <= 0 or version != storage_config_version():
+            return
+        self._entries[key] = (version, time.monotonic() + self.ttl_seconds, provider)
+
+    def clear(self) -> None:
+        """Drop every cached provider."""
+        self._entries.clear()
+
+
+_cache: StorageProviderCache | None = None
+
+
+def get_storage_provider_cache() -> StorageProviderCache:
+    """Get the process-wide storage provider cache."""
+    global _cache
+    if _cache is None:
+        _cache = StorageProviderCache(
+            ttl_seconds=get_settings().storage_provider_cache_ttl_seconds,
+        )
+    return _cache
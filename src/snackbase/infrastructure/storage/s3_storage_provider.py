@@ -2,19 +2,23 @@
 
 import asyncio
 import uuid
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from pydantic import BaseModel, ConfigDict
 
 from snackbase.core.config import get_settings
-from snackbase.domain.services.file_storage_service import FileMetadata
-from snackbase.infrastructure.storage.base import StoredFile, StorageProvider
+from snackbase.domain.services.file_storage_service import FileMetadata, iter_file_chunks
+from snackbase.infrastructure.storage.base import InvalidRangeError, StoredFile, StorageProvider
 
 S3_PREFIX = "s3/"
 
+# S3 rejects multipart parts smaller than 5MB (except the last one).
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
 
 class S3StorageSettings(BaseModel):
     """Configuration settings for the S3 storage provider."""
@@ -97,22 +101,94 @@ class S3StorageProvider(StorageProvider):
         size: int,
     ) -> FileMetadata:
         self._validate_file_size(size)
+        return await self.save_stream(
+            account_id=account_id,
+            chunks=iter_file_chunks(file_content),
+            filename=filename,
+            mime_type=mime_type,
+        )
+
+    async def save_stream(
+        self,
+        account_id: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        mime_type: str,
+    ) -> FileMetadata:
+        """Upload a stream to S3, switching to multipart once it exceeds one part.
+
+        At most one part (``s3_multipart_part_size``) is buffered in memory.
+        Files smaller than a part are sent with a single PutObject. A failed
+        multipart upload is aborted so no orphaned parts are billed.
+        """
         self._validate_mime_type(mime_type)
 
         unique_filename = self._generate_unique_filename(filename)
         key = f"{account_id}/{unique_filename}"
-        body = file_content.read()
+        client = self._get_client()
+        part_size = max(get_settings().s3_multipart_part_size, S3_MIN_PART_SIZE)
 
-        try:
-            await asyncio.to_thread(
-                self._get_client().put_object,
+        buffer = bytearray()
+        size = 0
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
+
+        async def upload_part(body: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                client.upload_part,
                 Bucket=self.settings.bucket,
                 Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
                 Body=body,
-                ContentType=mime_type,
             )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                self._validate_file_size(size)
+                buffer.extend(chunk)
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            client.create_multipart_upload,
+                            Bucket=self.settings.bucket,
+                            Key=key,
+                            ContentType=mime_type,
+                        )
+                        upload_id = response["UploadId"]
+                    await upload_part(bytes(buffer[:part_size]))
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    client.put_object,
+                    Bucket=self.settings.bucket,
+                    Key=key,
+                    Body=bytes(buffer),
+                    ContentType=mime_type,
+                )
+            else:
+                if buffer:
+                    await upload_part(bytes(buffer))
+                await asyncio.to_thread(
+                    client.complete_multipart_upload,
+                    Bucket=self.settings.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
         except (ClientError, BotoCoreError) as e:
+            if upload_id is not None:
+                await self._abort_multipart_upload(key, upload_id)
             raise RuntimeError(f"Failed to upload file to S3: {str(e)}") from e
+        except BaseException:
+            # Validation errors, client disconnects and cancellation
+            if upload_id is not None:
+                await self._abort_multipart_upload(key, upload_id)
+            raise
 
         return FileMetadata(
             filename=filename,
@@ -121,19 +197,46 @@ class S3StorageProvider(StorageProvider):
             path=self._key_to_path(key),
         )
 
-    async def get_file(self, account_id: str, file_path: str) -> StoredFile:
-        key = self._path_to_key(account_id, file_path)
-
+    async def _abort_multipart_upload(self, key: str, upload_id: str) -> None:
         try:
-            response = await asyncio.to_thread(
-                self._get_client().get_object,
+            await asyncio.to_thread(
+                self._get_client().abort_multipart_upload,
                 Bucket=self.settings.bucket,
                 Key=key,
+                UploadId=upload_id,
             )
+        except (ClientError, BotoCoreError):
+            # A lifecycle rule for incomplete uploads is the backstop here
+            pass
+
+    @staticmethod
+    async def _iter_body(body_stream: Any, chunk_size: int) -> AsyncIterator[bytes]:
+        """Read a botocore StreamingBody chunk by chunk off the event loop."""
+        try:
+            while chunk := await asyncio.to_thread(body_stream.read, chunk_size):
+                yield chunk
+        finally:
+            close = getattr(body_stream, "close", None)
+            if close is not None:
+                await asyncio.to_thread(close)
+
+    async def get_file(
+        self, account_id: str, file_path: str, byte_range: str | None = None
+    ) -> StoredFile:
+        key = self._path_to_key(account_id, file_path)
+
+        request: dict[str, Any] = {"Bucket": self.settings.bucket, "Key": key}
+        if byte_range is not None:
+            request["Range"] = byte_range
+
+        try:
+            response = await asyncio.to_thread(self._get_client().get_object, **request)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             if error_code in {"NoSuchKey", "404", "NotFound"}:
                 raise FileNotFoundError(f"File not found: {file_path}") from e
+            if error_code == "InvalidRange":
+                raise InvalidRangeError(f"Requested range not satisfiable: {byte_range}") from e
             raise RuntimeError(f"Failed to fetch file from S3: {str(e)}") from e
         except BotoCoreError as e:
             raise RuntimeError(f"Failed to fetch file from S3: {str(e)}") from e
@@ -142,9 +245,10 @@ class S3StorageProvider(StorageProvider):
         if body_stream is None:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        content = await asyncio.to_thread(body_stream.read)
         return StoredFile(
-            content=content,
+            stream=self._iter_body(body_stream, get_settings().storage_chunk_size),
+            size=response.get("ContentLength"),
+            content_range=response.get("ContentRange"),
             filename=Path(key).name,
             mime_type=response.get("ContentType", "application/octet-stream"),
         )
@@ -1,5 +1,6 @@
 """Storage service for resolving and using configured storage providers."""
 
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, BinaryIO
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,16 +11,30 @@ from snackbase.domain.services.file_storage_service import FileMetadata
 from snackbase.infrastructure.persistence.repositories.configuration_repository import (
     ConfigurationRepository,
 )
+from snackbase.infrastructure.persistence.repositories.dashboard_stat_repository import (
+    STORAGE_BYTES_KEY,
+    queue_increment,
+)
 from snackbase.infrastructure.security.encryption import EncryptionService
 from snackbase.infrastructure.storage.base import StoredFile, StorageProvider
 from snackbase.infrastructure.storage.local_storage_provider import LocalStorageProvider
+from snackbase.infrastructure.storage.provider_cache import (
+    STORAGE_PROVIDERS_CATEGORY,
+    get_storage_provider_cache,
+    storage_config_version,
+)
 from snackbase.infrastructure.storage.s3_storage_provider import S3StorageProvider, S3StorageSettings
 
 logger = get_logger(__name__)
 
 
 class StorageService:
-    """Facade service for storage provider selection and operations."""
+    """Facade service for storage provider selection and operations.
+
+    Resolved providers are cached per worker and invalidated when the storage
+    configuration changes (see ``provider_cache``), so file requests normally
+    neither read the configuration table nor decrypt credentials.
+    """
 
     SYSTEM_ACCOUNT_ID = "00000000-0000-0000-0000-000000000000"
 
@@ -33,10 +48,26 @@ class StorageService:
         self._encryption_service = encryption_service or EncryptionService(get_settings().encryption_key)
         self._local_provider = LocalStorageProvider()
 
+    async def _cached_provider(
+        self, purpose: str, resolve: Callable[[], Awaitable[StorageProvider]]
+    ) -> StorageProvider:
+        """Return a cached provider, resolving and caching it on a miss."""
+        cache = get_storage_provider_cache()
+        key = f"{self.SYSTEM_ACCOUNT_ID}:{purpose}"
+        provider = cache.get(key)
+        if provider is None:
+            version = storage_config_version()
+            provider = await resolve()
+            cache.put(key, version, provider)
+        return provider
+
     async def _get_active_system_provider(self) -> StorageProvider:
         """Resolve active system storage provider for uploads."""
+        return await self._cached_provider("active", self._resolve_active_system_provider)
+
+    async def _resolve_active_system_provider(self) -> StorageProvider:
         enabled_configs = await self._config_repo.list_configs(
-            category="storage_providers",
+            category=STORAGE_PROVIDERS_CATEGORY,
             account_id=self.SYSTEM_ACCOUNT_ID,
             is_system=True,
             enabled_only=True,
@@ -55,7 +86,7 @@ class StorageService:
 
         # If configs exist but none are enabled, fail explicitly.
         all_configs = await self._config_repo.list_configs(
-            category="storage_providers",
+            category=STORAGE_PROVIDERS_CATEGORY,
             account_id=self.SYSTEM_ACCOUNT_ID,
             is_system=True,
             enabled_only=False,
@@ -77,8 +108,11 @@ class StorageService:
 
     async def _get_s3_provider(self) -> StorageProvider:
         """Resolve S3 provider from system-level config for s3-prefixed file paths."""
+        return await self._cached_provider("s3", self._resolve_s3_provider)
+
+    async def _resolve_s3_provider(self) -> StorageProvider:
         config = await self._config_repo.get_config(
-            category="storage_providers",
+            category=STORAGE_PROVIDERS_CATEGORY,
             account_id=self.SYSTEM_ACCOUNT_ID,
             provider_name="s3",
             is_system=True,
@@ -105,6 +139,14 @@ class StorageService:
 
         raise ValueError(f"Unsupported storage provider: {provider_name}")
 
+    def _track_local_bytes(self, provider: StorageProvider, delta: int) -> None:
+        """Adjust the dashboard storage counter for local storage writes.
+
+        The change is applied when the caller's transaction commits.
+        """
+        if isinstance(provider, LocalStorageProvider) and delta:
+            queue_increment(self._session, STORAGE_BYTES_KEY, delta)
+
     async def save_file(
         self,
         account_id: str,
@@ -114,24 +156,53 @@ class StorageService:
         size: int,
     ) -> FileMetadata:
         provider = await self._get_active_system_provider()
-        return await provider.save_file(
+        metadata = await provider.save_file(
             account_id=account_id,
             file_content=file_content,
             filename=filename,
             mime_type=mime_type,
             size=size,
         )
+        self._track_local_bytes(provider, metadata.size)
+        return metadata
 
-    async def get_file(self, account_id: str, file_path: str) -> StoredFile:
+    async def save_stream(
+        self,
+        account_id: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        mime_type: str,
+    ) -> FileMetadata:
+        provider = await self._get_active_system_provider()
+        metadata = await provider.save_stream(
+            account_id=account_id,
+            chunks=chunks,
+            filename=filename,
+            mime_type=mime_type,
+        )
+        self._track_local_bytes(provider, metadata.size)
+        return metadata
+
+    async def get_file(
+        self, account_id: str, file_path: str, byte_range: str | None = None
+    ) -> StoredFile:
         if file_path.startswith("s3/"):
             provider = await self._get_s3_provider()
-        else:
-            provider = self._local_provider
-        return await provider.get_file(account_id=account_id, file_path=file_path)
+            return await provider.get_file(
+                account_id=account_id, file_path=file_path, byte_range=byte_range
+            )
+        # Local files are served with FileResponse, which handles Range itself
+        return await self._local_provider.get_file(account_id=account_id, file_path=file_path)
 
     async def delete_file(self, account_id: str, file_path: str) -> None:
         if file_path.startswith("s3/"):
             provider = await self._get_s3_provider()
-        else:
-            provider = self._local_provider
-        await provider.delete_file(account_id=account_id, file_path=file_path)
+            await provider.delete_file(account_id=account_id, file_path=file_path)
+            return
+
+        local_file = await self._local_provider.get_file(account_id=account_id, file_path=file_path)
+        size = local_file.local_path.stat().st_size if local_file.local_path else 0
+        await self._local_provider.delete_file(account_id=account_id, file_path=file_path)
+        self._track_local_bytes(self._local_provider, -size)
+        # The file is already gone, so persist the usage counter with it
+        await self._session.commit()
@@ -16,6 +16,7 @@ import ipaddress
 import json
 import re
 import secrets
+import time
 import urllib.parse
 from datetime import UTC, datetime
 from typing import Any
@@ -23,6 +24,7 @@ from typing import Any
 import httpx
 
 from snackbase.core.logging import get_logger
+from snackbase.core.metrics import WEBHOOK_DELIVERY_DURATION
 from snackbase.infrastructure.persistence.models.webhook import (
     WebhookDeliveryModel,
     WebhookModel,
@@ -247,6 +249,7 @@ async def _send_and_retry(
         response_body = None
         success = False
 
+        started = time.perf_counter()
         try:
             async with httpx.AsyncClient(timeout=timeout_seconds) as client:
                 response = await client.post(
@@ -267,6 +270,9 @@ async def _send_and_retry(
                 error=str(e),
             )
             response_body = str(e)[:5000]
+        WEBHOOK_DELIVERY_DURATION.observe(
+            time.perf_counter() - started, outcome="delivered" if success else "failed"
+        )
 
         # Persist attempt result
         async with session_factory() as session:
@@ -364,6 +370,7 @@ async def attempt_webhook_delivery(
     response_body = None
     success = False
 
+    started = time.perf_counter()
     try:
         async with httpx.AsyncClient(timeout=timeout_seconds) as client:
             response = await client.post(url, content=payload_bytes, headers=headers)
@@ -371,6 +378,7 @@ async def attempt_webhook_delivery(
             response_body = response.text[:5000]
             success = 200 <= status_code < 300
     except Exception as exc:
+        WEBHOOK_DELIVERY_DURATION.observe(time.perf_counter() - started, outcome="failed")
         response_body = str(exc)[:5000]
         async with db_manager.session() as session:
             delivery_repo = WebhookDeliveryRepository(session)
@@ -381,6 +389,9 @@ async def attempt_webhook_delivery(
             )
             await session.commit()
         raise RuntimeError(f"Webhook HTTP request failed: {exc}") from exc
+    WEBHOOK_DELIVERY_DURATION.observe(
+        time.perf_counter() - started, outcome="delivered" if success else "failed"
+    )
 
     async with db_manager.session() as session:
         delivery_repo = WebhookDeliveryRepository(session)
@@ -10,8 +10,10 @@ Step type dispatch:
     wait_delay  → enqueues a workflow_resume job, transitions instance to waiting
     wait_condition → not yet implemented (marks step skipped with a warning)
     wait_event  → not yet implemented (marks step skipped with a warning)
-    loop        → iterates over resolved items, calls inner step for each
-    parallel    → asyncio.gather over branch chains
+    loop        → iterates over resolved items (at most workflow_max_loop_items),
+                  calls inner step for each
+    parallel    → runs branch chains concurrently, at most
+                  workflow_max_parallel_branches at a time
 
 Template variables available inside step configs:
     {{trigger.<field>}}              — from instance.context["trigger"]
@@ -27,6 +29,7 @@ import re
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from snackbase.core.config import get_settings
 from snackbase.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -183,6 +186,7 @@ async def _execute_condition_step(
 async def _execute_wait_delay_step(
     step: dict[str, Any],
     instance_id: str,
+    workflow_id: str,
     next_step: str | None,
     account_id: str,
     session_factory: Any,
@@ -197,7 +201,7 @@ async def _execute_wait_delay_step(
     svc = JobService(session_factory)
     job_id = await svc.enqueue(
         handler="workflow_resume",
-        payload={"instance_id": instance_id, "next_step": next_step},
+        payload={"instance_id": instance_id, "workflow_id": workflow_id, "next_step": next_step},
         queue="workflows",
         run_at=run_at,
         max_retries=3,
@@ -232,6 +236,10 @@ async def _execute_loop_step(
     if inner_step is None:
         raise ValueError(f"Loop references unknown step '{inner_step_name}'")
 
+    max_items = get_settings().workflow_max_loop_items
+    if len(items) > max_items:
+        raise ValueError(f"Loop has {len(items)} items; the maximum is {max_items}")
+
     outputs = []
     for idx, item in enumerate(items):
         # Inject current item into context temporarily
@@ -255,20 +263,22 @@ async def _execute_parallel_step(
     instance_id: str,
     session_factory: Any,
 ) -> dict[str, Any]:
-    """Execute branch chains concurrently via asyncio.gather."""
+    """Execute branch chains concurrently, bounded by workflow_max_parallel_branches."""
     branches: list[list[str]] = step.get("branches") or []
+    semaphore = asyncio.Semaphore(max(1, get_settings().workflow_max_parallel_branches))
 
     async def _run_branch(step_names: list[str]) -> list[Any]:
-        branch_outputs = []
-        for sname in step_names:
-            s = workflow_steps.get(sname)
-            if s is None:
-                raise ValueError(f"Parallel branch references unknown step '{sname}'")
-            out = await _execute_single_step_inline(
-                s, instance_context, account_id, workflow_steps, instance_id, session_factory
-            )
-            branch_outputs.append(out)
-        return branch_outputs
+        async with semaphore:
+            branch_outputs = []
+            for sname in step_names:
+                s = workflow_steps.get(sname)
+                if s is None:
+                    raise ValueError(f"Parallel branch references unknown step '{sname}'")
+                out = await _execute_single_step_inline(
+                    s, instance_context, account_id, workflow_steps, instance_id, session_factory
+                )
+                branch_outputs.append(out)
+            return branch_outputs
 
     results = await asyncio.gather(*[_run_branch(b) for b in branches], return_exceptions=True)
 
@@ -300,6 +310,52 @@ async def _execute_single_step_inline(
         return {}
 
 
+# ---------------------------------------------------------------------------
+# Progress persistence
+# ---------------------------------------------------------------------------
+
+# Step types with no side effects. Consecutive runs of these are buffered and
+# written together with the next side-effecting step; re-running them after a
+# crash is harmless.
+_BUFFERABLE_STEP_TYPES = {"condition"}
+_MAX_BUFFERED_STEPS = 20
+
+
+async def _persist_progress(
+    instance_id: str,
+    session_factory: Any,
+    step_logs: list[Any],
+    **instance_values: Any,
+) -> bool:
+    """Write pending step logs and the instance cursor in a single transaction.
+
+    The instance row is updated in place (no read, no context rewrite); step
+    outputs live only in ``workflow_step_logs``.
+
+    Returns:
+        False if the instance was deleted or is no longer running, in which
+        case nothing is written and execution should stop.
+    """
+    from snackbase.infrastructure.persistence.repositories.workflow_instance_repository import (
+        WorkflowInstanceRepository,
+    )
+    from snackbase.infrastructure.persistence.repositories.workflow_step_log_repository import (
+        WorkflowStepLogRepository,
+    )
+
+    async with session_factory() as session:
+        advanced = await WorkflowInstanceRepository(session).advance_cursor(
+            instance_id, **instance_values
+        )
+        if not advanced:
+            await session.rollback()
+            return False
+        if step_logs:
+            await WorkflowStepLogRepository(session).create_many(step_logs)
+        await session.commit()
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Main execution loop
 # ---------------------------------------------------------------------------
@@ -316,6 +372,11 @@ async def run_instance(
     Loads the instance and its parent workflow from the DB, then runs steps
     sequentially until the workflow completes, fails, or pauses (wait_delay).
 
+    The instance row only carries a cursor (``current_step`` + status); each
+    step's output is written to the step log in the same transaction that
+    advances the cursor. Outputs from earlier runs are loaded back from the
+    step log when an instance resumes.
+
     This function is safe to call from a background task or job handler.
 
     Args:
@@ -326,9 +387,6 @@ async def run_instance(
     from snackbase.infrastructure.persistence.models.workflow import WorkflowModel
     from snackbase.infrastructure.persistence.models.workflow_instance import WorkflowInstanceModel
     from snackbase.infrastructure.persistence.models.workflow_step_log import WorkflowStepLogModel
-    from snackbase.infrastructure.persistence.repositories.workflow_instance_repository import (
-        WorkflowInstanceRepository,
-    )
     from snackbase.infrastructure.persistence.repositories.workflow_step_log_repository import (
         WorkflowStepLogRepository,
     )
@@ -362,9 +420,21 @@ async def run_instance(
         steps_list: list[dict[str, Any]] = list(wf.steps or [])
         account_id: str = inst.account_id
         workflow_id: str = wf.id
-        instance_context: dict[str, Any] = dict(inst.context or {})
+        stored_context: dict[str, Any] = inst.context or {}
         current_step_name: str | None = start_step or inst.current_step
 
+        # Prior step outputs are only needed when resuming; a fresh instance
+        # has no step logs yet. Legacy rows may still carry a "steps" section.
+        steps_section: dict[str, Any] = dict(stored_context.get("steps") or {})
+        if inst.current_step is not None:
+            steps_section.update(
+                await WorkflowStepLogRepository(session).get_step_outputs(instance_id)
+            )
+        instance_context: dict[str, Any] = {
+            "trigger": stored_context.get("trigger") or {},
+            "steps": steps_section,
+        }
+
         # Transition to running
         inst.status = "running"
         await session.commit()
@@ -382,19 +452,19 @@ async def run_instance(
         remaining_steps = steps_list
 
     if not remaining_steps:
-        async with session_factory() as session:
-            inst = await session.get(WorkflowInstanceModel, instance_id)
-            if inst:
-                inst.status = "completed"
-                inst.completed_at = datetime.now(UTC)
-                await session.commit()
+        await _persist_progress(
+            instance_id, session_factory, [],
+            status="completed", completed_at=datetime.now(UTC),
+        )
         logger.info("Workflow instance completed (no steps)", instance_id=instance_id)
         return
 
-    # Execute steps one by one
-    # We re-open a session per-step to persist progress incrementally
+    # Execute steps one by one. Progress is persisted once per step, except
+    # that runs of side-effect-free steps are grouped into a single write.
     step_iter = iter(remaining_steps)
     explicit_next: str | None = None  # set by condition/wait steps
+    pending_logs: list[WorkflowStepLogModel] = []
+    cursor: str | None = None
 
     while True:
         if explicit_next is not None:
@@ -441,7 +511,7 @@ async def run_instance(
             elif step_type == "wait_delay":
                 actual_next = step.get("next")
                 job_id = await _execute_wait_delay_step(
-                    step, instance_id, actual_next, account_id, session_factory
+                    step, instance_id, workflow_id, actual_next, account_id, session_factory
                 )
                 step_output = {"resume_job_id": job_id, "duration": step.get("duration")}
                 paused = True
@@ -490,9 +560,8 @@ async def run_instance(
 
         completed_at = datetime.now(UTC)
 
-        # Persist step log + update instance context
-        async with session_factory() as session:
-            step_log = WorkflowStepLogModel(
+        pending_logs.append(
+            WorkflowStepLogModel(
                 instance_id=instance_id,
                 workflow_id=workflow_id,
                 account_id=account_id,
@@ -505,61 +574,66 @@ async def run_instance(
                 started_at=started_at,
                 completed_at=completed_at,
             )
-            session.add(step_log)
+        )
+        cursor = step_name
 
-            inst = await session.get(WorkflowInstanceModel, instance_id)
-            if inst is None:
-                await session.commit()
-                return
+        # Keep the in-memory template context current
+        instance_context["steps"][step_name] = {"output": step_output, "status": step_status}
 
-            inst.current_step = step_name
-
-            # Update accumulated context with this step's output
-            ctx = dict(inst.context or {})
-            steps_section = dict(ctx.get("steps") or {})
-            steps_section[step_name] = {"output": step_output, "status": step_status}
-            ctx["steps"] = steps_section
-            inst.context = ctx
-            instance_context = ctx  # keep in-memory copy current
-
-            if step_status == "failed":
-                inst.status = "failed"
-                inst.error_message = step_error
-                inst.completed_at = datetime.now(UTC)
-                await session.commit()
-                logger.info(
-                    "Workflow instance failed",
-                    instance_id=instance_id,
-                    step=step_name,
-                    error=step_error,
-                )
-                return
+        if step_status == "failed":
+            await _persist_progress(
+                instance_id, session_factory, pending_logs,
+                current_step=cursor,
+                status="failed",
+                error_message=step_error,
+                completed_at=datetime.now(UTC),
+            )
+            logger.info(
+                "Workflow instance failed",
+                instance_id=instance_id,
+                step=step_name,
+                error=step_error,
+            )
+            return
+
+        if paused:
+            await _persist_progress(
+                instance_id, session_factory, pending_logs,
+                current_step=cursor,
+                status="waiting",
+                resume_job_id=step_output.get("resume_job_id"),
+            )
+            logger.info(
+                "Workflow instance paused (wait_delay)",
+                instance_id=instance_id,
+                step=step_name,
+            )
+            return
 
-            if paused:
-                inst.status = "waiting"
-                inst.resume_job_id = step_output.get("resume_job_id")
-                await session.commit()
+        bufferable = step_type in _BUFFERABLE_STEP_TYPES or step_status == "skipped"
+        if not bufferable or len(pending_logs) >= _MAX_BUFFERED_STEPS:
+            if not await _persist_progress(
+                instance_id, session_factory, pending_logs, current_step=cursor
+            ):
                 logger.info(
-                    "Workflow instance paused (wait_delay)",
+                    "Workflow instance no longer running — stopping",
                     instance_id=instance_id,
                     step=step_name,
                 )
                 return
-
-            await session.commit()
+            pending_logs = []
 
         if step_next and step_type != "condition":
             # Jump to the named next step (skips sequential iteration)
             explicit_next = step_next
             step_iter = iter([])  # exhaust the sequential iterator
 
-    # All steps executed successfully
-    async with session_factory() as session:
-        inst = await session.get(WorkflowInstanceModel, instance_id)
-        if inst:
-            inst.status = "completed"
-            inst.completed_at = datetime.now(UTC)
-            await session.commit()
+    # All steps executed successfully — flush any buffered logs with the
+    # terminal state in the same transaction.
+    final_values: dict[str, Any] = {"status": "completed", "completed_at": datetime.now(UTC)}
+    if cursor is not None:
+        final_values["current_step"] = cursor
+    await _persist_progress(instance_id, session_factory, pending_logs, **final_values)
 
     logger.info("Workflow instance completed", instance_id=instance_id)
 
@@ -0,0 +1,244 @@
+"""Workflow run queue and dedicated worker (F8.3).
+
+Workflow instances are never executed inside the request that triggered them.
+Every trigger path (event, manual, webhook, resume) creates the instance and a
+job on the ``workflows`` queue in the same transaction; the WorkflowWorker
+then runs those jobs with bounded concurrency:
+
+- a global cap per worker process (``workflow_worker_concurrency``)
+- a per-account cap on running runs (``workflow_max_concurrent_per_account``)
+- a per-workflow cap on running runs (``workflow_max_concurrent_per_workflow``)
+
+Accounts with ready jobs are served round-robin, so one tenant's bulk import
+cannot starve everyone else. The caps count running jobs in the ``jobs``
+table, so they hold across worker processes and recover on their own when a
+crashed worker's jobs are reset as stale. Instances paused on a wait step do
+not count.
+
+When an account already has ``workflow_max_queued_per_account`` runs queued,
+new triggers are rejected with WorkflowQueueFullError (backpressure).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from snackbase.core.config import get_settings
+from snackbase.core.logging import get_logger
+from snackbase.infrastructure.persistence.models.job import JobModel
+from snackbase.infrastructure.persistence.models.workflow_instance import WorkflowInstanceModel
+from snackbase.infrastructure.persistence.repositories.job_repository import JobRepository
+from snackbase.infrastructure.persistence.repositories.workflow_instance_repository import (
+    WorkflowInstanceRepository,
+)
+from snackbase.infrastructure.services.job_service import JobWorker
+
+logger = get_logger(__name__)
+
+WORKFLOW_QUEUE = "workflows"
+
+
+class WorkflowQueueFullError(Exception):
+    """Raised when an account has too many queued workflow runs."""
+
+    def __init__(self, account_id: str, limit: int) -> None:
+        self.account_id = account_id
+        self.limit = limit
+        super().__init__(f"Account has reached the maximum of {limit} queued workflow runs")
+
+
+async def start_workflow_instance(
+    session: AsyncSession,
+    *,
+    workflow_id: str,
+    account_id: str,
+    trigger: dict[str, Any],
+) -> WorkflowInstanceModel:
+    """Create a pending instance and enqueue its ``workflow_run`` job.
+
+    Both rows are added to ``session`` and flushed; the caller commits, so
+    the instance and its job are persisted atomically.
+
+    Raises:
+        WorkflowQueueFullError: If the account's queue is at capacity.
+    """
+    limit = get_settings().workflow_max_queued_per_account
+    queued = await JobRepository(session).count_queued(WORKFLOW_QUEUE, account_id)
+    if queued >= limit:
+        raise WorkflowQueueFullError(account_id, limit)
+
+    instance = WorkflowInstanceModel(
+        workflow_id=workflow_id,
+        account_id=account_id,
+        status="pending",
+        context={"trigger": trigger},
+        started_at=datetime.now(UTC),
+    )
+    await WorkflowInstanceRepository(session).create(instance)
+    await JobRepository(session).create(
+        JobModel(
+            queue=WORKFLOW_QUEUE,
+            handler="workflow_run",
+            payload={"instance_id": instance.id, "workflow_id": workflow_id},
+            status="pending",
+            max_retries=1,
+            account_id=account_id,
+        )
+    )
+    return instance
+
+
+async def enqueue_workflow_resume(
+    session: AsyncSession,
+    instance: WorkflowInstanceModel,
+    next_step: str | None,
+) -> str:
+    """Enqueue an immediate ``workflow_resume`` job for an instance.
+
+    The job is added to ``session``; the caller commits.
+
+    Returns:
+        The new job ID.
+    """
+    job = JobModel(
+        queue=WORKFLOW_QUEUE,
+        handler="workflow_resume",
+        payload={
+            "instance_id": instance.id,
+            "workflow_id": instance.workflow_id,
+            "next_step": next_step,
+        },
+        status="pending",
+        max_retries=3,
+        account_id=instance.account_id,
+    )
+    await JobRepository(session).create(job)
+    return job.id
+
+
+class WorkflowWorker(JobWorker):
+    """Dedicated worker for the ``workflows`` queue.
+
+    Unlike the generic JobWorker, which executes one job per tick, this
+    worker keeps up to ``workflow_worker_concurrency`` workflow runs in
+    flight as tracked tasks, claims them fairly across accounts, and defers
+    (without counting an attempt) runs that would exceed a per-account or
+    per-workflow cap.
+
+    Args:
+        session_factory: Async session factory (e.g., db_manager.session).
+        settings: Application settings instance.
+    """
+
+    def __init__(self, session_factory: Any, settings: Any) -> None:
+        super().__init__(session_factory, settings, queue_filter=WORKFLOW_QUEUE)
+        self._in_flight: set[asyncio.Task] = set()
+        self._last_served: dict[str, float] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of workflow runs currently executing in this process."""
+        return len(self._in_flight)
+
+    async def stop(self) -> None:
+        """Stop polling, then cancel in-flight runs (their jobs return to pending)."""
+        await super().stop()
+        for task in list(self._in_flight):
+            task.cancel()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _tick(self) -> None:
+        """Single worker tick: stale-job recovery + fair dispatch of ready runs."""
+        self._poll_count += 1
+
+        if self._poll_count % 60 == 0:
+            await self._reset_stale()
+
+        await self._dispatch_ready_jobs()
+
+    async def _dispatch_ready_jobs(self) -> int:
+        """Claim ready workflow jobs round-robin across accounts and start them.
+
+        Returns:
+            Number of runs started.
+        """
+        capacity = self._settings.workflow_worker_concurrency - len(self._in_flight)
+        if capacity <= 0:
+            return 0
+
+        per_account_cap = self._settings.workflow_max_concurrent_per_account
+
+        async with self._session_factory() as session:
+            repo = JobRepository(session)
+            accounts = await repo.list_ready_accounts(
+                WORKFLOW_QUEUE, limit=max(capacity * 10, 100)
+            )
+            running = await repo.count_running_by_account(WORKFLOW_QUEUE, accounts)
+
+        # Least recently served accounts first; the stable sort keeps the
+        # oldest-job ordering among accounts that have never been served.
+        ready = set(accounts)
+        self._last_served = {a: t for a, t in self._last_served.items() if a in ready}
+        accounts.sort(key=lambda a: self._last_served.get(a, 0.0))
+
+        started = 0
+
+        while capacity > 0 and accounts:
+            for account_id in list(accounts):
+                if capacity <= 0:
+                    break
+                if running.get(account_id, 0) >= per_account_cap:
+                    accounts.remove(account_id)
+                    continue
+
+                job = await self._claim_job(account_id=account_id)
+                if job is None:
+                    accounts.remove(account_id)
+                    continue
+                self._last_served[account_id] = time.monotonic()
+
+                workflow_id = job.payload.get("workflow_id")
+                if workflow_id and not await self._workflow_has_capacity(workflow_id):
+                    # Back off this account for the rest of the tick rather
+                    # than claiming and deferring its whole backlog.
+                    await self._defer(job)
+                    accounts.remove(account_id)
+                    continue
+
+                running[account_id] = running.get(account_id, 0) + 1
+                capacity -= 1
+                started += 1
+
+                task = asyncio.create_task(
+                    self._execute_job(job), name=f"snackbase-workflow-{job.id}"
+                )
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+        return started
+
+    async def _workflow_has_capacity(self, workflow_id: str) -> bool:
+        """Check the per-workflow cap (the just-claimed job is already counted)."""
+        async with self._session_factory() as session:
+            running = await JobRepository(session).count_running_with_payload(
+                WORKFLOW_QUEUE, "workflow_id", workflow_id
+            )
+        return running <= self._settings.workflow_max_concurrent_per_workflow
+
+    async def _defer(self, job: Any) -> None:
+        """Put a claimed job back on the queue for a short delay."""
+        run_at = datetime.now(UTC) + timedelta(seconds=self._settings.workflow_defer_seconds)
+        async with self._session_factory() as session:
+            await JobRepository(session).defer_job(job.id, run_at)
+            await session.commit()
+        logger.debug(
+            "Workflow run deferred by concurrency cap",
+            job_id=job.id,
+            workflow_id=job.payload.get("workflow_id"),
+        )
@@ -2,11 +2,16 @@
 
 Registers a single callback per supported event type in the HookRegistry.
 At runtime each callback queries the DB for matching enabled event-type
-workflows, creates a new WorkflowInstance, and runs it as a background task.
+workflows and, for each, creates a pending WorkflowInstance plus a
+``workflow_run`` job on the ``workflows`` queue. Execution happens on the
+WorkflowWorker (see workflow_queue.py), never in the web request, so a bulk
+import cannot fan out into unbounded concurrent workflow coroutines.
 
-This mirrors the api_defined_hook.py pattern: background tasks for
+This mirrors the api_defined_hook.py pattern: a short background task for
 non-blocking dispatch, session_factory for DB access, hot-reload automatic
 because each trigger queries the DB fresh.
+With the event outbox enabled, record events are dispatched by the
+OutboxRelay after the write commits instead.
 
 Supported events:
     records.create  → ON_RECORD_AFTER_CREATE
@@ -19,9 +24,9 @@ Supported events:
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
 from typing import Any, Optional, Set
 
+from snackbase.core.config import get_settings
 from snackbase.core.hooks.hook_events import HookEvent
 from snackbase.core.hooks.hook_registry import HookRegistry
 from snackbase.core.logging import get_logger
@@ -74,6 +79,9 @@ def register_workflow_event_triggers(
             _internal_event: str = internal_event,
             _session_factory: Any = session_factory,
         ) -> Optional[dict[str, Any]]:
+            if _internal_event in _RECORD_EVENTS and get_settings().event_outbox_enabled:
+                # Dispatched by the outbox relay once the write commits
+                return data
             task = asyncio.create_task(
                 _dispatch_workflow_triggers(
                     internal_event=_internal_event,
@@ -106,8 +114,13 @@ async def _dispatch_workflow_triggers(
     data: Optional[dict[str, Any]],
     context: Optional[HookContext],
     session_factory: Any,
+    reraise: bool = False,
 ) -> None:
-    """Query matching workflows and create+run an instance for each."""
+    """Query matching workflows and enqueue a run for each.
+
+    With ``reraise`` errors are raised after logging, so the outbox relay
+    can retry the event.
+    """
     if context is None or not context.account_id:
         return
 
@@ -126,6 +139,10 @@ async def _dispatch_workflow_triggers(
     from snackbase.infrastructure.persistence.repositories.workflow_repository import (
         WorkflowRepository,
     )
+    from snackbase.infrastructure.workflows.workflow_queue import (
+        WorkflowQueueFullError,
+        start_workflow_instance,
+    )
 
     try:
         async with session_factory() as session:
@@ -136,27 +153,40 @@ async def _dispatch_workflow_triggers(
                 collection=collection,
             )
 
-        for wf in workflows:
-            # Evaluate optional trigger condition
-            condition = (wf.trigger_config or {}).get("condition")
-            if condition and not _evaluate_condition(condition, trigger_data):
-                logger.debug(
-                    "Workflow trigger condition did not match — skipping",
-                    workflow_id=wf.id,
-                )
-                continue
-
-            task = asyncio.create_task(
-                _create_and_run_instance(
+            for wf in workflows:
+                # Evaluate optional trigger condition
+                condition = (wf.trigger_config or {}).get("condition")
+                if condition and not _evaluate_condition(condition, trigger_data):
+                    logger.debug(
+                        "Workflow trigger condition did not match — skipping",
+                        workflow_id=wf.id,
+                    )
+                    continue
+
+                try:
+                    inst = await start_workflow_instance(
+                        session,
+                        workflow_id=wf.id,
+                        account_id=account_id,
+                        trigger={**trigger_data, "_event": api_event},
+                    )
+                except WorkflowQueueFullError as exc:
+                    logger.warning(
+                        "Workflow queue full — dropping event trigger",
+                        workflow_id=wf.id,
+                        account_id=account_id,
+                        limit=exc.limit,
+                    )
+                    break
+
+                logger.info(
+                    "Workflow instance queued for event trigger",
                     workflow_id=wf.id,
-                    account_id=account_id,
-                    trigger_data=trigger_data,
+                    instance_id=inst.id,
                     trigger_event=api_event,
-                    session_factory=session_factory,
                 )
-            )
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
+
+            await session.commit()
 
     except Exception as exc:
         logger.error(
@@ -165,51 +195,8 @@ async def _dispatch_workflow_triggers(
             account_id=account_id,
             error=str(exc),
         )
-
-
-async def _create_and_run_instance(
-    workflow_id: str,
-    account_id: str,
-    trigger_data: dict[str, Any],
-    trigger_event: str,
-    session_factory: Any,
-) -> None:
-    """Create a WorkflowInstance and immediately start execution."""
-    from snackbase.infrastructure.persistence.models.workflow_instance import WorkflowInstanceModel
-    from snackbase.infrastructure.persistence.repositories.workflow_instance_repository import (
-        WorkflowInstanceRepository,
-    )
-    from snackbase.infrastructure.workflows.workflow_executor import run_instance
-
-    try:
-        async with session_factory() as session:
-            inst = WorkflowInstanceModel(
-                workflow_id=workflow_id,
-                account_id=account_id,
-                status="pending",
-                context={"trigger": {**trigger_data, "_event": trigger_event}, "steps": {}},
-                started_at=datetime.now(UTC),
-            )
-            repo = WorkflowInstanceRepository(session)
-            await repo.create(inst)
-            await session.commit()
-            instance_id = inst.id
-
-        logger.info(
-            "Workflow instance created for event trigger",
-            workflow_id=workflow_id,
-            instance_id=instance_id,
-            trigger_event=trigger_event,
-        )
-
-        await run_instance(instance_id, session_factory)
-
-    except Exception as exc:
-        logger.error(
-            "Failed to create/run workflow instance",
-            workflow_id=workflow_id,
-            error=str(exc),
-        )
+        if reraise:
+            raise
 
 
 def _evaluate_condition(condition: str, record: dict[str, Any]) -> bool:
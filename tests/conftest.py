@@ -69,6 +69,22 @@ def _setup_config_registry():
     yield app.state.config_registry
 
 
+@pytest.fixture(autouse=True)
+def _clear_storage_provider_cache():
+    """Drop storage providers resolved from a previous test's database."""
+    from snackbase.infrastructure.storage.provider_cache import get_storage_provider_cache
+
+    get_storage_provider_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_endpoint_route_tables():
+    """Drop custom endpoint routes compiled from a previous test's database."""
+    from snackbase.infrastructure.endpoints.route_table import get_route_table_cache
+
+    get_route_table_cache().clear()
+
+
 @pytest.fixture(autouse=True)
 def _clean_dynamic_migrations():
     """Clear the dynamic migrations directory before running tests."""
@@ -105,7 +121,7 @@ def _audit_hooks_registry():
     from snackbase.infrastructure.api.app import app
     
     registry = app.state.hook_registry if hasattr(app.state, "hook_registry") else None
-    return {"registry": registry, "registered": False}
+    return {"registry": registry, "registered": False, "builtin_hooks_registered": False}
 
 
 @pytest.fixture
@@ -128,8 +144,11 @@ def _maybe_enable_audit_hooks(request, _audit_hooks_registry):
             from snackbase.infrastructure.hooks import register_builtin_hooks
             from snackbase.infrastructure.persistence.event_listeners import register_sqlalchemy_listeners
             
-            # Register built-in hooks (includes audit logging hooks)
-            register_builtin_hooks(registry)
+            # Register built-in hooks (includes audit logging hooks). They
+            # cannot be unregistered, so only register them once per session.
+            if not _audit_hooks_registry["builtin_hooks_registered"]:
+                register_builtin_hooks(registry)
+                _audit_hooks_registry["builtin_hooks_registered"] = True
             
             # Register SQLAlchemy listeners (global Mapper class listeners)
             register_sqlalchemy_listeners(None, registry)
@@ -9,6 +9,8 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from snackbase.domain.services.account_code_generator import AccountCodeGenerator
+from snackbase.domain.services.account_service import AccountService
+from snackbase.infrastructure.persistence.database import get_db_manager
 from snackbase.infrastructure.persistence.models import AccountModel
 from snackbase.infrastructure.persistence.repositories.account_repository import (
     AccountRepository,
@@ -225,3 +227,80 @@ class TestAccountCodeGeneratorIntegration:
         all_codes = await repo.get_all_account_codes()
         assert "AA9999" in all_codes
         assert "AB0000" in all_codes
+
+    async def test_allocate_continues_after_highest_code(self, db_session: AsyncSession):
+        """The sequence is seeded from the highest existing code on first use."""
+        repo = AccountRepository(db_session)
+
+        import uuid
+
+        for code in ("AA0001", "AB0001", "AA0005"):
+            await repo.create(
+                AccountModel(
+                    id=str(uuid.uuid4()), account_code=code, slug=code.lower(), name=code
+                )
+            )
+        await db_session.commit()
+
+        assert await repo.allocate_account_code() == "AB0002"
+        assert await repo.allocate_account_code() == "AB0003"
+
+    async def test_allocate_skips_taken_codes(self, db_session: AsyncSession):
+        """Codes assigned outside the sequence are never handed out again."""
+        repo = AccountRepository(db_session)
+
+        import uuid
+
+        assert await repo.allocate_account_code() == "AA0001"
+        await repo.create(
+            AccountModel(id=str(uuid.uuid4()), account_code="AA0002", slug="taken", name="Taken")
+        )
+        await db_session.commit()
+
+        assert await repo.allocate_account_code() == "AA0003"
+
+    async def test_concurrent_allocation_is_unique_with_constant_cost(
+        self, db_session: AsyncSession
+    ):
+        """A burst of concurrent signups gets unique codes at constant cost.
+
+        Each creation runs in its own session and transaction, like
+        concurrent requests. Allocation cost is measured in SQL statements,
+        which must not grow with the number of accounts.
+        """
+        from sqlalchemy import event
+
+        manager = get_db_manager()
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        async def allocation_cost() -> int:
+            async with manager.session() as session:
+                statements.clear()
+                event.listen(manager.engine.sync_engine, "before_cursor_execute", count_statement)
+                try:
+                    await AccountRepository(session).allocate_account_code()
+                finally:
+                    event.remove(
+                        manager.engine.sync_engine, "before_cursor_execute", count_statement
+                    )
+                await session.rollback()
+                return len(statements)
+
+        async def create_account(index: int) -> str:
+            async with manager.session() as session:
+                account = await AccountService(session).create_account(name=f"Burst {index}")
+                await session.commit()
+                return account.account_code
+
+        # Seed the sequence so later measurements only see steady-state cost
+        await create_account(0)
+        cost_before = await allocation_cost()
+
+        codes = await asyncio.gather(*(create_account(i) for i in range(1, 41)))
+
+        assert len(set(codes)) == len(codes) == 40
+        assert all(AccountCodeGenerator.validate(code) for code in codes)
+        assert await allocation_cost() == cost_before
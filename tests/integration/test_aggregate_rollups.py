@@ -0,0 +1,279 @@
+"""Integration tests for materialized aggregate rollups.
+
+Rollup values are built on creation, maintained by record writes, and must
+answer /aggregate queries with the same results as the grouped SQL query.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from snackbase.core.config import get_settings
+from snackbase.infrastructure.persistence.aggregate_cache import get_aggregate_cache
+from snackbase.infrastructure.persistence.repositories import AggregateRollupRepository
+
+COLLECTION = "rollup_test_col"
+SCHEMA = [
+    {"name": "title", "type": "text", "required": True},
+    {"name": "status", "type": "text"},
+    {"name": "featured", "type": "boolean"},
+    {"name": "price", "type": "number"},
+]
+
+BASE_URL = f"/api/v1/records/{COLLECTION}"
+AGG_URL = f"/api/v1/records/{COLLECTION}/aggregate"
+ROLLUPS_URL = f"/api/v1/collections/{COLLECTION}/rollups"
+
+
+@pytest.fixture(autouse=True)
+async def setup_collection(client: AsyncClient, superadmin_token, monkeypatch):
+    """Enable rollups, create the collection and seed records."""
+    monkeypatch.setattr(get_settings(), "aggregate_rollups_enabled", True)
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "label": "Rollup Test", "schema": SCHEMA},
+        headers=headers,
+    )
+    assert resp.status_code == 201, f"Failed to create collection: {resp.text}"
+
+    for title, status_, featured, price in (
+        ("A", "active", True, 10.0),
+        ("B", "active", False, 20.0),
+        ("C", "pending", False, None),
+    ):
+        r = await client.post(
+            BASE_URL,
+            json={"title": title, "status": status_, "featured": featured, "price": price},
+            headers=headers,
+        )
+        assert r.status_code == 201, f"Failed to seed record: {r.text}"
+
+    yield
+
+    await client.delete(f"/api/v1/collections/{COLLECTION}", headers=headers)
+
+
+@pytest.fixture
+def rollup_queries(monkeypatch) -> list[str]:
+    """Record the rollup IDs that answer aggregation queries."""
+    calls: list[str] = []
+    original = AggregateRollupRepository.query
+
+    async def spy(self, rollup, *args, **kwargs):
+        calls.append(rollup.id)
+        return await original(self, rollup, *args, **kwargs)
+
+    monkeypatch.setattr(AggregateRollupRepository, "query", spy)
+    return calls
+
+
+async def _aggregate(
+    client: AsyncClient,
+    headers: dict,
+    params: dict,
+    use_rollups: bool,
+    collection: str = COLLECTION,
+):
+    settings = get_settings()
+    enabled = settings.aggregate_rollups_enabled
+    settings.aggregate_rollups_enabled = use_rollups
+    get_aggregate_cache().invalidate(collection)
+    try:
+        resp = await client.get(
+            f"/api/v1/records/{collection}/aggregate", params=params, headers=headers
+        )
+    finally:
+        settings.aggregate_rollups_enabled = enabled
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    data["results"].sort(key=lambda row: repr(sorted(row.items())))
+    return data
+
+
+@pytest.mark.asyncio
+async def test_rollup_matches_sql_after_writes(
+    client: AsyncClient, superadmin_token, rollup_queries
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.post(
+        ROLLUPS_URL,
+        json={"group_by": ["status", "featured"], "sum_fields": ["price"]},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    rollup_id = resp.json()["id"]
+    assert resp.json()["groups"] == 3
+
+    created = await client.post(
+        BASE_URL,
+        json={"title": "D", "status": "pending", "featured": True, "price": 5.0},
+        headers=headers,
+    )
+    assert created.status_code == 201, created.text
+    listing = await client.get(BASE_URL, params={"limit": 100}, headers=headers)
+    record_ids = {item["title"]: item["id"] for item in listing.json()["items"]}
+
+    r = await client.patch(
+        f"{BASE_URL}/{record_ids['B']}",
+        json={"status": "archived", "price": 30.0},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    r = await client.delete(f"{BASE_URL}/{record_ids['A']}", headers=headers)
+    assert r.status_code == 204, r.text
+
+    for params in (
+        {"functions": "count(),sum(price),avg(price),count(price)", "group_by": "status"},
+        {"functions": "count(),sum(price)", "group_by": "status,featured"},
+        {"functions": "count(),sum(price)"},
+    ):
+        from_rollup = await _aggregate(client, headers, params, use_rollups=True)
+        from_sql = await _aggregate(client, headers, params, use_rollups=False)
+        assert from_rollup == from_sql
+
+    assert rollup_queries == [rollup_id] * 3
+
+
+@pytest.mark.asyncio
+async def test_unmatched_queries_fall_back_to_sql(
+    client: AsyncClient, superadmin_token, rollup_queries
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.post(ROLLUPS_URL, json={"group_by": ["status"]}, headers=headers)
+    assert resp.status_code == 201, resp.text
+
+    for params in (
+        {"functions": "sum(price)", "group_by": "status"},
+        {"functions": "count()", "group_by": "featured"},
+        {"functions": "count()", "group_by": "status", "filter": 'title = "A"'},
+        {"functions": "max(price)"},
+    ):
+        await _aggregate(client, headers, params, use_rollups=True)
+
+    assert rollup_queries == []
+
+
+@pytest.mark.asyncio
+async def test_rollup_admin_endpoints(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+
+    bad = await client.post(ROLLUPS_URL, json={"group_by": ["price"]}, headers=headers)
+    assert bad.status_code == 400
+
+    resp = await client.post(
+        ROLLUPS_URL, json={"group_by": ["status"], "sum_fields": ["price"]}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    rollup_id = resp.json()["id"]
+
+    listing = await client.get(ROLLUPS_URL, headers=headers)
+    assert [r["id"] for r in listing.json()] == [rollup_id]
+
+    rebuilt = await client.post(f"{ROLLUPS_URL}/{rollup_id}/rebuild", headers=headers)
+    assert rebuilt.status_code == 200, rebuilt.text
+    assert rebuilt.json()["groups"] == 2
+
+    deleted = await client.delete(f"{ROLLUPS_URL}/{rollup_id}", headers=headers)
+    assert deleted.status_code == 204
+    assert (await client.get(ROLLUPS_URL, headers=headers)).json() == []
+
+
+def _typed(data: dict) -> list:
+    """Pair every result value with its type, since 15 == 15.0 in Python."""
+    return [
+        sorted((key, type(value).__name__, value) for key, value in row.items())
+        for row in data["results"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rollup_results_match_sql_types_included(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.post(
+        ROLLUPS_URL, json={"group_by": ["status"], "sum_fields": ["price"]}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+
+    for price in (1, 2, 3):
+        created = await client.post(
+            BASE_URL, json={"title": "I", "status": "integers", "price": price}, headers=headers
+        )
+        assert created.status_code == 201, created.text
+
+    # Decimal values pass through the rollup as +/- deltas on every update.
+    # The final prices are exact in binary, so the table's own sums are exact
+    # and any drift left in the stored totals shows up in the comparison.
+    for final_price in (0.25, 1.5, 2.75):
+        created = await client.post(
+            BASE_URL, json={"title": "D", "status": "decimals", "price": 0.3}, headers=headers
+        )
+        assert created.status_code == 201, created.text
+        for price in (1.1, 0.2, final_price):
+            r = await client.patch(
+                f"{BASE_URL}/{created.json()['id']}", json={"price": price}, headers=headers
+            )
+            assert r.status_code == 200, r.text
+
+    for params in (
+        {"functions": "count(),sum(price),avg(price),count(price)", "group_by": "status"},
+        {"functions": "count(),sum(price),avg(price)"},
+    ):
+        from_rollup = await _aggregate(client, headers, params, use_rollups=True)
+        from_sql = await _aggregate(client, headers, params, use_rollups=False)
+        assert _typed(from_rollup) == _typed(from_sql)
+
+
+@pytest.mark.asyncio
+async def test_rollup_follows_cascade_deletes(
+    client: AsyncClient, superadmin_token, rollup_queries
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    child = "rollup_test_child"
+    schema = [
+        {"name": "label", "type": "text"},
+        {"name": "amount", "type": "number"},
+        {
+            "name": "parent",
+            "type": "reference",
+            "collection": COLLECTION,
+            "on_delete": "cascade",
+        },
+    ]
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": child, "label": "Rollup Child", "schema": schema},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+
+    try:
+        listing = await client.get(BASE_URL, params={"limit": 100}, headers=headers)
+        parent_ids = {item["title"]: item["id"] for item in listing.json()["items"]}
+        for title, label, amount in (("A", "x", 1.0), ("A", "y", 2.0), ("B", "x", 4.0)):
+            r = await client.post(
+                f"/api/v1/records/{child}",
+                json={"label": label, "amount": amount, "parent": parent_ids[title]},
+                headers=headers,
+            )
+            assert r.status_code == 201, r.text
+
+        resp = await client.post(
+            f"/api/v1/collections/{child}/rollups",
+            json={"group_by": ["label"], "sum_fields": ["amount"]},
+            headers=headers,
+        )
+        assert resp.status_code == 201, resp.text
+
+        # Deleting A removes its children through ON DELETE CASCADE
+        r = await client.delete(f"{BASE_URL}/{parent_ids['A']}", headers=headers)
+        assert r.status_code == 204, r.text
+
+        params = {"functions": "count(),sum(amount)", "group_by": "label"}
+        from_rollup = await _aggregate(client, headers, params, True, collection=child)
+        from_sql = await _aggregate(client, headers, params, False, collection=child)
+        assert rollup_queries == [resp.json()["id"]]
+        assert from_rollup["results"] == from_sql["results"]
+        assert from_sql["results"] == [{"label": "x", "count": 1, "sum_amount": 4.0}]
+    finally:
+        await client.delete(f"/api/v1/collections/{child}", headers=headers)
@@ -92,6 +92,7 @@ async def test_anonymous_list_public_collection(client: AsyncClient, superadmin_
 
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
+        params={"include_count": True},
         headers={"X-Account-ID": ACCOUNT_SLUG},
     )
     assert resp.status_code == 200
@@ -305,6 +306,7 @@ async def test_authenticated_user_on_public_collection(client: AsyncClient, supe
 
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
+        params={"include_count": True},
         headers={"Authorization": f"Bearer {regular_user_token}"},
     )
     assert resp.status_code == 200
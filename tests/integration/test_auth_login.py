@@ -250,3 +250,23 @@ async def test_saml_user_cannot_login_with_password(client: AsyncClient, db_sess
     assert data["auth_provider"] == "saml"
     assert data["provider_name"] == "okta"
     assert "/api/v1/auth/saml/okta/login" in data["redirect_url"]
+
+
+@pytest.mark.asyncio
+async def test_login_returns_429_when_password_hashing_queue_full(
+    client: AsyncClient, monkeypatch
+):
+    """A saturated password hashing pool sheds logins with 429 instead of queueing."""
+    from snackbase.infrastructure.auth import password_hasher
+
+    monkeypatch.setattr(
+        password_hasher, "_pool", password_hasher._HashingPool(max_workers=1, max_pending=0)
+    )
+
+    res = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "nobody@example.com", "password": "Password123!", "account": "nowhere"},
+    )
+
+    assert res.status_code == 429
+    assert res.headers["Retry-After"] == "1"
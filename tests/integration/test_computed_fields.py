@@ -462,7 +462,7 @@ async def test_filter_by_computed_number_field(
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     r = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "total_price > 25"},
+        params={"filter": "total_price > 25", "include_count": True},
         headers=headers,
     )
     assert r.status_code == 200
@@ -478,7 +478,7 @@ async def test_filter_by_computed_text_field(
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     r = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'full_name ~ "%Smith%"'},
+        params={"filter": 'full_name ~ "%Smith%"', "include_count": True},
         headers=headers,
     )
     assert r.status_code == 200
@@ -493,7 +493,7 @@ async def test_filter_computed_field_equality(
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     r = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'full_name = "Bob Jones"'},
+        params={"filter": 'full_name = "Bob Jones"', "include_count": True},
         headers=headers,
     )
     assert r.status_code == 200
@@ -509,7 +509,7 @@ async def test_filter_combined_computed_and_regular_field(
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     r = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'total_price > 25 && last_name = "Smith"'},
+        params={"filter": 'total_price > 25 && last_name = "Smith"', "include_count": True},
         headers=headers,
     )
     assert r.status_code == 200
@@ -608,7 +608,9 @@ async def test_collection_with_no_computed_fields_works_normally(
     )
     assert r.status_code == 201
 
-    r = await client.get("/api/v1/records/no_computed_col", headers=headers)
+    r = await client.get(
+        "/api/v1/records/no_computed_col", params={"include_count": True}, headers=headers
+    )
     assert r.status_code == 200
     assert r.json()["total"] == 1
 
@@ -289,3 +289,46 @@ async def test_dashboard_stats_active_sessions_count(
     # Active sessions should only count the active token
     # (plus any from test fixtures)
     assert data["active_sessions"] >= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.enable_audit_hooks
+async def test_dashboard_total_records_follows_record_writes(
+    client: AsyncClient, superadmin_token: str
+):
+    """Test total_records is served from counters maintained by record writes."""
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.post(
+        "/api/v1/collections",
+        json={
+            "name": "dashboard_count_col",
+            "label": "Dashboard Count",
+            "schema": [{"name": "title", "type": "text"}],
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+
+    async def total_records() -> int:
+        response = await client.get("/api/v1/dashboard/stats", headers=headers)
+        assert response.status_code == 200
+        return response.json()["total_records"]
+
+    # First load seeds the counter from a one-off count
+    assert await total_records() == 0
+
+    record_ids = []
+    for title in ("a", "b"):
+        r = await client.post(
+            "/api/v1/records/dashboard_count_col", json={"title": title}, headers=headers
+        )
+        assert r.status_code == 201, r.text
+        record_ids.append(r.json()["id"])
+    assert await total_records() == 2
+
+    r = await client.delete(f"/api/v1/records/dashboard_count_col/{record_ids[0]}", headers=headers)
+    assert r.status_code == 204
+    data = (await client.get("/api/v1/dashboard/stats", headers=headers)).json()
+    assert data["total_records"] == 1
+    assert data["stats_updated_at"] is not None
+    assert data["stats_reconciled_at"] is not None
@@ -1,6 +1,11 @@
-
 import pytest
-from snackbase.infrastructure.persistence.database import DatabaseManager, get_db_manager
+
+from snackbase.core.config import get_settings
+from snackbase.infrastructure.persistence.database import (
+    DatabaseManager,
+    TimedQueuePool,
+    get_db_manager,
+)
 
 
 @pytest.mark.asyncio
@@ -38,3 +43,41 @@ async def test_database_session_factory():
     finally:
         # Clean up the engine to prevent event loop issues in subsequent tests
         await db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_database_shares_one_connection(monkeypatch):
+    """Test that an in-memory SQLite URL keeps its data across sessions."""
+    from sqlalchemy import text
+    from sqlalchemy.pool import StaticPool
+
+    monkeypatch.setattr(get_settings(), "database_url", "sqlite+aiosqlite://")
+    db = DatabaseManager()
+
+    try:
+        assert isinstance(db.engine.sync_engine.pool, StaticPool)
+        assert db.pool_stats() is None
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE memory_check (id INTEGER)"))
+            await session.execute(text("INSERT INTO memory_check VALUES (1)"))
+            await session.commit()
+        async with db.session() as session:
+            result = await session.execute(text("SELECT id FROM memory_check"))
+            assert result.scalar() == 1
+    finally:
+        await db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_file_database_uses_timed_pool(monkeypatch, tmp_path):
+    """Test that file databases keep the instrumented queue pool."""
+    monkeypatch.setattr(
+        get_settings(), "database_url", f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    )
+    db = DatabaseManager()
+
+    try:
+        assert isinstance(db.engine.sync_engine.pool, TimedQueuePool)
+        assert db.pool_stats() is not None
+    finally:
+        await db.disconnect()
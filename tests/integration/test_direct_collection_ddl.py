@@ -0,0 +1,161 @@
+"""Integration tests for direct collection DDL with the schema journal.
+
+With ``collection_ddl_mode = "direct"`` collection tables are created,
+altered and dropped in a transaction recorded in collection_schema_journal,
+without writing Alembic revision files.
+"""
+
+import json
+from pathlib import Path
+from typing import cast
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from snackbase.core.config import get_settings
+from snackbase.infrastructure.persistence.direct_schema_service import DirectSchemaService
+from snackbase.infrastructure.persistence.models import (
+    CollectionModel,
+    CollectionSchemaJournalModel,
+)
+
+COLLECTION = "direct_ddl_col"
+TABLE = f"col_{COLLECTION}"
+SCHEMA = [{"name": "title", "type": "text", "required": True}]
+
+
+@pytest.fixture(autouse=True)
+def direct_mode(monkeypatch):
+    monkeypatch.setattr(get_settings(), "collection_ddl_mode", "direct")
+
+
+def migration_files() -> set[str]:
+    directory = Path("sb_data/migrations")
+    return {p.name for p in directory.glob("*.py")} if directory.is_dir() else set()
+
+
+async def table_columns(engine: AsyncEngine, table: str) -> set[str] | None:
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns(table)}
+            if inspect(sync_conn).has_table(table)
+            else None
+        )
+
+
+async def journal(db_session) -> list[tuple[str, str]]:
+    rows = await db_session.execute(
+        select(CollectionSchemaJournalModel.operation, CollectionSchemaJournalModel.revision)
+        .where(CollectionSchemaJournalModel.collection_name == COLLECTION)
+        .order_by(CollectionSchemaJournalModel.applied_at)
+    )
+    return [tuple(row) for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_collection_lifecycle_is_journaled_without_revision_files(
+    client: AsyncClient, superadmin_token, db_session
+):
+    engine = cast(AsyncEngine, db_session.bind)
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    files_before = migration_files()
+
+    resp = await client.post(
+        "/api/v1/collections", json={"name": COLLECTION, "schema": SCHEMA}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    collection_id = resp.json()["id"]
+    assert await table_columns(engine, TABLE) >= {"id", "account_id", "title"}
+
+    resp = await client.post(f"/api/v1/records/{COLLECTION}", json={"title": "A"}, headers=headers)
+    assert resp.status_code == 201, resp.text
+
+    # Add a unique field and a plain field
+    resp = await client.put(
+        f"/api/v1/collections/{collection_id}",
+        json={
+            "schema": SCHEMA
+            + [
+                {"name": "slug", "type": "text", "unique": True},
+                {"name": "views", "type": "number", "default": 0},
+            ]
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+    assert {"slug", "views"} <= await table_columns(engine, TABLE)
+
+    resp = await client.post(
+        f"/api/v1/records/{COLLECTION}", json={"title": "B", "slug": "b"}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    assert resp.json()["views"] == 0
+    resp = await client.post(
+        f"/api/v1/records/{COLLECTION}", json={"title": "C", "slug": "b"}, headers=headers
+    )
+    assert resp.status_code in (400, 409), resp.text
+
+    entries = await journal(db_session)
+    assert [operation for operation, _ in entries] == ["create", "update"]
+    stored = await db_session.scalar(
+        select(CollectionModel.migration_revision).where(CollectionModel.id == collection_id)
+    )
+    assert stored == entries[-1][1]
+
+    resp = await client.delete(f"/api/v1/collections/{collection_id}", headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert await table_columns(engine, TABLE) is None
+    assert [operation for operation, _ in await journal(db_session)] == [
+        "create",
+        "update",
+        "delete",
+    ]
+
+    assert migration_files() == files_before
+
+
+@pytest.mark.asyncio
+async def test_failed_change_rolls_back_ddl_and_journal(db_session):
+    engine = cast(AsyncEngine, db_session.bind)
+    service = DirectSchemaService(engine)
+    service.generate_create_collection_migration(COLLECTION, SCHEMA)
+    # The second create of the same table fails inside the same transaction
+    service.generate_create_collection_migration(COLLECTION, SCHEMA)
+
+    with pytest.raises(OperationalError):
+        await service.apply_migrations()
+
+    assert await table_columns(engine, TABLE) is None
+    assert await journal(db_session) == []
+
+    # Nothing stays queued after a failure
+    await service.apply_migrations()
+    assert await table_columns(engine, TABLE) is None
+
+
+@pytest.mark.asyncio
+async def test_journal_records_executed_statements(db_session):
+    engine = cast(AsyncEngine, db_session.bind)
+    service = DirectSchemaService(engine)
+    revision = service.generate_create_collection_migration(COLLECTION, SCHEMA)
+    await service.apply_migrations()
+
+    statements = json.loads(
+        await db_session.scalar(
+            select(CollectionSchemaJournalModel.statements).where(
+                CollectionSchemaJournalModel.revision == revision
+            )
+        )
+    )
+    assert statements[0].startswith(f'CREATE TABLE "{TABLE}"')
+    async with engine.connect() as conn:
+        indexes = (
+            await conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t"),
+                {"t": TABLE},
+            )
+        ).scalars().all()
+    assert f"ix_{TABLE}_account_created_id" in indexes
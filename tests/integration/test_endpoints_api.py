@@ -705,6 +705,51 @@ async def test_dispatcher_disabled_endpoint_not_found(
     assert resp.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_dispatcher_picks_up_endpoint_changes(
+    client: AsyncClient, account: AccountModel, user_token: str
+) -> None:
+    """Compiled routes are rebuilt after endpoints are created, updated or deleted."""
+
+    async def create(path: str, source: str) -> str:
+        resp = await client.post(
+            "/api/v1/endpoints",
+            json={
+                "name": source,
+                "path": path,
+                "method": "GET",
+                "auth_required": False,
+                "response_template": {"status": 200, "body": {"source": source}},
+            },
+            headers=_auth(user_token),
+        )
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    param_id = await create("/catalog/:slug", "param")
+    resp = await client.get("/api/v1/x/endpoint-test/catalog/featured")
+    assert resp.json() == {"source": "param"}
+
+    # A literal segment takes precedence over a parameter
+    literal_id = await create("/catalog/featured", "literal")
+    resp = await client.get("/api/v1/x/endpoint-test/catalog/featured")
+    assert resp.json() == {"source": "literal"}
+
+    await client.put(
+        f"/api/v1/endpoints/{literal_id}",
+        json={"path": "/catalog/featured/all"},
+        headers=_auth(user_token),
+    )
+    resp = await client.get("/api/v1/x/endpoint-test/catalog/featured")
+    assert resp.json() == {"source": "param"}
+    resp = await client.get("/api/v1/x/endpoint-test/catalog/featured/all")
+    assert resp.json() == {"source": "literal"}
+
+    await client.delete(f"/api/v1/endpoints/{param_id}", headers=_auth(user_token))
+    resp = await client.get("/api/v1/x/endpoint-test/catalog/featured")
+    assert resp.status_code == 404
+
+
 # ---------------------------------------------------------------------------
 # EXECUTION HISTORY
 # ---------------------------------------------------------------------------
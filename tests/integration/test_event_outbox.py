@@ -0,0 +1,223 @@
+"""Integration tests for the transactional event outbox and its relay.
+
+With ``event_outbox_enabled`` record writes append their events to
+event_outbox in the same transaction, and the OutboxRelay delivers them to
+webhooks, API-defined hooks and workflow triggers. Realtime subscribers are
+published to by the writing process once it has committed.
+"""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from snackbase.core.config import get_settings
+from snackbase.core.context import clear_current_context, set_current_context
+from snackbase.domain.entities.hook_context import HookContext
+from snackbase.infrastructure.persistence.database import get_db_manager
+from snackbase.infrastructure.persistence.models import EventOutboxModel, WebhookDeliveryModel
+from snackbase.infrastructure.persistence.models.webhook import WebhookModel
+from snackbase.infrastructure.persistence.repositories.event_outbox_repository import (
+    add_commit_listener,
+    enqueue_record_event,
+    remove_commit_listener,
+)
+from snackbase.infrastructure.services.outbox_relay import OutboxRelay
+
+COLLECTION = "outbox_posts"
+
+
+@pytest.fixture(autouse=True)
+def outbox_enabled(monkeypatch):
+    monkeypatch.setattr(get_settings(), "event_outbox_enabled", True)
+
+
+@pytest.fixture
+def broadcaster(client, monkeypatch):
+    from snackbase.infrastructure.api.app import app
+
+    mock = MagicMock()
+    mock.publish_event = AsyncMock()
+    monkeypatch.setattr(app.state, "event_broadcaster", mock)
+    return mock
+
+
+@pytest.fixture
+def relay():
+    return OutboxRelay(get_db_manager().session, get_settings())
+
+
+async def outbox_rows(db_session) -> list[EventOutboxModel]:
+    db_session.expire_all()
+    result = await db_session.execute(select(EventOutboxModel).order_by(EventOutboxModel.id))
+    return list(result.scalars().all())
+
+
+async def create_collection(client: AsyncClient, headers: dict[str, str]) -> None:
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "schema": [{"name": "title", "type": "text"}]},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+
+
+@pytest.mark.asyncio
+async def test_record_writes_are_relayed_from_the_outbox(
+    client: AsyncClient, superadmin_token, db_session, relay, broadcaster
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    await create_collection(client, headers)
+
+    resp = await client.post(f"/api/v1/records/{COLLECTION}", json={"title": "A"}, headers=headers)
+    assert resp.status_code == 201, resp.text
+    record_id = resp.json()["id"]
+    resp = await client.patch(
+        f"/api/v1/records/{COLLECTION}/{record_id}", json={"title": "B"}, headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    resp = await client.delete(f"/api/v1/records/{COLLECTION}/{record_id}", headers=headers)
+    assert resp.status_code == 204, resp.text
+
+    rows = await outbox_rows(db_session)
+    assert [row.operation for row in rows] == ["create", "update", "delete"]
+    update = json.loads(rows[1].payload)
+    assert update["record"]["title"] == "B"
+    assert update["old_values"]["title"] == "A"
+    context = json.loads(rows[0].context)
+    assert context["user"]["email"]
+    assert {row.targets for row in rows} == {"webhooks,hooks,workflows"}
+
+    # Realtime events were published by this process after each commit
+    calls = [call.kwargs for call in broadcaster.publish_event.await_args_list]
+    assert [call["operation"] for call in calls] == ["create", "update", "delete"]
+    assert calls[0]["data"]["title"] == "A"
+    assert calls[2]["data"] == {"id": record_id}
+
+    assert await relay.drain_once() == 3
+    assert broadcaster.publish_event.await_count == 3
+    assert await outbox_rows(db_session) == []
+    assert await relay.drain_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_relay_creates_webhook_deliveries(
+    client: AsyncClient, superadmin_token, db_session, relay
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    await create_collection(client, headers)
+    resp = await client.post(f"/api/v1/records/{COLLECTION}", json={"title": "A"}, headers=headers)
+    assert resp.status_code == 201, resp.text
+
+    (row,) = await outbox_rows(db_session)
+    webhook = WebhookModel(
+        account_id=json.loads(row.context)["account_id"],
+        url="https://example.com/hook",
+        collection=COLLECTION,
+        events=["create"],
+        secret="outbox-secret",
+        enabled=True,
+    )
+    db_session.add(webhook)
+    await db_session.commit()
+
+    assert await relay.drain_once() == 1
+
+    deliveries = (
+        (
+            await db_session.execute(
+                select(WebhookDeliveryModel).where(WebhookDeliveryModel.webhook_id == webhook.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert [delivery.event for delivery in deliveries] == ["records.create"]
+    assert deliveries[0].payload["record"]["title"] == "A"
+
+
+@pytest.mark.asyncio
+async def test_failed_target_is_retried_then_parked(db_session, relay, monkeypatch):
+    set_current_context(HookContext(app=None, account_id="acc-1"))
+    try:
+        enqueue_record_event(db_session, "create", COLLECTION, "acc-1", {"id": "r1", "title": "A"})
+        await db_session.commit()
+    finally:
+        clear_current_context()
+
+    async def fail_hooks(target, event, data, context):
+        if target == "hooks":
+            raise RuntimeError("hook lookup failed")
+
+    monkeypatch.setattr(relay, "_deliver_to", fail_hooks)
+    monkeypatch.setattr(relay, "_subscribed_targets", AsyncMock(return_value={"hooks": {"acc-1"}}))
+    monkeypatch.setattr(get_settings(), "event_outbox_max_attempts", 2)
+
+    assert await relay.drain_once() == 1
+    (row,) = await outbox_rows(db_session)
+    # Delivered targets are not repeated on retry
+    assert row.targets == "hooks"
+    assert row.attempts == 1
+    assert "hook lookup failed" in row.last_error
+    assert row.available_at.replace(tzinfo=UTC) > datetime.now(UTC)
+
+    # Not due yet
+    assert await relay.drain_once() == 0
+
+    row.available_at = datetime.now(UTC)
+    await db_session.commit()
+    assert await relay.drain_once() == 1
+    (row,) = await outbox_rows(db_session)
+    assert row.attempts == 2
+    assert row.available_at is None  # parked
+    assert await relay.drain_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_targets_without_subscriptions_are_skipped(db_session, relay, monkeypatch):
+    set_current_context(HookContext(app=None, account_id="acc-1"))
+    try:
+        enqueue_record_event(db_session, "create", COLLECTION, "acc-1", {"id": "r1"})
+        await db_session.commit()
+    finally:
+        clear_current_context()
+
+    delivered = []
+
+    async def record_target(target, event, data, context):
+        delivered.append(target)
+
+    monkeypatch.setattr(relay, "_deliver_to", record_target)
+    assert await relay.drain_once() == 1
+    # acc-1 has no webhooks, hooks or event workflows
+    assert delivered == []
+    assert await outbox_rows(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_events_are_written_only_when_the_transaction_commits(db_session):
+    commits = []
+
+    def listener():
+        commits.append(True)
+
+    add_commit_listener(listener)
+    try:
+        # Record writes enqueue inside an open transaction
+        await db_session.execute(select(EventOutboxModel.id))
+        enqueue_record_event(db_session, "create", COLLECTION, "acc-1", {"id": "r1"})
+        await db_session.rollback()
+        assert await outbox_rows(db_session) == []
+        assert commits == []
+
+        enqueue_record_event(db_session, "create", COLLECTION, "acc-1", {"id": "r2"})
+        enqueue_record_event(db_session, "delete", COLLECTION, "acc-1", {"id": "r2"})
+        await db_session.commit()
+        assert commits == [True]
+        count = await db_session.scalar(select(func.count()).select_from(EventOutboxModel))
+        assert count == 2
+    finally:
+        remove_commit_listener(listener)
@@ -86,6 +86,28 @@ async def test_upload_and_download_file(client: AsyncClient, superadmin_token: s
     assert download_response.content == file_content
 
 
+@pytest.mark.asyncio
+async def test_download_file_byte_range(client: AsyncClient, superadmin_token: str):
+    """Test that a Range request returns 206 with only the requested bytes."""
+    file_content = b"0123456789abcdef"
+    upload_response = await client.post(
+        "/api/v1/files/upload",
+        headers={"Authorization": f"Bearer {superadmin_token}"},
+        files={"file": ("range.txt", BytesIO(file_content), "text/plain")},
+    )
+    assert upload_response.status_code == 201
+    file_path = upload_response.json()["file"]["path"]
+
+    download_response = await client.get(
+        f"/api/v1/files/{file_path}",
+        headers={"Authorization": f"Bearer {superadmin_token}", "Range": "bytes=4-9"},
+    )
+
+    assert download_response.status_code == 206
+    assert download_response.content == b"456789"
+    assert download_response.headers["content-range"] == f"bytes 4-9/{len(file_content)}"
+
+
 @pytest.mark.asyncio
 async def test_upload_file_size_limit(client: AsyncClient, superadmin_token: str):
     """Test that file upload enforces size limit."""
@@ -0,0 +1,61 @@
+"""Integration tests for the Prometheus /metrics endpoint."""
+
+import pytest
+from httpx import AsyncClient
+
+from snackbase.core.config import get_settings
+from snackbase.core.metrics import HTTP_REQUEST_DURATION
+from snackbase.infrastructure.persistence.models.job import JobModel
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch):
+    """Serve /metrics, which is off by default."""
+    monkeypatch.setattr(get_settings(), "metrics_enabled", True)
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_by_default(client: AsyncClient):
+    assert (await client.get("/metrics")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_requests_and_job_queues(
+    client: AsyncClient, db_session, metrics_enabled
+):
+    db_session.add(JobModel(queue="metrics_q", handler="send_email", payload={}))
+    await db_session.commit()
+
+    labels = {"method": "GET", "route": "GET /health", "status": "200"}
+    before = HTTP_REQUEST_DURATION.count(**labels)
+    resp = await client.get("/health")
+    assert resp.status_code == 200
+    assert HTTP_REQUEST_DURATION.count(**labels) == before + 1
+
+    resp = await client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = resp.text
+    assert (
+        'snackbase_http_request_duration_seconds_count{method="GET",route="GET /health",status="200"}'
+        in body
+    )
+    assert 'snackbase_job_queue_depth{queue="metrics_q"} 1' in body
+    assert 'snackbase_job_queue_oldest_age_seconds{queue="metrics_q"}' in body
+    assert "# TYPE snackbase_realtime_connections gauge" in body
+    assert "# TYPE snackbase_hook_duration_seconds histogram" in body
+    assert 'snackbase_password_hash_tasks{state="queued"} 0' in body
+    assert 'snackbase_password_hash_limit{limit="pending"}' in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_token_and_disable(client: AsyncClient, monkeypatch, metrics_enabled):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+
+    assert (await client.get("/metrics")).status_code == 401
+    resp = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert resp.status_code == 200
+
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    assert (await client.get("/metrics")).status_code == 404
@@ -0,0 +1,56 @@
+"""Integration tests for per-request query instrumentation and /admin/profiling."""
+
+import pytest
+from httpx import AsyncClient
+
+from snackbase.infrastructure.persistence.query_stats import get_route_profiler
+
+PROFILING_URL = "/api/v1/admin/profiling"
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_db_queries(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.get("/api/v1/collections", headers=headers)
+    assert resp.status_code == 200
+
+    timing = resp.headers["Server-Timing"]
+    db_part, total_part = timing.split(", ")
+    assert db_part.startswith("db;dur=")
+    queries = int(db_part.split('desc="')[1].split(" ")[0])
+    assert queries >= 1
+    assert total_part.startswith("total;dur=")
+
+
+@pytest.mark.asyncio
+async def test_profiling_groups_requests_by_route(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    get_route_profiler().reset()
+
+    for _ in range(2):
+        resp = await client.get("/api/v1/collections/does_not_exist", headers=headers)
+        assert resp.status_code == 404
+
+    resp = await client.get(PROFILING_URL, headers=headers)
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["enabled"] is True
+    routes = {row["route"]: row for row in data["routes"]}
+    profile = routes["GET /api/v1/collections/{collection_id}"]
+    assert profile["requests"] == 2
+    assert profile["queries"] >= 2
+
+    resp = await client.delete(PROFILING_URL, headers=headers)
+    assert resp.status_code == 204
+    # Only the reset request itself has been recorded since
+    assert [row["route"] for row in get_route_profiler().top()] == [
+        "DELETE /api/v1/admin/profiling"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_profiling_requires_superadmin(client: AsyncClient, regular_user_token):
+    resp = await client.get(
+        PROFILING_URL, headers={"Authorization": f"Bearer {regular_user_token}"}
+    )
+    assert resp.status_code == 403
@@ -0,0 +1,163 @@
+"""Integration tests for conditional GET on record endpoints.
+
+Single records carry strong ETags derived from ``updated_at``; lists carry
+weak ETags derived from the collection's change counter. Matching
+``If-None-Match`` requests are answered with ``304 Not Modified``.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+COLLECTION = "etag_test_col"
+SCHEMA = [{"name": "title", "type": "text", "required": True}]
+
+BASE_URL = f"/api/v1/records/{COLLECTION}"
+
+# The regular_user_token fixture creates an account with slug="reg-user-acc"
+ACCOUNT_SLUG = "reg-user-acc"
+
+
+@pytest.fixture(autouse=True)
+async def setup_collection(client: AsyncClient, superadmin_token):
+    """Create the collection before each test."""
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "label": "ETag Test", "schema": SCHEMA},
+        headers=headers,
+    )
+    assert resp.status_code == 201, f"Failed to create collection: {resp.text}"
+
+    yield
+
+    await client.delete(f"/api/v1/collections/{COLLECTION}", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_list_not_modified_until_a_record_changes(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    created = await client.post(BASE_URL, json={"title": "First"}, headers=headers)
+    assert created.status_code == 201
+
+    first = await client.get(BASE_URL, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    unchanged = await client.get(BASE_URL, headers={**headers, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+
+    # Other query parameters are a different representation
+    other_page = await client.get(
+        BASE_URL, params={"limit": 5}, headers={**headers, "If-None-Match": etag}
+    )
+    assert other_page.status_code == 200
+
+    await client.patch(
+        f"{BASE_URL}/{created.json()['id']}", json={"title": "Renamed"}, headers=headers
+    )
+    changed = await client.get(BASE_URL, headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["items"][0]["title"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_record_revalidates_on_etag_and_last_modified(
+    client: AsyncClient, superadmin_token
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    created = await client.post(BASE_URL, json={"title": "First"}, headers=headers)
+    url = f"{BASE_URL}/{created.json()['id']}"
+
+    first = await client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert not etag.startswith("W/")
+
+    assert (await client.get(url, headers={**headers, "If-None-Match": etag})).status_code == 304
+    since = {**headers, "If-Modified-Since": first.headers["last-modified"]}
+    assert (await client.get(url, headers=since)).status_code == 304
+
+    await client.patch(url, json={"title": "Renamed"}, headers=headers)
+    changed = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+    missing = await client.get(
+        f"{BASE_URL}/does-not-exist", headers={**headers, "If-None-Match": etag}
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_public_collection_is_cacheable_for_anonymous_requests(
+    client: AsyncClient, superadmin_token, regular_user_token
+):
+    resp = await client.put(
+        f"/api/v1/collections/{COLLECTION}/rules",
+        json={"list_rule": "", "view_rule": "", "create_rule": ""},
+        headers={"Authorization": f"Bearer {superadmin_token}"},
+    )
+    assert resp.status_code == 200, resp.text
+    created = await client.post(
+        BASE_URL,
+        json={"title": "Public"},
+        headers={"Authorization": f"Bearer {regular_user_token}"},
+    )
+    assert created.status_code == 201, created.text
+
+    anonymous = {"X-Account-ID": ACCOUNT_SLUG}
+    listing = await client.get(BASE_URL, headers=anonymous)
+    assert listing.status_code == 200
+    assert listing.headers["cache-control"].startswith("public, ")
+    assert "X-Account-ID" in listing.headers["vary"]
+
+    revalidated = await client.get(
+        BASE_URL, headers={**anonymous, "If-None-Match": listing.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_cascade_delete_changes_referencing_list_etag(
+    client: AsyncClient, superadmin_token
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    child = "etag_test_child"
+    schema = [
+        {"name": "note", "type": "text"},
+        {"name": "parent", "type": "reference", "collection": COLLECTION, "on_delete": "cascade"},
+    ]
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": child, "label": "ETag Child", "schema": schema},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    child_url = f"/api/v1/records/{child}"
+
+    try:
+        parent = await client.post(BASE_URL, json={"title": "Parent"}, headers=headers)
+        r = await client.post(
+            child_url, json={"note": "n", "parent": parent.json()["id"]}, headers=headers
+        )
+        assert r.status_code == 201, r.text
+
+        first = await client.get(child_url, headers=headers)
+        assert len(first.json()["items"]) == 1
+        etag = first.headers["etag"]
+
+        # Deleting the parent removes the child through ON DELETE CASCADE
+        r = await client.delete(f"{BASE_URL}/{parent.json()['id']}", headers=headers)
+        assert r.status_code == 204, r.text
+
+        changed = await client.get(child_url, headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["items"] == []
+    finally:
+        await client.delete(f"/api/v1/collections/{child}", headers=headers)
@@ -0,0 +1,146 @@
+"""Integration tests for cursor pagination of record lists.
+
+Lists without ``skip`` are keyset-paginated with signed cursors that are
+bound to the sort order and collection schema they were issued for.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+COLLECTION = "cursor_test_col"
+SCHEMA = [
+    {"name": "title", "type": "text", "required": True},
+    {"name": "rank", "type": "number"},
+]
+
+BASE_URL = f"/api/v1/records/{COLLECTION}"
+
+
+@pytest.fixture(autouse=True)
+async def setup_collection(client: AsyncClient, superadmin_token):
+    """Create the collection and seed records before each test."""
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "label": "Cursor Test", "schema": SCHEMA},
+        headers=headers,
+    )
+    assert resp.status_code == 201, f"Failed to create collection: {resp.text}"
+
+    r = await client.post(
+        f"{BASE_URL}/batch",
+        json={"records": [{"title": f"R{i}", "rank": i} for i in range(7)]},
+        headers=headers,
+    )
+    assert r.status_code == 201, f"Failed to seed records: {r.text}"
+
+    yield
+
+    await client.delete(f"/api/v1/collections/{COLLECTION}", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_default_list_pages_forward_and_backward(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    params = {"sort": "-rank", "limit": 3}
+
+    pages = []
+    resp = await client.get(BASE_URL, params=params, headers=headers)
+    while True:
+        assert resp.status_code == 200, resp.text
+        page = resp.json()
+        assert "skip" not in page
+        pages.append([item["title"] for item in page["items"]])
+        if not page["has_more"]:
+            break
+        resp = await client.get(
+            BASE_URL, params={**params, "cursor": page["next_cursor"]}, headers=headers
+        )
+
+    assert pages == [["R6", "R5", "R4"], ["R3", "R2", "R1"], ["R0"]]
+
+    back = await client.get(
+        BASE_URL, params={**params, "cursor_before": page["prev_cursor"]}, headers=headers
+    )
+    assert back.status_code == 200, back.text
+    assert [item["title"] for item in back.json()["items"]] == ["R3", "R2", "R1"]
+
+    offset = await client.get(BASE_URL, params={**params, "skip": 3}, headers=headers)
+    assert offset.json()["total"] == 7
+    assert [item["title"] for item in offset.json()["items"]] == ["R3", "R2", "R1"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_rejected_for_other_sort_or_when_tampered(
+    client: AsyncClient, superadmin_token
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    first = await client.get(BASE_URL, params={"sort": "-rank", "limit": 2}, headers=headers)
+    cursor = first.json()["next_cursor"]
+
+    other_sort = await client.get(
+        BASE_URL, params={"sort": "+rank", "limit": 2, "cursor": cursor}, headers=headers
+    )
+    assert other_sort.status_code == 400
+    assert "different sort" in other_sort.json()["message"]
+
+    payload, _, signature = cursor.partition(".")
+    tampered = await client.get(
+        BASE_URL,
+        params={"sort": "-rank", "limit": 2, "cursor": f"{payload}x.{signature}"},
+        headers=headers,
+    )
+    assert tampered.status_code == 400
+
+
+async def _collect_pages(client: AsyncClient, headers: dict, params: dict) -> list[list[str]]:
+    pages = []
+    resp = await client.get(BASE_URL, params=params, headers=headers)
+    while True:
+        assert resp.status_code == 200, resp.text
+        page = resp.json()
+        pages.append(page)
+        if not page["has_more"]:
+            return pages
+        resp = await client.get(
+            BASE_URL, params={**params, "cursor": page["next_cursor"]}, headers=headers
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("sort", "nulls_first"), [("+rank", True), ("rank", False)])
+async def test_null_sort_values_page_across_boundaries(
+    client: AsyncClient, superadmin_token, sort: str, nulls_first: bool
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    r = await client.post(
+        f"{BASE_URL}/batch",
+        json={"records": [{"title": f"N{i}"} for i in range(3)]},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    params = {"sort": sort, "limit": 2}
+
+    pages = await _collect_pages(client, headers, params)
+    titles = [item["title"] for page in pages for item in page["items"]]
+
+    # Every record once; NULL ranks rank lowest, ordered by ID among themselves
+    assert sorted(titles) == sorted([f"N{i}" for i in range(3)] + [f"R{i}" for i in range(7)])
+    ranked = [f"R{i}" for i in range(7)]
+    if nulls_first:
+        assert titles[3:] == ranked
+    else:
+        assert titles[:7] == ranked[::-1]
+    null_ids = [
+        item["id"] for page in pages for item in page["items"] if item["title"].startswith("N")
+    ]
+    assert null_ids == sorted(null_ids, reverse=not nulls_first)
+
+    # Paging backward from the last page retraces the same pages
+    for previous, page in zip(pages[-2::-1], pages[:0:-1], strict=True):
+        back = await client.get(
+            BASE_URL, params={**params, "cursor_before": page["prev_cursor"]}, headers=headers
+        )
+        assert back.status_code == 200, back.text
+        assert back.json()["items"] == previous["items"]
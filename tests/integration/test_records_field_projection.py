@@ -0,0 +1,97 @@
+"""Integration tests for ?fields= projection on record reads.
+
+Only requested columns (plus system fields) are selected from the database;
+computed fields and the sort field keep working with a projection.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+COLLECTION = "projection_test_col"
+SCHEMA = [
+    {"name": "title", "type": "text", "required": True},
+    {"name": "body", "type": "text"},
+    {"name": "price", "type": "number"},
+    {"name": "quantity", "type": "number"},
+    {"name": "total", "type": "computed", "expression": "price * quantity", "return_type": "number"},
+]
+
+BASE_URL = f"/api/v1/records/{COLLECTION}"
+SYSTEM_FIELDS = {"id", "account_id", "created_at", "created_by", "updated_at", "updated_by"}
+
+
+@pytest.fixture(autouse=True)
+async def setup_collection(client: AsyncClient, superadmin_token):
+    """Create the collection and seed records before each test."""
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "label": "Projection Test", "schema": SCHEMA},
+        headers=headers,
+    )
+    assert resp.status_code == 201, f"Failed to create collection: {resp.text}"
+
+    for title, price, quantity in (("A", 2.0, 3), ("B", 5.0, 1)):
+        r = await client.post(
+            BASE_URL,
+            json={"title": title, "body": "x" * 1000, "price": price, "quantity": quantity},
+            headers=headers,
+        )
+        assert r.status_code == 201, f"Failed to seed record: {r.text}"
+
+    yield
+
+    await client.delete(f"/api/v1/collections/{COLLECTION}", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_list_returns_only_requested_fields(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.get(
+        BASE_URL, params={"fields": "title,total", "sort": "+price"}, headers=headers
+    )
+
+    assert resp.status_code == 200, resp.text
+    items = resp.json()["items"]
+    assert [item["title"] for item in items] == ["A", "B"]
+    assert [item["total"] for item in items] == [6.0, 5.0]
+    for item in items:
+        assert set(item) == SYSTEM_FIELDS | {"account_name", "title", "total"}
+        assert item["account_name"] is None
+
+
+@pytest.mark.asyncio
+async def test_cursor_list_with_projection_excluding_sort_field(
+    client: AsyncClient, superadmin_token
+):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    first = await client.get(
+        BASE_URL,
+        params={"fields": "title", "sort": "+price", "limit": 1, "cursor": ""},
+        headers=headers,
+    )
+    assert first.status_code == 200, first.text
+    page = first.json()
+    assert [item["title"] for item in page["items"]] == ["A"]
+    assert "price" not in page["items"][0]
+
+    second = await client.get(
+        BASE_URL,
+        params={"fields": "title", "sort": "+price", "limit": 1, "cursor": page["next_cursor"]},
+        headers=headers,
+    )
+    assert second.status_code == 200, second.text
+    assert [item["title"] for item in second.json()["items"]] == ["B"]
+
+
+@pytest.mark.asyncio
+async def test_account_name_requested(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.get(BASE_URL, params={"fields": "account_name"}, headers=headers)
+
+    assert resp.status_code == 200, resp.text
+    item = resp.json()["items"][0]
+    assert "body" not in item
+    assert item["account_name"]
+
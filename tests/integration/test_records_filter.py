@@ -73,7 +73,7 @@ async def test_filter_equality(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'status = "active"'},
+        params={"filter": 'status = "active"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -88,7 +88,7 @@ async def test_filter_not_equal(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'status != "archived"'},
+        params={"filter": 'status != "archived"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -103,7 +103,7 @@ async def test_filter_greater_than(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "price > 1.0"},
+        params={"filter": "price > 1.0", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -118,7 +118,7 @@ async def test_filter_less_than(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "price < 1.0"},
+        params={"filter": "price < 1.0", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -131,7 +131,7 @@ async def test_filter_greater_than_or_equal(client: AsyncClient, superadmin_toke
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "price >= 20.0"},
+        params={"filter": "price >= 20.0", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -143,7 +143,7 @@ async def test_filter_less_than_or_equal(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "price <= 0.8"},
+        params={"filter": "price <= 0.8", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -155,7 +155,7 @@ async def test_filter_like(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'title ~ "E%"'},
+        params={"filter": 'title ~ "E%"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -167,7 +167,7 @@ async def test_filter_boolean(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "is_featured = true"},
+        params={"filter": "is_featured = true", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -179,7 +179,7 @@ async def test_filter_in_operator(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'status IN ("active", "pending")'},
+        params={"filter": 'status IN ("active", "pending")', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -195,7 +195,7 @@ async def test_filter_is_null(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "deleted_at IS NULL"},
+        params={"filter": "deleted_at IS NULL", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -208,7 +208,7 @@ async def test_filter_is_not_null(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "deleted_at IS NOT NULL"},
+        params={"filter": "deleted_at IS NOT NULL", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -220,7 +220,7 @@ async def test_filter_and_logic(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'status = "active" && price > 1.0'},
+        params={"filter": 'status = "active" && price > 1.0', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -236,7 +236,7 @@ async def test_filter_or_logic(client: AsyncClient, superadmin_token):
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'status = "pending" || status = "archived"'},
+        params={"filter": 'status = "pending" || status = "archived"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -249,7 +249,7 @@ async def test_filter_parentheses_grouping(client: AsyncClient, superadmin_token
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": '(status = "active" || status = "pending") && price > 1.0'},
+        params={"filter": '(status = "active" || status = "pending") && price > 1.0', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -265,7 +265,7 @@ async def test_filter_system_field_created_by(client: AsyncClient, superadmin_to
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'created_by = "superadmin"'},
+        params={"filter": 'created_by = "superadmin"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -279,7 +279,7 @@ async def test_filter_pagination_respects_filter(client: AsyncClient, superadmin
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'category = "fruit"', "limit": 2, "skip": 0},
+        params={"filter": 'category = "fruit"', "limit": 2, "skip": 0, "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -296,7 +296,7 @@ async def test_filter_pagination_second_page(client: AsyncClient, superadmin_tok
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'category = "fruit"', "limit": 2, "skip": 2},
+        params={"filter": 'category = "fruit"', "limit": 2, "skip": 2, "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -310,7 +310,7 @@ async def test_filter_unknown_field_returns_400(client: AsyncClient, superadmin_
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'nonexistent_field = "value"'},
+        params={"filter": 'nonexistent_field = "value"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 400
@@ -324,7 +324,7 @@ async def test_filter_context_variable_returns_400(client: AsyncClient, superadm
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": '@request.auth.id = "user123"'},
+        params={"filter": '@request.auth.id = "user123"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 400
@@ -337,7 +337,7 @@ async def test_filter_malformed_syntax_returns_400(client: AsyncClient, superadm
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": "title ==="},
+        params={"filter": "title ===", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 400
@@ -363,7 +363,9 @@ async def test_old_query_param_returns_400_with_migration_hint(
 async def test_no_filter_returns_all_records(client: AsyncClient, superadmin_token):
     """Without a filter, all records are returned."""
     headers = {"Authorization": f"Bearer {superadmin_token}"}
-    resp = await client.get(f"/api/v1/records/{COLLECTION}", headers=headers)
+    resp = await client.get(
+        f"/api/v1/records/{COLLECTION}", params={"include_count": True}, headers=headers
+    )
     assert resp.status_code == 200
     assert resp.json()["total"] == 5
 
@@ -374,7 +376,7 @@ async def test_empty_filter_returns_all_records(client: AsyncClient, superadmin_
     headers = {"Authorization": f"Bearer {superadmin_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": ""},
+        params={"filter": "", "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
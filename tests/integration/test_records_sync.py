@@ -0,0 +1,229 @@
+"""Integration tests for delta sync of collection records.
+
+``GET /records/{collection}/changes`` first pages a snapshot of the
+collection, then returns only the records created, updated or deleted since
+the watermark of the previous call, with tombstones for deletes.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from snackbase.core.config import get_settings
+from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_CODE
+from snackbase.infrastructure.persistence.models import RecordChangeModel
+from snackbase.infrastructure.persistence.repositories import RecordChangeRepository
+
+COLLECTION = "sync_test_col"
+SCHEMA = [{"name": "title", "type": "text", "required": True}]
+
+BASE_URL = f"/api/v1/records/{COLLECTION}"
+SYNC_URL = f"{BASE_URL}/changes"
+
+
+def sync_headers(superadmin_token: str) -> dict[str, str]:
+    """Superadmin headers syncing the system account, which owns its records."""
+    return {"Authorization": f"Bearer {superadmin_token}", "X-Account-ID": SYSTEM_ACCOUNT_CODE}
+
+
+@pytest.fixture(autouse=True)
+async def setup_collection(client: AsyncClient, superadmin_token):
+    """Create the collection before each test."""
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "label": "Sync Test", "schema": SCHEMA},
+        headers=headers,
+    )
+    assert resp.status_code == 201, f"Failed to create collection: {resp.text}"
+
+    yield resp.json()["id"]
+
+    await client.delete(f"/api/v1/collections/{resp.json()['id']}", headers=headers)
+
+
+async def sync_all(client: AsyncClient, headers: dict, since: str | None = None, limit: int = 100):
+    """Call the sync endpoint until has_more is false; returns (pages, watermark)."""
+    pages = []
+    while True:
+        params = {"limit": limit}
+        if since:
+            params["since"] = since
+        resp = await client.get(SYNC_URL, params=params, headers=headers)
+        assert resp.status_code == 200, resp.text
+        page = resp.json()
+        pages.append(page)
+        since = page["watermark"]
+        if not page["has_more"]:
+            return pages, since
+
+
+@pytest.mark.asyncio
+async def test_snapshot_then_changes_with_tombstones(client: AsyncClient, superadmin_token):
+    headers = sync_headers(superadmin_token)
+    ids = []
+    for title in ("A", "B", "C"):
+        resp = await client.post(BASE_URL, json={"title": title}, headers=headers)
+        ids.append(resp.json()["id"])
+
+    pages, watermark = await sync_all(client, headers, limit=2)
+    assert [[item["title"] for item in page["items"]] for page in pages] == [["A", "B"], ["C"]]
+    assert all(page["deleted"] == [] for page in pages)
+
+    # Nothing changed since
+    pages, watermark = await sync_all(client, headers, watermark)
+    assert pages == [{"items": [], "deleted": [], "watermark": watermark, "has_more": False}]
+
+    await client.patch(f"{BASE_URL}/{ids[1]}", json={"title": "B2"}, headers=headers)
+    await client.delete(f"{BASE_URL}/{ids[0]}", headers=headers)
+    await client.post(BASE_URL, json={"title": "D"}, headers=headers)
+    # A record created and deleted between syncs only leaves a tombstone
+    resp = await client.post(BASE_URL, json={"title": "E"}, headers=headers)
+    await client.delete(f"{BASE_URL}/{resp.json()['id']}", headers=headers)
+
+    pages, _ = await sync_all(client, headers, watermark, limit=2)
+    items = [item["title"] for page in pages for item in page["items"]]
+    deleted = [record_id for page in pages for record_id in page["deleted"]]
+    assert items == ["B2", "D"]
+    assert deleted == [ids[0], resp.json()["id"]]
+
+
+@pytest.mark.asyncio
+async def test_changes_during_snapshot_follow_it(client: AsyncClient, superadmin_token):
+    headers = sync_headers(superadmin_token)
+    ids = []
+    for title in ("A", "B"):
+        resp = await client.post(BASE_URL, json={"title": title}, headers=headers)
+        ids.append(resp.json()["id"])
+
+    first = (await client.get(SYNC_URL, params={"limit": 1}, headers=headers)).json()
+    assert [item["title"] for item in first["items"]] == ["A"]
+    await client.patch(f"{BASE_URL}/{ids[0]}", json={"title": "A2"}, headers=headers)
+
+    pages, _ = await sync_all(client, headers, first["watermark"], limit=1)
+    assert [item["title"] for page in pages for item in page["items"]] == ["B", "A2"]
+
+
+@pytest.mark.asyncio
+async def test_feed_keeps_one_row_per_record(client: AsyncClient, superadmin_token, db_session):
+    headers = sync_headers(superadmin_token)
+    resp = await client.post(BASE_URL, json={"title": "A"}, headers=headers)
+    record_id = resp.json()["id"]
+    for title in ("B", "C", "D"):
+        await client.patch(f"{BASE_URL}/{record_id}", json={"title": title}, headers=headers)
+
+    rows = (
+        await db_session.execute(
+            select(func.count()).where(RecordChangeModel.collection_name == COLLECTION)
+        )
+    ).scalar_one()
+    assert rows == 1
+
+
+@pytest.mark.asyncio
+async def test_old_tombstones_are_pruned(client: AsyncClient, superadmin_token, db_session):
+    headers = sync_headers(superadmin_token)
+    for title in ("A", "B"):
+        resp = await client.post(BASE_URL, json={"title": title}, headers=headers)
+    await client.delete(f"{BASE_URL}/{resp.json()['id']}", headers=headers)
+
+    repo = RecordChangeRepository(db_session)
+    assert await repo.delete_tombstones_before(datetime.now(UTC) - timedelta(days=1)) == 0
+    assert await repo.delete_tombstones_before(datetime.now(UTC) + timedelta(seconds=1)) == 1
+    await db_session.commit()
+
+    remaining = (await db_session.execute(select(RecordChangeModel.deleted))).scalars().all()
+    assert remaining == [False]
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_expired_watermarks(client: AsyncClient, superadmin_token, monkeypatch):
+    headers = sync_headers(superadmin_token)
+    await client.post(BASE_URL, json={"title": "A"}, headers=headers)
+    _, watermark = await sync_all(client, headers)
+
+    resp = await client.get(SYNC_URL, params={"since": watermark[:-2] + "xx"}, headers=headers)
+    assert resp.status_code == 400
+
+    # A list cursor is not a watermark
+    cursor = (await client.get(BASE_URL, params={"limit": 1}, headers=headers)).json()
+    resp = await client.get(SYNC_URL, params={"since": cursor["prev_cursor"]}, headers=headers)
+    assert resp.status_code == 400
+
+    monkeypatch.setattr(get_settings(), "record_sync_tombstone_retention_days", 0)
+    resp = await client.get(SYNC_URL, params={"since": watermark}, headers=headers)
+    assert resp.status_code == 410
+
+
+@pytest.mark.asyncio
+async def test_recreated_collection_expires_watermarks(
+    client: AsyncClient, superadmin_token, setup_collection
+):
+    headers = sync_headers(superadmin_token)
+    await client.post(BASE_URL, json={"title": "A"}, headers=headers)
+    _, watermark = await sync_all(client, headers)
+
+    resp = await client.delete(f"/api/v1/collections/{setup_collection}", headers=headers)
+    assert resp.status_code == 200, resp.text
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": COLLECTION, "label": "Sync Test", "schema": SCHEMA},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+
+    resp = await client.get(SYNC_URL, params={"since": watermark}, headers=headers)
+    assert resp.status_code == 410
+
+
+@pytest.mark.asyncio
+async def test_superadmin_must_name_the_account(client: AsyncClient, superadmin_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    resp = await client.get(SYNC_URL, headers=headers)
+    assert resp.status_code == 400
+    assert resp.json()["error"] == "Account required"
+
+
+@pytest.mark.asyncio
+async def test_cascade_deletes_leave_tombstones(client: AsyncClient, superadmin_token):
+    headers = sync_headers(superadmin_token)
+    child = "sync_test_child"
+    schema = [
+        {"name": "note", "type": "text"},
+        {"name": "parent", "type": "reference", "collection": COLLECTION, "on_delete": "cascade"},
+    ]
+    resp = await client.post(
+        "/api/v1/collections",
+        json={"name": child, "label": "Sync Child", "schema": schema},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    child_id = resp.json()["id"]
+    child_url = f"/api/v1/records/{child}"
+
+    try:
+        parent = await client.post(BASE_URL, json={"title": "Parent"}, headers=headers)
+        note = await client.post(
+            child_url, json={"note": "n", "parent": parent.json()["id"]}, headers=headers
+        )
+        assert note.status_code == 201, note.text
+
+        resp = await client.get(f"{child_url}/changes", headers=headers)
+        assert [item["id"] for item in resp.json()["items"]] == [note.json()["id"]]
+        watermark = resp.json()["watermark"]
+
+        # Deleting the parent removes the note through ON DELETE CASCADE
+        r = await client.delete(f"{BASE_URL}/{parent.json()['id']}", headers=headers)
+        assert r.status_code == 204, r.text
+
+        resp = await client.get(
+            f"{child_url}/changes", params={"since": watermark}, headers=headers
+        )
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["items"] == []
+        assert resp.json()["deleted"] == [note.json()["id"]]
+    finally:
+        await client.delete(f"/api/v1/collections/{child_id}", headers=headers)
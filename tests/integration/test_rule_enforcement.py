@@ -73,7 +73,9 @@ async def test_rule_enforcement_end_to_end(client: AsyncClient, superadmin_token
     # 4. List as User 2
     # Should see: User1 Public
     # Should NOT see: User1 Private
-    list_res = await client.get("/api/v1/records/tasks", headers=user2_headers)
+    list_res = await client.get(
+        "/api/v1/records/tasks", params={"include_count": True}, headers=user2_headers
+    )
     assert list_res.status_code == 200
     data = list_res.json()
     assert data["total"] == 1
@@ -91,7 +93,9 @@ async def test_rule_enforcement_end_to_end(client: AsyncClient, superadmin_token
     
     # 7. List as User 2 again
     # Should see: User1 Public AND User2 Private
-    list_res = await client.get("/api/v1/records/tasks", headers=user2_headers)
+    list_res = await client.get(
+        "/api/v1/records/tasks", params={"include_count": True}, headers=user2_headers
+    )
     assert list_res.json()["total"] == 2
     titles = [i["title"] for i in list_res.json()["items"]]
     assert "User1 Public" in titles
@@ -108,7 +112,9 @@ async def test_rule_enforcement_end_to_end(client: AsyncClient, superadmin_token
     assert delete_res.status_code == 404
     
     # 10. Superadmin should see everything (bypass)
-    list_super = await client.get("/api/v1/records/tasks", headers=super_headers)
+    list_super = await client.get(
+        "/api/v1/records/tasks", params={"include_count": True}, headers=super_headers
+    )
     assert list_super.status_code == 200
     assert list_super.json()["total"] >= 3
     
@@ -158,3 +164,26 @@ async def test_create_rule_validation(client: AsyncClient, superadmin_token, reg
     res2 = await client.post("/api/v1/records/logs", json={"level": "debug"}, headers=user_headers)
     assert res2.status_code == 400
     assert "satisfy collection rules" in res2.json()["detail"]
+
+@pytest.mark.asyncio
+async def test_create_rule_with_json_payload(client: AsyncClient, superadmin_token, regular_user_token):
+    headers = {"Authorization": f"Bearer {superadmin_token}"}
+    user_headers = {"Authorization": f"Bearer {regular_user_token}"}
+
+    await client.post("/api/v1/collections", json={
+        "name": "events",
+        "label": "Events",
+        "schema": [{"name": "name", "type": "text"}, {"name": "payload", "type": "json"}]
+    }, headers=headers)
+    await client.put("/api/v1/collections/events/rules", json={
+        "create_rule": "@request.auth.id != \"\"",
+        "view_rule": ""
+    }, headers=headers)
+
+    res = await client.post(
+        "/api/v1/records/events",
+        json={"name": "signup", "payload": {"plan": "pro", "seats": [1, 2]}},
+        headers=user_headers,
+    )
+    assert res.status_code == 201, res.text
+    assert res.json()["payload"] == {"plan": "pro", "seats": [1, 2]}
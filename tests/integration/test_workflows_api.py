@@ -37,6 +37,23 @@ from snackbase.infrastructure.persistence.models.workflow import WorkflowModel
 from snackbase.infrastructure.persistence.models.workflow_instance import WorkflowInstanceModel
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _drain_workflow_queue() -> int:
+    """Run one WorkflowWorker dispatch pass and wait for the started runs."""
+    from snackbase.core.config import get_settings
+    from snackbase.infrastructure.persistence.database import get_db_manager
+    from snackbase.infrastructure.workflows.workflow_queue import WorkflowWorker
+
+    worker = WorkflowWorker(get_db_manager().session, get_settings())
+    started = await worker._dispatch_ready_jobs()
+    await asyncio.gather(*worker._in_flight)
+    return started
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -629,8 +646,8 @@ async def test_trigger_workflow_instance_completes(client: AsyncClient, user_tok
     )
     instance_id = trigger_resp.json()["instance_id"]
 
-    # Allow the background task to finish
-    await asyncio.sleep(0.2)
+    # The run is queued on the workflows queue; let the worker execute it
+    assert await _drain_workflow_queue() == 1
 
     detail = await client.get(
         f"/api/v1/workflow-instances/{instance_id}", headers=_auth(user_token)
@@ -1073,6 +1090,204 @@ async def test_max_workflow_limit(
     assert "maximum" in resp.json()["detail"].lower()
 
 
+# ---------------------------------------------------------------------------
+# WORKFLOW QUEUE — concurrency caps, fairness, backpressure
+# ---------------------------------------------------------------------------
+
+
+async def _queue_runs(db_session: AsyncSession, account_id: str, count: int) -> WorkflowModel:
+    """Create an empty workflow for ``account_id`` and queue ``count`` runs of it."""
+    from snackbase.infrastructure.workflows.workflow_queue import start_workflow_instance
+
+    wf = WorkflowModel(
+        account_id=account_id,
+        name=f"Queued Flow {account_id[-2:]}",
+        trigger_type="manual",
+        trigger_config={"type": "manual"},
+        steps=[],
+        enabled=True,
+    )
+    db_session.add(wf)
+    await db_session.flush()
+    for _ in range(count):
+        await start_workflow_instance(
+            db_session, workflow_id=wf.id, account_id=account_id, trigger={}
+        )
+    await db_session.commit()
+    return wf
+
+
+async def _instance_statuses(db_session: AsyncSession, workflow_id: str) -> list[str]:
+    rows = await db_session.execute(
+        select(WorkflowInstanceModel.status).where(
+            WorkflowInstanceModel.workflow_id == workflow_id
+        )
+    )
+    return sorted(rows.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_trigger_queues_run_instead_of_executing(
+    client: AsyncClient, user_token: str, db_session: AsyncSession
+) -> None:
+    """Manual trigger creates a pending instance plus a workflow_run job."""
+    from snackbase.infrastructure.persistence.models.job import JobModel
+
+    create = await client.post(
+        "/api/v1/workflows",
+        json={"name": "Queued Trigger", "trigger": {"type": "manual"}, "steps": []},
+        headers=_auth(user_token),
+    )
+    wf_id = create.json()["id"]
+
+    resp = await client.post(f"/api/v1/workflows/{wf_id}/trigger", headers=_auth(user_token))
+    assert resp.status_code == 202
+    instance_id = resp.json()["instance_id"]
+
+    job = (
+        await db_session.execute(select(JobModel).where(JobModel.handler == "workflow_run"))
+    ).scalar_one()
+    assert job.queue == "workflows"
+    assert job.payload == {"instance_id": instance_id, "workflow_id": wf_id}
+    assert await _instance_statuses(db_session, wf_id) == ["pending"]
+
+
+@pytest.mark.asyncio
+async def test_trigger_returns_429_when_account_queue_full(
+    client: AsyncClient, user_token: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from snackbase.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "workflow_max_queued_per_account", 1)
+
+    create = await client.post(
+        "/api/v1/workflows",
+        json={"name": "Backpressure Flow", "trigger": {"type": "manual"}, "steps": []},
+        headers=_auth(user_token),
+    )
+    wf_id = create.json()["id"]
+
+    first = await client.post(f"/api/v1/workflows/{wf_id}/trigger", headers=_auth(user_token))
+    assert first.status_code == 202
+    second = await client.post(f"/api/v1/workflows/{wf_id}/trigger", headers=_auth(user_token))
+    assert second.status_code == 429
+    assert second.headers["retry-after"] == "60"
+
+
+@pytest.mark.asyncio
+async def test_worker_serves_accounts_round_robin(
+    db_session: AsyncSession,
+    account: AccountModel,
+    other_account: AccountModel,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A tenant with a large backlog does not starve another tenant."""
+    from snackbase.core.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "workflow_worker_concurrency", 2)
+    monkeypatch.setattr(settings, "workflow_max_concurrent_per_workflow", 10)
+
+    busy_wf_id = (await _queue_runs(db_session, account.id, 5)).id
+    quiet_wf_id = (await _queue_runs(db_session, other_account.id, 1)).id
+
+    assert await _drain_workflow_queue() == 2
+    assert await _instance_statuses(db_session, busy_wf_id) == ["completed"] + ["pending"] * 4
+    assert await _instance_statuses(db_session, quiet_wf_id) == ["completed"]
+
+
+@pytest.mark.asyncio
+async def test_worker_enforces_per_account_cap(
+    db_session: AsyncSession,
+    account: AccountModel,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from snackbase.core.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "workflow_max_concurrent_per_account", 2)
+    monkeypatch.setattr(settings, "workflow_max_concurrent_per_workflow", 10)
+
+    wf = await _queue_runs(db_session, account.id, 4)
+
+    assert await _drain_workflow_queue() == 2
+    assert await _instance_statuses(db_session, wf.id) == ["completed"] * 2 + ["pending"] * 2
+
+
+@pytest.mark.asyncio
+async def test_worker_defers_run_over_per_workflow_cap(
+    db_session: AsyncSession,
+    account: AccountModel,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A run over the per-workflow cap goes back to the queue without an attempt."""
+    from snackbase.core.config import get_settings
+    from snackbase.infrastructure.persistence.models.job import JobModel
+
+    monkeypatch.setattr(get_settings(), "workflow_max_concurrent_per_workflow", 1)
+
+    wf = await _queue_runs(db_session, account.id, 1)
+    wf_id = wf.id
+    account_id = account.id
+    # Simulate another worker already running an instance of this workflow
+    db_session.add(
+        JobModel(
+            queue="workflows",
+            handler="workflow_run",
+            payload={"instance_id": "elsewhere", "workflow_id": wf_id},
+            status="running",
+            account_id="someone-else",
+        )
+    )
+    await db_session.commit()
+
+    assert await _drain_workflow_queue() == 0
+
+    db_session.expire_all()
+    job = (
+        await db_session.execute(
+            select(JobModel).where(
+                JobModel.account_id == account_id, JobModel.handler == "workflow_run"
+            )
+        )
+    ).scalar_one()
+    assert job.status == "pending"
+    assert job.attempt_number == 0
+    assert job.run_at is not None
+    assert await _instance_statuses(db_session, wf_id) == ["pending"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_step_branches_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No more than workflow_max_parallel_branches branches run at once."""
+    from snackbase.core.config import get_settings
+    from snackbase.infrastructure.workflows import workflow_executor
+
+    monkeypatch.setattr(get_settings(), "workflow_max_parallel_branches", 2)
+
+    active = 0
+    peak = 0
+
+    async def _fake_inline(*_args, **_kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {}
+
+    monkeypatch.setattr(workflow_executor, "_execute_single_step_inline", _fake_inline)
+
+    step = {"name": "fan_out", "type": "parallel", "branches": [["a"]] * 6}
+    workflow_steps = {"a": {"name": "a", "type": "condition"}}
+    result = await workflow_executor._execute_parallel_step(
+        step, {}, "acc", workflow_steps, "inst", None
+    )
+
+    assert len(result["branch_results"]) == 6
+    assert peak == 2
+
+
 # ---------------------------------------------------------------------------
 # STEP EXECUTION — unit-level tests via workflow_executor directly
 # ---------------------------------------------------------------------------
@@ -1289,7 +1504,7 @@ async def test_executor_context_accumulates_step_outputs(
     db_session: AsyncSession,
     account: AccountModel,
 ) -> None:
-    """After executing a step the instance context must include that step's output."""
+    """Step outputs are persisted to the step log, not rewritten into the instance row."""
     from snackbase.infrastructure.persistence.database import get_db_manager
     from snackbase.infrastructure.workflows.workflow_executor import run_instance
 
@@ -1327,8 +1542,16 @@ async def test_executor_context_accumulates_step_outputs(
     await run_instance(inst.id, db_manager.session)
 
     await db_session.refresh(inst)
-    assert "branch" in inst.context["steps"]
-    assert inst.context["steps"]["branch"]["output"]["result"] is True
+    assert inst.status == "completed"
+    assert inst.current_step == "branch"
+    assert inst.context == {"trigger": {"flag": True}, "steps": {}}
+
+    from snackbase.infrastructure.persistence.repositories.workflow_step_log_repository import (
+        WorkflowStepLogRepository,
+    )
+
+    outputs = await WorkflowStepLogRepository(db_session).get_step_outputs(inst.id)
+    assert outputs["branch"]["output"]["result"] is True
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +116,7 @@ async def test_tenant_isolation_with_filter(
     headers = {"Authorization": f"Bearer {regular_user_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'status = "active"'},
+        params={"filter": 'status = "active"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -147,7 +147,7 @@ async def test_filter_account_id_cannot_bypass_tenant_isolation(
     headers = {"Authorization": f"Bearer {regular_user_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": f'account_id = "{superadmin_account_id}"'},
+        params={"filter": f'account_id = "{superadmin_account_id}"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -178,7 +178,7 @@ async def test_filter_cannot_read_other_tenants_secrets(
     headers = {"Authorization": f"Bearer {regular_user_token}"}
     resp = await client.get(
         f"/api/v1/records/{COLLECTION}",
-        params={"filter": 'secret = "admin_secret"'},
+        params={"filter": 'secret = "admin_secret"', "include_count": True},
         headers=headers,
     )
     assert resp.status_code == 200
@@ -41,7 +41,7 @@ async def test_register_success(mock_session):
          patch("snackbase.infrastructure.api.routes.auth_router.RoleRepository") as MockRoleRepo, \
          patch("snackbase.infrastructure.api.routes.auth_router.RefreshTokenRepository") as MockRefreshTokenRepo, \
          patch("snackbase.infrastructure.api.routes.auth_router.jwt_service") as mock_jwt_service, \
-         patch("snackbase.infrastructure.api.routes.auth_router.hash_password") as mock_hash:
+         patch("snackbase.infrastructure.api.routes.auth_router.hash_password_async") as mock_hash:
 
         # Setup mocks
         mock_account_repo = MockAccountRepo.return_value
@@ -79,12 +79,10 @@ async def test_register_success(mock_session):
 @patch("snackbase.infrastructure.api.routes.auth_router.RoleRepository")
 @patch("snackbase.infrastructure.api.routes.auth_router.RefreshTokenRepository")
 @patch("snackbase.infrastructure.api.routes.auth_router.jwt_service")
-@patch("snackbase.infrastructure.api.routes.auth_router.hash_password")
-@patch("snackbase.infrastructure.api.routes.auth_router.AccountCodeGenerator")
+@patch("snackbase.infrastructure.api.routes.auth_router.hash_password_async")
 @patch("snackbase.infrastructure.api.routes.auth_router.GroupRepository")
 def test_register_endpoint_success(
     mock_group_repo,
-    mock_id_gen,
     mock_hash,
     mock_jwt,
     mock_refresh_repo,
@@ -108,7 +106,7 @@ def test_register_endpoint_success(
     
     account_repo_instance = mock_account_repo.return_value
     account_repo_instance.slug_exists = AsyncMock(return_value=False)
-    account_repo_instance.get_all_account_codes = AsyncMock(return_value=[])
+    account_repo_instance.allocate_account_code = AsyncMock(return_value="XY1234")
     account_repo_instance.create = AsyncMock()
     
     role_repo_instance = mock_role_repo.return_value
@@ -129,7 +127,6 @@ def test_register_endpoint_success(
     group_repo_instance.add_user = AsyncMock()
     
     mock_hash.return_value = "hashed_password"
-    mock_id_gen.generate.return_value = "XY1234"
     
     mock_jwt.create_access_token.return_value = "fake_access_token"
     mock_jwt.create_refresh_token.return_value = ("fake_refresh_token", "fake_token_id")
@@ -252,7 +249,7 @@ def test_register_slug_conflict(mock_account_repo, mock_validator, mock_get_sett
 from datetime import datetime, timezone
 
 @patch("snackbase.infrastructure.api.routes.auth_router.get_settings")
-@patch("snackbase.infrastructure.api.routes.auth_router.verify_password")
+@patch("snackbase.infrastructure.api.routes.auth_router.verify_password_async")
 @patch("snackbase.infrastructure.api.routes.auth_router.jwt_service")
 @patch("snackbase.infrastructure.api.routes.auth_router.RefreshTokenRepository")
 @patch("snackbase.infrastructure.api.routes.auth_router.RoleRepository")
@@ -404,7 +401,7 @@ def test_login_user_not_found(mock_account_repo, mock_user_repo, mock_get_settin
 
 
 @patch("snackbase.infrastructure.api.routes.auth_router.get_settings")
-@patch("snackbase.infrastructure.api.routes.auth_router.verify_password")
+@patch("snackbase.infrastructure.api.routes.auth_router.verify_password_async")
 @patch("snackbase.infrastructure.api.routes.auth_router.UserRepository")
 @patch("snackbase.infrastructure.api.routes.auth_router.AccountRepository")
 def test_login_invalid_password(mock_account_repo, mock_user_repo, mock_verify, mock_get_settings, client):
@@ -447,7 +444,7 @@ def test_login_invalid_password(mock_account_repo, mock_user_repo, mock_verify,
 
 
 @patch("snackbase.infrastructure.api.routes.auth_router.get_settings")
-@patch("snackbase.infrastructure.api.routes.auth_router.verify_password")
+@patch("snackbase.infrastructure.api.routes.auth_router.verify_password_async")
 @patch("snackbase.infrastructure.api.routes.auth_router.UserRepository")
 @patch("snackbase.infrastructure.api.routes.auth_router.AccountRepository")
 def test_login_inactive_user(mock_account_repo, mock_user_repo, mock_verify, mock_get_settings, client):
@@ -487,7 +484,7 @@ def test_login_inactive_user(mock_account_repo, mock_user_repo, mock_verify, moc
     app.dependency_overrides = {}
 
 @patch("snackbase.infrastructure.api.routes.auth_router.get_settings")
-@patch("snackbase.infrastructure.api.routes.auth_router.verify_password")
+@patch("snackbase.infrastructure.api.routes.auth_router.verify_password_async")
 @patch("snackbase.infrastructure.api.routes.auth_router.jwt_service")
 @patch("snackbase.infrastructure.api.routes.auth_router.RefreshTokenRepository")
 @patch("snackbase.infrastructure.api.routes.auth_router.RoleRepository")
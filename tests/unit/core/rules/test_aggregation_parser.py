@@ -8,6 +8,7 @@ from snackbase.core.rules.aggregation_parser import (
     parse_agg_functions,
     parse_having,
     validate_group_by,
+    validate_rollup_definition,
 )
 
 
@@ -304,3 +305,30 @@ def test_having_multiple_params_unique_keys(alias_to_sql):
     assert "hp_0" in params
     assert "hp_1" in params
     assert params["hp_0"] != params["hp_1"] or True  # keys must be distinct
+
+
+# ── validate_rollup_definition ────────────────────────────────────────────────
+
+
+def test_rollup_definition_valid(schema_lookup):
+    validate_rollup_definition(["status", "is_active", "created_by"], ["price"], schema_lookup)
+
+
+def test_rollup_group_by_datetime_raises(schema_lookup):
+    with pytest.raises(AggregationParseError, match="cannot group by"):
+        validate_rollup_definition(["event_time"], [], schema_lookup)
+
+
+def test_rollup_sum_field_must_be_number(schema_lookup):
+    with pytest.raises(AggregationParseError, match="must be a number field"):
+        validate_rollup_definition(["status"], ["category"], schema_lookup)
+
+
+def test_rollup_unknown_field_raises(schema_lookup):
+    with pytest.raises(AggregationParseError, match="not found"):
+        validate_rollup_definition(["nonexistent"], [], schema_lookup)
+
+
+def test_rollup_duplicate_fields_raise(schema_lookup):
+    with pytest.raises(AggregationParseError, match="duplicates"):
+        validate_rollup_definition(["status", "status"], [], schema_lookup)
@@ -0,0 +1,98 @@
+"""Unit tests for signed pagination cursors."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from snackbase.core.cursor import (
+    CursorError,
+    CursorScope,
+    SyncWatermark,
+    decode_cursor,
+    decode_watermark,
+    encode_cursor,
+    encode_watermark,
+    schema_version,
+)
+
+SCHEMA = [{"name": "title", "type": "text"}, {"name": "price", "type": "number"}]
+SCOPE = CursorScope("created_at", True, schema_version(SCHEMA))
+SECRET = "test-secret"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2026, 10, 18, 12, 30, 5, 123456, tzinfo=UTC),
+        "2026-10-18 12:30:05.123456",
+        42,
+        9.75,
+        Decimal("19.990"),
+        True,
+        None,
+    ],
+)
+def test_round_trip_preserves_type(value):
+    cursor = encode_cursor(value, "rec-1", SCOPE, SECRET)
+
+    decoded, record_id = decode_cursor(cursor, SCOPE, SECRET)
+
+    assert record_id == "rec-1"
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_tampered_cursor_is_rejected():
+    cursor = encode_cursor(10, "rec-1", SCOPE, SECRET)
+    forged = encode_cursor(10, "rec-2", SCOPE, "other-secret")
+    payload, _, signature = cursor.partition(".")
+
+    with pytest.raises(CursorError, match="signature"):
+        decode_cursor(f"{forged.partition('.')[0]}.{signature}", SCOPE, SECRET)
+    with pytest.raises(CursorError, match="signature"):
+        decode_cursor(forged, SCOPE, SECRET)
+    with pytest.raises(CursorError, match="format"):
+        decode_cursor(payload, SCOPE, SECRET)
+
+
+def test_cursor_is_bound_to_sort_and_schema():
+    cursor = encode_cursor("x", "rec-1", SCOPE, SECRET)
+
+    with pytest.raises(CursorError, match="different sort"):
+        decode_cursor(cursor, CursorScope("created_at", False, SCOPE.schema_version), SECRET)
+    with pytest.raises(CursorError, match="different sort"):
+        decode_cursor(cursor, CursorScope("title", True, SCOPE.schema_version), SECRET)
+
+    changed = schema_version([*SCHEMA, {"name": "stock", "type": "number"}])
+    with pytest.raises(CursorError, match="different collection schema"):
+        decode_cursor(cursor, CursorScope("created_at", True, changed), SECRET)
+
+
+@pytest.mark.parametrize(
+    "snapshot_after",
+    [None, ("2026-10-18 12:30:05.123456", "rec-1"), (datetime(2026, 10, 18, tzinfo=UTC), "r")],
+)
+def test_watermark_round_trip(snapshot_after):
+    watermark = SyncWatermark(
+        collection_id="col-1",
+        account_id=None,
+        seq=42,
+        issued_at=datetime(2026, 10, 19, 8, 0, tzinfo=UTC),
+        snapshot_after=snapshot_after,
+    )
+
+    assert decode_watermark(encode_watermark(watermark, SECRET), SECRET) == watermark
+
+
+def test_cursor_and_watermark_are_not_interchangeable():
+    watermark = SyncWatermark("col-1", "acc-1", 7, datetime(2026, 10, 19, tzinfo=UTC))
+    token = encode_watermark(watermark, SECRET)
+    cursor = encode_cursor(10, "rec-1", SCOPE, SECRET)
+
+    with pytest.raises(CursorError, match="signature"):
+        decode_watermark(cursor, SECRET)
+    with pytest.raises(CursorError, match="signature"):
+        decode_cursor(token, SCOPE, SECRET)
+    with pytest.raises(CursorError, match="signature"):
+        decode_watermark(token, "other-secret")
@@ -0,0 +1,69 @@
+"""Unit tests for the in-process Prometheus metrics registry."""
+
+import pytest
+
+from snackbase.core.metrics import MetricsRegistry
+
+
+@pytest.mark.asyncio
+async def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "test_duration_seconds", "Test latency.", ("route",), buckets=(0.1, 1.0)
+    )
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(5.0, route="/a")
+
+    body = await registry.render()
+
+    assert "# TYPE test_duration_seconds histogram" in body
+    assert 'test_duration_seconds_bucket{route="/a",le="0.1"} 1' in body
+    assert 'test_duration_seconds_bucket{route="/a",le="1"} 2' in body
+    assert 'test_duration_seconds_bucket{route="/a",le="+Inf"} 3' in body
+    assert 'test_duration_seconds_sum{route="/a"} 5.55' in body
+    assert 'test_duration_seconds_count{route="/a"} 3' in body
+    assert histogram.count(route="/a") == 3
+
+
+@pytest.mark.asyncio
+async def test_counter_and_label_escaping():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter.", ("name",))
+    counter.inc(name='a"b')
+    counter.inc(2, name='a"b')
+
+    body = await registry.render()
+
+    assert 'test_total{name="a\\"b"} 3' in body
+    assert counter.value(name='a"b') == 3
+
+
+@pytest.mark.asyncio
+async def test_gauges_come_from_collectors():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("test_queue_depth", "Test gauge.", ("queue",))
+
+    async def collect():
+        return [(gauge.name, {"queue": "default"}, 4)]
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    registry.register_collector("queues", collect)
+    registry.register_collector("broken", broken)
+
+    body = await registry.render()
+
+    assert "# TYPE test_queue_depth gauge" in body
+    assert 'test_queue_depth{queue="default"} 4' in body
+
+
+def test_labels_must_match_declaration():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_labels_total", "Test counter.", ("a",))
+
+    with pytest.raises(ValueError):
+        counter.inc(b="x")
+    with pytest.raises(ValueError):
+        registry.counter("test_labels_total", "Duplicate.")
@@ -21,6 +21,7 @@ def account_service(mock_session):
     service = AccountService(mock_session)
     # Mock the internal repository instance directly
     service.account_repo = AsyncMock()
+    service.account_repo.allocate_account_code.return_value = "AA0001"
     return service
 
 
@@ -1,11 +1,12 @@
 """Unit tests for DashboardService."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from snackbase.domain.services import DashboardService
+from snackbase.domain.services.dashboard_service import measure_storage_bytes
 from snackbase.infrastructure.api.schemas import DashboardStats
 
 
@@ -24,8 +25,14 @@ def dashboard_service(mock_session):
 @pytest.mark.asyncio
 async def test_get_dashboard_stats_with_data(dashboard_service, mock_session):
     """Test get_dashboard_stats returns correct data when data exists."""
+    updated_at = datetime.now(UTC)
+    stats = {
+        "records:posts": MagicMock(value=100, updated_at=updated_at, reconciled_at=None),
+    }
     # Mock repository responses
     with patch.object(
+        dashboard_service.stat_repo, "get_all", return_value=stats
+    ), patch.object(
         dashboard_service.account_repo, "count_all", return_value=5
     ), patch.object(
         dashboard_service.account_repo, "count_created_since", return_value=2
@@ -90,6 +97,8 @@ async def test_get_dashboard_stats_with_data(dashboard_service, mock_session):
         assert result.system_health.database_status == "connected"
         assert result.system_health.storage_usage_mb == 10.5
         assert result.recent_audit_logs == []
+        assert result.stats_updated_at == updated_at
+        assert result.stats_reconciled_at is None
 
 
 @pytest.mark.asyncio
@@ -97,6 +106,8 @@ async def test_get_dashboard_stats_empty_database(dashboard_service):
     """Test get_dashboard_stats with empty database."""
     # Mock all counts as zero
     with patch.object(
+        dashboard_service.stat_repo, "get_all", return_value={}
+    ), patch.object(
         dashboard_service.account_repo, "count_all", return_value=0
     ), patch.object(
         dashboard_service.account_repo, "count_created_since", return_value=0
@@ -158,11 +169,35 @@ async def test_count_total_records_multiple_collections(dashboard_service, mock_
     ]
     mock_session.execute.side_effect = [mock_result] + count_results
 
-    # Execute
-    total = await dashboard_service._count_total_records()
+    # Execute (no counters yet: tables are counted once and counters seeded)
+    with patch.object(dashboard_service.stat_repo, "set_value") as mock_set_value:
+        total = await dashboard_service._count_total_records({})
 
     # Verify
     assert total == 85  # 10 + 25 + 50
+    assert mock_set_value.await_count == 3
+    mock_set_value.assert_any_await("records:posts", 25)
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_count_total_records_uses_maintained_counters(dashboard_service, mock_session):
+    """Test _count_total_records reads counters instead of scanning tables."""
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [("users",), ("posts",)]
+    mock_session.execute.side_effect = [mock_result]
+
+    stats = {
+        "records:users": MagicMock(value=10),
+        "records:posts": MagicMock(value=25),
+        "records:deleted": MagicMock(value=99),
+    }
+    total = await dashboard_service._count_total_records(stats)
+
+    # Only the collections query ran; stale counters are ignored
+    assert total == 35
+    assert mock_session.execute.await_count == 1
+    mock_session.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -182,10 +217,12 @@ async def test_count_total_records_handles_errors(dashboard_service, mock_sessio
     ]
 
     # Execute
-    total = await dashboard_service._count_total_records()
+    with patch.object(dashboard_service.stat_repo, "set_value") as mock_set_value:
+        total = await dashboard_service._count_total_records({})
 
-    # Verify - should only count the successful table
+    # Verify - should only count (and seed) the successful table
     assert total == 10
+    mock_set_value.assert_awaited_once_with("records:users", 10)
 
 
 @pytest.mark.asyncio
@@ -218,8 +255,8 @@ async def test_get_system_health_database_disconnected(dashboard_service, mock_s
         assert health.storage_usage_mb == 0.0
 
 
-def test_get_storage_usage_with_files(dashboard_service):
-    """Test _get_storage_usage calculates file sizes correctly."""
+def test_measure_storage_bytes_with_files():
+    """Test measure_storage_bytes sums file sizes correctly."""
     with patch("snackbase.domain.services.dashboard_service.Path") as mock_path, patch(
         "snackbase.domain.services.dashboard_service.os.walk"
     ) as mock_walk, patch(
@@ -240,20 +277,66 @@ def test_get_storage_usage_with_files(dashboard_service):
         mock_getsize.side_effect = [1024, 2048, 512]  # 1KB, 2KB, 0.5KB
 
         # Execute
-        usage_mb = dashboard_service._get_storage_usage()
+        total = measure_storage_bytes("/storage")
 
-        # Verify - (1024 + 2048 + 512) / (1024 * 1024) = 0.0034 MB
-        assert usage_mb == 0.0
+        # Verify
+        assert total == 3584
 
 
-def test_get_storage_usage_no_storage_path(dashboard_service):
-    """Test _get_storage_usage returns 0 when storage path doesn't exist."""
+def test_measure_storage_bytes_no_storage_path():
+    """Test measure_storage_bytes returns 0 when storage path doesn't exist."""
     with patch("snackbase.domain.services.dashboard_service.Path") as mock_path:
         # Mock storage path doesn't exist
         mock_path.return_value.exists.return_value = False
 
-        # Execute
-        usage_mb = dashboard_service._get_storage_usage()
+        assert measure_storage_bytes("/missing") == 0
 
-        # Verify
-        assert usage_mb == 0.0
+
+@pytest.mark.asyncio
+async def test_get_storage_usage_uses_counter(dashboard_service):
+    """Test _get_storage_usage serves the maintained counter without walking storage."""
+    with patch(
+        "snackbase.domain.services.dashboard_service.measure_storage_bytes"
+    ) as mock_measure:
+        usage_mb = await dashboard_service._get_storage_usage(
+            {"storage_bytes": MagicMock(value=5 * 1024 * 1024)}
+        )
+
+    assert usage_mb == 5.0
+    mock_measure.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_storage_usage_seeds_missing_counter(dashboard_service, mock_session):
+    """Test _get_storage_usage measures once and seeds the counter when missing."""
+    with patch(
+        "snackbase.domain.services.dashboard_service.measure_storage_bytes",
+        return_value=2 * 1024 * 1024,
+    ), patch.object(dashboard_service.stat_repo, "set_value") as mock_set_value:
+        usage_mb = await dashboard_service._get_storage_usage({})
+
+    assert usage_mb == 2.0
+    mock_set_value.assert_awaited_once_with("storage_bytes", 2 * 1024 * 1024)
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_stats(dashboard_service, mock_session):
+    """Test reconcile_stats recounts tables, storage, and drops stale counters."""
+    collections = MagicMock()
+    collections.fetchall.return_value = [("posts",)]
+    mock_session.execute.side_effect = [collections, MagicMock(scalar_one=lambda: 7)]
+
+    with patch(
+        "snackbase.domain.services.dashboard_service.measure_storage_bytes", return_value=42
+    ), patch.object(dashboard_service.stat_repo, "set_value") as mock_set_value, patch.object(
+        dashboard_service.stat_repo,
+        "get_all",
+        return_value={"records:posts": MagicMock(), "records:gone": MagicMock()},
+    ), patch.object(dashboard_service.stat_repo, "delete_keys") as mock_delete_keys:
+        await dashboard_service.reconcile_stats()
+
+    mock_set_value.assert_any_await("records:posts", 7)
+    mock_set_value.assert_any_await("storage_bytes", 42)
+    mock_delete_keys.assert_awaited_once_with(["records:gone"])
+    mock_session.commit.assert_awaited_once()
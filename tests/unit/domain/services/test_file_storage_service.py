@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+from snackbase.domain.services import file_storage_service
 from snackbase.domain.services.file_storage_service import FileMetadata, FileStorageService
 
 
@@ -223,6 +224,47 @@ class TestFileStorageService:
                 size=4,
             )
 
+    @pytest.mark.asyncio
+    async def test_save_stream_writes_chunks(self, storage_service, temp_storage_path):
+        """Test that save_stream writes every chunk and reports the streamed size."""
+        account_id = "test-account-123"
+
+        async def chunks():
+            for part in (b"alpha-", b"beta-", b"gamma"):
+                yield part
+
+        metadata = await storage_service.save_stream(
+            account_id=account_id,
+            chunks=chunks(),
+            filename="stream.txt",
+            mime_type="text/plain",
+        )
+
+        assert metadata.size == len(b"alpha-beta-gamma")
+        assert (Path(temp_storage_path) / metadata.path).read_bytes() == b"alpha-beta-gamma"
+
+    @pytest.mark.asyncio
+    async def test_save_stream_removes_partial_file_over_limit(
+        self, storage_service, temp_storage_path, monkeypatch
+    ):
+        """Test that exceeding the size limit mid-stream leaves no file behind."""
+        monkeypatch.setattr(file_storage_service.settings, "max_file_size", 10)
+        account_id = "test-account-123"
+
+        async def chunks():
+            yield b"x" * 8
+            yield b"x" * 8
+
+        with pytest.raises(ValueError, match="File size.*exceeds maximum"):
+            await storage_service.save_stream(
+                account_id=account_id,
+                chunks=chunks(),
+                filename="big.txt",
+                mime_type="text/plain",
+            )
+
+        assert list((Path(temp_storage_path) / account_id).iterdir()) == []
+
     @pytest.mark.asyncio
     async def test_get_file_path_success(self, storage_service, temp_storage_path):
         """Test getting file path for existing file."""
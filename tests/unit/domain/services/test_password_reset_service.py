@@ -150,7 +150,7 @@ async def test_reset_password_success(
     mock_refresh_token_repo.revoke_all_for_user.return_value = 2
 
     # Execute
-    with patch("snackbase.domain.services.password_reset_service.hash_password") as mock_hash:
+    with patch("snackbase.domain.services.password_reset_service.hash_password_async") as mock_hash:
         mock_hash.return_value = "new-hashed-password"
         result = await reset_service.reset_password(token_plain, new_password)
 
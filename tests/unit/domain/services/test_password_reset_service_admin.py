@@ -93,7 +93,7 @@ async def test_set_password_by_admin_success(
     mock_user_repo.get_by_id.return_value = user_model
 
     # Execute
-    with patch("snackbase.domain.services.password_reset_service.hash_password") as mock_hash:
+    with patch("snackbase.domain.services.password_reset_service.hash_password_async") as mock_hash:
         mock_hash.return_value = "new-hashed-password"
         result = await reset_service.set_password_by_admin(user_id, new_password)
 
@@ -184,6 +184,15 @@ class TestPIIMaskingService:
         result = PIIMaskingService.mask_value("data", "unknown")
         assert result == "data"
 
+    def test_masker_for_matches_mask_value(self):
+        """Test masker_for resolves the same function mask_value dispatches to."""
+        for mask_type in ("email", "ssn", "phone", "name", "full", "custom", "EMAIL"):
+            masker = PIIMaskingService.masker_for(mask_type)
+            assert masker("john@example.com") == PIIMaskingService.mask_value(
+                "john@example.com", mask_type
+            )
+        assert PIIMaskingService.masker_for("unknown") is None
+
     def test_mask_value_none(self):
         """Test mask_value with None returns None."""
         result = PIIMaskingService.mask_value(None, "email")
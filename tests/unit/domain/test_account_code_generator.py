@@ -370,3 +370,40 @@ class TestSortingAndComparison:
         existing = {"invalid", "AB12", "12345"}
         highest = AccountCodeGenerator._find_highest_code(existing)
         assert highest == "AA0000"
+
+
+class TestSequenceMapping:
+    """Test constant-time mapping between sequence numbers and codes."""
+
+    def test_sequence_matches_generate_order(self):
+        """Sequence numbers enumerate codes in the order generate() yields them."""
+        existing: list[str] = []
+        for value in range(1, 50):
+            expected = AccountCodeGenerator.generate(existing[-1:])
+            assert AccountCodeGenerator.from_sequence(value) == expected
+            assert AccountCodeGenerator.to_sequence(expected) == value
+            existing.append(expected)
+
+    def test_pair_overflow(self):
+        """AA9999 is followed by AB0000."""
+        value = AccountCodeGenerator.to_sequence("AA9999")
+        assert AccountCodeGenerator.from_sequence(value + 1) == "AB0000"
+
+    def test_sy_block_skipped(self):
+        """SX9999 is followed by SZ0000."""
+        value = AccountCodeGenerator.to_sequence("SX9999")
+        assert AccountCodeGenerator.from_sequence(value + 1) == "SZ0000"
+        assert AccountCodeGenerator.to_sequence("SZ0000") == value + 1
+
+        with pytest.raises(ValueError):
+            AccountCodeGenerator.to_sequence("SY0001")
+
+    def test_bounds(self):
+        """The last sequence number maps to ZZ9999; beyond it is exhausted."""
+        assert AccountCodeGenerator.from_sequence(AccountCodeGenerator.MAX_SEQUENCE) == "ZZ9999"
+        assert AccountCodeGenerator.MAX_SEQUENCE == 6_750_000 - 1
+
+        with pytest.raises(AccountCodeExhaustedError):
+            AccountCodeGenerator.from_sequence(AccountCodeGenerator.MAX_SEQUENCE + 1)
+        with pytest.raises(ValueError):
+            AccountCodeGenerator.from_sequence(0)
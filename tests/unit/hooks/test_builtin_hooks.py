@@ -1,5 +1,7 @@
 """Unit tests for built-in hooks."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from snackbase.core.hooks import HookEvent, HookRegistry
@@ -7,6 +9,7 @@ from snackbase.domain.entities.hook_context import HookContext
 from snackbase.infrastructure.hooks import (
     account_isolation_hook,
     created_by_hook,
+    record_count_hook,
     register_builtin_hooks,
     timestamp_hook,
 )
@@ -189,6 +192,45 @@ class TestCreatedByHook:
         assert "created_by" not in result
 
 
+class TestRecordCountHook:
+    """Tests for the record_count_hook."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("event", "delta"),
+        [(HookEvent.ON_RECORD_AFTER_CREATE, 1), (HookEvent.ON_RECORD_AFTER_DELETE, -1)],
+    )
+    async def test_adjusts_collection_counter(self, event: str, delta: int) -> None:
+        """Test that creates and deletes queue an adjustment of the collection's counter."""
+        session = SimpleNamespace(info={})
+        result = await record_count_hook(
+            event=event,
+            data={"record": {"id": "r1"}, "collection": "posts", "session": session},
+            context=None,
+        )
+
+        assert session.info["snackbase_dashboard_stat_deltas"] == {"records:posts": delta}
+        assert result["collection"] == "posts"
+
+    @pytest.mark.asyncio
+    async def test_writes_in_one_transaction_share_one_adjustment(self) -> None:
+        """Test that deltas of the same transaction are summed per counter."""
+        session = SimpleNamespace(info={})
+        for _ in range(3):
+            await record_count_hook(
+                event=HookEvent.ON_RECORD_AFTER_CREATE,
+                data={"collection": "posts", "session": session},
+                context=None,
+            )
+        await record_count_hook(
+            event=HookEvent.ON_RECORD_AFTER_DELETE,
+            data={"collection": "posts", "session": session},
+            context=None,
+        )
+
+        assert session.info["snackbase_dashboard_stat_deltas"] == {"records:posts": 2}
+
+
 class TestRegisterBuiltinHooks:
     """Tests for the register_builtin_hooks function."""
 
@@ -197,8 +239,8 @@ class TestRegisterBuiltinHooks:
         registry = HookRegistry()
         hook_ids = register_builtin_hooks(registry)
 
-        # 2 timestamp + 1 account + 2 created_by + 3 audit capture
-        assert len(hook_ids) == 8
+        # 2 timestamp + 1 account + 2 created_by + 3 audit capture + 2 record count
+        assert len(hook_ids) == 10
 
     def test_builtin_hooks_cannot_be_unregistered(self) -> None:
         """Test that built-in hooks cannot be unregistered."""
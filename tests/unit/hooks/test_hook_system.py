@@ -240,6 +240,23 @@ class TestHookRegistryTrigger:
         assert result.data["original"] is True
         assert result.data["added_field"] is True
 
+    @pytest.mark.asyncio
+    async def test_trigger_records_hook_duration(self) -> None:
+        """Test that trigger() records chain execution time per event."""
+        from snackbase.core.metrics import HOOK_DURATION
+
+        registry = HookRegistry()
+
+        async def my_hook(event, data, context):
+            return data
+
+        registry.register(HookEvent.ON_RECORD_AFTER_UPDATE, my_hook)
+        before = HOOK_DURATION.count(event=HookEvent.ON_RECORD_AFTER_UPDATE)
+
+        await registry.trigger(event=HookEvent.ON_RECORD_AFTER_UPDATE, data={})
+
+        assert HOOK_DURATION.count(event=HookEvent.ON_RECORD_AFTER_UPDATE) == before + 1
+
 
 class TestHookRegistryFiltering:
     """Tests for tag-based filtering in hook trigger."""
@@ -0,0 +1,116 @@
+"""Unit tests for the shared rate limit backends."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from snackbase.infrastructure.api.middleware import rate_limit_backends
+from snackbase.infrastructure.api.middleware.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    SQLRateLimitBackend,
+    create_file_engine,
+)
+from snackbase.infrastructure.api.middleware.rate_limit_storage import RateLimitStorage
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(rate_limit_backends.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+async def workers(tmp_path, clock):
+    """Two backends with their own engines on one file, like two worker processes."""
+    path = str(tmp_path / "rate_limits.db")
+    backends = [
+        SQLRateLimitBackend(create_file_engine(path), create_table=True, dispose_engine=True)
+        for _ in range(2)
+    ]
+    yield backends
+    for backend in backends:
+        await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_uses_storage():
+    backend = MemoryRateLimitBackend(RateLimitStorage())
+
+    assert (await backend.consume("ip:a", 60, burst=1))[0] is True
+    assert (await backend.consume("ip:a", 60, burst=1))[0] is False
+
+
+@pytest.mark.asyncio
+async def test_workers_share_buckets(workers):
+    first, second = workers
+
+    assert await first.consume("ip:a", 60, burst=3) == (True, 2, 1.0)
+    assert await second.consume("ip:a", 60, burst=3) == (True, 1, 2.0)
+    assert (await first.consume("ip:a", 60, burst=3))[:2] == (True, 0)
+
+    allowed, remaining, retry_after = await second.consume("ip:a", 60, burst=3)
+    assert (allowed, remaining) == (False, 0)
+    assert retry_after == pytest.approx(1.0)
+
+    # Other keys have their own bucket
+    assert (await second.consume("ip:b", 60, burst=3))[0] is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_never_exceed_burst(workers):
+    results = await asyncio.gather(
+        *(workers[i % 2].consume("user:1", 60, burst=5) for i in range(20))
+    )
+
+    assert sum(allowed for allowed, _, _ in results) == 5
+
+
+@pytest.mark.asyncio
+async def test_tokens_refill_over_time(workers, clock):
+    first, second = workers
+    for _ in range(2):
+        await first.consume("ip:a", 60, burst=2)
+    assert (await second.consume("ip:a", 60, burst=2))[0] is False
+
+    clock[0] += 0.5
+    allowed, _, retry_after = await second.consume("ip:a", 60, burst=2)
+    assert allowed is False
+    assert retry_after == pytest.approx(0.5)
+
+    clock[0] += 0.5
+    assert (await second.consume("ip:a", 60, burst=2))[0] is True
+
+    # Refill is capped at the burst capacity
+    clock[0] += 3600
+    assert await first.consume("ip:a", 60, burst=2) == (True, 1, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_idle_buckets_are_deleted(workers, clock):
+    backend = workers[0]
+    backend.idle_seconds = 600
+    backend.cleanup_interval = 60
+    await backend.consume("ip:old", 60, burst=2)
+
+    clock[0] += 300
+    await backend.consume("ip:recent", 60, burst=2)
+
+    clock[0] += 400
+    await backend.consume("ip:new", 60, burst=2)
+
+    async with backend.engine.connect() as conn:
+        keys = (await conn.execute(text("SELECT key FROM rate_limit_buckets"))).scalars().all()
+    assert sorted(keys) == ["ip:new", "ip:recent"]
+
+
+@pytest.mark.asyncio
+async def test_backend_failure_allows_request():
+    engine = MagicMock()
+    engine.begin.side_effect = OperationalError("INSERT", {}, Exception("database is locked"))
+    backend = SQLRateLimitBackend(engine)
+
+    assert await backend.consume("ip:a", 60, burst=3) == (True, 2, 0.0)
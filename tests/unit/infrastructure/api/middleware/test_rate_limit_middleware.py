@@ -10,7 +10,10 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
 from snackbase.infrastructure.api.middleware.rate_limit_middleware import RateLimitMiddleware
-from snackbase.infrastructure.api.middleware.rate_limit_storage import RateLimitStorage
+from snackbase.infrastructure.api.middleware.rate_limit_storage import (
+    RateLimitStorage,
+    rate_limit_storage,
+)
 from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_ID
 from snackbase.domain.entities.hook_context import HookContext
 
@@ -49,7 +52,6 @@ def test_rate_limit_headers_present(mock_settings):
     """Verify rate limit headers are added to the response."""
     with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_settings", return_value=mock_settings):
         # Reset storage to ensures clean state
-        from snackbase.infrastructure.api.middleware.rate_limit_middleware import rate_limit_storage
         rate_limit_storage._storage = {}
         
         app = create_test_app()
@@ -70,7 +72,6 @@ def test_rate_limit_exceeded(mock_settings):
     mock_settings.rate_limit_burst = 1
     
     with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_settings", return_value=mock_settings):
-        from snackbase.infrastructure.api.middleware.rate_limit_middleware import rate_limit_storage
         rate_limit_storage._storage = {}
         
         app = create_test_app()
@@ -102,7 +103,6 @@ def test_superadmin_bypass(mock_settings):
     
     with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_settings", return_value=mock_settings):
         with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_current_context", return_value=mock_context):
-            from snackbase.infrastructure.api.middleware.rate_limit_middleware import rate_limit_storage
             rate_limit_storage._storage = {}
             
             app = create_test_app()
@@ -129,7 +129,6 @@ def test_user_based_limit(mock_settings):
     
     with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_settings", return_value=mock_settings):
         with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_current_context", return_value=mock_context):
-            from snackbase.infrastructure.api.middleware.rate_limit_middleware import rate_limit_storage
             rate_limit_storage._storage = {}
             
             app = create_test_app()
@@ -153,7 +152,6 @@ def test_rate_limit_disabled(mock_settings):
     mock_settings.rate_limit_burst = 1
     
     with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_settings", return_value=mock_settings):
-        from snackbase.infrastructure.api.middleware.rate_limit_middleware import rate_limit_storage
         rate_limit_storage._storage = {}
         
         app = create_test_app()
@@ -173,7 +171,6 @@ def test_endpoint_override(mock_settings):
     mock_settings.rate_limit_burst = 1
     
     with patch("snackbase.infrastructure.api.middleware.rate_limit_middleware.get_settings", return_value=mock_settings):
-        from snackbase.infrastructure.api.middleware.rate_limit_middleware import rate_limit_storage
         rate_limit_storage._storage = {}
         
         app = create_test_app()
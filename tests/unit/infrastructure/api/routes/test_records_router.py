@@ -14,7 +14,7 @@ from snackbase.infrastructure.api.routes.records_router import (
     update_record_partial,
     delete_record,
 )
-from snackbase.infrastructure.api.schemas import CursorListResponse, RecordValidationErrorDetail
+from snackbase.infrastructure.api.schemas import RecordValidationErrorDetail
 from snackbase.infrastructure.api.middleware import RuleFilter
 
 
@@ -23,6 +23,16 @@ def mock_session():
     return AsyncMock()
 
 
+@pytest.fixture(autouse=True)
+def mock_change_counters():
+    """Report an unchanged collection to the list ETag lookup."""
+    with patch(
+        "snackbase.infrastructure.api.routes.records_router.CollectionChangeCounterRepository"
+    ) as repo_cls:
+        repo_cls.return_value.get_state = AsyncMock(return_value=(0, None))
+        yield repo_cls
+
+
 @pytest.fixture
 def mock_user():
     user = MagicMock()
@@ -311,13 +321,13 @@ async def test_list_records_cursor_success(
         session=mock_session,
     )
 
-    assert isinstance(response, CursorListResponse)
-    assert response.next_cursor == next_cursor
-    assert response.prev_cursor == prev_cursor
-    assert response.has_more is False
-    assert response.total is None
-    assert len(response.items) == 2
-    assert response.items[0].title == "A"
+    body = json.loads(response.body)
+    assert body["next_cursor"] == next_cursor
+    assert body["prev_cursor"] == prev_cursor
+    assert body["has_more"] is False
+    assert body["total"] is None
+    assert len(body["items"]) == 2
+    assert body["items"][0]["title"] == "A"
 
 
 @patch("snackbase.infrastructure.api.routes.records_router.decode_cursor")
@@ -379,9 +389,9 @@ async def test_list_records_cursor_with_count(
         session=mock_session,
     )
 
-    assert isinstance(response, CursorListResponse)
-    assert response.total == 150
-    assert len(response.items) == 1
+    body = json.loads(response.body)
+    assert body["total"] == 150
+    assert len(body["items"]) == 1
 @patch("snackbase.infrastructure.api.routes.records_router.check_collection_permission")
 @patch("snackbase.infrastructure.api.routes.records_router.CollectionRepository")
 @pytest.mark.asyncio
@@ -453,8 +463,9 @@ async def test_get_record_success(
 
     response = await get_record("posts", "rec-1", mock_user, mock_auth_context, mock_session)
 
-    assert response.id == "rec-1"
-    assert response.title == "My Post"
+    body = json.loads(response.body)
+    assert body["id"] == "rec-1"
+    assert body["title"] == "My Post"
 
 
 @patch("snackbase.infrastructure.api.routes.records_router.check_collection_permission")
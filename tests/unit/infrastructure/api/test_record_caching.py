@@ -0,0 +1,80 @@
+"""Unit tests for conditional GET helpers of record endpoints."""
+
+from datetime import UTC, datetime
+
+from starlette.requests import Request
+
+from snackbase.infrastructure.api.record_caching import (
+    as_utc,
+    cache_headers,
+    etag_matches,
+    list_etag,
+    not_modified_since,
+    record_etag,
+)
+
+UPDATED_AT = datetime(2026, 10, 18, 12, 30, 5, 250000, tzinfo=UTC)
+
+
+def make_request(**headers: str) -> Request:
+    raw = [(k.replace("_", "-").lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_etags_change_with_data_and_variant():
+    etag = record_etag("rec-1", "2026-10-18T12:30:05", ["col-1", "schema-a"])
+
+    assert etag.startswith('"')
+    assert etag == record_etag("rec-1", "2026-10-18T12:30:05", ["col-1", "schema-a"])
+    assert etag != record_etag("rec-1", "2026-10-18T12:30:06", ["col-1", "schema-a"])
+    assert etag != record_etag("rec-1", "2026-10-18T12:30:05", ["col-1", "schema-b"])
+
+    weak = list_etag(3, ["col-1"])
+    assert weak.startswith('W/"')
+    assert weak != list_etag(4, ["col-1"])
+
+
+def test_if_none_match_uses_weak_comparison():
+    weak = list_etag(3, ["col-1"])
+    opaque = weak.removeprefix("W/")
+
+    assert etag_matches(make_request(if_none_match=weak), weak)
+    assert etag_matches(make_request(if_none_match=f'"other", {opaque}'), weak)
+    assert etag_matches(make_request(if_none_match="*"), weak)
+    assert not etag_matches(make_request(if_none_match='"other"'), weak)
+    assert not etag_matches(make_request(), weak)
+
+
+def test_if_modified_since_has_second_precision():
+    assert not_modified_since(
+        make_request(if_modified_since="Sun, 18 Oct 2026 12:30:05 GMT"), UPDATED_AT
+    )
+    assert not not_modified_since(
+        make_request(if_modified_since="Sun, 18 Oct 2026 12:30:04 GMT"), UPDATED_AT
+    )
+    # If-None-Match takes precedence over If-Modified-Since
+    assert not not_modified_since(
+        make_request(
+            if_modified_since="Sun, 18 Oct 2026 12:30:05 GMT", if_none_match='"x"'
+        ),
+        UPDATED_AT,
+    )
+    assert not not_modified_since(make_request(if_modified_since="garbage"), UPDATED_AT)
+
+
+def test_as_utc_treats_naive_timestamps_as_utc():
+    assert as_utc("2026-10-18 12:30:05.250000") == UPDATED_AT
+    assert as_utc(UPDATED_AT.replace(tzinfo=None)) == UPDATED_AT
+    assert as_utc("not a date") is None
+
+
+def test_cache_headers_public_only_when_requested():
+    public = cache_headers('"e"', UPDATED_AT, public=True)
+    assert public["Cache-Control"].startswith("public, max-age=")
+    assert public["ETag"] == '"e"'
+    assert public["Last-Modified"] == "Sun, 18 Oct 2026 12:30:05 GMT"
+
+    private = cache_headers(None, UPDATED_AT, public=False)
+    assert private["Cache-Control"] == "private, no-cache"
+    assert "ETag" not in private
+    assert "Last-Modified" not in private
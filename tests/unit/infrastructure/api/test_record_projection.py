@@ -0,0 +1,128 @@
+"""Unit tests for record projection plans."""
+
+import json
+
+import pytest
+
+from snackbase.infrastructure.api import record_projection
+from snackbase.infrastructure.api.dependencies import SYSTEM_ACCOUNT_ID
+from snackbase.infrastructure.api.record_projection import (
+    get_record_projection,
+    parse_fields_param,
+)
+
+SCHEMA = [
+    {"name": "title", "type": "text"},
+    {"name": "email", "type": "email", "pii": True, "mask_type": "email"},
+    {"name": "ssn", "type": "text", "pii": True},
+    {"name": "notes", "type": "text", "pii": True, "mask_type": "unknown"},
+]
+SCHEMA_KEY = json.dumps(SCHEMA)
+
+
+@pytest.fixture(autouse=True)
+def clear_projection_cache():
+    """Start each test with an empty plan cache."""
+    record_projection._projections.clear()
+    yield
+    record_projection._projections.clear()
+
+
+def make_record(**fields):
+    """Create a record with system fields and PII data."""
+    record = {
+        "id": "rec-1",
+        "account_id": "acc-1",
+        "created_at": "2026-01-01T00:00:00",
+        "created_by": "user-1",
+        "updated_at": "2026-01-01T00:00:00",
+        "updated_by": "user-1",
+        "account_name": "Acme",
+        "title": "Hello",
+        "email": "john@example.com",
+        "ssn": "123-45-6789",
+        "notes": "private",
+    }
+    record.update(fields)
+    return record
+
+
+def test_identity_plan_for_pii_access_user():
+    """Test that full access without ?fields= leaves records unchanged."""
+    projection = get_record_projection(SCHEMA_KEY, SCHEMA, "*", None, ["pii_access"], "acc-1")
+    record = make_record()
+
+    assert projection.is_identity
+    assert projection.apply([record]) == [record]
+
+
+def test_masks_pii_in_one_pass_without_mutating_input():
+    """Test that PII fields are masked on copies of the records."""
+    projection = get_record_projection(SCHEMA_KEY, SCHEMA, "*", None, [], "acc-1")
+    records = [make_record(), make_record(id="rec-2", email=None)]
+
+    result = projection.apply(records)
+
+    assert result[0]["email"] == "j***@example.com"
+    assert result[0]["ssn"] == "***********"  # default 'full' masking
+    assert result[0]["notes"] == "private"  # unknown mask type is left as is
+    assert result[1]["email"] is None
+    assert records[0]["email"] == "john@example.com"
+
+
+def test_superadmin_bypasses_masking():
+    """Test that superadmins see unmasked data."""
+    projection = get_record_projection(SCHEMA_KEY, SCHEMA, "*", None, [], SYSTEM_ACCOUNT_ID)
+
+    assert projection.apply_one(make_record())["email"] == "john@example.com"
+
+
+def test_combines_allowed_fields_and_fields_param():
+    """Test that the plan keeps the intersection plus system fields."""
+    projection = get_record_projection(
+        SCHEMA_KEY, SCHEMA, ["title", "email"], "email,ssn", [], "acc-1"
+    )
+
+    result = projection.apply_one(make_record())
+
+    assert set(result) == {
+        "id",
+        "account_id",
+        "created_at",
+        "created_by",
+        "updated_at",
+        "updated_by",
+        "email",
+    }
+    assert result["email"] == "j***@example.com"
+    # Dropped PII fields are not part of the masking plan
+    assert [name for name, _ in projection.maskers] == ["email"]
+
+
+def test_plans_are_cached_per_key():
+    """Test that a plan is built once per (schema, fields, access) key."""
+    first = get_record_projection(SCHEMA_KEY, SCHEMA, ["title"], "title", [], "acc-1")
+    again = get_record_projection(SCHEMA_KEY, SCHEMA, ["title"], "title", [], "acc-1")
+    other_access = get_record_projection(
+        SCHEMA_KEY, SCHEMA, ["title"], "title", ["pii_access"], "acc-1"
+    )
+    other_schema = get_record_projection(SCHEMA_KEY + " ", SCHEMA, ["title"], "title", [], "acc-1")
+
+    assert again is first
+    assert other_access is not first
+    assert other_schema is not first
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        ("", None),
+        ("*", None),
+        (" * ", None),
+        ("title, email", frozenset({"title", "email"})),
+    ],
+)
+def test_parse_fields_param(value, expected):
+    """Test parsing of the ?fields= query parameter."""
+    assert parse_fields_param(value) == expected
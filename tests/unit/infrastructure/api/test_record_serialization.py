@@ -0,0 +1,98 @@
+"""Unit tests for the orjson record response path."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from snackbase.infrastructure.api.record_serialization import (
+    RecordJSONResponse,
+    prepare_record,
+    prepare_records,
+)
+from snackbase.infrastructure.api.schemas import RecordResponse
+
+
+def make_record(**fields):
+    """Create a record dict with all system fields."""
+    record = {
+        "title": "Hello",
+        "updated_by": "user-1",
+        "id": "rec-1",
+        "created_at": "2026-01-01T00:00:00",
+        "account_id": "acc-1",
+        "created_by": "user-1",
+        "updated_at": "2026-01-01T00:00:00",
+    }
+    record.update(fields)
+    return record
+
+
+def test_prepare_record_uses_record_response_field_order():
+    """Test that system fields come first, then account_name, then data fields."""
+    prepared = prepare_record(make_record(views=3))
+
+    assert list(prepared) == [
+        "id",
+        "account_id",
+        "created_at",
+        "created_by",
+        "updated_at",
+        "updated_by",
+        "account_name",
+        "title",
+        "views",
+    ]
+    assert prepared["account_name"] is None
+
+
+def test_prepare_records_handles_varying_shapes():
+    """Test that rows with different keys (e.g., expansion) are each reordered."""
+    records = [make_record(), make_record(id="rec-2", author={"id": "u1"})]
+
+    prepared = prepare_records(records)
+
+    assert "author" not in prepared[0]
+    assert prepared[1]["author"] == {"id": "u1"}
+    assert prepared[1]["id"] == "rec-2"
+
+
+def test_prepare_record_missing_system_field():
+    """Test that a record without a system field is rejected."""
+    record = make_record()
+    del record["created_by"]
+
+    with pytest.raises(ValueError, match="created_by"):
+        prepare_record(record)
+
+
+def test_prepare_records_non_string_system_field():
+    """Test that system field types are checked on every row."""
+    records = [make_record(), make_record(updated_by=None)]
+
+    with pytest.raises(ValueError, match="updated_by"):
+        prepare_records(records)
+
+
+def test_response_matches_pydantic_serialization():
+    """Test that the fast path produces the same document as RecordResponse."""
+    record = make_record(
+        account_name="Acme",
+        price=Decimal("9.99"),
+        tags=("a", "b"),
+        meta={"nested": [1, 2.5, None]},
+        active=True,
+    )
+
+    body = RecordJSONResponse(prepare_record(record)).body
+
+    assert json.loads(body) == RecordResponse.from_record(record).model_dump(mode="json")
+    assert body.startswith(b'{"id":"rec-1","account_id":"acc-1"')
+
+
+def test_response_media_type():
+    """Test that the response is sent as JSON."""
+    response = RecordJSONResponse({"items": []})
+
+    assert response.media_type == "application/json"
+    assert response.headers["content-type"] == "application/json"
@@ -1,13 +1,23 @@
 """Unit tests for password hashing utilities."""
 
+import asyncio
+import threading
+
 import pytest
 
+from snackbase.core.config import get_settings
+from snackbase.core.metrics import PASSWORD_HASH_REJECTED
+from snackbase.infrastructure.auth import password_hasher
 from snackbase.infrastructure.auth.password_hasher import (
     DUMMY_PASSWORD_HASH,
+    PasswordHashingBusyError,
     generate_random_password,
+    get_password_hashing_stats,
     hash_password,
+    hash_password_async,
     needs_rehash,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -142,3 +152,72 @@ class TestDummyPasswordHash:
                 assert verify_password(password, DUMMY_PASSWORD_HASH) is True
             else:
                 assert verify_password(password, DUMMY_PASSWORD_HASH) is False
+
+
+class TestAsyncPasswordHashing:
+    """Tests for the pooled async hashing functions."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_async_roundtrip(self):
+        """Test that async hashing produces hashes the async verifier accepts."""
+        hashed = await hash_password_async("SecureP@ss123!")
+
+        assert hashed.startswith("$argon2id$")
+        assert await verify_password_async("SecureP@ss123!", hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_async_hashing_does_not_block_event_loop(self):
+        """Test that other coroutines keep running while hashes are computed."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(hash_password_async("SecureP@ss123!") for _ in range(4)))
+        task.cancel()
+
+        assert ticks > 1
+
+    @pytest.mark.asyncio
+    async def test_pool_rejects_work_when_queue_full(self, monkeypatch):
+        """Test admission control once max_pending operations are in flight."""
+        pool = password_hasher._HashingPool(max_workers=1, max_pending=1)
+        monkeypatch.setattr(password_hasher, "_pool", pool)
+        release = threading.Event()
+
+        rejected_before = PASSWORD_HASH_REJECTED.value()
+
+        first = asyncio.create_task(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(PasswordHashingBusyError):
+            await verify_password_async("password", DUMMY_PASSWORD_HASH)
+        assert PASSWORD_HASH_REJECTED.value() == rejected_before + 1
+
+        stats = get_password_hashing_stats()
+        assert stats["pending"] == 1
+        assert stats["running"] == 1
+        assert stats["rejected"] == 1
+
+        release.set()
+        await first
+        pool.shutdown()
+        assert get_password_hashing_stats()["completed"] == 1
+
+    def test_hasher_uses_configured_parameters(self, monkeypatch):
+        """Test that Argon2 parameters come from settings."""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "password_hash_time_cost", 2)
+        monkeypatch.setattr(settings, "password_hash_memory_cost", 8192)
+        monkeypatch.setattr(settings, "password_hash_parallelism", 1)
+
+        hasher = password_hasher._create_hasher()
+
+        assert hasher.hash("password").startswith("$argon2id$v=19$m=8192,t=2,p=1$")
+        # Hashes produced with the previous parameters are flagged for rehash
+        assert hasher.check_needs_rehash(DUMMY_PASSWORD_HASH) is True
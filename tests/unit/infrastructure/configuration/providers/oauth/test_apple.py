@@ -1,10 +1,13 @@
 """Unit tests for AppleOAuthHandler."""
 
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import httpx
 import jwt
 import time
+from cryptography.hazmat.primitives.asymmetric import rsa
 from snackbase.infrastructure.configuration.providers.oauth.apple import AppleOAuthHandler
 
 
@@ -26,6 +29,29 @@ class TestAppleOAuthHandler:
             "redirect_uri": "https://example.com/callback",
         }
 
+    @pytest.fixture
+    def apple_keys(self):
+        """Serve a freshly generated signing key as Apple's JWKS."""
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+        documents = {
+            "https://appleid.apple.com/.well-known/openid-configuration": {
+                "jwks_uri": "https://appleid.apple.com/auth/keys"
+            },
+            "https://appleid.apple.com/auth/keys": {"keys": [{**jwk, "kid": "k1", "alg": "RS256"}]},
+        }
+
+        async def fetch(url, max_age=None):
+            return documents[url]
+
+        with patch(
+            "snackbase.infrastructure.configuration.providers.oauth.http_client.fetch_cached_json",
+            side_effect=fetch,
+        ):
+            yield SimpleNamespace(
+                sign=lambda claims: jwt.encode(claims, key, algorithm="RS256", headers={"kid": "k1"})
+            )
+
     def test_metadata_properties(self, handler):
         """Test provider metadata properties."""
         assert handler.provider_name == "apple"
@@ -128,23 +154,39 @@ class TestAppleOAuthHandler:
             )
 
     @pytest.mark.asyncio
-    @patch("jwt.decode")
-    async def test_get_user_info_success(self, mock_jwt_decode, handler, config):
-        """Test successful user info retrieval from id_token."""
-        mock_jwt_decode.return_value = {
-            "sub": "apple_user_123",
-            "email": "user@apple.com",
-            "email_verified": "true",
-        }
-        
-        user_info = await handler.get_user_info(config, "fake_id_token")
-        
+    async def test_get_user_info_success(self, handler, config, apple_keys):
+        """Test successful user info retrieval from a verified id_token."""
+        id_token = apple_keys.sign(
+            {
+                "iss": "https://appleid.apple.com",
+                "aud": "test_client_id",
+                "sub": "apple_user_123",
+                "email": "user@apple.com",
+                "email_verified": "true",
+                "exp": int(time.time()) + 600,
+            }
+        )
+
+        user_info = await handler.get_user_info(config, id_token)
+
         assert user_info["id"] == "apple_user_123"
         assert user_info["email"] == "user@apple.com"
         assert user_info["verified_email"] is True
-        
-        # Verify decode call
-        mock_jwt_decode.assert_called_with("fake_id_token", options={"verify_signature": False})
+
+    @pytest.mark.asyncio
+    async def test_get_user_info_rejects_other_audience(self, handler, config, apple_keys):
+        """Test that an id_token issued to another client is rejected."""
+        id_token = apple_keys.sign(
+            {
+                "iss": "https://appleid.apple.com",
+                "aud": "other_client_id",
+                "sub": "apple_user_123",
+                "exp": int(time.time()) + 600,
+            }
+        )
+
+        with pytest.raises(ValueError, match="Failed to decode Apple id_token"):
+            await handler.get_user_info(config, id_token)
 
     @pytest.mark.asyncio
     async def test_get_user_info_failure(self, handler, config):
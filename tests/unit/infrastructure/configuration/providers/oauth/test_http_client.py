@@ -0,0 +1,90 @@
+"""Unit tests for the shared OAuth HTTP client and metadata cache."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from snackbase.infrastructure.configuration.providers.oauth import http_client
+from snackbase.infrastructure.configuration.providers.oauth.http_client import (
+    close_oauth_http_client,
+    fetch_cached_json,
+    get_discovery_document,
+    get_oauth_http_client,
+    get_signing_key,
+)
+
+JWKS_URI = "https://idp.example.com/keys"
+
+
+def json_response(document):
+    response = MagicMock(spec=httpx.Response)
+    response.json.return_value = document
+    return response
+
+
+def make_jwk(kid: str) -> dict:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return {**json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key())), "kid": kid}
+
+
+@pytest.fixture(autouse=True)
+async def fresh_client():
+    await close_oauth_http_client()
+    yield
+    await close_oauth_http_client()
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_and_closed_on_shutdown():
+    client = get_oauth_http_client()
+    assert get_oauth_http_client() is client
+    assert client.timeout.connect == 5.0
+
+    await close_oauth_http_client()
+    assert client.is_closed
+    assert get_oauth_http_client() is not client
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient.get")
+async def test_documents_are_cached_until_max_age(mock_get, monkeypatch):
+    mock_get.return_value = json_response({"jwks_uri": JWKS_URI})
+    clock = [1000.0]
+    monkeypatch.setattr(http_client.time, "monotonic", lambda: clock[0])
+
+    document = await get_discovery_document("https://idp.example.com/")
+    assert document["jwks_uri"] == JWKS_URI
+    assert await get_discovery_document("https://idp.example.com") is document
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.args[0] == "https://idp.example.com/.well-known/openid-configuration"
+
+    clock[0] += 3600
+    await get_discovery_document("https://idp.example.com")
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient.get")
+async def test_unknown_kid_refreshes_jwks_at_most_once_per_interval(mock_get, monkeypatch):
+    old_key, new_key = make_jwk("old"), make_jwk("new")
+    mock_get.return_value = json_response({"keys": [old_key]})
+    clock = [1000.0]
+    monkeypatch.setattr(http_client.time, "monotonic", lambda: clock[0])
+
+    assert (await get_signing_key(JWKS_URI, "old")).key_id == "old"
+
+    # Rotated key within the refresh interval: no extra fetch
+    mock_get.return_value = json_response({"keys": [old_key, new_key]})
+    with pytest.raises(ValueError, match="not found"):
+        await get_signing_key(JWKS_URI, "new")
+    assert mock_get.call_count == 1
+
+    # After the interval the key set is refetched before the TTL expires
+    clock[0] += 120
+    assert (await get_signing_key(JWKS_URI, "new")).key_id == "new"
+    assert mock_get.call_count == 2
+    assert (await fetch_cached_json(JWKS_URI))["keys"][1]["kid"] == "new"
@@ -2,7 +2,7 @@
 
 import base64
 import zlib
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from lxml import etree
@@ -81,7 +81,7 @@ async def test_get_authorization_url(provider, valid_config):
 @pytest.mark.asyncio
 async def test_parse_saml_response_success(provider, valid_config):
     """Test parsing a valid SAML response from Azure AD."""
-    # Mock XMLVerifier to avoid actual signature verification logic
+    # Mock signature verification to avoid actual signature verification logic
     # and return a constructed XML element representing a valid assertion
     
     mock_signed_xml = etree.fromstring("""
@@ -109,9 +109,11 @@ async def test_parse_saml_response_success(provider, valid_config):
     </saml:Assertion>
     """)
 
-    with patch("snackbase.infrastructure.configuration.providers.saml.azure_ad.XMLVerifier") as MockVerifier:
-        instance = MockVerifier.return_value
-        instance.verify.return_value = MagicMock(signed_xml=mock_signed_xml)
+    with patch(
+        "snackbase.infrastructure.configuration.providers.saml.azure_ad.verify_saml_signature",
+        new_callable=AsyncMock,
+        return_value=mock_signed_xml,
+    ):
 
         user_info = await provider.parse_saml_response(
             valid_config,
@@ -140,9 +142,11 @@ async def test_parse_saml_response_fallback_name(provider, valid_config):
     </saml:Assertion>
     """)
 
-    with patch("snackbase.infrastructure.configuration.providers.saml.azure_ad.XMLVerifier") as MockVerifier:
-        instance = MockVerifier.return_value
-        instance.verify.return_value = MagicMock(signed_xml=mock_signed_xml)
+    with patch(
+        "snackbase.infrastructure.configuration.providers.saml.azure_ad.verify_saml_signature",
+        new_callable=AsyncMock,
+        return_value=mock_signed_xml,
+    ):
 
         user_info = await provider.parse_saml_response(
             valid_config,
@@ -168,9 +172,11 @@ async def test_parse_saml_response_upn_fallback(provider, valid_config):
     </saml:Assertion>
     """)
 
-    with patch("snackbase.infrastructure.configuration.providers.saml.azure_ad.XMLVerifier") as MockVerifier:
-        instance = MockVerifier.return_value
-        instance.verify.return_value = MagicMock(signed_xml=mock_signed_xml)
+    with patch(
+        "snackbase.infrastructure.configuration.providers.saml.azure_ad.verify_saml_signature",
+        new_callable=AsyncMock,
+        return_value=mock_signed_xml,
+    ):
 
         user_info = await provider.parse_saml_response(
             valid_config,
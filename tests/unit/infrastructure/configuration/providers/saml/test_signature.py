@@ -0,0 +1,106 @@
+"""Unit tests for off-loop SAML signature verification."""
+
+import datetime
+import threading
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from lxml import etree
+from signxml import InvalidSignature, XMLSigner
+
+from snackbase.infrastructure.configuration.providers.saml import signature
+from snackbase.infrastructure.configuration.providers.saml.signature import (
+    load_idp_certificate,
+    shutdown_saml_verification_pool,
+    verify_saml_signature,
+)
+
+ASSERTION = (
+    '<saml:Assertion xmlns:saml="urn:oasis:names:tc:SAML:2.0:assertion" ID="a1">'
+    "<saml:Subject><saml:NameID>user@example.com</saml:NameID></saml:Subject>"
+    "</saml:Assertion>"
+)
+
+
+def make_identity() -> tuple[bytes, str]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "idp.example.com")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return key_pem, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+@pytest.fixture(scope="module")
+def identity() -> tuple[bytes, str]:
+    return make_identity()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    yield
+    shutdown_saml_verification_pool()
+
+
+def sign(key_pem: bytes, cert_pem: str) -> bytes:
+    signed = XMLSigner().sign(etree.fromstring(ASSERTION), key=key_pem, cert=cert_pem)
+    return etree.tostring(signed)
+
+
+@pytest.mark.asyncio
+async def test_verifies_on_pool_thread(identity, monkeypatch):
+    key_pem, cert_pem = identity
+    threads = []
+    verify = signature._verify
+
+    def recording_verify(*args):
+        threads.append(threading.current_thread().name)
+        return verify(*args)
+
+    monkeypatch.setattr(signature, "_verify", recording_verify)
+
+    verified = await verify_saml_signature(sign(key_pem, cert_pem), cert_pem)
+
+    ns = {"saml": "urn:oasis:names:tc:SAML:2.0:assertion"}
+    assert verified.find(".//saml:NameID", ns).text == "user@example.com"
+    assert threads[0].startswith("snackbase-saml")
+
+
+@pytest.mark.asyncio
+async def test_rejects_document_signed_by_other_key(identity):
+    _, cert_pem = identity
+    other_key, other_cert = make_identity()
+
+    with pytest.raises(InvalidSignature):
+        await verify_saml_signature(sign(other_key, other_cert), cert_pem)
+
+
+def test_certificate_is_parsed_once_per_config_value(identity):
+    _, cert_pem = identity
+    body = "".join(cert_pem.strip().splitlines()[1:-1])
+    load_idp_certificate.cache_clear()
+
+    first = load_idp_certificate(cert_pem)
+    assert load_idp_certificate(cert_pem) is first
+    # The bare base64 body from IdP metadata is accepted as well
+    assert load_idp_certificate(body) == first
+    assert load_idp_certificate.cache_info().hits == 1
+
+    with pytest.raises(ValueError):
+        load_idp_certificate("not a certificate")
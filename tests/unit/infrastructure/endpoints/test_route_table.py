@@ -0,0 +1,105 @@
+"""Unit tests for precompiled custom endpoint route tables."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from snackbase.infrastructure.endpoints.route_table import (
+    CompiledEndpoint,
+    RouteTable,
+    RouteTableCache,
+    get_route_table,
+)
+
+
+def make_endpoint(path: str, method: str = "GET", endpoint_id: str | None = None):
+    return CompiledEndpoint(
+        id=endpoint_id or f"{method} {path}",
+        method=method,
+        path=path,
+        auth_required=False,
+        condition=None,
+        actions=[],
+        response_template=None,
+    )
+
+
+def matched(table: RouteTable, method: str, path: str):
+    result = table.match(method, path)
+    return None if result is None else (result[0].id, result[1])
+
+
+def test_matches_literal_and_parameter_segments():
+    table = RouteTable(
+        [
+            make_endpoint("/users/:user_id/orders"),
+            make_endpoint("/users/me/orders"),
+            make_endpoint("/users/:user_id", method="DELETE"),
+            make_endpoint("/files/:name.json"),
+        ]
+    )
+
+    assert matched(table, "GET", "/users/u1/orders") == (
+        "GET /users/:user_id/orders",
+        {"user_id": "u1"},
+    )
+    assert matched(table, "GET", "/users/me/orders") == ("GET /users/me/orders", {})
+    assert matched(table, "DELETE", "/users/u1") == ("DELETE /users/:user_id", {"user_id": "u1"})
+    assert matched(table, "GET", "/files/report.json") == (
+        "GET /files/:name.json",
+        {"name": "report"},
+    )
+
+    # Same rules as the regex a template used to compile to
+    assert matched(table, "POST", "/users/u1/orders") is None
+    assert matched(table, "GET", "/users//orders") is None
+    assert matched(table, "GET", "/users/u1/orders/") is None
+    assert matched(table, "GET", "/files/report.xml") is None
+
+
+def test_backtracks_from_literal_to_parameter():
+    table = RouteTable([make_endpoint("/shops/new"), make_endpoint("/shops/:shop_id/items")])
+
+    assert matched(table, "GET", "/shops/new/items") == (
+        "GET /shops/:shop_id/items",
+        {"shop_id": "new"},
+    )
+
+
+def test_cache_is_keyed_by_route_version():
+    cache = RouteTableCache(max_accounts=1)
+    table = RouteTable()
+    cache.put("acc-1", 3, table)
+
+    assert cache.get("acc-1", 3) is table
+    assert cache.get("acc-1", 4) is None
+
+    cache.put("acc-2", 1, RouteTable())
+    assert cache.get("acc-1", 3) is None
+
+
+@pytest.mark.asyncio
+async def test_table_is_rebuilt_only_when_the_version_moves():
+    endpoint = SimpleNamespace(
+        id="ep-1",
+        method="GET",
+        path="/ping",
+        auth_required=False,
+        condition=None,
+        actions=None,
+        response_template={"status": 200},
+    )
+    repo = SimpleNamespace(
+        get_route_version=AsyncMock(return_value=1),
+        get_all_enabled_for_account=AsyncMock(return_value=[endpoint]),
+    )
+
+    first = await get_route_table(repo, "acc-1")
+    assert await get_route_table(repo, "acc-1") is first
+    repo.get_all_enabled_for_account.assert_awaited_once()
+    assert matched(first, "GET", "/ping") == ("ep-1", {})
+
+    repo.get_route_version.return_value = 2
+    assert await get_route_table(repo, "acc-1") is not first
+    assert repo.get_all_enabled_for_account.await_count == 2
@@ -0,0 +1,52 @@
+"""Unit tests for queued dashboard counter increments."""
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from snackbase.infrastructure.persistence.models import DashboardStatModel
+from snackbase.infrastructure.persistence.repositories.dashboard_stat_repository import (
+    queue_increment,
+)
+
+
+def _value(session: Session, key: str) -> int:
+    return session.scalar(select(DashboardStatModel.value).where(DashboardStatModel.key == key))
+
+
+def test_queued_increments_apply_once_on_commit() -> None:
+    engine = create_engine("sqlite://")
+    DashboardStatModel.__table__.create(engine)
+
+    with Session(engine) as session:
+        session.add(DashboardStatModel(key="records:posts", value=10))
+        session.add(DashboardStatModel(key="storage_bytes", value=100))
+        session.commit()
+
+        queue_increment(session, "records:posts", 1)
+        queue_increment(session, "records:posts", 1)
+        queue_increment(session, "storage_bytes", 5)
+        queue_increment(session, "storage_bytes", -5)
+        # Nothing is written before the commit
+        assert _value(session, "records:posts") == 10
+        session.commit()
+
+        assert _value(session, "records:posts") == 12
+        assert _value(session, "storage_bytes") == 100
+
+
+def test_queued_increments_are_dropped_on_rollback() -> None:
+    engine = create_engine("sqlite://")
+    DashboardStatModel.__table__.create(engine)
+
+    with Session(engine) as session:
+        session.add(DashboardStatModel(key="records:posts", value=10))
+        session.commit()
+
+        # The write that queues the delta runs inside the transaction
+        session.add(DashboardStatModel(key="records:comments", value=0))
+        session.flush()
+        queue_increment(session, "records:posts", -1)
+        session.rollback()
+        session.commit()
+
+        assert _value(session, "records:posts") == 10
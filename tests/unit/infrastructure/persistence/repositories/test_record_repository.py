@@ -234,3 +234,73 @@ async def test_find_all(repository, mock_session, sample_schema):
     select_call = mock_session.execute.call_args_list[1]
     assert "ORDER BY" in str(select_call[0][0])
     assert '"count" ASC' in str(select_call[0][0])
+
+
+@pytest.mark.asyncio
+async def test_find_all_with_columns(repository, mock_session, sample_schema):
+    # Arrange
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 1
+    row = MagicMock()
+    row._mapping = {"id": "1", "title": "A", "count": 1}
+    rows_result = MagicMock()
+    rows_result.fetchall.return_value = [row]
+    mock_session.execute.side_effect = [count_result, rows_result]
+
+    # Act
+    with patch("snackbase.infrastructure.persistence.repositories.record_repository.TableBuilder.generate_table_name") as mock_table_name:
+        mock_table_name.return_value = "sb_posts"
+        await repository.find_all(
+            "posts", "acc_123", sample_schema, sort_by="count",
+            columns={"title", "bogus\" OR 1=1"},
+        )
+
+    # Assert: only system fields, requested columns and the sort field are selected
+    select_sql = str(mock_session.execute.call_args_list[1][0][0])
+    assert 'r."id", r."account_id"' in select_sql
+    assert 'r."title"' in select_sql
+    assert 'r."count"' in select_sql
+    assert "r.*" not in select_sql
+    assert '"metadata"' not in select_sql
+    assert "bogus" not in select_sql
+    assert "JOIN accounts" not in select_sql
+
+
+@pytest.mark.asyncio
+async def test_find_all_cursor_with_account_name(repository, mock_session, sample_schema):
+    # Arrange
+    rows_result = MagicMock()
+    rows_result.fetchall.return_value = []
+    mock_session.execute.return_value = rows_result
+
+    # Act
+    with patch("snackbase.infrastructure.persistence.repositories.record_repository.TableBuilder.generate_table_name") as mock_table_name:
+        mock_table_name.return_value = "sb_posts"
+        await repository.find_all_cursor(
+            "posts", "acc_123", sample_schema, columns={"account_name"}
+        )
+
+    # Assert
+    select_sql = str(mock_session.execute.call_args[0][0])
+    assert "a.name as account_name" in select_sql
+    assert "LEFT JOIN accounts a" in select_sql
+    assert '"title"' not in select_sql
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_with_columns(repository, mock_session, sample_schema):
+    # Arrange
+    mock_result = MagicMock()
+    mock_result.fetchone.return_value = None
+    mock_session.execute.return_value = mock_result
+
+    # Act
+    with patch("snackbase.infrastructure.persistence.repositories.record_repository.TableBuilder.generate_table_name") as mock_table_name:
+        mock_table_name.return_value = "sb_posts"
+        await repository.get_by_id("posts", "rec_1", "acc_123", sample_schema, columns=["is_active"])
+
+    # Assert
+    select_sql = str(mock_session.execute.call_args[0][0])
+    assert '"is_active"' in select_sql
+    assert '"title"' not in select_sql
+    assert "*" not in select_sql
@@ -0,0 +1,84 @@
+"""Unit tests for the per-worker aggregate result cache."""
+
+from unittest.mock import MagicMock, patch
+
+from snackbase.infrastructure.persistence.aggregate_cache import (
+    AggregateResultCache,
+    _bump_pending,
+    collection_write_version,
+    has_pending_writes,
+    mark_collection_written,
+)
+
+
+def _session() -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    return session
+
+
+def test_hit_until_collection_is_written():
+    cache = AggregateResultCache(max_entries=10, ttl_seconds=60)
+    key = cache.make_key("cache_col_a", "acc", ["COUNT(*)"])
+    cache.put("cache_col_a", key, collection_write_version("cache_col_a"), [{"count": 3}])
+
+    assert cache.get("cache_col_a", key) == [{"count": 3}]
+
+    mark_collection_written(_session(), "cache_col_a")
+
+    assert cache.get("cache_col_a", key) is None
+
+
+def test_put_rejected_when_written_during_query():
+    cache = AggregateResultCache(max_entries=10, ttl_seconds=60)
+    key = cache.make_key("cache_col_b")
+    version = collection_write_version("cache_col_b")
+
+    mark_collection_written(_session(), "cache_col_b")
+    cache.put("cache_col_b", key, version, [{"count": 1}])
+
+    assert cache.get("cache_col_b", key) is None
+
+
+def test_commit_bumps_pending_collections():
+    session = _session()
+    mark_collection_written(session, "cache_col_c")
+    assert has_pending_writes(session, "cache_col_c")
+    version = collection_write_version("cache_col_c")
+
+    _bump_pending(session)
+
+    assert collection_write_version("cache_col_c") == version + 1
+    assert not has_pending_writes(session, "cache_col_c")
+
+
+def test_entries_expire_after_ttl():
+    cache = AggregateResultCache(max_entries=10, ttl_seconds=5)
+    key = cache.make_key("cache_col_d")
+    with patch("snackbase.infrastructure.persistence.aggregate_cache.time.monotonic") as now:
+        now.return_value = 100.0
+        cache.put("cache_col_d", key, collection_write_version("cache_col_d"), [])
+        now.return_value = 104.0
+        assert cache.get("cache_col_d", key) == []
+        now.return_value = 106.0
+        assert cache.get("cache_col_d", key) is None
+
+
+def test_lru_eviction_and_disabled_cache():
+    cache = AggregateResultCache(max_entries=2, ttl_seconds=60)
+    version = collection_write_version("cache_col_e")
+    for i in range(3):
+        cache.put("cache_col_e", str(i), version, [i])
+
+    assert cache.get("cache_col_e", "0") is None
+    assert cache.get("cache_col_e", "2") == [2]
+
+    disabled = AggregateResultCache(max_entries=2, ttl_seconds=0)
+    disabled.put("cache_col_e", "k", version, [1])
+    assert disabled.get("cache_col_e", "k") is None
+
+
+def test_key_is_order_insensitive_for_params():
+    assert AggregateResultCache.make_key("c", {"a": 1, "b": 2}) == AggregateResultCache.make_key(
+        "c", {"b": 2, "a": 1}
+    )
@@ -0,0 +1,109 @@
+"""Unit tests for per-request SQL statement instrumentation."""
+
+from sqlalchemy import create_engine, text
+
+from snackbase.infrastructure.persistence.query_stats import (
+    QueryStats,
+    RouteProfiler,
+    get_current_query_stats,
+    route_template,
+    start_query_stats,
+    stop_query_stats,
+)
+
+
+def test_statements_counted_only_while_collecting():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+        stats, token = start_query_stats()
+        try:
+            conn.execute(text("SELECT 2"))
+            conn.execute(text("SELECT   3"))
+        finally:
+            stop_query_stats(token)
+
+        conn.execute(text("SELECT 4"))
+
+    assert get_current_query_stats() is None
+    assert stats.count == 2
+    assert stats.total_ms >= stats.slowest_ms > 0
+    assert stats.slowest_statement in ("SELECT 2", "SELECT 3")
+
+
+def test_failed_statement_does_not_skew_timing():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        stats, token = start_query_stats()
+        try:
+            try:
+                conn.execute(text("SELECT * FROM missing_table"))
+            except Exception:
+                pass
+            conn.execute(text("SELECT 1"))
+        finally:
+            stop_query_stats(token)
+
+        assert stats.count == 1
+        assert not conn.info.get("snackbase_query_started")
+
+
+def test_route_profiler_ranks_by_db_time():
+    profiler = RouteProfiler()
+    profiler.record(
+        "GET /a", QueryStats(count=3, total_ms=5.0, slowest_ms=4.0, slowest_statement="A"), 10.0
+    )
+    profiler.record(
+        "GET /a", QueryStats(count=5, total_ms=7.0, slowest_ms=2.0, slowest_statement="B"), 20.0
+    )
+    profiler.record(
+        "GET /b", QueryStats(count=1, total_ms=20.0, slowest_ms=20.0, slowest_statement="C"), 30.0
+    )
+
+    top = profiler.top()
+    assert [row["route"] for row in top] == ["GET /b", "GET /a"]
+    assert top[1] == {
+        "route": "GET /a",
+        "requests": 2,
+        "db_time_ms": 12.0,
+        "avg_db_time_ms": 6.0,
+        "avg_duration_ms": 15.0,
+        "queries": 8,
+        "avg_queries": 4.0,
+        "max_queries": 5,
+        "slowest_ms": 4.0,
+        "slowest_statement": "A",
+    }
+    assert [row["route"] for row in profiler.top(sort_by="queries", limit=1)] == ["GET /a"]
+
+    profiler.reset()
+    assert profiler.top() == []
+
+
+def test_route_profiler_caps_distinct_routes():
+    profiler = RouteProfiler(max_routes=1)
+    profiler.record("GET /a", QueryStats(), 1.0)
+    profiler.record("GET /b", QueryStats(), 1.0)
+
+    assert [row["route"] for row in profiler.top()] == ["GET /a"]
+
+
+def test_route_template_replaces_path_params():
+    scope = {
+        "method": "GET",
+        "path": "/api/v1/records/posts/42",
+        "route": object(),
+        "path_params": {"collection": "posts", "record_id": "42"},
+    }
+    assert route_template(scope) == "GET /api/v1/records/{collection}/{record_id}"
+
+    scope = {
+        "method": "GET",
+        "path": "/api/v1/files/a/b.png",
+        "route": object(),
+        "path_params": {"path": "a/b.png"},
+    }
+    assert route_template(scope) == "GET /api/v1/files/{path}"
+
+    assert route_template({"method": "GET", "path": "/nope"}) == "GET <unmatched>"
@@ -0,0 +1,96 @@
+"""Unit tests for the startup schema fingerprint."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from snackbase.infrastructure.persistence.models.schema_state import SchemaStateModel
+from snackbase.infrastructure.persistence.schema_fingerprint import (
+    compute_schema_fingerprint,
+    is_schema_current,
+    record_schema_fingerprint,
+)
+
+
+@pytest.fixture
+def alembic_ini(tmp_path):
+    core = tmp_path / "versions"
+    dynamic = tmp_path / "migrations"
+    core.mkdir()
+    dynamic.mkdir()
+    (core / "001_core.py").write_text("revision = '001'\n")
+    ini = tmp_path / "alembic.ini"
+    ini.write_text(
+        "[alembic]\n"
+        "script_location = %(here)s/alembic\n"
+        "version_locations = %(here)s/versions:%(here)s/migrations\n"
+        "path_separator = os\n"
+    )
+    return ini
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+async def create_tables(engine, *revisions):
+    async with engine.begin() as conn:
+        await conn.run_sync(SchemaStateModel.__table__.create)
+        await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32))"))
+        for revision in revisions:
+            await conn.execute(text("INSERT INTO alembic_version VALUES (:r)"), {"r": revision})
+
+
+def test_fingerprint_tracks_migration_scripts(alembic_ini):
+    initial = compute_schema_fingerprint(str(alembic_ini))
+    assert compute_schema_fingerprint(str(alembic_ini)) == initial
+
+    # New dynamic migration, e.g. a collection was created
+    dynamic = alembic_ini.parent / "migrations" / "abc_create_collection_posts.py"
+    dynamic.write_text("revision = 'abc'\n")
+    added = compute_schema_fingerprint(str(alembic_ini))
+    assert added != initial
+
+    # Edited script
+    dynamic.write_text("revision = 'abc'\n# edited\n")
+    assert compute_schema_fingerprint(str(alembic_ini)) not in (initial, added)
+
+    # Non-script files are ignored
+    dynamic.write_text("revision = 'abc'\n")
+    (alembic_ini.parent / "migrations" / "README").write_text("notes")
+    assert compute_schema_fingerprint(str(alembic_ini)) == added
+
+
+@pytest.mark.asyncio
+async def test_unmigrated_database_is_not_current(engine):
+    assert await is_schema_current(engine, "f" * 64) is False
+
+
+@pytest.mark.asyncio
+async def test_recorded_fingerprint_is_current(engine):
+    await create_tables(engine, "core_head", "dynamic_head")
+    assert await is_schema_current(engine, "a" * 64) is False
+
+    await record_schema_fingerprint(engine, "a" * 64)
+    assert await is_schema_current(engine, "a" * 64) is True
+    assert await is_schema_current(engine, "b" * 64) is False
+
+    # Recording again replaces the previous state
+    await record_schema_fingerprint(engine, "b" * 64)
+    assert await is_schema_current(engine, "b" * 64) is True
+    assert await is_schema_current(engine, "a" * 64) is False
+
+
+@pytest.mark.asyncio
+async def test_changed_alembic_heads_invalidate_fingerprint(engine):
+    await create_tables(engine, "core_head")
+    await record_schema_fingerprint(engine, "a" * 64)
+
+    # e.g. the database was downgraded or restored from an older backup
+    async with engine.begin() as conn:
+        await conn.execute(text("UPDATE alembic_version SET version_num = 'older'"))
+
+    assert await is_schema_current(engine, "a" * 64) is False
@@ -107,7 +107,7 @@ def test_build_index_ddl():
     # Let's check the code: TableBuilder actually DOES create explicit indexes for reference fields AND account_id
     # And it loops through schema to index reference fields.
 
-    assert len(indexes) == 2 # 1 for account_id + 1 for reference field author_id. Unique slug usually handled by constraint but check code.
+    assert len(indexes) == 3 # account_id + pagination + reference field author_id. Unique slug usually handled by constraint but check code.
 
     # Let's re-read TableBuilder.build_index_ddl from the previous turn...
     # It does: indexes.append(account_id)
@@ -119,6 +119,7 @@ def test_build_index_ddl():
 
     assert any('ON "col_posts"("account_id")' in idx for idx in indexes)
     assert any('ON "col_posts"("author_id")' in idx for idx in indexes)
+    assert any('ON "col_posts"("account_id", "created_at", "id")' in idx for idx in indexes)
 
 @pytest.mark.asyncio
 async def test_table_exists_true():
@@ -17,7 +17,11 @@ from snackbase.infrastructure.persistence.repositories.email_template_repository
 from snackbase.infrastructure.services.email.smtp_provider import SMTPProvider
 from snackbase.infrastructure.services.email.aws_ses_provider import AWSESProvider
 from snackbase.infrastructure.services.email.resend_provider import ResendProvider
-from snackbase.infrastructure.services.email_service import EmailService, SYSTEM_ACCOUNT_ID
+from snackbase.infrastructure.services.email_service import (
+    SYSTEM_ACCOUNT_ID,
+    EmailService,
+    invalidate_provider_instances,
+)
 
 
 @pytest.fixture
@@ -358,3 +362,45 @@ async def test_get_specific_provider(email_service, mock_config_repository):
     
     assert f"Provider '{provider_name}' is not configured or enabled" in str(exc_info.value)
 
+
+
+@pytest.mark.asyncio
+async def test_provider_instance_shared_across_services(
+    mock_encryption_service, mock_config_repository
+):
+    """Test that provider instances are reused per (config id, updated_at)."""
+    mock_config = MagicMock()
+    mock_config.id = "cfg-shared"
+    mock_config.updated_at = datetime(2026, 1, 1, tzinfo=UTC)
+    mock_config.provider_name = "aws_ses"
+    mock_config.is_system = False
+    mock_config.config = {
+        "region": "us-east-1",
+        "access_key_id": "key",
+        "secret_access_key": "secret",
+        "from_email": "test@example.com",
+    }
+    mock_config_repository.list_configs = AsyncMock(return_value=[mock_config])
+
+    def make_service():
+        return EmailService(
+            template_repository=MagicMock(spec=EmailTemplateRepository),
+            log_repository=MagicMock(spec=EmailLogRepository),
+            config_repository=mock_config_repository,
+            encryption_service=mock_encryption_service,
+        )
+
+    invalidate_provider_instances()
+    provider1, _, _, _ = await make_service()._get_provider(AsyncMock(), "acc-1")
+    provider2, _, _, _ = await make_service()._get_provider(AsyncMock(), "acc-1")
+    assert provider1 is provider2
+    assert mock_encryption_service.decrypt_dict.call_count == 1
+
+    # Editing the configuration bumps updated_at, which yields a new instance
+    mock_config.updated_at = datetime(2026, 1, 2, tzinfo=UTC)
+    provider3, _, _, _ = await make_service()._get_provider(AsyncMock(), "acc-1")
+    assert provider3 is not provider1
+
+    invalidate_provider_instances("cfg-shared")
+    provider4, _, _, _ = await make_service()._get_provider(AsyncMock(), "acc-1")
+    assert provider4 is not provider3
@@ -4,9 +4,12 @@ Tests verify that email templates are correctly rendered with Jinja2 variable
 substitution and that the rendered output is valid.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from snackbase.infrastructure.services.email.template_renderer import (
+    TemplateRenderer,
     get_template_renderer,
 )
 
@@ -239,3 +242,41 @@ Your email is {{ user_email }}.
 
     assert "Hello Alice!" in result
     assert "Your email is alice@example.com." in result
+
+
+def test_render_with_cache_key_reuses_compiled_template() -> None:
+    """Test that a cache key compiles the template source only once."""
+    renderer = TemplateRenderer()
+    key = ("tpl-1", "2026-01-01T00:00:00", "en", "subject")
+
+    with patch.object(renderer.env, "from_string", wraps=renderer.env.from_string) as compile_:
+        first = renderer.render("Hi {{ name }}", {"name": "Ann"}, key)
+        second = renderer.render("Hi {{ name }}", {"name": "Bob"}, key)
+
+    assert first == "Hi Ann"
+    assert second == "Hi Bob"
+    assert compile_.call_count == 1
+
+
+def test_invalidate_drops_compiled_templates_for_template_id() -> None:
+    """Test that invalidating a template ID forces recompilation of its fields only."""
+    renderer = TemplateRenderer()
+    renderer.render("old {{ x }}", {"x": "1"}, ("tpl-1", None, "en", "subject"))
+    renderer.render("other", {}, ("tpl-2", None, "en", "subject"))
+
+    renderer.invalidate("tpl-1")
+
+    assert renderer.render("new {{ x }}", {"x": "1"}, ("tpl-1", None, "en", "subject")) == "new 1"
+    assert renderer.render("ignored", {}, ("tpl-2", None, "en", "subject")) == "other"
+
+
+def test_compiled_template_cache_is_bounded() -> None:
+    """Test that the least recently used compiled template is evicted."""
+    renderer = TemplateRenderer(cache_size=2)
+    renderer.render("a", {}, "a")
+    renderer.render("b", {}, "b")
+    renderer.render("a", {}, "a")
+    renderer.render("c", {}, "c")
+
+    assert renderer.render("b2", {}, "b") == "b2"
+    assert renderer.render("stale", {}, "c") == "c"
@@ -6,7 +6,10 @@ from unittest import mock
 import pytest
 from botocore.exceptions import ClientError
 
+from snackbase.core.config import get_settings
+from snackbase.infrastructure.storage.base import InvalidRangeError
 from snackbase.infrastructure.storage.s3_storage_provider import (
+    S3_MIN_PART_SIZE,
     S3StorageProvider,
     S3StorageSettings,
 )
@@ -47,23 +50,121 @@ async def test_save_file_returns_s3_prefixed_path(s3_provider: S3StorageProvider
     client.put_object.assert_called_once()
 
 
+async def _read_stream(stored_file) -> bytes:
+    return b"".join([chunk async for chunk in stored_file.stream])
+
+
 @pytest.mark.asyncio
-async def test_get_file_returns_content(s3_provider: S3StorageProvider) -> None:
+async def test_get_file_streams_content(s3_provider: S3StorageProvider) -> None:
     with mock.patch("snackbase.infrastructure.storage.s3_storage_provider.boto3.client") as mock_client:
         client = mock.MagicMock()
         client.get_object.return_value = {
             "Body": BytesIO(b"payload"),
             "ContentType": "text/plain",
+            "ContentLength": 7,
         }
         mock_client.return_value = client
 
         stored_file = await s3_provider.get_file("acc_123", "s3/acc_123/file.txt")
 
-    assert stored_file.content == b"payload"
+    assert stored_file.content is None
+    assert await _read_stream(stored_file) == b"payload"
+    assert stored_file.size == 7
     assert stored_file.mime_type == "text/plain"
     assert stored_file.filename == "file.txt"
 
 
+@pytest.mark.asyncio
+async def test_get_file_passes_byte_range(s3_provider: S3StorageProvider) -> None:
+    with mock.patch("snackbase.infrastructure.storage.s3_storage_provider.boto3.client") as mock_client:
+        client = mock.MagicMock()
+        client.get_object.return_value = {
+            "Body": BytesIO(b"ylo"),
+            "ContentType": "text/plain",
+            "ContentLength": 3,
+            "ContentRange": "bytes 2-4/7",
+        }
+        mock_client.return_value = client
+
+        stored_file = await s3_provider.get_file(
+            "acc_123", "s3/acc_123/file.txt", byte_range="bytes=2-4"
+        )
+
+    client.get_object.assert_called_once_with(
+        Bucket="test-bucket", Key="acc_123/file.txt", Range="bytes=2-4"
+    )
+    assert stored_file.content_range == "bytes 2-4/7"
+    assert await _read_stream(stored_file) == b"ylo"
+
+
+@pytest.mark.asyncio
+async def test_get_file_invalid_range_raises(s3_provider: S3StorageProvider) -> None:
+    with mock.patch("snackbase.infrastructure.storage.s3_storage_provider.boto3.client") as mock_client:
+        client = mock.MagicMock()
+        client.get_object.side_effect = _client_error("InvalidRange", "bad", "GetObject")
+        mock_client.return_value = client
+
+        with pytest.raises(InvalidRangeError):
+            await s3_provider.get_file("acc_123", "s3/acc_123/file.txt", byte_range="bytes=99-")
+
+
+@pytest.mark.asyncio
+async def test_save_stream_uses_multipart_for_large_files(
+    s3_provider: S3StorageProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "max_file_size", 64 * 1024 * 1024)
+    monkeypatch.setattr(settings, "s3_multipart_part_size", S3_MIN_PART_SIZE)
+    part = S3_MIN_PART_SIZE
+
+    async def chunks():
+        for _ in range(11):
+            yield b"x" * (part // 4)
+
+    with mock.patch("snackbase.infrastructure.storage.s3_storage_provider.boto3.client") as mock_client:
+        client = mock.MagicMock()
+        client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        client.upload_part.side_effect = lambda **kw: {"ETag": f"etag-{kw['PartNumber']}"}
+        mock_client.return_value = client
+
+        metadata = await s3_provider.save_stream("acc_123", chunks(), "big.txt", "text/plain")
+
+    assert metadata.size == 11 * (part // 4)
+    client.put_object.assert_not_called()
+    part_sizes = [len(c.kwargs["Body"]) for c in client.upload_part.call_args_list]
+    assert part_sizes == [part, part, 3 * (part // 4)]
+    complete = client.complete_multipart_upload.call_args.kwargs
+    assert complete["UploadId"] == "up-1"
+    assert [p["PartNumber"] for p in complete["MultipartUpload"]["Parts"]] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_save_stream_aborts_multipart_when_size_limit_exceeded(
+    s3_provider: S3StorageProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "max_file_size", S3_MIN_PART_SIZE + 10)
+    monkeypatch.setattr(settings, "s3_multipart_part_size", S3_MIN_PART_SIZE)
+
+    async def chunks():
+        yield b"x" * S3_MIN_PART_SIZE
+        yield b"x" * 20
+
+    with mock.patch("snackbase.infrastructure.storage.s3_storage_provider.boto3.client") as mock_client:
+        client = mock.MagicMock()
+        client.create_multipart_upload.return_value = {"UploadId": "up-2"}
+        client.upload_part.return_value = {"ETag": "etag"}
+        mock_client.return_value = client
+
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            await s3_provider.save_stream("acc_123", chunks(), "big.txt", "text/plain")
+
+    client.abort_multipart_upload.assert_called_once_with(
+        Bucket="test-bucket", Key=mock.ANY, UploadId="up-2"
+    )
+    client.complete_multipart_upload.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_file_rejects_other_account_path(s3_provider: S3StorageProvider) -> None:
     with pytest.raises(ValueError, match="does not belong to this account"):
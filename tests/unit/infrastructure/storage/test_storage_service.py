@@ -2,16 +2,34 @@
 
 from io import BytesIO
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from snackbase.domain.services.file_storage_service import FileMetadata
+from snackbase.infrastructure.persistence.models.configuration import ConfigurationModel
+from snackbase.infrastructure.persistence.repositories.configuration_repository import (
+    ConfigurationRepository,
+)
 from snackbase.infrastructure.security.encryption import EncryptionService
 from snackbase.infrastructure.storage.base import StoredFile
+from snackbase.infrastructure.storage.provider_cache import (
+    get_storage_provider_cache,
+    storage_config_version,
+)
+from snackbase.infrastructure.storage.s3_storage_provider import S3StorageProvider
 from snackbase.infrastructure.storage.storage_service import StorageService
 
+S3_SETTINGS = {
+    "bucket": "bucket",
+    "region": "us-east-1",
+    "access_key_id": "key",
+    "secret_access_key": "secret",
+}
+
 
 @pytest.fixture
 def mock_session() -> AsyncSession:
@@ -121,6 +139,31 @@ async def test_get_file_routes_local_paths_to_local_provider(
     local_get.assert_awaited_once_with(account_id="acc_1", file_path="acc_1/file.txt")
 
 
+@pytest.mark.asyncio
+async def test_delete_file_commits_the_storage_counter_decrement(
+    storage_service: StorageService,
+    mock_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    stored = tmp_path / "file.txt"
+    stored.write_bytes(b"data")
+    mock_session.info = {}
+    monkeypatch.setattr(
+        storage_service._local_provider,
+        "get_file",
+        AsyncMock(return_value=StoredFile(local_path=stored)),
+    )
+    local_delete = AsyncMock()
+    monkeypatch.setattr(storage_service._local_provider, "delete_file", local_delete)
+
+    await storage_service.delete_file("acc_1", "acc_1/file.txt")
+
+    local_delete.assert_awaited_once_with(account_id="acc_1", file_path="acc_1/file.txt")
+    assert mock_session.info["snackbase_dashboard_stat_deltas"] == {"storage_bytes": -4}
+    mock_session.commit.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_file_routes_s3_paths_to_s3_provider(
     storage_service: StorageService,
@@ -136,6 +179,7 @@ async def test_get_file_routes_s3_paths_to_s3_provider(
     s3_provider.get_file.assert_awaited_once_with(
         account_id="acc_1",
         file_path="s3/acc_1/file.txt",
+        byte_range=None,
     )
 
 
@@ -169,3 +213,67 @@ async def test_save_file_raises_when_system_configs_exist_but_none_enabled(
             mime_type="text/plain",
             size=4,
         )
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_reuse_the_resolved_provider(
+    mock_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    encryption = EncryptionService("test-key-must-be-32-bytes-long!!!!")
+    s3_config = SimpleNamespace(
+        provider_name="s3", enabled=True, config=encryption.encrypt_dict(S3_SETTINGS)
+    )
+    get_config = AsyncMock(return_value=s3_config)
+    monkeypatch.setattr(ConfigurationRepository, "get_config", get_config)
+    decrypt = Mock(wraps=encryption.decrypt_dict)
+    monkeypatch.setattr(encryption, "decrypt_dict", decrypt)
+
+    # One StorageService per request, as in the files router
+    providers = [
+        await StorageService(mock_session, encryption)._get_s3_provider() for _ in range(3)
+    ]
+
+    assert isinstance(providers[0], S3StorageProvider)
+    assert all(provider is providers[0] for provider in providers)
+    get_config.assert_awaited_once()
+    decrypt.assert_called_once()
+
+
+def test_storage_config_writes_invalidate_cached_providers() -> None:
+    engine = create_engine("sqlite://")
+    ConfigurationModel.__table__.create(engine)
+    cache = get_storage_provider_cache()
+    cache.put("system:s3", storage_config_version(), "cached-provider")
+
+    with Session(engine) as session:
+        session.add(
+            ConfigurationModel(
+                id="cfg-1",
+                account_id=StorageService.SYSTEM_ACCOUNT_ID,
+                category="auth_providers",
+                provider_name="google",
+                display_name="Google",
+                config={},
+            )
+        )
+        session.commit()
+        assert cache.get("system:s3") == "cached-provider"
+
+        session.add(
+            ConfigurationModel(
+                id="cfg-2",
+                account_id=StorageService.SYSTEM_ACCOUNT_ID,
+                category="storage_providers",
+                provider_name="s3",
+                display_name="Amazon S3",
+                config={},
+            )
+        )
+        session.flush()
+        assert cache.get("system:s3") is None
+
+        # A provider resolved from uncommitted data is dropped on commit
+        cache.put("system:s3", storage_config_version(), "pre-commit-provider")
+        session.commit()
+        assert cache.get("system:s3") is None